@@ -1,23 +1,119 @@
 import os
 import asyncio
+import functools
+import math
+from array import array
 import httpx
 from dotenv import load_dotenv
 
+from .eta_estimator import build_eta_estimator_from_env, region_key
+from .services.tmap_cache import build_tmap_distance_cache_from_env, build_tmap_route_cache_from_env
+
 load_dotenv()
 TMAP_APP_KEY = os.getenv("TMAP_APP_KEY")
+TMAP_BASE_URL = os.getenv("TMAP_BASE_URL", "https://apis.openapi.sk.com").rstrip("/")
+# Tmap 호출 전 직선거리 사전 필터: 가까운 TOP3 + 여유분(margin)만 Tmap에 보낸다
+NEAREST_PREFILTER_ENABLED = os.getenv("NEAREST_PREFILTER_ENABLED", "true").lower() in {"1", "true", "yes", "on"}
+NEAREST_PREFILTER_MARGIN = int(os.getenv("NEAREST_PREFILTER_MARGIN", "5"))
+NEAREST_TOP_N = 3
+EARTH_RADIUS_M = 6371008.8
+# 공유 커넥션 풀 / 동시 호출 수 / 호출·배치 마감 시간
+TMAP_MAX_CONCURRENCY = int(os.getenv("TMAP_MAX_CONCURRENCY", "8"))
+TMAP_CALL_TIMEOUT_SECONDS = float(os.getenv("TMAP_CALL_TIMEOUT_SECONDS", "8"))
+TMAP_BATCH_TIMEOUT_SECONDS = float(os.getenv("TMAP_BATCH_TIMEOUT_SECONDS", "5"))
+TMAP_HTTP2 = os.getenv("TMAP_HTTP2", "true").lower() in {"1", "true", "yes", "on"}
 
 if not TMAP_APP_KEY:
     raise ValueError("TMAP_APP_KEY가 .env 파일에서 로드되지 않았습니다.")
 
-# Tmap 비동기 호출
-async def get_tmap_distance_async(start_lat, start_lon, end_lat, end_lon):
-    url = "https://apis.openapi.sk.com/tmap/routes?version=1&format=json"
 
+# (출발 격자 칸, HPID, 시간대) 단위 Tmap 거리 캐시. 끄면 None
+tmap_distance_cache = build_tmap_distance_cache_from_env()
+# nearest TOP3 경로 캐시 (출발 격자 칸, HPID). /api/ktas/route/path가 Tmap을 다시 부르지 않게 한다
+tmap_route_cache = build_tmap_route_cache_from_env()
+# Tmap 실패/마감 초과 병원의 거리·시간 대체값 (시군구별 우회 비율·속도 보정). 끄면 None
+eta_estimator = build_eta_estimator_from_env()
+
+
+# ---------- 공유 Tmap 클라이언트 ----------
+# 호출마다 AsyncClient를 새로 만들면 병원마다 TLS 핸드셰이크를 다시 한다.
+# 이벤트 루프 하나에 클라이언트/세마포어 하나 (startup에서 만들고 shutdown에서 닫는다)
+
+_tmap_client = None
+_tmap_semaphore = None
+_tmap_loop = None
+_tmap_transport = None
+
+
+def _http2_available():
+    if not TMAP_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401  (httpx[http2] 선택 의존성)
+    except ImportError:
+        return False
+    return True
+
+
+def init_tmap_client(transport=None):
+    """현재 이벤트 루프에 묶인 공유 클라이언트를 만든다. transport는 테스트용."""
+    global _tmap_client, _tmap_semaphore, _tmap_loop, _tmap_transport
+    _tmap_transport = transport
+    _tmap_loop = asyncio.get_running_loop()
+    _tmap_semaphore = asyncio.Semaphore(max(1, TMAP_MAX_CONCURRENCY))
+    _tmap_client = httpx.AsyncClient(
+        http2=_http2_available(),
+        timeout=TMAP_CALL_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=max(1, TMAP_MAX_CONCURRENCY),
+            max_keepalive_connections=max(1, TMAP_MAX_CONCURRENCY),
+        ),
+        transport=transport,
+    )
+    return _tmap_client
+
+
+async def close_tmap_client():
+    global _tmap_client, _tmap_semaphore, _tmap_loop
+    client = _tmap_client
+    _tmap_client = _tmap_semaphore = _tmap_loop = None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def _get_tmap_client():
+    # startup 없이 불린 경우(테스트, 스크립트)나 루프가 바뀐 경우 새로 만든다
+    if (
+        _tmap_client is None
+        or _tmap_client.is_closed
+        or _tmap_loop is not asyncio.get_running_loop()
+    ):
+        init_tmap_client(_tmap_transport)
+    return _tmap_client, _tmap_semaphore
+
+
+async def _post_tmap_routes(body):
+    client, semaphore = _get_tmap_client()
+    url = f"{TMAP_BASE_URL}/tmap/routes?version=1&format=json"
     headers = {
         "appKey": TMAP_APP_KEY,
         "Content-Type": "application/json"
     }
+    async with semaphore:
+        # httpx timeout은 단계별(connect/read)이라 호출 전체 마감은 wait_for로 건다
+        response = await asyncio.wait_for(
+            client.post(url, json=body, headers=headers),
+            timeout=TMAP_CALL_TIMEOUT_SECONDS,
+        )
+    response.raise_for_status()
+    return response.json()
 
+# Tmap 비동기 호출
+async def get_tmap_distance_async(start_lat, start_lon, end_lat, end_lon, route_sink=None):
+    """
+    (거리 m, 시간 초)를 돌려준다. route_sink를 주면 같은 응답에서 뽑은 경로
+    (get_tmap_route_async와 같은 dict)를 넘겨서 경로 재요청을 피할 수 있게 한다.
+    """
     body = {
         "startX": str(start_lon),
         "startY": str(start_lat),
@@ -28,46 +124,111 @@ async def get_tmap_distance_async(start_lat, start_lon, end_lat, end_lon):
         "searchOption": "0"
     }
 
-    async with httpx.AsyncClient(timeout=8.0) as client:
-        try:
-            response = await client.post(url, json=body, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-        except Exception as exc:
-            print(
-                "[TMAP] request failed "
-                f"start=({start_lat},{start_lon}) end=({end_lat},{end_lon}) error={exc}"
-            )
-            return None, None
+    try:
+        data = await _post_tmap_routes(body)
+    except Exception as exc:
+        print(
+            "[TMAP] request failed "
+            f"start=({start_lat},{start_lon}) end=({end_lat},{end_lon}) error={exc!r}"
+        )
+        return None, None
 
+    try:
+        distance = data["features"][0]["properties"]["totalDistance"]
+        duration = data["features"][0]["properties"]["totalTime"]
+    except Exception:
+        print(
+            "[TMAP] unexpected response "
+            f"start=({start_lat},{start_lon}) end=({end_lat},{end_lon}) data={data}"
+        )
+        return None, None
+
+    if route_sink is not None:
         try:
-            distance = data["features"][0]["properties"]["totalDistance"]
-            duration = data["features"][0]["properties"]["totalTime"]
-            return distance, duration
+            route_sink(_parse_tmap_route(data))
         except Exception:
-            print(
-                "[TMAP] unexpected response "
-                f"start=({start_lat},{start_lon}) end=({end_lat},{end_lon}) data={data}"
-            )
-            return None, None
+            # 경로가 없어도 거리 결과는 그대로 쓴다 (path 요청 때 다시 받는다)
+            pass
+    return distance, duration
 
 # 거리 계산 (JSON 병원 리스트 입력)
-async def calculate_all_distances_async(user_lat, user_lon, hospitals):
-    
-    tasks = [
-        get_tmap_distance_async(user_lat, user_lon, h["latitude"], h["longitude"])
-        for h in hospitals
-    ]
+async def calculate_all_distances_async(user_lat, user_lon, hospitals, batch_timeout=None, route_paths=None):
+    """
+    병원마다 Tmap 호출을 동시에 보내되(TMAP_MAX_CONCURRENCY로 제한),
+    batch_timeout(기본 TMAP_BATCH_TIMEOUT_SECONDS)이 지나면 가장 느린 호출을 기다리지 않고
+    그때까지 끝난 결과만 돌려준다.
+    tmap_distance_cache에 있는 병원은 Tmap을 부르지 않고 결과에 "cached": True를 붙인다.
+    route_paths(dict)를 주면 Tmap을 부른 병원의 경로를 {HPID: route}로 채운다.
+    Tmap이 실패했거나 마감 시간을 넘긴 병원은 eta_estimator 추정값으로 채우고 "estimated": True를 붙인다.
+    """
+    cache = tmap_distance_cache
+    estimator = eta_estimator
+    cached = {}
+    tasks = {}
+    for idx, h in enumerate(hospitals):
+        hit = cache.get(user_lat, user_lon, h["id"]) if cache is not None and h.get("id") else None
+        if hit is not None:
+            cached[idx] = hit
+            continue
+        kwargs = {}
+        if route_paths is not None:
+            kwargs["route_sink"] = functools.partial(route_paths.__setitem__, h["id"])
+        tasks[idx] = asyncio.ensure_future(
+            get_tmap_distance_async(user_lat, user_lon, h["latitude"], h["longitude"], **kwargs)
+        )
+    timeout = TMAP_BATCH_TIMEOUT_SECONDS if batch_timeout is None else batch_timeout
 
-    results_raw = await asyncio.gather(*tasks)
+    if tasks:
+        _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        for task in pending:
+            task.cancel()
+    else:
+        pending = set()
+
+    # 보정/추정용 직선거리 {idx: m}. 좌표가 없는 병원은 빼서 나머지 Tmap 결과를 버리지 않는다.
+    straight_m = {}
+    if estimator is not None and tasks:
+        located = [
+            idx
+            for idx in tasks
+            if hospitals[idx].get("latitude") is not None and hospitals[idx].get("longitude") is not None
+        ]
+        straight_m = dict(
+            zip(
+                located,
+                haversine_distances_m(
+                    user_lat,
+                    user_lon,
+                    array("d", (float(hospitals[idx]["latitude"]) for idx in located)),
+                    array("d", (float(hospitals[idx]["longitude"]) for idx in located)),
+                ),
+            )
+        )
 
     results = []
+    estimated_count = 0
 
-    for h, (dist, duration) in zip(hospitals, results_raw):
-        if dist is None:
-            continue
-        
-        results.append({
+    for idx, h in enumerate(hospitals):
+        estimated = False
+        if idx in cached:
+            dist, duration = cached[idx]
+        else:
+            task = tasks[idx]
+            dist, duration = (None, None) if task in pending else task.result()
+            if dist is not None:
+                if cache is not None and h.get("id"):
+                    cache.set(user_lat, user_lon, h["id"], dist, duration)
+                if idx in straight_m and duration is not None:
+                    estimator.observe(region_key(h.get("address")), straight_m[idx], float(dist), float(duration))
+            elif idx in straight_m:
+                estimate = estimator.estimate(region_key(h.get("address")), straight_m[idx])
+                dist, duration = estimate.distance_m, estimate.duration_sec
+                estimated = True
+                estimated_count += 1
+            else:
+                continue
+
+        result = {
             "id": h["id"],
             "name": h["name"],
             "distance": dist,
@@ -75,14 +236,69 @@ async def calculate_all_distances_async(user_lat, user_lon, hospitals):
             "coverage_score": h.get("coverage_score", 0.0),
             "priority_score": h.get("priority_score", 0.0),
             "reason_summary": h.get("reason_summary", "정보 없음")
-        })
+        }
+        if idx in cached:
+            result["cached"] = True
+        if estimated:
+            result["estimated"] = True
+        results.append(result)
 
     print(
         "[TMAP] distance results "
-        f"requested={len(hospitals)} resolved={len(results)}"
+        f"requested={len(hospitals)} cache_hits={len(cached)} "
+        f"resolved={len(results)} estimated={estimated_count} deadline_skipped={len(pending)}"
     )
     return results
 
+# 대원(haversine) 거리 일괄 계산 (미터)
+def haversine_distances_m(user_lat, user_lon, lats, lons):
+    lat0 = math.radians(user_lat)
+    lon0 = math.radians(user_lon)
+    cos_lat0 = math.cos(lat0)
+    out = array("d", bytes(8 * len(lats)))
+    for i, (lat, lon) in enumerate(zip(lats, lons)):
+        phi = math.radians(lat)
+        a = (
+            math.sin((phi - lat0) / 2) ** 2
+            + cos_lat0 * math.cos(phi) * math.sin((math.radians(lon) - lon0) / 2) ** 2
+        )
+        out[i] = 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+    return out
+
+
+# Tmap 호출 전 사전 필터: 직선거리(또는 추정 도로 거리) 가까운 keep개만 남긴다 (입력 순서 유지)
+def prefilter_by_great_circle(user_lat, user_lon, hospitals, keep, estimator=None):
+    """
+    좌표가 없는 병원은 어차피 Tmap 계산이 안 되므로 같이 걸러낸다.
+    estimator를 주면 시군구별 우회 비율로 추정한 도로 거리 순으로 고른다.
+    (get_top3가 거리 순으로 자르므로 사전 필터도 같은 기준을 써야 최종 1등 후보가 Tmap 전에 빠지지 않는다.)
+    반환: (Tmap에 보낼 병원 리스트, 걸러낸 병원 수)
+    """
+    located = [
+        idx
+        for idx, h in enumerate(hospitals)
+        if h.get("latitude") is not None and h.get("longitude") is not None
+    ]
+    if len(located) <= keep:
+        kept = [hospitals[idx] for idx in located]
+        return kept, len(hospitals) - len(kept)
+
+    distances = haversine_distances_m(
+        user_lat,
+        user_lon,
+        array("d", (float(hospitals[idx]["latitude"]) for idx in located)),
+        array("d", (float(hospitals[idx]["longitude"]) for idx in located)),
+    )
+    if estimator is not None:
+        distances = [
+            estimator.estimate(region_key(hospitals[idx].get("address")), distances[pos]).distance_m
+            for pos, idx in enumerate(located)
+        ]
+    nearest = sorted(range(len(located)), key=lambda pos: (distances[pos], pos))[:keep]
+    kept = [hospitals[located[pos]] for pos in sorted(nearest)]
+    return kept, len(hospitals) - len(kept)
+
+
 # TOP3 반환
 def get_top3(results):
     def sort_key(item):
@@ -95,17 +311,47 @@ def get_top3(results):
             -float(item.get("priority_score") or 0.0),
         )
 
-    return sorted(results, key=sort_key)[:3]
+    return sorted(results, key=sort_key)[:NEAREST_TOP_N]
 
 
-async def get_tmap_route_async(start_lat, start_lon, end_lat, end_lon):
-    url = "https://apis.openapi.sk.com/tmap/routes?version=1&format=json"
+def _parse_tmap_route(data):
+    features = data.get("features", [])
+    summary = next(
+        (feature.get("properties", {}) for feature in features if feature.get("properties", {}).get("totalDistance") is not None),
+        None,
+    )
+    if not summary:
+        raise ValueError("route summary missing")
 
-    headers = {
-        "appKey": TMAP_APP_KEY,
-        "Content-Type": "application/json"
+    path = []
+    for feature in features:
+        geometry = feature.get("geometry", {})
+        geometry_type = geometry.get("type")
+        coordinates = geometry.get("coordinates", [])
+
+        if geometry_type == "LineString":
+            for coord in coordinates:
+                if isinstance(coord, list) and len(coord) >= 2:
+                    path.append({"lon": float(coord[0]), "lat": float(coord[1])})
+        elif geometry_type == "MultiLineString":
+            for segment in coordinates:
+                if not isinstance(segment, list):
+                    continue
+                for coord in segment:
+                    if isinstance(coord, list) and len(coord) >= 2:
+                        path.append({"lon": float(coord[0]), "lat": float(coord[1])})
+
+    if not path:
+        raise ValueError("route path missing")
+
+    return {
+        "path": path,
+        "distance": float(summary["totalDistance"]),
+        "duration_sec": int(summary["totalTime"]),
     }
 
+
+async def get_tmap_route_async(start_lat, start_lon, end_lat, end_lon):
     body = {
         "startX": str(start_lon),
         "startY": str(start_lat),
@@ -116,53 +362,17 @@ async def get_tmap_route_async(start_lat, start_lon, end_lat, end_lon):
         "searchOption": "0"
     }
 
-    async with httpx.AsyncClient(timeout=8.0) as client:
-        try:
-            response = await client.post(url, json=body, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-        except Exception as exc:
-            print(
-                "[TMAP] route request failed "
-                f"start=({start_lat},{start_lon}) end=({end_lat},{end_lon}) error={exc}"
-            )
-            return None
-
     try:
-        features = data.get("features", [])
-        summary = next(
-            (feature.get("properties", {}) for feature in features if feature.get("properties", {}).get("totalDistance") is not None),
-            None,
+        data = await _post_tmap_routes(body)
+    except Exception as exc:
+        print(
+            "[TMAP] route request failed "
+            f"start=({start_lat},{start_lon}) end=({end_lat},{end_lon}) error={exc!r}"
         )
-        if not summary:
-            raise ValueError("route summary missing")
-
-        path = []
-        for feature in features:
-            geometry = feature.get("geometry", {})
-            geometry_type = geometry.get("type")
-            coordinates = geometry.get("coordinates", [])
+        return None
 
-            if geometry_type == "LineString":
-                for coord in coordinates:
-                    if isinstance(coord, list) and len(coord) >= 2:
-                        path.append({"lon": float(coord[0]), "lat": float(coord[1])})
-            elif geometry_type == "MultiLineString":
-                for segment in coordinates:
-                    if not isinstance(segment, list):
-                        continue
-                    for coord in segment:
-                        if isinstance(coord, list) and len(coord) >= 2:
-                            path.append({"lon": float(coord[0]), "lat": float(coord[1])})
-
-        if not path:
-            raise ValueError("route path missing")
-
-        return {
-            "path": path,
-            "distance": float(summary["totalDistance"]),
-            "duration_sec": int(summary["totalTime"]),
-        }
+    try:
+        return _parse_tmap_route(data)
     except Exception as exc:
         print(
             "[TMAP] unexpected route response "
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .services.spatial_index import region_from_address
+
+
+ETA_ESTIMATOR_ENABLED = os.getenv("ETA_ESTIMATOR_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+ETA_CALIBRATION_PATH = os.getenv("ETA_CALIBRATION_PATH", "data/eta_calibration.json")
+ETA_DEFAULT_DETOUR_FACTOR = float(os.getenv("ETA_DEFAULT_DETOUR_FACTOR", "1.35"))
+ETA_DEFAULT_SPEED_KMH = float(os.getenv("ETA_DEFAULT_SPEED_KMH", "30"))
+ETA_MIN_SAMPLES = int(os.getenv("ETA_MIN_SAMPLES", "5"))
+ETA_SAVE_EVERY = int(os.getenv("ETA_SAVE_EVERY", "20"))
+
+# 너무 가까운 병원(수백 m)은 우회 비율이 튀므로 보정 표본에서 뺀다
+MIN_CALIBRATION_STRAIGHT_M = 500.0
+GLOBAL_REGION = "*"
+
+
+def region_key(address: Optional[str]) -> Optional[str]:
+    """병원 주소 → "시도 시군구" 보정 키. 주소가 없으면 None(전국 값 사용)."""
+    region = region_from_address(address)
+    if region is None:
+        return None
+    return f"{region[0]} {region[1]}"
+
+
+@dataclass
+class RegionCalibration:
+    """
+    시군구 하나의 누적 표본.
+    우회 비율 = Σ도로거리 / Σ직선거리, 속도 = Σ도로거리 / Σ시간 (거리 가중 평균)
+    """
+
+    samples: int = 0
+    straight_m: float = 0.0
+    road_m: float = 0.0
+    duration_sec: float = 0.0
+
+    def add(self, straight_m: float, road_m: float, duration_sec: float) -> None:
+        self.samples += 1
+        self.straight_m += straight_m
+        self.road_m += road_m
+        self.duration_sec += duration_sec
+
+    @property
+    def detour_factor(self) -> float:
+        return self.road_m / self.straight_m
+
+    @property
+    def speed_mps(self) -> float:
+        return self.road_m / self.duration_sec
+
+
+@dataclass(frozen=True)
+class EtaEstimate:
+    distance_m: float
+    duration_sec: int
+    basis: str  # 보정에 쓴 키: 시군구 / "*"(전국) / "default"
+
+
+class EtaEstimator:
+    """
+    직선거리 × 우회 비율 ÷ 평균 속도로 도로 거리/시간을 추정한다.
+
+    Tmap 응답을 볼 때마다 observe()로 시군구별 보정값을 쌓고 JSON 파일에 저장해 두었다가,
+    Tmap이 실패하거나 마감 시간을 넘긴 병원에 대신 쓴다.
+    표본이 ETA_MIN_SAMPLES보다 적은 시군구는 전국 값, 그것도 없으면 기본값을 쓴다.
+    observe()는 이벤트 루프에서 불리므로 save_every마다의 파일 저장은 전용 스레드에서 한다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        default_detour_factor: float = ETA_DEFAULT_DETOUR_FACTOR,
+        default_speed_kmh: float = ETA_DEFAULT_SPEED_KMH,
+        min_samples: int = ETA_MIN_SAMPLES,
+        save_every: int = ETA_SAVE_EVERY,
+        save_executor: Optional[Executor] = None,
+    ) -> None:
+        self.path = path
+        self.default_detour_factor = default_detour_factor
+        self.default_speed_mps = default_speed_kmh * 1000 / 3600
+        self.min_samples = max(1, min_samples)
+        self.save_every = save_every
+        self._lock = threading.Lock()
+        self._regions: Dict[str, RegionCalibration] = {}
+        self._unsaved = 0
+        self._save_executor = save_executor
+        self._save_scheduled = False
+        if path is not None:
+            self._load(path)
+
+    def _load(self, path: Path) -> None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            print(f"[ETA] calibration load failed path={path} error={exc!r}")
+            return
+        for key, values in (data.get("regions") or {}).items():
+            try:
+                self._regions[key] = RegionCalibration(**values)
+            except TypeError:
+                continue
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            payload = {
+                "regions": {
+                    key: {
+                        "samples": calibration.samples,
+                        "straight_m": round(calibration.straight_m, 1),
+                        "road_m": round(calibration.road_m, 1),
+                        "duration_sec": round(calibration.duration_sec, 1),
+                    }
+                    for key, calibration in sorted(self._regions.items())
+                }
+            }
+            self._unsaved = 0
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=1), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            print(f"[ETA] calibration save failed path={self.path} error={exc!r}")
+
+    def observe(
+        self,
+        region: Optional[str],
+        straight_m: float,
+        road_m: float,
+        duration_sec: float,
+    ) -> None:
+        if straight_m < MIN_CALIBRATION_STRAIGHT_M or road_m <= 0 or duration_sec <= 0:
+            return
+        with self._lock:
+            for key in (region, GLOBAL_REGION):
+                if key is None:
+                    continue
+                self._regions.setdefault(key, RegionCalibration()).add(
+                    straight_m, road_m, duration_sec
+                )
+            self._unsaved += 1
+            should_save = (
+                self.path is not None
+                and self.save_every > 0
+                and self._unsaved >= self.save_every
+                and not self._save_scheduled
+            )
+            if should_save:
+                self._save_scheduled = True
+                if self._save_executor is None:
+                    self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eta-save")
+                executor = self._save_executor
+        if should_save:
+            executor.submit(self._background_save)
+
+    def _background_save(self) -> None:
+        try:
+            self.save()
+        finally:
+            with self._lock:
+                self._save_scheduled = False
+
+    def _calibration(self, region: Optional[str]) -> Optional[tuple]:
+        for key in (region, GLOBAL_REGION):
+            if key is None:
+                continue
+            calibration = self._regions.get(key)
+            if calibration is not None and calibration.samples >= self.min_samples:
+                return key, calibration.detour_factor, calibration.speed_mps
+        return None
+
+    def estimate(self, region: Optional[str], straight_m: float) -> EtaEstimate:
+        with self._lock:
+            found = self._calibration(region)
+        if found is None:
+            basis, detour, speed = "default", self.default_detour_factor, self.default_speed_mps
+        else:
+            basis, detour, speed = found
+        distance_m = max(0.0, straight_m) * detour
+        return EtaEstimate(
+            distance_m=round(distance_m, 1),
+            duration_sec=int(round(distance_m / speed)),
+            basis=basis,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            calibrated = [
+                key
+                for key, calibration in self._regions.items()
+                if key != GLOBAL_REGION and calibration.samples >= self.min_samples
+            ]
+            national = self._regions.get(GLOBAL_REGION)
+            return {
+                "regions": len(self._regions) - (1 if national else 0),
+                "calibrated_regions": len(calibrated),
+                "samples": national.samples if national else 0,
+                "national_detour_factor": round(national.detour_factor, 3) if national else None,
+                "national_speed_kmh": round(national.speed_mps * 3.6, 1) if national else None,
+            }
+
+
+def build_eta_estimator_from_env() -> Optional[EtaEstimator]:
+    if not ETA_ESTIMATOR_ENABLED:
+        return None
+    path = Path(ETA_CALIBRATION_PATH) if ETA_CALIBRATION_PATH else None
+    return EtaEstimator(path=path)
@@ -1,13 +1,19 @@
 # app/main.py
+import contextvars
+import math
 import os
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import partial
 from io import BytesIO
 
 from fastapi import FastAPI, Query, Response, Body, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
-from typing import Dict, List, Literal, Set, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Literal, Set, Optional, Sequence, Tuple
 from fastapi import UploadFile, File # UploadFile, File 추가
 from app.stt_cleaner import (
     InvalidSTTAudioError,
@@ -19,16 +25,39 @@ from app.ktas_engine import SBARParseError
 from pydantic import BaseModel
 import requests
 
-from .services.ermct_client import ErmctClient
+from .services.circuit_breaker import (
+    build_ermct_circuit_breakers_from_env,
+    collect_stale_operations,
+)
+from .services.ermct_cache import build_ermct_cache_from_env
+from .services.ermct_client import AsyncErmctClient, ErmctClient
+from .services.rate_limiter import (
+    PRIORITY_BACKGROUND,
+    ErmctRateLimitError,
+    build_ermct_rate_limiter_from_env,
+    ermct_priority,
+    priority_for_ktas,
+)
+from .services.single_flight import SingleFlight
 from .services.sigungu_search import (
+    EXPANSION_MODES,
+    SIDO_CODE_TO_NAME,
     ExpansionPolicy,
     ProgressiveSearchResult,
     SigunguAdjacencyIndex,
     build_expansion_levels,
+    expand_sigungu,
     load_sigungu_adjacency,
+    load_sigungu_adjacency_artifact,
+    order_codes_by_distance,
     search_regions_progressively,
 )
+from .services.region_cache import build_region_cache_from_env
 from .services.region_resolver import KakaoRegionResolver
+from .services.sigungu_boundaries import LocalSigunguResolver, load_sigungu_boundary_index_from_env
+from .services.sigungu_er_index import load_sigungu_er_index_from_env
+from .services.spatial_index import SpatialIndex, build_hospital_spatial_index, region_from_address
+from .services.hospital_snapshot import HospitalSnapshotRefresher, HospitalSnapshotStore
 
 from app.schemas import (
     HospitalRealtime,
@@ -76,7 +105,21 @@ class TextKTASRequest(BaseModel):
     ktas_method: Literal["rule_based", "rag_based"] = "rule_based"
 
 # 3단계 import
-from .distance_logic import calculate_all_distances_async, get_top3, get_tmap_route_async
+from .route_geometry import encode_delta, encode_polyline, simplify_douglas_peucker
+from .distance_logic import (
+    NEAREST_PREFILTER_ENABLED,
+    NEAREST_PREFILTER_MARGIN,
+    NEAREST_TOP_N,
+    calculate_all_distances_async,
+    close_tmap_client,
+    eta_estimator,
+    get_top3,
+    get_tmap_route_async,
+    init_tmap_client,
+    prefilter_by_great_circle,
+    tmap_distance_cache,
+    tmap_route_cache,
+)
 
 SERIOUS_MKIOSK_KEYS = [f"MKioskTy{i}" for i in range(1, 28)]  # 1 ~ 27
 
@@ -92,55 +135,76 @@ SEOUL_SIGUNGU_LIST = [
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 SIGUNGU_ADJACENCY_PATH = DATA_DIR / "sigungu_adjacency.json"
-DEFAULT_EXPANSION_POLICY = ExpansionPolicy(top_touching_limit=3)
+# scripts/build_sigungu_adjacency_artifact.py 결과. JSON보다 새것일 때만 쓴다
+SIGUNGU_ADJACENCY_ARTIFACT_PATH = DATA_DIR / "sigungu_adjacency.bin"
+# 점진 확장 검색 정책 (adjacency: 1홉 인접 링, k_ring: BFS 다중 홉, nearest_n: centroid 거리 상위 N)
+SIGUNGU_EXPANSION_MODE = os.getenv("SIGUNGU_EXPANSION_MODE", "adjacency").strip().lower()
+SIGUNGU_EXPANSION_MAX_HOPS = int(os.getenv("SIGUNGU_EXPANSION_MAX_HOPS", "2"))
+SIGUNGU_EXPANSION_NEAREST_N = int(os.getenv("SIGUNGU_EXPANSION_NEAREST_N", "12"))
+SIGUNGU_EXPANSION_LEVEL_SIZE = int(os.getenv("SIGUNGU_EXPANSION_LEVEL_SIZE", "4"))
+DEFAULT_EXPANSION_POLICY = ExpansionPolicy(
+    top_touching_limit=3,
+    mode=SIGUNGU_EXPANSION_MODE if SIGUNGU_EXPANSION_MODE in EXPANSION_MODES else "adjacency",
+    max_hops=SIGUNGU_EXPANSION_MAX_HOPS,
+    nearest_n=SIGUNGU_EXPANSION_NEAREST_N,
+    level_size=SIGUNGU_EXPANSION_LEVEL_SIZE,
+)
 MAX_GLOBAL_FALLBACK_SIGUNGU = 5
 MAX_GLOBAL_FALLBACK_RAW_HOSPITALS = 20
 MAX_GLOBAL_FALLBACK_VALID_HOSPITALS = 10
 MAX_GLOBAL_FALLBACK_API_CALLS = 20
 MAX_GLOBAL_FALLBACK_SECONDS = 5.0
 MAX_GLOBAL_FALLBACK_TIMEOUTS = 2
+MAX_GLOBAL_FALLBACK_CONCURRENCY = 3
+# 지역 요약 1회당 ERMCT 호출 수: 실시간, 중증 수용, 외상센터, 기본정보 목록
+REGION_SUMMARY_API_CALLS = 4
+# 지역 요약 계산 시 ERMCT 호출 병렬 처리 설정
+# 지역 요약 1번(fan-out)마다 최대 ERMCT_FANOUT_WORKERS개 스레드의 전용 풀을 쓰고,
+# ERMCT_CALL_TIMEOUT_SECONDS는 호출이 실제로 시작된 시점부터 잰다.
+ERMCT_FANOUT_WORKERS = int(os.getenv("ERMCT_FANOUT_WORKERS", "8"))
+ERMCT_CALL_TIMEOUT_SECONDS = float(os.getenv("ERMCT_CALL_TIMEOUT_SECONDS", "8"))
+# 점진 확장 검색에서 한 레벨(인접 시군구들)을 동시에 조회한다.
+# 요청마다 SIGUNGU_FETCH_WORKERS개짜리 풀을 따로 만들어서 다른 요청의 조회 뒤에 줄 서지 않게 한다.
+SIGUNGU_PARALLEL_FETCH = os.getenv("SIGUNGU_PARALLEL_FETCH", "true").lower() in {"1", "true", "yes", "on"}
+SIGUNGU_FETCH_WORKERS = int(os.getenv("SIGUNGU_FETCH_WORKERS", "4"))
+# 레벨 N을 평가하는 동안 레벨 N+1 조회를 미리 시작 (SIGUNGU_PARALLEL_FETCH가 켜져 있어야 동작)
+SIGUNGU_PREFETCH_NEXT_LEVEL = os.getenv("SIGUNGU_PREFETCH_NEXT_LEVEL", "true").lower() in {"1", "true", "yes", "on"}
+# user_lat/user_lon이 있으면 행정구역 인접 링 대신 병원 좌표 공간 색인으로 후보 시군구를 고른다
+ROUTING_SPATIAL_SEARCH = os.getenv("ROUTING_SPATIAL_SEARCH", "true").lower() in {"1", "true", "yes", "on"}
+ROUTING_SPATIAL_INDEX_TTL_SECONDS = float(os.getenv("ROUTING_SPATIAL_INDEX_TTL_SECONDS", "21600"))
+ROUTING_SPATIAL_RINGS_KM = (5.0, 10.0, 20.0, 40.0)
+ROUTING_SPATIAL_NEAREST_K = 20
+# 색인 재구축 실패 시 다음 시도까지 기다리는 시간 (실패가 이어지면 두 배씩, 최대값까지)
+ROUTING_SPATIAL_INDEX_RETRY_SECONDS = float(os.getenv("ROUTING_SPATIAL_INDEX_RETRY_SECONDS", "30"))
+ROUTING_SPATIAL_INDEX_RETRY_MAX_SECONDS = float(os.getenv("ROUTING_SPATIAL_INDEX_RETRY_MAX_SECONDS", "1800"))
+hospital_location_index: Optional["HospitalLocationIndex"] = None
+_hospital_location_index_lock = threading.Lock()
+_hospital_location_index_building = False
+_hospital_location_index_failures = 0
+_hospital_location_index_next_attempt = 0.0
 sigungu_adjacency_index: Optional[SigunguAdjacencyIndex] = None
+# 시군구별 응급의료기관 수 + 0건 지역 negative cache (끄면 None)
+sigungu_er_index = load_sigungu_er_index_from_env()
 kakao_region_resolver = KakaoRegionResolver()
+# Kakao 앞 geohash 칸 캐시 (끄면 None)
+kakao_region_cache = build_region_cache_from_env(kakao_region_resolver)
+# 좌표 → 시군구: 로컬 경계 폴리곤 우선, 경계 밖이거나 파일이 없을 때만 Kakao
+sigungu_region_resolver = LocalSigunguResolver(
+    load_sigungu_boundary_index_from_env(),
+    fallback=kakao_region_cache or kakao_region_resolver,
+)
 
-SIDO_CODE_TO_NAME: Dict[str, str] = {
-    "11": "서울특별시",
-    "26": "부산광역시",
-    "27": "대구광역시",
-    "28": "인천광역시",
-    "29": "광주광역시",
-    "30": "대전광역시",
-    "31": "울산광역시",
-    "36": "세종특별자치시",
-    "41": "경기도",
-    "42": "강원특별자치도",
-    "43": "충청북도",
-    "44": "충청남도",
-    "45": "전북특별자치도",
-    "46": "전라남도",
-    "47": "경상북도",
-    "48": "경상남도",
-    "50": "제주특별자치도",
-}
-
-SIDO_CODE_TO_NAME = {
-    "11": "서울특별시",
-    "21": "부산광역시",
-    "22": "대구광역시",
-    "23": "인천광역시",
-    "24": "광주광역시",
-    "25": "대전광역시",
-    "26": "울산광역시",
-    "29": "세종특별자치시",
-    "31": "경기도",
-    "32": "강원특별자치도",
-    "33": "충청북도",
-    "34": "충청남도",
-    "35": "전북특별자치도",
-    "36": "전라남도",
-    "37": "경상북도",
-    "38": "경상남도",
-    "39": "제주특별자치도",
-}
+# 백그라운드 갱신 병원 스냅샷 (HOSPITAL_SNAPSHOT_ENABLED=true일 때만 요청 경로에서 사용)
+HOSPITAL_SNAPSHOT_ENABLED = os.getenv("HOSPITAL_SNAPSHOT_ENABLED", "").lower() in {"1", "true", "yes", "on"}
+HOSPITAL_SNAPSHOT_REFRESH_SECONDS = float(os.getenv("HOSPITAL_SNAPSHOT_REFRESH_SECONDS", "120"))
+HOSPITAL_SNAPSHOT_MAX_AGE_SECONDS = float(os.getenv("HOSPITAL_SNAPSHOT_MAX_AGE_SECONDS", "300"))
+HOSPITAL_SNAPSHOT_TARGETS = os.getenv("HOSPITAL_SNAPSHOT_TARGETS", "").strip()
+# 요청 경로에서 이 시간 안에 쓰인 시군구만 백그라운드 갱신한다 (0이면 스냅샷에 들어온 시군구 전부)
+HOSPITAL_SNAPSHOT_ACTIVE_SECONDS = float(os.getenv("HOSPITAL_SNAPSHOT_ACTIVE_SECONDS", "1800"))
+HOSPITAL_SNAPSHOT_REFRESH_WORKERS = int(os.getenv("HOSPITAL_SNAPSHOT_REFRESH_WORKERS", "4"))
+HOSPITAL_SNAPSHOT_NUM_ROWS = 200
+hospital_snapshot = HospitalSnapshotStore(max_age_seconds=HOSPITAL_SNAPSHOT_MAX_AGE_SECONDS)
+hospital_snapshot_refresher: Optional[HospitalSnapshotRefresher] = None
 
 
 def _get_all_seoul_summaries(sm_type: int = 1) -> List[HospitalSummary]:
@@ -196,7 +260,7 @@ def _get_all_indexed_summaries(sm_type: int = 1) -> List[HospitalSummary]:
         except Exception as exc:
             failure_count += 1
             error_text = sanitize_error_text(exc)
-            if "429" in error_text:
+            if _is_rate_limited(exc):
                 throttled_count += 1
 
             if len(failure_samples) < max_failure_samples:
@@ -228,6 +292,50 @@ def _get_all_indexed_summaries(sm_type: int = 1) -> List[HospitalSummary]:
     return all_summaries
 
 
+def _snapshot_refresh_targets() -> List[Tuple[str, str]]:
+    """
+    스냅샷 백그라운드 갱신 대상 (sido, sigungu) 목록.
+
+    - 기본(비어 있음): 요청 경로에서 최근 HOSPITAL_SNAPSHOT_ACTIVE_SECONDS 안에 쓰인 시군구만
+    - HOSPITAL_SNAPSHOT_TARGETS=서울특별시:강남구,...: 지정한 시군구 + 최근 쓰인 시군구
+    - HOSPITAL_SNAPSHOT_TARGETS=all: adjacency 인덱스의 전국 시군구 (한 주기에 약 250개 지역, 호출량 주의)
+    """
+    targets: List[Tuple[str, str]] = []
+
+    if HOSPITAL_SNAPSHOT_TARGETS.lower() == "all":
+        adjacency = _get_sigungu_adjacency_index()
+        for sigungu_code in adjacency.all_codes:
+            sigungu_name = adjacency.get_name(sigungu_code)
+            sido_code = adjacency.get_sido_code(sigungu_code)
+            sido_name = SIDO_CODE_TO_NAME.get(sido_code) if sido_code else None
+            if sigungu_name and sido_name:
+                targets.append((sido_name, sigungu_name))
+    elif HOSPITAL_SNAPSHOT_TARGETS:
+        for raw_target in HOSPITAL_SNAPSHOT_TARGETS.split(","):
+            sido, _, sigungu = raw_target.partition(":")
+            if sido.strip() and sigungu.strip():
+                targets.append((sido.strip(), sigungu.strip()))
+
+    targets.extend(
+        hospital_snapshot.region_targets(
+            active_within=HOSPITAL_SNAPSHOT_ACTIVE_SECONDS if HOSPITAL_SNAPSHOT_ACTIVE_SECONDS > 0 else None
+        )
+    )
+    return targets
+
+
+def _refresh_snapshot_region(sido: str, sigungu: str) -> List[HospitalSummary]:
+    # 백그라운드 갱신은 rate limiter에서 KTAS 라우팅 트래픽보다 뒤로 밀린다.
+    with ermct_priority(PRIORITY_BACKGROUND):
+        return _fetch_hospital_summaries_live(
+            sido=sido,
+            sigungu=sigungu,
+            sm_type=1,
+            num_rows=HOSPITAL_SNAPSHOT_NUM_ROWS,
+            include_messages=True,
+        )
+
+
 @dataclass
 class GlobalFallbackResult:
     candidates: List[RoutingCandidateHospital] = field(default_factory=list)
@@ -239,10 +347,151 @@ class GlobalFallbackResult:
 
 
 def _is_rate_limited(exc: Exception) -> bool:
+    if isinstance(exc, ErmctRateLimitError):
+        return True
     response = getattr(exc, "response", None)
     return getattr(response, "status_code", None) == 429 or "429" in str(exc)
 
 
+def _raise_if_rate_limited(errors: Dict[Hashable, BaseException]) -> None:
+    for exc in errors.values():
+        if isinstance(exc, Exception) and _is_rate_limited(exc):
+            raise exc
+
+
+def _gather_ermct_calls(
+    calls: Dict[Hashable, Callable[[], Any]],
+    timeout: Optional[float] = None,
+) -> Tuple[Dict[Hashable, Any], Dict[Hashable, BaseException]]:
+    """
+    ERMCT 호출들을 이번 fan-out 전용 풀(최대 ERMCT_FANOUT_WORKERS개)에서 동시에 실행하고
+    (성공 결과, 실패 예외)를 호출 key 기준으로 나눠서 돌려준다.
+
+    - timeout은 호출마다 실제로 시작된 시점부터 잰다 (풀 대기 시간은 세지 않는다).
+    - 시작 후 timeout 안에 끝나지 않은 호출은 requests.Timeout으로 기록한다.
+    - 앞 호출들이 늦어져 전체 상한(timeout × 차례 수)까지 시작도 못 한 호출은 취소하고 Timeout으로 기록한다.
+    """
+    if not calls:
+        return {}, {}
+
+    limit = ERMCT_CALL_TIMEOUT_SECONDS if timeout is None else timeout
+    workers = max(1, min(ERMCT_FANOUT_WORKERS, len(calls)))
+    batch_deadline = time.monotonic() + limit * math.ceil(len(calls) / workers)
+    started_at: Dict[Hashable, float] = {}
+
+    def run(key: Hashable, fn: Callable[[], Any]) -> Any:
+        started_at[key] = time.monotonic()
+        return fn()
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ermct-call")
+    results: Dict[Hashable, Any] = {}
+    errors: Dict[Hashable, BaseException] = {}
+    try:
+        # 호출마다 현재 컨텍스트(ERMCT 우선순위 등)를 복사해서 워커 스레드로 넘긴다.
+        futures = {
+            key: pool.submit(contextvars.copy_context().run, run, key, fn)
+            for key, fn in calls.items()
+        }
+        pending = dict(futures)
+        while pending:
+            now = time.monotonic()
+            deadlines = [
+                started_at[key] + limit if key in started_at else batch_deadline
+                for key in pending
+            ]
+            wait(
+                list(pending.values()),
+                timeout=max(0.0, min(deadlines) - now),
+                return_when=FIRST_COMPLETED,
+            )
+            now = time.monotonic()
+            for key, future in list(pending.items()):
+                if future.done():
+                    del pending[key]
+                    continue
+                started = started_at.get(key)
+                if started is not None and now >= started + limit:
+                    del pending[key]
+                    errors[key] = requests.Timeout(f"ERMCT call timed out after {limit}s")
+                elif started is None and now >= batch_deadline:
+                    future.cancel()
+                    del pending[key]
+                    errors[key] = requests.Timeout("ERMCT call did not start before the fan-out deadline")
+
+        for key, future in futures.items():
+            if key in errors:
+                continue
+            exc = future.exception()
+            if exc is not None:
+                errors[key] = exc
+            else:
+                results[key] = future.result()
+    finally:
+        # 시간을 넘긴 호출은 기다리지 않는다 (끝나면 스레드도 정리된다)
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results, errors
+
+
+# ---------- 지역 요약 부분 실패 표시 ----------
+
+_region_failures: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    "region_summary_failures", default=None
+)
+
+
+@contextmanager
+def collect_region_failures() -> Iterator[List[str]]:
+    """
+    이 블록 안에서 지역 요약을 만들다 일부 ERMCT 호출이 실패한 지역을 모은다.
+    (collect_stale_operations와 같은 방식으로 worker 스레드도 같은 리스트를 공유한다.)
+    """
+    collected: List[str] = []
+    token = _region_failures.set(collected)
+    try:
+        yield collected
+    finally:
+        _region_failures.reset(token)
+
+
+def _report_region_failures(sido: str, sigungu: str, failures: Sequence[str]) -> None:
+    collected = _region_failures.get()
+    if collected is None or not failures:
+        return
+    message = (
+        f"partial ERMCT data for {sido} {sigungu}: "
+        f"{len(failures)} call(s) failed ({'; '.join(failures[:3])})"
+    )
+    if message not in collected:
+        collected.append(message)
+
+
+# ---------- 응답에 실을 스냅샷 버전 ----------
+
+_snapshot_versions_read: contextvars.ContextVar[Optional[Set[int]]] = contextvars.ContextVar(
+    "hospital_snapshot_versions_read", default=None
+)
+
+
+@contextmanager
+def collect_snapshot_versions() -> Iterator[Set[int]]:
+    """
+    이 블록 안에서 지역 요약을 읽거나 넣은 스냅샷 버전을 모은다.
+    (응답을 만들 때 스토어를 다시 읽으면 그 사이 갱신된 버전이 나가므로 검색 중에 기록한다.)
+    """
+    collected: Set[int] = set()
+    token = _snapshot_versions_read.set(collected)
+    try:
+        yield collected
+    finally:
+        _snapshot_versions_read.reset(token)
+
+
+def _report_snapshot_version(version: Optional[int]) -> None:
+    collected = _snapshot_versions_read.get()
+    if collected is not None and version is not None:
+        collected.add(version)
+
+
 def _merge_candidates_by_hpid(
     existing: Sequence[RoutingCandidateHospital],
     additional: Sequence[RoutingCandidateHospital],
@@ -256,82 +505,196 @@ def _merge_candidates_by_hpid(
     )
 
 
+def _global_fallback_order(
+    adjacency: SigunguAdjacencyIndex,
+    base_sigungu_code: Optional[str],
+    searched_codes: Iterable[str],
+) -> List[str]:
+    # 환자 위치 기준 확장 정책 순서 → 나머지는 centroid 거리 순.
+    # 기준 시군구를 모르면 먼저 조회했던 시군구를 기준으로 삼고, 그것도 없으면 코드 순서 그대로.
+    searched = list(searched_codes)
+    anchor = base_sigungu_code if base_sigungu_code and adjacency.get_name(base_sigungu_code) else None
+    if anchor is None:
+        anchor = next((code for code in searched if adjacency.get_name(code)), None)
+    if anchor is not None:
+        codes = expand_sigungu(
+            anchor,
+            adjacency,
+            policy=DEFAULT_EXPANSION_POLICY,
+            fallback_codes=order_codes_by_distance(anchor, adjacency),
+        )
+    else:
+        codes = adjacency.all_codes
+    skip = set(searched)
+    codes = [code for code in codes if code not in skip]
+    # 빈 시군구는 MAX_GLOBAL_FALLBACK_SIGUNGU 예산을 쓰지 않도록 미리 뺀다
+    return sigungu_er_index.filter_codes(codes) if sigungu_er_index is not None else codes
+
+
 def _run_global_fallback(
     req: KTASRoutingRequest,
     complaint_id: int,
     required_groups: List[str],
     complaint_label: str,
+    base_sigungu_code: Optional[str] = None,
+    searched_codes: Iterable[str] = (),
 ) -> GlobalFallbackResult:
+    """
+    점진 확장 검색으로 후보를 못 찾았을 때 전국 범위로 넓혀 찾는 마지막 단계.
+
+    - 기준 시군구에서 확장 정책 순서 → 가까운 순서(order_codes_by_distance)로, 이미 조회한 시군구와
+      응급의료기관이 없는 시군구(sigungu_er_index)는 건너뛴다.
+    - 요청마다 MAX_GLOBAL_FALLBACK_CONCURRENCY개짜리 풀을 따로 만들어 최대 그만큼만 동시에 조회한다
+      (제출한 조회는 줄 서지 않고 바로 시작한다).
+    - 지금까지 가장 느렸던 지역 조회 시간 안에 끝낼 수 없으면 새 지역을 제출하지 않는다.
+    - MAX_GLOBAL_FALLBACK_SECONDS가 지나면 진행 중인 조회를 기다리지 않고 모은 것만 돌려준다.
+      버린 조회도 호출은 나간 것이므로 estimated_api_calls와 warnings에 남긴다.
+    - 결과는 완료 순서와 상관없이 지역 순서대로 합친다.
+    """
     adjacency = _get_sigungu_adjacency_index()
     result = GlobalFallbackResult()
-    candidates: List[RoutingCandidateHospital] = []
     started_at = time.monotonic()
+    deadline = started_at + MAX_GLOBAL_FALLBACK_SECONDS
     consecutive_timeouts = 0
+    slowest_region_seconds = 0.0
 
-    for sigungu_code in adjacency.all_codes:
+    pending_codes = iter(_global_fallback_order(adjacency, base_sigungu_code, searched_codes))
+    in_flight: Dict[Future, int] = {}
+    submitted_at: Dict[Future, float] = {}
+    candidates_by_order: Dict[int, List[RoutingCandidateHospital]] = {}
+    seen_hpids: set[str] = set()
+    submitted = 0
+    stop_submitting = False
+
+    def fetch_region(sigungu_code: str, sido_name: str, sigungu_name: str, num_rows: int) -> List[HospitalSummary]:
+        summaries = get_hospital_summaries_by_region(
+            sido=sido_name,
+            sigungu=sigungu_name,
+            sm_type=1,
+            num_rows=num_rows,
+            include_messages=False,
+        )
+        if sigungu_er_index is not None:
+            sigungu_er_index.record(sigungu_code, len(summaries))
+        return summaries
+
+    def budget_exhausted_reason() -> Optional[str]:
         if result.attempted_sigungu >= MAX_GLOBAL_FALLBACK_SIGUNGU:
-            result.reason = "sigungu_budget_exhausted"
-            break
+            return "sigungu_budget_exhausted"
         if result.raw_hospitals >= MAX_GLOBAL_FALLBACK_RAW_HOSPITALS:
-            result.reason = "raw_hospital_budget_exhausted"
-            break
-        if len(candidates) >= MAX_GLOBAL_FALLBACK_VALID_HOSPITALS:
-            result.reason = "valid_hospital_budget_exhausted"
-            break
-        if result.estimated_api_calls + 3 > MAX_GLOBAL_FALLBACK_API_CALLS:
-            result.reason = "api_call_budget_exhausted"
-            break
-        if time.monotonic() - started_at >= MAX_GLOBAL_FALLBACK_SECONDS:
-            result.reason = "time_budget_exhausted"
-            break
+            return "raw_hospital_budget_exhausted"
+        reserved_calls = (len(in_flight) + 1) * REGION_SUMMARY_API_CALLS
+        if result.estimated_api_calls + reserved_calls > MAX_GLOBAL_FALLBACK_API_CALLS:
+            return "api_call_budget_exhausted"
+        if time.monotonic() + slowest_region_seconds >= deadline:
+            return "time_budget_exhausted"
+        return None
 
-        sigungu_name = adjacency.get_name(sigungu_code)
-        sido_code = adjacency.get_sido_code(sigungu_code)
-        sido_name = SIDO_CODE_TO_NAME.get(sido_code) if sido_code else None
-        if not sigungu_name or not sido_name:
-            continue
+    def fill_in_flight() -> None:
+        nonlocal submitted, stop_submitting
+        while not stop_submitting and len(in_flight) < MAX_GLOBAL_FALLBACK_CONCURRENCY:
+            reason = budget_exhausted_reason()
+            if reason is not None:
+                result.reason = result.reason or reason
+                stop_submitting = True
+                return
+            sigungu_code = next(pending_codes, None)
+            if sigungu_code is None:
+                stop_submitting = True
+                return
+
+            sigungu_name = adjacency.get_name(sigungu_code)
+            sido_code = adjacency.get_sido_code(sigungu_code)
+            sido_name = SIDO_CODE_TO_NAME.get(sido_code) if sido_code else None
+            if not sigungu_name or not sido_name:
+                continue
 
-        result.attempted_sigungu += 1
-        remaining_raw = MAX_GLOBAL_FALLBACK_RAW_HOSPITALS - result.raw_hospitals
-        try:
-            summaries = get_hospital_summaries_by_region(
-                sido=sido_name,
-                sigungu=sigungu_name,
-                sm_type=1,
-                num_rows=min(200, remaining_raw),
-                include_messages=False,
+            result.attempted_sigungu += 1
+            remaining_raw = MAX_GLOBAL_FALLBACK_RAW_HOSPITALS - result.raw_hospitals
+            future = pool.submit(
+                contextvars.copy_context().run,
+                fetch_region,
+                sigungu_code,
+                sido_name,
+                sigungu_name,
+                min(200, remaining_raw),
             )
-            consecutive_timeouts = 0
-        except requests.Timeout as exc:
-            consecutive_timeouts += 1
-            result.warnings.append(sanitize_error_text(exc))
-            if consecutive_timeouts >= MAX_GLOBAL_FALLBACK_TIMEOUTS:
-                result.reason = "timeout_budget_exhausted"
-                break
-            continue
-        except Exception as exc:
-            result.warnings.append(sanitize_error_text(exc))
-            if _is_rate_limited(exc):
-                result.reason = "rate_limited"
+            in_flight[future] = submitted
+            submitted_at[future] = time.monotonic()
+            submitted += 1
+
+    pool = ThreadPoolExecutor(max_workers=MAX_GLOBAL_FALLBACK_CONCURRENCY, thread_name_prefix="global-fallback")
+    try:
+        fill_in_flight()
+        while in_flight:
+            done, _ = wait(
+                list(in_flight),
+                timeout=max(0.0, deadline - time.monotonic()),
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                result.reason = "time_budget_exhausted"
                 break
-            continue
 
-        result.raw_hospitals += len(summaries)
-        # Regional calls: realtime, serious acceptance, trauma centers; basic info per hospital.
-        result.estimated_api_calls += 3 + len(summaries)
-        region_candidates = _build_routing_candidates_from_summaries(
-            req=req,
-            complaint_id=complaint_id,
-            required_groups=required_groups,
-            complaint_label=complaint_label,
-            summaries=summaries,
+            hard_stop = False
+            for future in done:
+                order = in_flight.pop(future)
+                slowest_region_seconds = max(slowest_region_seconds, time.monotonic() - submitted_at.pop(future))
+                try:
+                    summaries = future.result()
+                    consecutive_timeouts = 0
+                except requests.Timeout as exc:
+                    consecutive_timeouts += 1
+                    result.warnings.append(sanitize_error_text(exc))
+                    if consecutive_timeouts >= MAX_GLOBAL_FALLBACK_TIMEOUTS:
+                        result.reason = "timeout_budget_exhausted"
+                        hard_stop = True
+                    continue
+                except Exception as exc:
+                    result.warnings.append(sanitize_error_text(exc))
+                    if _is_rate_limited(exc):
+                        result.reason = "rate_limited"
+                        hard_stop = True
+                    continue
+
+                result.raw_hospitals += len(summaries)
+                # Regional calls: realtime, serious acceptance, trauma centers, basic-info listing.
+                result.estimated_api_calls += REGION_SUMMARY_API_CALLS
+                region_candidates = _build_routing_candidates_from_summaries(
+                    req=req,
+                    complaint_id=complaint_id,
+                    required_groups=required_groups,
+                    complaint_label=complaint_label,
+                    summaries=summaries,
+                )
+                candidates_by_order[order] = region_candidates
+                seen_hpids.update(candidate.id for candidate in region_candidates)
+
+            if len(seen_hpids) >= MAX_GLOBAL_FALLBACK_VALID_HOSPITALS:
+                result.reason = "valid_hospital_budget_exhausted"
+                hard_stop = True
+            if hard_stop:
+                break
+            fill_in_flight()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    # 기다리지 않고 버리는 조회: 아직 시작 전이면 취소, 진행 중이면 호출은 나갔으니 비용으로 센다
+    abandoned = sum(1 for future in in_flight if not future.cancel())
+    if abandoned:
+        result.estimated_api_calls += abandoned * REGION_SUMMARY_API_CALLS
+        result.warnings.append(
+            f"global fallback abandoned {abandoned} in-flight region fetch(es) "
+            f"({abandoned * REGION_SUMMARY_API_CALLS} ERMCT calls) at {result.reason}"
         )
-        candidates = _merge_candidates_by_hpid(candidates, region_candidates)
-        candidates = candidates[:MAX_GLOBAL_FALLBACK_VALID_HOSPITALS]
+
+    candidates: List[RoutingCandidateHospital] = []
+    for order in sorted(candidates_by_order):
+        candidates = _merge_candidates_by_hpid(candidates, candidates_by_order[order])
 
     if result.reason is None:
         result.reason = "all_regions_exhausted"
-    result.candidates = candidates
+    result.candidates = candidates[:MAX_GLOBAL_FALLBACK_VALID_HOSPITALS]
     return result
 
 
@@ -402,7 +765,7 @@ def _resolve_current_region(req: KTASRoutingRequest) -> Tuple[Optional[str], Opt
 
     if req.user_lat is not None and req.user_lon is not None:
         try:
-            resolved = kakao_region_resolver.resolve_sigungu(req.user_lat, req.user_lon)
+            resolved = sigungu_region_resolver.resolve(req.user_lat, req.user_lon)
         except Exception as exc:
             print(f"[REGION RESOLVER] Kakao resolver failed: {exc}")
             return current_sigungu_code, None
@@ -411,6 +774,8 @@ def _resolve_current_region(req: KTASRoutingRequest) -> Tuple[Optional[str], Opt
             return current_sigungu_code, None
 
         code = current_sigungu_code
+        if not code and resolved.sigungu_code:
+            code = resolved.sigungu_code
         if not code:
             direct = adjacency.get_code(resolved.sigungu_name)
             if direct:
@@ -666,23 +1031,14 @@ def _build_stage1_response(stage1_result: dict) -> RoutingCandidateResponse:
     )
 
 
-def _search_routing_candidates_progressively(
+def _make_sigungu_candidate_fetcher(
     req: KTASRoutingRequest,
     complaint_id: int,
     required_groups: List[str],
     complaint_label: str,
-    base_sigungu_code: str,
     base_sido_name: Optional[str],
-) -> tuple[List[RoutingCandidateHospital], ProgressiveSearchResult[RoutingCandidateHospital]]:
-    adjacency = _get_sigungu_adjacency_index()
-    base_code = base_sigungu_code
-
-    levels = build_expansion_levels(
-        base_code=base_code,
-        adjacency_index=adjacency,
-        policy=DEFAULT_EXPANSION_POLICY,
-    )
-
+    adjacency: SigunguAdjacencyIndex,
+) -> Callable[[str], Sequence[RoutingCandidateHospital]]:
     def fetch_candidates(sigungu_code: str) -> Sequence[RoutingCandidateHospital]:
         sigungu_name = adjacency.get_name(sigungu_code)
         if not sigungu_name:
@@ -707,6 +1063,8 @@ def _search_routing_candidates_progressively(
             f"raw_summary_count={len(summaries)} "
             f"sample_hpids={[s.id for s in summaries[:5] if s.id]}"
         )
+        if sigungu_er_index is not None:
+            sigungu_er_index.record(sigungu_code, len(summaries))
         return _build_routing_candidates_from_summaries(
             req=req,
             complaint_id=complaint_id,
@@ -715,13 +1073,37 @@ def _search_routing_candidates_progressively(
             summaries=summaries,
         )
 
-    search_result = search_regions_progressively(
-        levels=levels,
-        fetch_valid_items=fetch_candidates,
-        item_key=lambda hospital: hospital.id,
-        min_valid_items=req.min_valid_hospitals,
-        code_to_name=adjacency.code_to_name,
+    return fetch_candidates
+
+
+def _run_progressive_search(
+    req: KTASRoutingRequest,
+    levels: List[List[str]],
+    fetch_candidates: Callable[[str], Sequence[RoutingCandidateHospital]],
+    adjacency: SigunguAdjacencyIndex,
+) -> tuple[List[RoutingCandidateHospital], ProgressiveSearchResult[RoutingCandidateHospital]]:
+    if sigungu_er_index is not None:
+        # 응급의료기관이 없는 시군구는 upstream을 부르지 않고 건너뛴다
+        levels = [level for level in map(sigungu_er_index.filter_codes, levels) if level]
+    level_executor = (
+        ThreadPoolExecutor(max_workers=SIGUNGU_FETCH_WORKERS, thread_name_prefix="sigungu-fetch")
+        if SIGUNGU_PARALLEL_FETCH
+        else None
     )
+    try:
+        search_result = search_regions_progressively(
+            levels=levels,
+            fetch_valid_items=fetch_candidates,
+            item_key=lambda hospital: hospital.id,
+            min_valid_items=req.min_valid_hospitals,
+            code_to_name=adjacency.code_to_name,
+            level_executor=level_executor,
+            prefetch_next_level=SIGUNGU_PREFETCH_NEXT_LEVEL,
+        )
+    finally:
+        if level_executor is not None:
+            # 버린 조회는 기다리지 않는다 (시작 전인 것은 search_regions_progressively가 이미 취소했다)
+            level_executor.shutdown(wait=False, cancel_futures=True)
 
     candidates = sorted(
         search_result.items,
@@ -729,6 +1111,84 @@ def _search_routing_candidates_progressively(
     )
     return candidates, search_result
 
+
+def _search_routing_candidates_progressively(
+    req: KTASRoutingRequest,
+    complaint_id: int,
+    required_groups: List[str],
+    complaint_label: str,
+    base_sigungu_code: str,
+    base_sido_name: Optional[str],
+) -> tuple[List[RoutingCandidateHospital], ProgressiveSearchResult[RoutingCandidateHospital]]:
+    adjacency = _get_sigungu_adjacency_index()
+    base_code = base_sigungu_code
+
+    levels = build_expansion_levels(
+        base_code=base_code,
+        adjacency_index=adjacency,
+        policy=DEFAULT_EXPANSION_POLICY,
+    )
+    fetch_candidates = _make_sigungu_candidate_fetcher(
+        req, complaint_id, required_groups, complaint_label, base_sido_name, adjacency
+    )
+    return _run_progressive_search(req, levels, fetch_candidates, adjacency)
+
+
+def _spatial_expansion_levels(
+    location_index: "HospitalLocationIndex",
+    lat: float,
+    lon: float,
+) -> List[List[str]]:
+    """
+    환자 좌표 기준 거리 링(ROUTING_SPATIAL_RINGS_KM)마다, 그 링 안에 병원이 있는 시군구를
+    가까운 병원 순서로 한 레벨로 묶는다. 반경 안에 병원이 하나도 없으면 가장 가까운
+    ROUTING_SPATIAL_NEAREST_K개 병원의 시군구를 마지막 링 밖 레벨로 쓴다.
+    """
+    index = location_index.index
+    hits = index.within_radius(lat, lon, ROUTING_SPATIAL_RINGS_KM[-1])
+    if not hits:
+        hits = index.nearest_k(lat, lon, ROUTING_SPATIAL_NEAREST_K)
+
+    levels: List[List[str]] = [[] for _ in range(len(ROUTING_SPATIAL_RINGS_KM) + 1)]
+    seen: Set[str] = set()
+    for hit in hits:
+        code = location_index.sigungu_codes.get(hit.point.key)
+        if not code or code in seen:
+            continue
+        seen.add(code)
+        ring = next(
+            (idx for idx, km in enumerate(ROUTING_SPATIAL_RINGS_KM) if hit.distance_km <= km),
+            len(ROUTING_SPATIAL_RINGS_KM),
+        )
+        levels[ring].append(code)
+    return [level for level in levels if level]
+
+
+def _search_routing_candidates_spatially(
+    req: KTASRoutingRequest,
+    complaint_id: int,
+    required_groups: List[str],
+    complaint_label: str,
+    base_sido_name: Optional[str],
+) -> Optional[tuple[List[RoutingCandidateHospital], ProgressiveSearchResult[RoutingCandidateHospital]]]:
+    """
+    행정구역 인접 링 대신 병원 좌표 KD-tree로 가까운 시군구부터 조회한다.
+    색인을 만들 수 없거나 주변에 색인된 병원이 없으면 None (호출 쪽이 인접 링으로 진행).
+    """
+    location_index = _get_hospital_location_index()
+    if location_index is None or req.user_lat is None or req.user_lon is None:
+        return None
+
+    levels = _spatial_expansion_levels(location_index, req.user_lat, req.user_lon)
+    if not levels:
+        return None
+
+    adjacency = _get_sigungu_adjacency_index()
+    fetch_candidates = _make_sigungu_candidate_fetcher(
+        req, complaint_id, required_groups, complaint_label, base_sido_name, adjacency
+    )
+    return _run_progressive_search(req, levels, fetch_candidates, adjacency)
+
 def _compute_coverage_score_and_level(
     required_groups: List[str],
     groups_with_beds: List[str],
@@ -865,31 +1325,269 @@ app.add_middleware(
 app.include_router(reservations_router)
 
 # 전역 클라이언트 인스턴스
-ermct_client = ErmctClient()
+# - ermct_client: 동기 엔드포인트/지역 요약 계산용
+# - async_ermct_client: 단순 조회 엔드포인트용 (커넥션 풀 재사용, threadpool 점유 없음)
+# - ermct_cache: 두 클라이언트가 공유하는 오퍼레이션별 TTL 응답 캐시 (ERMCT_CACHE_BACKEND=off면 None)
+# - ermct_rate_limiter: 두 클라이언트가 공유하는 토큰 버킷 + 일일 한도 (ERMCT_RATE_LIMIT_ENABLED=false면 None)
+# - ermct_circuit_breakers: 오퍼레이션별 회로 차단기 (ERMCT_CIRCUIT_ENABLED=false면 None)
+ermct_cache = build_ermct_cache_from_env()
+ermct_rate_limiter = build_ermct_rate_limiter_from_env()
+ermct_circuit_breakers = build_ermct_circuit_breakers_from_env()
+ermct_client = ErmctClient(
+    cache=ermct_cache,
+    rate_limiter=ermct_rate_limiter,
+    circuit_breakers=ermct_circuit_breakers,
+    # 지역 요약 fan-out이 동시에 여는 연결 수만큼 keep-alive로 유지한다
+    pool_maxsize=ERMCT_FANOUT_WORKERS,
+)
+async_ermct_client = AsyncErmctClient(
+    cache=ermct_cache,
+    rate_limiter=ermct_rate_limiter,
+    circuit_breakers=ermct_circuit_breakers,
+)
+# 같은 지역 요약을 동시에 요청하면 실시간 조회 1번을 나눠 쓴다.
+region_summary_flight = SingleFlight()
 
 @app.on_event("startup")
 async def startup_event():
-    global sigungu_adjacency_index
-    sigungu_adjacency_index = load_sigungu_adjacency(SIGUNGU_ADJACENCY_PATH)
+    global sigungu_adjacency_index, hospital_snapshot_refresher
+    sigungu_adjacency_index = _load_sigungu_adjacency_index()
     print(f" [Startup] Sigungu adjacency 로딩 완료: {len(sigungu_adjacency_index.all_codes)}개 코드")
+    init_tmap_client()
+    if ROUTING_SPATIAL_SEARCH:
+        # 첫 요청 전에 공간 색인 구축을 백그라운드로 시작한다
+        _get_hospital_location_index()
+
+    if HOSPITAL_SNAPSHOT_ENABLED:
+        hospital_snapshot_refresher = HospitalSnapshotRefresher(
+            store=hospital_snapshot,
+            fetch_region=_refresh_snapshot_region,
+            targets=_snapshot_refresh_targets,
+            interval_seconds=HOSPITAL_SNAPSHOT_REFRESH_SECONDS,
+            num_rows=HOSPITAL_SNAPSHOT_NUM_ROWS,
+            max_workers=HOSPITAL_SNAPSHOT_REFRESH_WORKERS,
+        )
+        hospital_snapshot_refresher.start()
+        print(
+            " [Startup] 병원 스냅샷 백그라운드 갱신 시작: "
+            f"targets={HOSPITAL_SNAPSHOT_TARGETS or 'recent'} "
+            f"workers={HOSPITAL_SNAPSHOT_REFRESH_WORKERS} "
+            f"interval={HOSPITAL_SNAPSHOT_REFRESH_SECONDS}s"
+        )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    global hospital_snapshot_refresher
+    if hospital_snapshot_refresher is not None:
+        hospital_snapshot_refresher.stop()
+        hospital_snapshot_refresher = None
+    await async_ermct_client.aclose()
+    ermct_client.close()
+    await close_tmap_client()
+    if eta_estimator is not None:
+        eta_estimator.save()
+    if kakao_region_cache is not None:
+        kakao_region_cache.save()
+    if sigungu_er_index is not None:
+        sigungu_er_index.save()
+
+
+def _load_sigungu_adjacency_index() -> SigunguAdjacencyIndex:
+    artifact = SIGUNGU_ADJACENCY_ARTIFACT_PATH
+    index = None
+    if artifact.exists() and artifact.stat().st_mtime >= SIGUNGU_ADJACENCY_PATH.stat().st_mtime:
+        try:
+            index = load_sigungu_adjacency_artifact(artifact)
+        except (OSError, ValueError) as exc:
+            print(f"[SIGUNGU] adjacency artifact load failed path={artifact} error={exc!r}")
+    if index is None:
+        index = load_sigungu_adjacency(SIGUNGU_ADJACENCY_PATH)
+    # 요청마다 정렬하지 않도록 거리 행렬과 기본 정책의 확장 계획을 미리 만든다
+    index.distance_matrix
+    index.expansion_plans(DEFAULT_EXPANSION_POLICY)
+    return index
 
 
 def _get_sigungu_adjacency_index() -> SigunguAdjacencyIndex:
     global sigungu_adjacency_index
     if sigungu_adjacency_index is None:
-        sigungu_adjacency_index = load_sigungu_adjacency(SIGUNGU_ADJACENCY_PATH)
+        sigungu_adjacency_index = _load_sigungu_adjacency_index()
     return sigungu_adjacency_index
 
+
+@dataclass(frozen=True)
+class HospitalLocationIndex:
+    index: SpatialIndex[HospitalBasicInfo]
+    # HPID → sigungu_adjacency.json 시군구 코드 (주소로 판별)
+    sigungu_codes: Dict[str, str]
+    built_at: float
+
+
+def _sido_key(name: str) -> str:
+    # "충청북도" / "충북", "전라북도" / "전북특별자치도" 를 같은 키로
+    name = name.strip()
+    if len(name) == 4 and name.endswith("도") and name[2] in {"남", "북"}:
+        return name[0] + name[2]
+    return name[:2]
+
+
+def _match_sigungu_codes(
+    adjacency: SigunguAdjacencyIndex,
+    hospitals: Sequence[HospitalBasicInfo],
+) -> Dict[str, str]:
+    codes_by_name: Dict[str, List[str]] = {}
+    for code, name in adjacency.code_to_name.items():
+        codes_by_name.setdefault(name.replace(" ", ""), []).append(code)
+
+    matched: Dict[str, str] = {}
+    for hospital in hospitals:
+        region = region_from_address(hospital.address)
+        if region is None:
+            continue
+        sido, sigungu = region
+        codes = codes_by_name.get(sigungu.replace(" ", ""), [])
+        if len(codes) > 1:
+            # 중구/동구처럼 여러 시도에 있는 이름은 시도로 가른다
+            codes = [
+                code
+                for code in codes
+                if _sido_key(SIDO_CODE_TO_NAME.get(adjacency.get_sido_code(code) or "", "")) == _sido_key(sido)
+            ]
+        if len(codes) == 1:
+            matched[hospital.id] = codes[0]
+    return matched
+
+
+def _build_hospital_location_index() -> None:
+    global hospital_location_index, _hospital_location_index_building
+    global _hospital_location_index_failures, _hospital_location_index_next_attempt
+    try:
+        hospitals = list(ermct_client.get_basic_info_bulk().values())
+        index = build_hospital_spatial_index(hospitals)
+        sigungu_codes = _match_sigungu_codes(_get_sigungu_adjacency_index(), hospitals)
+    except Exception as exc:
+        with _hospital_location_index_lock:
+            _hospital_location_index_failures += 1
+            delay = min(
+                ROUTING_SPATIAL_INDEX_RETRY_MAX_SECONDS,
+                ROUTING_SPATIAL_INDEX_RETRY_SECONDS * 2 ** (_hospital_location_index_failures - 1),
+            )
+            _hospital_location_index_next_attempt = time.time() + delay
+            _hospital_location_index_building = False
+        print(
+            f"[SPATIAL INDEX] build failed: {sanitize_error_text(exc)} "
+            f"failures={_hospital_location_index_failures} retry_in={delay:.0f}s"
+        )
+        return
+
+    with _hospital_location_index_lock:
+        hospital_location_index = HospitalLocationIndex(
+            index=index,
+            sigungu_codes=sigungu_codes,
+            built_at=time.time(),
+        )
+        _hospital_location_index_failures = 0
+        _hospital_location_index_next_attempt = 0.0
+        _hospital_location_index_building = False
+    print(
+        "[SPATIAL INDEX] built "
+        f"hospitals={len(index)} matched_sigungu={len(sigungu_codes)}"
+    )
+
+
+def _get_hospital_location_index() -> Optional[HospitalLocationIndex]:
+    """
+    전국 응급의료기관 기본정보(좌표) 목록으로 만든 공간 색인.
+
+    요청은 색인 구축을 기다리지 않는다. 색인이 없거나 ROUTING_SPATIAL_INDEX_TTL_SECONDS가 지났으면
+    백그라운드 스레드로 다시 만들기 시작하고, 그동안은 지금 색인(없으면 None)을 돌려준다.
+    구축이 실패하면 직전 색인을 계속 쓰고, 다음 시도는 ROUTING_SPATIAL_INDEX_RETRY_SECONDS부터
+    두 배씩 늘려 미룬다.
+    """
+    global _hospital_location_index_building
+    now = time.time()
+    with _hospital_location_index_lock:
+        current = hospital_location_index
+        if current is not None and now - current.built_at < ROUTING_SPATIAL_INDEX_TTL_SECONDS:
+            return current
+        if _hospital_location_index_building or now < _hospital_location_index_next_attempt:
+            return current
+        _hospital_location_index_building = True
+
+    threading.Thread(
+        target=_build_hospital_location_index,
+        name="spatial-index-build",
+        daemon=True,
+    ).start()
+    return current
+
 @app.get("/health")
 def health_check():
-    return {"status": "ok"}
+    response: Dict[str, Any] = {"status": "ok"}
+    if ermct_circuit_breakers is not None:
+        # 회로가 열린 ERMCT 오퍼레이션이 있으면 degraded (서버 자체는 응답 가능)
+        response["ermct_circuits"] = ermct_circuit_breakers.status()
+        if ermct_circuit_breakers.any_open():
+            response["status"] = "degraded"
+    return response
+
+
+@app.get("/debug/metrics")
+def get_debug_metrics():
+    """
+    캐시 적중률 등 내부 성능 지표
+    """
+    return {
+        "ermct_cache": ermct_cache.stats() if ermct_cache is not None else None,
+        "tmap_distance_cache": (
+            tmap_distance_cache.stats() if tmap_distance_cache is not None else None
+        ),
+        "tmap_route_cache": tmap_route_cache.stats() if tmap_route_cache is not None else None,
+        "eta_estimator": eta_estimator.stats() if eta_estimator is not None else None,
+        "sigungu_region_resolver": sigungu_region_resolver.stats(),
+        "kakao_region_cache": kakao_region_cache.stats() if kakao_region_cache is not None else None,
+        "sigungu_er_index": sigungu_er_index.stats() if sigungu_er_index is not None else None,
+        "ermct_rate_limit": (
+            ermct_rate_limiter.status() if ermct_rate_limiter is not None else None
+        ),
+        "single_flight": {
+            "ermct_client": ermct_client.single_flight.stats(),
+            "async_ermct_client": async_ermct_client.single_flight.stats(),
+            "region_summaries": region_summary_flight.stats(),
+        },
+    }
+
+
+@app.get("/api/ermct/quota")
+def get_ermct_quota_status():
+    """
+    data.go.kr ERMCT 오퍼레이션별 오늘 사용량/남은 일일 한도와 토큰 버킷 상태
+    """
+    if ermct_rate_limiter is None:
+        return {"enabled": False}
+    return {"enabled": True, **ermct_rate_limiter.status()}
+
+
+@app.get("/api/hospitals/snapshot")
+def get_hospital_snapshot_status():
+    """
+    백그라운드 병원 스냅샷의 버전/갱신 시각 등 신선도 정보
+    """
+    status = hospital_snapshot.status()
+    status["enabled"] = HOSPITAL_SNAPSHOT_ENABLED
+    status["refresh_interval_seconds"] = HOSPITAL_SNAPSHOT_REFRESH_SECONDS
+    status["last_cycle"] = (
+        hospital_snapshot_refresher.last_cycle if hospital_snapshot_refresher else None
+    )
+    return status
 
 
 @app.get(
     "/api/hospitals/realtime",
     response_model=list[HospitalRealtime],
 )
-def get_realtime_hospitals(
+async def get_realtime_hospitals(
     sido: str = Query(..., description="시도명 (예: 서울특별시)"),
     sigungu: str = Query(..., description="시군구명 (예: 강남구)"),
     num_rows: int = Query(50, ge=1, le=200),
@@ -897,7 +1595,7 @@ def get_realtime_hospitals(
     """
     특정 시/군/구 기준 실시간 응급실 가용 병상 정보 반환
     """
-    return ermct_client.get_realtime_beds(
+    return await async_ermct_client.get_realtime_beds(
         sido=sido,
         sigungu=sigungu,
         num_rows=num_rows,
@@ -928,14 +1626,14 @@ def debug_realtime_xml(
     "/api/hospitals/basic",
     response_model=HospitalBasicInfo | None,
 )
-def get_hospital_basic(
+async def get_hospital_basic(
     hpid: str = Query(..., description="병원 기관 코드 (HPID, 예: A1100010)"),
 ):
     """
     HPID 기준 응급의료기관 기본정보 조회
     (주소, 대표전화, 응급실 전화, 위경도 등)
     """
-    return ermct_client.get_basic_info(hpid=hpid)
+    return await async_ermct_client.get_basic_info(hpid=hpid)
 
 
 # --------------------------------------------------------------------
@@ -945,7 +1643,7 @@ def get_hospital_basic(
     "/api/hospitals/serious",
     response_model=list[SeriousDiseaseStatus],
 )
-def get_serious_hospitals(
+async def get_serious_hospitals(
     sido: str = Query(..., description="시도명 (예: 서울특별시)"),
     sigungu: str = Query(..., description="시군구명 (예: 강남구)"),
     sm_type: int = Query(
@@ -961,7 +1659,7 @@ def get_serious_hospitals(
     - MKioskTyXX: 각 중증질환 카테고리의 수용 가능/불가 상태
     - MKioskTyXXMsg: 해당 상태에 대한 상세 메시지
     """
-    return ermct_client.get_serious_acceptance(
+    return await async_ermct_client.get_serious_acceptance(
         sido=sido,
         sigungu=sigungu,
         sm_type=sm_type,
@@ -977,7 +1675,7 @@ def get_serious_hospitals(
     "/api/hospitals/messages",
     response_model=list[HospitalMessage],
 )
-def get_hospital_messages(
+async def get_hospital_messages(
     hpid: str = Query(..., description="병원 기관 코드 (HPID, 예: A1100010)"),
     num_rows: int = Query(10, ge=1, le=100),
     page_no: int = Query(1, ge=1),
@@ -988,7 +1686,7 @@ def get_hospital_messages(
     - 장비 고장, 병상 과밀, 특정 중증질환 수용 불가 등 메시지
     - symBlkMsg / symBlkMsgTyp / symTypCod / symTypCodMag 등 포함
     """
-    return ermct_client.get_emergency_messages(
+    return await async_ermct_client.get_emergency_messages(
         hpid=hpid,
         num_rows=num_rows,
         page_no=page_no,
@@ -1028,6 +1726,12 @@ def get_hospital_summary(
     - messages: getEmrrmSrsillDissMsgInqire (응급실/중증 관련 메시지)
     """
 
+    # 0) 스냅샷에 최신 요약이 있으면 네트워크 없이 반환
+    if HOSPITAL_SNAPSHOT_ENABLED:
+        cached_summary = hospital_snapshot.get_hospital(hpid)
+        if cached_summary is not None:
+            return cached_summary
+
     # 1) 기본정보 (HPID 기반)
     basic = ermct_client.get_basic_info(hpid=hpid)
 
@@ -1161,28 +1865,153 @@ def get_hospital_summaries_by_region(
     """
     특정 시/군/구 내 모든 응급의료기관에 대한 통합 요약 정보 리스트
 
-    - basic: getEgytBassInfoInqire (기본정보)
+    - basic: getEgytListInfoInqire (응급의료기관 지역 목록)
     - realtime: getEmrrmRltmUsefulSckbdInfoInqire (실시간 가용 병상)
     - serious: getSrsillDissAceptncPosblInfoInqire (중증질환 수용 가능정보)
     - messages: getEmrrmSrsillDissMsgInqire (응급실/중증 관련 메시지)
+
+    HOSPITAL_SNAPSHOT_ENABLED=true면 백그라운드 스냅샷에서 먼저 읽고,
+    스냅샷에 없거나 오래된 지역만 실시간으로 조회한다.
     """
 
-    # 1) 해당 지역 실시간 병상 정보 → 병원 리스트(HPID)
-    realtime_list: List[HospitalRealtime] = ermct_client.get_realtime_beds(
-        sido=sido,
-        sigungu=sigungu,
-        num_rows=num_rows,
-        page_no=1,
+    if HOSPITAL_SNAPSHOT_ENABLED:
+        cached, version = hospital_snapshot.lookup_region(
+            sido=sido,
+            sigungu=sigungu,
+            sm_type=sm_type,
+            num_rows=num_rows,
+            include_messages=include_messages,
+        )
+        if cached is not None:
+            _report_snapshot_version(version)
+            return cached
+
+    flight_key = (sido.strip(), sigungu.strip(), sm_type, num_rows, include_messages)
+    summaries, version = region_summary_flight.do(
+        flight_key,
+        lambda: _fetch_and_store_region_summaries(
+            sido=sido,
+            sigungu=sigungu,
+            sm_type=sm_type,
+            num_rows=num_rows,
+            include_messages=include_messages,
+        ),
     )
+    _report_snapshot_version(version)
+    # 같은 요청을 공유한 호출자끼리 리스트를 건드려도 서로 영향이 없도록 복사해서 돌려준다.
+    return list(summaries)
 
-    # 2) 해당 지역 중증질환 수용 가능 정보 한 번에 조회
-    serious_list: List[SeriousDiseaseStatus] = ermct_client.get_serious_acceptance(
+
+def _fetch_and_store_region_summaries(
+    sido: str,
+    sigungu: str,
+    sm_type: int,
+    num_rows: int,
+    include_messages: bool,
+) -> Tuple[List[HospitalSummary], Optional[int]]:
+    """실시간 조회 결과와, 스냅샷에 넣었다면 그 버전 (스냅샷 비활성화 시 None)."""
+    summaries = _fetch_hospital_summaries_live(
         sido=sido,
         sigungu=sigungu,
         sm_type=sm_type,
         num_rows=num_rows,
-        page_no=1,
+        include_messages=include_messages,
+    )
+
+    version: Optional[int] = None
+    if HOSPITAL_SNAPSHOT_ENABLED:
+        version = hospital_snapshot.put_region(
+            sido=sido,
+            sigungu=sigungu,
+            summaries=summaries,
+            sm_type=sm_type,
+            num_rows=num_rows,
+            include_messages=include_messages,
+        )
+
+    return summaries, version
+
+
+_LISTED_BASIC_INFO_FIELDS = ("name", "address", "phone", "emergency_phone", "latitude", "longitude")
+
+
+def _merge_listed_basic_info(
+    detail: Optional[HospitalBasicInfo],
+    listed: Optional[HospitalBasicInfo],
+) -> Optional[HospitalBasicInfo]:
+    """
+    getEgytBassInfoInqire 기본정보에 getEgytListInfoInqire 목록의 이름/주소/전화/좌표를 보탠다.
+    목록에는 MKioskTy 플래그가 없으므로 raw_fields는 항상 기본정보 쪽을 쓴다
+    (기본정보 조회가 실패하면 플래그 없이 목록 값만 남는다).
+    """
+    if detail is None or listed is None:
+        return detail or listed
+    updates = {
+        name: getattr(listed, name)
+        for name in _LISTED_BASIC_INFO_FIELDS
+        if getattr(detail, name) is None and getattr(listed, name) is not None
+    }
+    return detail.model_copy(update=updates) if updates else detail
+
+
+def _fetch_hospital_summaries_live(
+    sido: str,
+    sigungu: str,
+    sm_type: int = 1,
+    num_rows: int = 200,
+    include_messages: bool = True,
+) -> List[HospitalSummary]:
+    """
+    스냅샷을 거치지 않고 ERMCT API를 직접 호출해 시군구 요약 리스트를 만든다.
+    (백그라운드 스냅샷 갱신과 스냅샷 miss 시에 사용)
+
+    - 지역 단위 호출(실시간/중증/외상센터/기본정보 목록)은 동시에 보내고
+    - 기본정보 목록에 없는 병원의 개별 기본정보, 병원별 메시지 호출은
+      이번 fan-out 전용 풀에서 병렬로 처리한다 (_gather_ermct_calls).
+    - 실시간 병상 조회 실패, 429 응답은 예외로 올려 보내고
+      그 외 부가 정보 실패는 해당 값만 비운 채 경고로 남긴다
+      (collect_region_failures 블록 안이면 라우팅 응답 warnings에도 실린다).
+    """
+    failures: List[str] = []
+
+    # 1) 실시간 병상 / 중증질환 수용 가능 정보 / 외상센터 목록 / 기본정보 목록 동시 조회
+    regional, regional_errors = _gather_ermct_calls(
+        {
+            "realtime": lambda: ermct_client.get_realtime_beds(
+                sido=sido,
+                sigungu=sigungu,
+                num_rows=num_rows,
+                page_no=1,
+            ),
+            "serious": lambda: ermct_client.get_serious_acceptance(
+                sido=sido,
+                sigungu=sigungu,
+                sm_type=sm_type,
+                num_rows=num_rows,
+                page_no=1,
+            ),
+            "trauma": lambda: ermct_client.get_trauma_centers(
+                sido=sido,
+                sigungu=sigungu,
+                num_rows=200,
+                page_no=1,
+            ),
+            "basic_bulk": lambda: ermct_client.get_basic_info_bulk(
+                sido=sido,
+                sigungu=sigungu,
+            ),
+        }
     )
+    if "realtime" in regional_errors:
+        raise regional_errors["realtime"]
+    _raise_if_rate_limited(regional_errors)
+
+    realtime_list: List[HospitalRealtime] = regional["realtime"]
+    serious_list: List[SeriousDiseaseStatus] = regional.get("serious", [])
+    trauma_list: List[TraumaCenter] = regional.get("trauma", [])
+    listed_by_hpid: Dict[str, HospitalBasicInfo] = regional.get("basic_bulk", {})
+    for key, exc in regional_errors.items():
+        failures.append(f"{key}: {sanitize_error_text(exc)}")
 
     # 2-1) 중증 정보 HPID -> SeriousDiseaseStatus 매핑
     serious_by_hpid: Dict[str, SeriousDiseaseStatus] = {}
@@ -1200,45 +2029,58 @@ def get_hospital_summaries_by_region(
         if s_hpid:
             serious_by_hpid[s_hpid] = s
 
-    # 2-2) 외상센터 목록도 한 번만 조회해서 HPID set으로
-    trauma_list: List[TraumaCenter] = ermct_client.get_trauma_centers(
-        sido=sido,
-        sigungu=sigungu,
-        num_rows=200,
-        page_no=1,
-    )
+    # 2-2) 외상센터 HPID set
     trauma_hpids: Set[str] = {t.id for t in trauma_list if t.id}
 
-    results: List[HospitalSummary] = []
+    # 2-3) 실시간 병상 리스트 순서대로 중복 없는 HPID 목록
+    unique_realtime: List[HospitalRealtime] = []
     seen: Set[str] = set()
+    for r in realtime_list:
+        if not r.id or r.id in seen:
+            continue
+        seen.add(r.id)
+        unique_realtime.append(r)
+
+    # 2-4) 병원별 기본정보 / 메시지 병렬 조회
+    # 기본정보의 MKioskTy 플래그는 getEgytBassInfoInqire에만 있어서 목록이 있어도 병원별로 조회한다
+    # (기본정보 응답은 ERMCT 캐시에 24시간 남으므로 실제 upstream 호출은 하루 한 번꼴이다).
+    per_hospital_calls: Dict[Tuple[str, str], Callable[[], object]] = {}
+    for r in unique_realtime:
+        per_hospital_calls[("basic", r.id)] = partial(ermct_client.get_basic_info, hpid=r.id)
+        if include_messages:
+            per_hospital_calls[("messages", r.id)] = partial(
+                ermct_client.get_emergency_messages,
+                hpid=r.id,
+                num_rows=50,
+                page_no=1,
+            )
+    per_hospital, per_hospital_errors = _gather_ermct_calls(per_hospital_calls)
+    _raise_if_rate_limited(per_hospital_errors)
+    for (call_name, hpid), exc in per_hospital_errors.items():
+        failures.append(f"{call_name}[{hpid}]: {sanitize_error_text(exc)}")
+
+    if failures:
+        print(
+            "[WARN] region summary partial failure "
+            f"sido={sido} sigungu={sigungu} count={len(failures)} "
+            f"samples={failures[:5]}"
+        )
+        _report_region_failures(sido, sigungu, failures)
+
+    results: List[HospitalSummary] = []
 
     # 3) 실시간 병상 리스트 기준으로 병원별 summary 구성
-    for r in realtime_list:
+    for r in unique_realtime:
         hpid = r.id
-        if not hpid or hpid in seen:
-            continue
-        seen.add(hpid)
 
-        # (1) 기본 정보
-        basic = ermct_client.get_basic_info(hpid=hpid)
+        # (1) 기본 정보 (개별 조회 기준, 비어 있는 이름/주소/전화/좌표만 목록 값으로 채움)
+        basic = _merge_listed_basic_info(per_hospital.get(("basic", hpid)), listed_by_hpid.get(hpid))
 
         # (2) 중증 정보: 미리 만든 매핑에서 가져오기
         serious = serious_by_hpid.get(hpid)
 
-        # (3) 응급실/중증 메시지 (외부 API 5xx 등은 무시하고 계속 진행)
-        messages: List[HospitalMessage] = []
-        if include_messages:
-            try:
-                messages = ermct_client.get_emergency_messages(
-                    hpid=hpid,
-                    num_rows=50,
-                    page_no=1,
-                )
-            except Exception as exc:
-                print(
-                    f"[WARN] get_emergency_messages failed for {hpid}: "
-                    f"{sanitize_error_text(exc)}"
-                )
+        # (3) 응급실/중증 메시지 (실패 시 빈 리스트)
+        messages: List[HospitalMessage] = per_hospital.get(("messages", hpid)) or []
 
         # (4) 이름 결정 (basic → realtime → messages 순)
         name: Optional[str] = None
@@ -1374,12 +2216,12 @@ def recommend_hospitals(triage: TriageRequest = Body(...)):
 # 7) 중증 외상센터 정보
 # --------------------------------------------------------------------
 @app.get("/api/hospitals/trauma/by-region", response_model=List[TraumaCenter])
-def get_trauma_by_region(
+async def get_trauma_by_region(
     sido: str,
     sigungu: str,
     num_rows: int = 50,
 ):
-    return ermct_client.get_trauma_centers(
+    return await async_ermct_client.get_trauma_centers(
         sido=sido,
         sigungu=sigungu,
         num_rows=num_rows,
@@ -1725,7 +2567,30 @@ def route_from_ktas_seoul(req: KTASRoutingRequest = Body(...)):
     - chief_complaint에 해당하는 complaint_id(1~10)를 커버하고
     - 해당 procedure group 기준 effective_beds > 0 인 병원만
       RoutingCandidateHospital 리스트로 반환.
+
+    KTAS 1~2 요청의 ERMCT 호출은 rate limiter에서 critical 우선순위로 처리된다.
+    회로 차단 때문에 캐시의 오래된 값을 쓴 오퍼레이션, 일부 호출이 실패한 지역 요약은 warnings에 표시한다.
     """
+    with (
+        ermct_priority(priority_for_ktas(req.ktas_level)),
+        collect_stale_operations() as stale_operations,
+        collect_region_failures() as region_failures,
+        collect_snapshot_versions() as snapshot_versions,
+    ):
+        response = _route_from_ktas_seoul(req)
+
+    # 검색 중 실제로 읽은 스냅샷 중 가장 새 버전 (지역을 하나도 안 읽었으면 null)
+    if HOSPITAL_SNAPSHOT_ENABLED and snapshot_versions:
+        response.snapshot_version = max(snapshot_versions)
+
+    response.warnings.extend(
+        f"stale ERMCT data (circuit open): {operation}" for operation in stale_operations
+    )
+    response.warnings.extend(region_failures)
+    return response
+
+
+def _route_from_ktas_seoul(req: KTASRoutingRequest) -> RoutingCandidateResponse:
 
     # 1) chief_complaint → complaint_id
     complaint_id = complaint_id_from_chief_complaint(req.chief_complaint)
@@ -1769,7 +2634,20 @@ def route_from_ktas_seoul(req: KTASRoutingRequest = Body(...)):
         f"resolved_sido_name={current_sido_name!r}"
     )
 
-    if current_sigungu_code:
+    search_mode: Optional[str] = None
+    if ROUTING_SPATIAL_SEARCH and req.user_lat is not None and req.user_lon is not None:
+        spatial = _search_routing_candidates_spatially(
+            req=req,
+            complaint_id=complaint_id,
+            required_groups=required_groups,
+            complaint_label=complaint_label,
+            base_sido_name=current_sido_name,
+        )
+        if spatial is not None:
+            candidates, progressive_result = spatial
+            search_mode = "spatial"
+
+    if search_mode is None and current_sigungu_code:
         candidates, progressive_result = _search_routing_candidates_progressively(
             req=req,
             complaint_id=complaint_id,
@@ -1778,6 +2656,7 @@ def route_from_ktas_seoul(req: KTASRoutingRequest = Body(...)):
             base_sigungu_code=current_sigungu_code,
             base_sido_name=current_sido_name,
         )
+        search_mode = "adjacency"
 
     fallback_used = False
     fallback_reason: Optional[str] = None
@@ -1801,6 +2680,14 @@ def route_from_ktas_seoul(req: KTASRoutingRequest = Body(...)):
             complaint_id=complaint_id,
             required_groups=required_groups,
             complaint_label=complaint_label,
+            base_sigungu_code=current_sigungu_code,
+            searched_codes=(
+                attempt.sigungu_code
+                for attempt in progressive_result.attempts
+                if attempt.fetch_status == "success"
+            )
+            if progressive_result
+            else (),
         )
         candidates = _merge_candidates_by_hpid(candidates, fallback_result.candidates)
         fallback_reason = fallback_result.reason
@@ -1838,7 +2725,20 @@ def route_from_ktas_seoul(req: KTASRoutingRequest = Body(...)):
                 f"[SIGUNGU SEARCH] level={attempt.level} code={attempt.sigungu_code} "
                 f"name={attempt.sigungu_name} status={attempt.fetch_status} "
                 f"raw_count={attempt.raw_count} "
-                f"candidate_count={attempt.fetched_count} valid_total={attempt.valid_count}"
+                f"candidate_count={attempt.fetched_count} valid_total={attempt.valid_count} "
+                f"elapsed_ms={attempt.elapsed_ms}"
+            )
+        wasted = [
+            attempt
+            for attempt in progressive_result.attempts
+            if attempt.fetch_status in {"prefetch_discarded", "prefetch_cancelled"}
+        ]
+        if wasted:
+            print(
+                "[SIGUNGU PREFETCH] wasted "
+                f"discarded={sum(a.fetch_status == 'prefetch_discarded' for a in wasted)} "
+                f"cancelled={sum(a.fetch_status == 'prefetch_cancelled' for a in wasted)} "
+                f"elapsed_ms={round(sum(a.elapsed_ms or 0.0 for a in wasted), 1)}"
             )
 
     return RoutingCandidateResponse(
@@ -1846,6 +2746,7 @@ def route_from_ktas_seoul(req: KTASRoutingRequest = Body(...)):
         case=routing_case,
         hospitals=candidates,
         search_status=search_status,
+        search_mode=search_mode,
         fallback_used=fallback_used,
         fallback_reason=fallback_reason,
         warnings=warnings,
@@ -1870,6 +2771,7 @@ async def route_seoul_nearest(
             "name": h.name,
             "latitude": h.latitude,
             "longitude": h.longitude,
+            "address": h.address,
             "coverage_score": h.coverage_score,
             "priority_score": h.priority_score,
             "reason_summary": h.reason_summary,
@@ -1877,21 +2779,39 @@ async def route_seoul_nearest(
         for h in req.hospitals
     ]
 
-    # 2) Tmap API로 모든 후보 병원까지 거리/시간 계산
+    # 2) 직선거리(시군구별 추정 도로 거리)로 가까운 TOP3 + 여유분만 남겨서 Tmap 호출 수를 줄인다
+    prefilter_pruned: Optional[int] = None
+    if NEAREST_PREFILTER_ENABLED:
+        hospitals_payload, prefilter_pruned = prefilter_by_great_circle(
+            user_lat=req.user_lat,
+            user_lon=req.user_lon,
+            hospitals=hospitals_payload,
+            keep=NEAREST_TOP_N + max(0, NEAREST_PREFILTER_MARGIN),
+            estimator=eta_estimator,
+        )
+
+    # 3) Tmap API로 남은 후보 병원까지 거리/시간 계산 (경로도 같이 받아 둔다)
+    route_paths: Optional[Dict[str, Dict[str, Any]]] = {} if tmap_route_cache is not None else None
     results = await calculate_all_distances_async(
         user_lat=req.user_lat,
         user_lon=req.user_lon,
         hospitals=hospitals_payload,
+        route_paths=route_paths,
     )
+    distance_cache_hits = sum(1 for result in results if result.get("cached"))
+    distance_estimated = sum(1 for result in results if result.get("estimated"))
     print(
         "[ROUTE NEAREST] "
-        f"input_hospitals={len(req.hospitals)} distance_results={len(results)}"
+        f"input_hospitals={len(req.hospitals)} tmap_requests={len(hospitals_payload) - distance_cache_hits} "
+        f"prefilter_pruned={prefilter_pruned} distance_cache_hits={distance_cache_hits} "
+        f"distance_estimated={distance_estimated} "
+        f"distance_results={len(results)}"
     )
 
-    # 3) 거리 기준 상위 3개만 선택
+    # 4) 거리 기준 상위 3개만 선택
     top3_results = get_top3(results)
 
-    # 4) HPID 기준으로 매핑하고, 실제 TMAP 정렬 결과 순서를 유지
+    # 5) HPID 기준으로 매핑하고, 실제 TMAP 정렬 결과 순서를 유지
     hospital_by_id = {hospital.id: hospital for hospital in req.hospitals}
 
     top3_hospitals: List[RoutingCandidateHospital] = []
@@ -1906,16 +2826,30 @@ async def route_seoul_nearest(
         data["distance"] = float(result["distance"])
         duration = result.get("duration_sec")
         data["duration_sec"] = int(duration) if duration is not None else None
+        if result.get("estimated"):
+            data["distance_source"] = "estimate"
+        else:
+            data["distance_source"] = "cache" if result.get("cached") else "tmap"
 
         top3_hospitals.append(RoutingCandidateHospital(**data))
 
-    # 5) followup_id는 그대로 유지, 병원 리스트만 top3로 교체
+        # 프론트가 TOP3 중 하나의 경로를 바로 요청하므로 받은 경로를 남겨 둔다
+        route = route_paths.get(hospital.id) if route_paths else None
+        if route and hospital.latitude is not None and hospital.longitude is not None:
+            tmap_route_cache.set(
+                req.user_lat, req.user_lon, hospital.id, hospital.latitude, hospital.longitude, route
+            )
+
+    # 6) followup_id는 그대로 유지, 병원 리스트만 top3로 교체
     return RoutingCandidateResponse(
         followup_id=req.followup_id,
         case=req.case,
         user_lat=req.user_lat,
         user_lon=req.user_lon,
         hospitals=top3_hospitals,
+        prefilter_pruned=prefilter_pruned,
+        distance_cache_hits=distance_cache_hits if tmap_distance_cache is not None else None,
+        distance_estimated=distance_estimated if eta_estimator is not None else None,
     )
 
 
@@ -1924,20 +2858,46 @@ async def route_seoul_nearest(
     response_model=RoutePathResponse,
 )
 async def get_route_path(req: RoutePathRequest = Body(...)):
-    route = await get_tmap_route_async(
-        start_lat=req.start_lat,
-        start_lon=req.start_lon,
-        end_lat=req.end_lat,
-        end_lon=req.end_lon,
-    )
+    route = None
+    route_source = "tmap"
+    if req.hospital_id and tmap_route_cache is not None:
+        route = tmap_route_cache.get(
+            req.start_lat, req.start_lon, req.hospital_id, req.end_lat, req.end_lon
+        )
+        if route is not None:
+            route_source = "cache"
+
+    if route is None:
+        route = await get_tmap_route_async(
+            start_lat=req.start_lat,
+            start_lon=req.start_lon,
+            end_lat=req.end_lat,
+            end_lon=req.end_lon,
+        )
 
     if not route:
         raise HTTPException(status_code=502, detail="Tmap route calculation failed")
 
+    points = [(point["lat"], point["lon"]) for point in route["path"]]
+    if req.simplify_tolerance_m:
+        points = simplify_douglas_peucker(points, req.simplify_tolerance_m)
+
+    encoded: Dict[str, Any]
+    if req.path_format == "polyline":
+        encoded = {"encoded_path": encode_polyline(points, req.precision), "precision": req.precision}
+    elif req.path_format == "delta":
+        encoded = {"delta_path": encode_delta(points, req.precision), "precision": req.precision}
+    else:
+        encoded = {"path": [RoutePathPoint(lat=lat, lon=lon) for lat, lon in points]}
+
     return RoutePathResponse(
-        path=[RoutePathPoint(**point) for point in route["path"]],
         distance=float(route["distance"]),
         duration_sec=int(route["duration_sec"]),
+        route_source=route_source,
+        path_format=req.path_format,
+        point_count=len(points),
+        original_point_count=len(route["path"]),
+        **encoded,
     )
 
 
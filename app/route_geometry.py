@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import math
+from typing import List, Sequence, Tuple
+
+# 경로 좌표 압축/단순화 도구.
+# 점은 (lat, lon) 튜플. Tmap path의 {"lat", "lon"} dict는 호출하는 쪽에서 바꿔 넘긴다.
+
+EARTH_RADIUS_M = 6371008.8
+DEFAULT_PRECISION = 5  # 소수점 5자리 ≈ 1.1m
+
+
+def _project(points: Sequence[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    # 경로 하나 범위에서는 첫 점 기준 등장방형 투영으로 충분하다 (m 단위 평면 좌표)
+    if not points:
+        return []
+    lat0 = math.radians(points[0][0])
+    cos_lat0 = math.cos(lat0)
+    return [
+        (
+            math.radians(lon) * cos_lat0 * EARTH_RADIUS_M,
+            math.radians(lat) * EARTH_RADIUS_M,
+        )
+        for lat, lon in points
+    ]
+
+
+def _segment_distance_sq(
+    p: Tuple[float, float], a: Tuple[float, float], b: Tuple[float, float]
+) -> float:
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0.0:
+        return (p[0] - a[0]) ** 2 + (p[1] - a[1]) ** 2
+    t = max(0.0, min(1.0, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / length_sq))
+    cx, cy = a[0] + t * dx, a[1] + t * dy
+    return (p[0] - cx) ** 2 + (p[1] - cy) ** 2
+
+
+def simplify_douglas_peucker(
+    points: Sequence[Tuple[float, float]],
+    tolerance_m: float,
+) -> List[Tuple[float, float]]:
+    """
+    Douglas–Peucker 단순화. 남은 선분에서 tolerance_m보다 멀리 떨어진 점만 남긴다.
+    양 끝점은 항상 유지하고, 긴 경로에서도 재귀 깊이 걱정이 없게 스택으로 돈다.
+    """
+    if tolerance_m <= 0 or len(points) <= 2:
+        return list(points)
+
+    projected = _project(points)
+    tolerance_sq = tolerance_m * tolerance_m
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        farthest, farthest_sq = -1, tolerance_sq
+        for index in range(first + 1, last):
+            dist_sq = _segment_distance_sq(projected[index], projected[first], projected[last])
+            if dist_sq > farthest_sq:
+                farthest, farthest_sq = index, dist_sq
+        if farthest >= 0:
+            keep[farthest] = True
+            stack.append((first, farthest))
+            stack.append((farthest, last))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def _quantize(points: Sequence[Tuple[float, float]], precision: int) -> List[Tuple[int, int]]:
+    factor = 10 ** precision
+    return [(int(round(lat * factor)), int(round(lon * factor))) for lat, lon in points]
+
+
+def encode_polyline(points: Sequence[Tuple[float, float]], precision: int = DEFAULT_PRECISION) -> str:
+    """Google encoded polyline 알고리즘 문자열 (위도, 경도 순서)."""
+    chunks: List[str] = []
+    prev_lat = prev_lon = 0
+    for lat, lon in _quantize(points, precision):
+        for delta in (lat - prev_lat, lon - prev_lon):
+            value = ~(delta << 1) if delta < 0 else delta << 1
+            while value >= 0x20:
+                chunks.append(chr((0x20 | (value & 0x1F)) + 63))
+                value >>= 5
+            chunks.append(chr(value + 63))
+        prev_lat, prev_lon = lat, lon
+    return "".join(chunks)
+
+
+def decode_polyline(encoded: str, precision: int = DEFAULT_PRECISION) -> List[Tuple[float, float]]:
+    factor = 10 ** precision
+    points: List[Tuple[float, float]] = []
+    index = lat = lon = 0
+    while index < len(encoded):
+        deltas = []
+        for _ in range(2):
+            shift = result = 0
+            while True:
+                byte = ord(encoded[index]) - 63
+                index += 1
+                result |= (byte & 0x1F) << shift
+                shift += 5
+                if byte < 0x20:
+                    break
+            deltas.append(~(result >> 1) if result & 1 else result >> 1)
+        lat += deltas[0]
+        lon += deltas[1]
+        points.append((lat / factor, lon / factor))
+    return points
+
+
+def encode_delta(points: Sequence[Tuple[float, float]], precision: int = DEFAULT_PRECISION) -> List[int]:
+    """
+    [lat0, lon0, dlat1, dlon1, ...] 정수 배열. 첫 점은 10^precision 배 절대값,
+    나머지는 직전 점과의 차이라서 JSON 숫자가 대부분 1~3자리로 짧아진다.
+    """
+    flat: List[int] = []
+    prev_lat = prev_lon = 0
+    for lat, lon in _quantize(points, precision):
+        flat.append(lat - prev_lat)
+        flat.append(lon - prev_lon)
+        prev_lat, prev_lon = lat, lon
+    return flat
+
+
+def decode_delta(flat: Sequence[int], precision: int = DEFAULT_PRECISION) -> List[Tuple[float, float]]:
+    factor = 10 ** precision
+    points: List[Tuple[float, float]] = []
+    lat = lon = 0
+    for index in range(0, len(flat) - 1, 2):
+        lat += flat[index]
+        lon += flat[index + 1]
+        points.append((lat / factor, lon / factor))
+    return points
@@ -75,7 +75,7 @@ class HospitalRealtime(BaseModel):
 
 
 class HospitalBasicInfo(BaseModel):
-    """getEgytBassInfoInqire 응답 래핑"""
+    """getEgytBassInfoInqire(HPID 단건) / getEgytListInfoInqire(지역 목록) 응답 래핑"""
 
     id: str                                # hpid / emcOrgCod
     name: Optional[str] = None             # dutyName
@@ -324,11 +324,11 @@ class KTASRoutingRequest(BaseModel):
     )
     user_lat: Optional[float] = Field(
         default=None,
-        description="사용자 위도. 현재는 저장만 하며, 이후 실제 거리 기반 정렬 확장용",
+        description="사용자 위도. user_lon과 함께 주어지면 병원 좌표 공간 색인으로 후보 시군구를 고른다",
     )
     user_lon: Optional[float] = Field(
         default=None,
-        description="사용자 경도. 현재는 저장만 하며, 이후 실제 거리 기반 정렬 확장용",
+        description="사용자 경도. user_lat과 함께 주어지면 병원 좌표 공간 색인으로 후보 시군구를 고른다",
     )
     min_valid_hospitals: int = Field(
         default=3,
@@ -394,6 +394,13 @@ class RoutingCandidateHospital(BaseModel):
         None,
         description="예상 이동 시간(초, Tmap 결과)",
     )
+    distance_source: Optional[Literal["tmap", "cache", "estimate"]] = Field(
+        None,
+        description=(
+            "distance/duration_sec 출처 (tmap: 이번 요청에서 호출, cache: Tmap 거리 캐시 적중, "
+            "estimate: Tmap 실패/마감 초과로 직선거리 기반 추정값)"
+        ),
+    )
 
 
 class RoutingCandidateResponse(BaseModel):
@@ -422,8 +429,28 @@ class RoutingCandidateResponse(BaseModel):
         "fallback_partial",
         "fallback_exhausted",
     ]] = None
+    search_mode: Optional[Literal["spatial", "adjacency"]] = Field(
+        default=None,
+        description="후보 시군구 선택 방식: spatial(좌표 공간 색인) / adjacency(행정구역 인접 링)",
+    )
     fallback_used: bool = False
     warnings: List[str] = Field(default_factory=list)
+    prefilter_pruned: Optional[int] = Field(
+        default=None,
+        description="nearest 라우팅에서 직선거리 사전 필터로 Tmap 호출 전에 제외한 후보 수",
+    )
+    distance_cache_hits: Optional[int] = Field(
+        default=None,
+        description="nearest 라우팅에서 Tmap 호출 없이 거리 캐시로 채운 후보 수",
+    )
+    distance_estimated: Optional[int] = Field(
+        default=None,
+        description="nearest 라우팅에서 Tmap 대신 ETA 추정값으로 채운 후보 수",
+    )
+    snapshot_version: Optional[int] = Field(
+        default=None,
+        description="후보 계산에 사용한 병원 스냅샷 버전 (스냅샷 비활성화 시 null)",
+    )
 
 class NearestRoutingRequest(RoutingCandidateResponse):
     user_lat: float
@@ -435,6 +462,23 @@ class RoutePathRequest(BaseModel):
     start_lon: float
     end_lat: float
     end_lon: float
+    hospital_id: Optional[str] = Field(
+        None,
+        description="목적지 병원 HPID. 주면 nearest 라우팅 때 받아 둔 경로를 재사용한다",
+    )
+    path_format: Literal["points", "polyline", "delta"] = Field(
+        "points",
+        description=(
+            "points: path에 {lat, lon} 목록(기본), polyline: encoded_path에 Google encoded polyline, "
+            "delta: delta_path에 [lat0, lon0, dlat1, dlon1, ...] 정수 배열"
+        ),
+    )
+    precision: int = Field(5, ge=1, le=7, description="polyline/delta 좌표 소수점 자릿수")
+    simplify_tolerance_m: Optional[float] = Field(
+        None,
+        ge=0,
+        description="Douglas–Peucker 단순화 허용 오차(m). 없거나 0이면 단순화하지 않는다",
+    )
 
 
 class RoutePathPoint(BaseModel):
@@ -446,3 +490,13 @@ class RoutePathResponse(BaseModel):
     path: List[RoutePathPoint] = Field(default_factory=list)
     distance: float = Field(..., description="총 거리(m)")
     duration_sec: int = Field(..., description="총 이동 시간(초)")
+    route_source: Optional[Literal["tmap", "cache"]] = Field(
+        None,
+        description="경로 출처 (tmap: 이번 요청에서 호출, cache: nearest 라우팅 때 받아 둔 경로)",
+    )
+    path_format: Literal["points", "polyline", "delta"] = "points"
+    encoded_path: Optional[str] = Field(None, description="path_format=polyline일 때 경로")
+    delta_path: Optional[List[int]] = Field(None, description="path_format=delta일 때 경로")
+    precision: Optional[int] = Field(None, description="encoded_path/delta_path 좌표 소수점 자릿수")
+    point_count: Optional[int] = Field(None, description="단순화 후 응답에 담긴 좌표 수")
+    original_point_count: Optional[int] = Field(None, description="Tmap 원본 좌표 수")
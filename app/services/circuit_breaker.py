@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+import requests
+
+
+ERMCT_CIRCUIT_ENABLED = os.getenv("ERMCT_CIRCUIT_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+ERMCT_CIRCUIT_FAILURE_RATE = float(os.getenv("ERMCT_CIRCUIT_FAILURE_RATE", "0.5"))
+ERMCT_CIRCUIT_MIN_CALLS = int(os.getenv("ERMCT_CIRCUIT_MIN_CALLS", "5"))
+ERMCT_CIRCUIT_WINDOW = int(os.getenv("ERMCT_CIRCUIT_WINDOW", "20"))
+ERMCT_CIRCUIT_OPEN_SECONDS = float(os.getenv("ERMCT_CIRCUIT_OPEN_SECONDS", "30"))
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class ErmctCircuitOpenError(requests.RequestException):
+    """회로가 열려 있고 대신 돌려줄 캐시 값도 없을 때 upstream 호출 없이 바로 실패."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(
+            f"ERMCT circuit open for {name} (retry in {retry_after:.1f}s)"
+        )
+
+
+class CircuitBreaker:
+    """
+    오퍼레이션 하나에 대한 closed / open / half-open 회로 차단기.
+
+    - closed: 최근 window_size번 호출 중 min_calls 이상 쌓였고 실패율이
+      failure_rate_threshold 이상이면 open
+    - open: open_seconds 동안 호출을 막는다
+    - half-open: 시험 호출 1개만 내보내서 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = ERMCT_CIRCUIT_FAILURE_RATE,
+        min_calls: int = ERMCT_CIRCUIT_MIN_CALLS,
+        window_size: int = ERMCT_CIRCUIT_WINDOW,
+        open_seconds: float = ERMCT_CIRCUIT_OPEN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = max(1, min_calls)
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._window: Deque[bool] = deque(maxlen=max(self.min_calls, window_size))
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.open_count = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if self._state == STATE_OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._state = STATE_HALF_OPEN
+            self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self._state = STATE_OPEN
+        self._opened_at = self._clock()
+        self._probe_in_flight = False
+        self._window.clear()
+        self.open_count += 1
+
+    def retry_after(self) -> float:
+        with self._lock:
+            if self._state != STATE_OPEN:
+                return 0.0
+            return max(0.0, self.open_seconds - (self._clock() - self._opened_at))
+
+    def allow(self) -> bool:
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == STATE_CLOSED:
+                return True
+            if self._state == STATE_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == STATE_HALF_OPEN:
+                self._state = STATE_CLOSED
+                self._probe_in_flight = False
+                self._window.clear()
+                return
+            self._window.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == STATE_HALF_OPEN:
+                self._open()
+                return
+            if self._state == STATE_OPEN:
+                return
+            self._window.append(False)
+            failures = self._window.count(False)
+            if (
+                len(self._window) >= self.min_calls
+                and failures / len(self._window) >= self.failure_rate_threshold
+            ):
+                self._open()
+
+    def release(self) -> None:
+        """성공/실패로 치지 않는 결과(로컬 rate limit 등) — half-open 시험 슬롯만 돌려준다."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            self._maybe_half_open()
+            calls = len(self._window)
+            failures = self._window.count(False)
+            return {
+                "state": self._state,
+                "recent_calls": calls,
+                "recent_failure_rate": round(failures / calls, 3) if calls else 0.0,
+                "open_count": self.open_count,
+                "rejected": self.rejected,
+            }
+
+
+class CircuitBreakerRegistry:
+    """오퍼레이션 이름별 CircuitBreaker를 필요할 때 만들어 들고 있는다."""
+
+    def __init__(self, factory: Callable[[str], CircuitBreaker] = CircuitBreaker) -> None:
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._factory(name)
+                self._breakers[name] = breaker
+            return breaker
+
+    def any_open(self) -> bool:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return any(breaker.state != STATE_CLOSED for breaker in breakers)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.status() for name, breaker in sorted(breakers.items())}
+
+
+def build_ermct_circuit_breakers_from_env() -> Optional[CircuitBreakerRegistry]:
+    if not ERMCT_CIRCUIT_ENABLED:
+        return None
+    return CircuitBreakerRegistry()
+
+
+# ---------- stale 응답 표시 ----------
+
+_stale_operations: ContextVar[Optional[List[str]]] = ContextVar("ermct_stale_operations", default=None)
+
+
+@contextmanager
+def collect_stale_operations() -> Iterator[List[str]]:
+    """
+    이 블록 안에서 회로 차단 때문에 캐시의 오래된 값으로 대신 응답한 오퍼레이션 이름을 모은다.
+    (스레드풀로 넘어간 호출도 copy_context로 같은 리스트를 공유한다.)
+    """
+    collected: List[str] = []
+    token = _stale_operations.set(collected)
+    try:
+        yield collected
+    finally:
+        _stale_operations.reset(token)
+
+
+def mark_stale(name: str) -> None:
+    collected = _stale_operations.get()
+    if collected is not None and name not in collected:
+        collected.append(name)
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Protocol
+
+
+ERMCT_CACHE_BACKEND = os.getenv("ERMCT_CACHE_BACKEND", "memory").strip().lower()
+ERMCT_CACHE_PATH = os.getenv("ERMCT_CACHE_PATH", "data/ermct_cache.sqlite3")
+ERMCT_CACHE_MAX_ENTRIES = int(os.getenv("ERMCT_CACHE_MAX_ENTRIES", "5000"))
+
+# 오퍼레이션별 기본 TTL(초).
+# 기본정보/외상센터 목록은 거의 바뀌지 않고, 중증 수용/메시지는 분 단위,
+# 실시간 병상은 초 단위로 바뀐다.
+DEFAULT_ERMCT_CACHE_TTLS: Dict[str, float] = {
+    "getEmrrmRltmUsefulSckbdInfoInqire": 10.0,
+    "getSrsillDissAceptncPosblInfoInqire": 60.0,
+    "getEmrrmSrsillDissMsgInqire": 60.0,
+    "getEgytBassInfoInqire": 24 * 3600.0,
+    "getEgytListInfoInqire": 24 * 3600.0,
+    "getStrmListInfoInqire": 24 * 3600.0,
+}
+
+_TTL_ENV_NAMES: Dict[str, str] = {
+    "getEmrrmRltmUsefulSckbdInfoInqire": "ERMCT_CACHE_TTL_REALTIME",
+    "getSrsillDissAceptncPosblInfoInqire": "ERMCT_CACHE_TTL_SERIOUS",
+    "getEmrrmSrsillDissMsgInqire": "ERMCT_CACHE_TTL_MESSAGES",
+    "getEgytBassInfoInqire": "ERMCT_CACHE_TTL_BASIC",
+    "getEgytListInfoInqire": "ERMCT_CACHE_TTL_BASIC",
+    "getStrmListInfoInqire": "ERMCT_CACHE_TTL_TRAUMA",
+}
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    value: Any
+    stored_at: float
+    expires_at: float
+
+
+class CacheBackend(Protocol):
+    evictions: int
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        ...
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+
+class MemoryCacheBackend:
+    """
+    프로세스 메모리 LRU. max_entries를 넘으면 가장 오래 안 쓴 항목부터 내보낸다.
+    """
+
+    def __init__(self, max_entries: int = ERMCT_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, max_entries)
+        self.evictions = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteCacheBackend:
+    """
+    SQLite 파일 기반 LRU. 재시작해도 정적 데이터(기본정보/외상센터)를 다시 받지 않도록 한다.
+    값은 pickle로 저장하므로 신뢰할 수 있는 로컬 경로에만 둘 것.
+    """
+
+    def __init__(self, path: str | Path, max_entries: int = ERMCT_CACHE_MAX_ENTRIES) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max(1, max_entries)
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ermct_cache ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at, expires_at FROM ermct_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE ermct_cache SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._conn.commit()
+        try:
+            value = pickle.loads(row[0])
+        except Exception:
+            return None
+        return CacheEntry(value=value, stored_at=row[1], expires_at=row[2])
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        blob = pickle.dumps(entry.value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ermct_cache"
+                " (key, value, stored_at, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, blob, entry.stored_at, entry.expires_at, time.time()),
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM ermct_cache").fetchone()
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM ermct_cache WHERE key IN ("
+                    " SELECT key FROM ermct_cache ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+                self.evictions += overflow
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM ermct_cache")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM ermct_cache").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def cache_key(path: str, params: Mapping[str, Any]) -> str:
+    # serviceKey는 키에 넣지 않는다 (디스크에 키가 남지 않도록).
+    items = sorted(
+        (str(name), str(value))
+        for name, value in params.items()
+        if name != "serviceKey" and value is not None
+    )
+    return json.dumps([path, items], ensure_ascii=False, separators=(",", ":"))
+
+
+class ErmctResponseCache:
+    """
+    ERMCT 오퍼레이션(path) + 요청 파라미터 단위 응답 캐시.
+
+    TTL이 지난 항목은 miss로 취급하지만 backend에서 바로 지우지는 않는다.
+    (LRU로 밀려날 때까지 남아 있어서, 필요하면 get_stale()로 꺼내 쓸 수 있다.)
+    TTL이 0 이하인 오퍼레이션은 캐시하지 않는다.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.backend: CacheBackend = backend if backend is not None else MemoryCacheBackend()
+        self.ttls: Dict[str, float] = dict(DEFAULT_ERMCT_CACHE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def ttl_for(self, path: str) -> float:
+        return float(self.ttls.get(path, self.default_ttl))
+
+    def _count(self, path: str, name: str) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(path, {"hits": 0, "misses": 0, "stores": 0})
+            counters[name] += 1
+
+    def get(self, path: str, params: Mapping[str, Any]) -> Optional[Any]:
+        if self.ttl_for(path) <= 0:
+            return None
+        entry = self.backend.get(cache_key(path, params))
+        if entry is None or entry.expires_at <= self._clock():
+            self._count(path, "misses")
+            return None
+        self._count(path, "hits")
+        return entry.value
+
+    def get_stale(self, path: str, params: Mapping[str, Any]) -> Optional[CacheEntry]:
+        """TTL과 무관하게 남아 있는 마지막 값을 돌려준다."""
+        return self.backend.get(cache_key(path, params))
+
+    def set(self, path: str, params: Mapping[str, Any], value: Any) -> None:
+        ttl = self.ttl_for(path)
+        if ttl <= 0:
+            return
+        now = self._clock()
+        self.backend.set(
+            cache_key(path, params),
+            CacheEntry(value=value, stored_at=now, expires_at=now + ttl),
+        )
+        self._count(path, "stores")
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            operations = {path: dict(counters) for path, counters in self._counters.items()}
+        hits = sum(item["hits"] for item in operations.values())
+        misses = sum(item["misses"] for item in operations.values())
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": len(self.backend),
+            "hits": hits,
+            "misses": misses,
+            "evictions": self.backend.evictions,
+            "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+            "ttl_seconds": dict(self.ttls),
+            "operations": operations,
+        }
+
+
+def _ttls_from_env() -> Dict[str, float]:
+    ttls = dict(DEFAULT_ERMCT_CACHE_TTLS)
+    for path, env_name in _TTL_ENV_NAMES.items():
+        raw = os.getenv(env_name)
+        if raw is not None and raw.strip():
+            ttls[path] = float(raw)
+    return ttls
+
+
+def build_ermct_cache_from_env() -> Optional[ErmctResponseCache]:
+    """
+    ERMCT_CACHE_BACKEND=memory|sqlite|off 에 따라 캐시를 만든다.
+    off(또는 none)면 None을 반환해서 클라이언트가 캐시 없이 동작하게 한다.
+    """
+    if ERMCT_CACHE_BACKEND in {"off", "none", "disabled", ""}:
+        return None
+    if ERMCT_CACHE_BACKEND == "sqlite":
+        backend: CacheBackend = SqliteCacheBackend(ERMCT_CACHE_PATH, ERMCT_CACHE_MAX_ENTRIES)
+    elif ERMCT_CACHE_BACKEND == "memory":
+        backend = MemoryCacheBackend(ERMCT_CACHE_MAX_ENTRIES)
+    else:
+        raise RuntimeError(f"지원하지 않는 ERMCT_CACHE_BACKEND 값입니다: {ERMCT_CACHE_BACKEND}")
+    return ErmctResponseCache(backend=backend, ttls=_ttls_from_env())
@@ -1,13 +1,27 @@
 # app/services/ermct_client.py
 from __future__ import annotations
 
+import asyncio
+import os
 from typing import List, Any, Dict, Optional
 
+import httpx
 import requests
 import xmltodict
+from requests.adapters import HTTPAdapter
 
 from app.config import ERMCT_SERVICE_KEY
 from app.error_utils import sanitize_error_text
+from app.services import ermct_xml
+from app.services.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    ErmctCircuitOpenError,
+    mark_stale,
+)
+from app.services.ermct_cache import ErmctResponseCache, cache_key
+from app.services.rate_limiter import ErmctRateLimiter, ErmctRateLimitError
+from app.services.single_flight import AsyncSingleFlight, SingleFlight
 from app.schemas import (
     HospitalRealtime,
     HospitalBasicInfo,
@@ -16,12 +30,41 @@ from app.schemas import (
     TraumaCenter,
 )
 
-BASE_URL = "http://apis.data.go.kr/B552657/ErmctInfoInqireService"
+BASE_URL = os.getenv(
+    "ERMCT_BASE_URL", "http://apis.data.go.kr/B552657/ErmctInfoInqireService"
+).rstrip("/")
+ERMCT_MAX_CONCURRENCY = int(os.getenv("ERMCT_MAX_CONCURRENCY", "10"))
+# fast: ElementTree 풀 파서 + tag→필드 표 (app/services/ermct_xml.py), xmltodict: 기존 경로
+ERMCT_XML_PARSER = os.getenv("ERMCT_XML_PARSER", "fast").strip().lower()
+
 
-class ErmctClient:
-    def __init__(self, service_key: str | None = None, timeout: int = 5) -> None:
+class _ErmctClientBase:
+    """
+    ErmctClient / AsyncErmctClient 공통 부분.
+    요청 파라미터 구성과 XML body → 스키마 변환은 여기서 하고,
+    하위 클래스는 HTTP 전송 방식(sync / async)만 구현한다.
+    """
+
+    def __init__(
+        self,
+        service_key: str | None = None,
+        timeout: int = 5,
+        cache: ErmctResponseCache | None = None,
+        xml_parser: str | None = None,
+        rate_limiter: ErmctRateLimiter | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+    ) -> None:
         self.service_key = service_key or ERMCT_SERVICE_KEY
         self.timeout = timeout
+        # 오퍼레이션별 TTL 응답 캐시 (None이면 매번 upstream 호출)
+        self.cache = cache
+        # upstream 호출 직전에 토큰/일일 한도를 확인 (None이면 제한 없음)
+        self.rate_limiter = rate_limiter
+        # 오퍼레이션별 회로 차단기 (None이면 차단 없음)
+        self.circuit_breakers = circuit_breakers
+        self.xml_parser = (xml_parser or ERMCT_XML_PARSER).strip().lower()
+        if self.xml_parser not in {"fast", "xmltodict"}:
+            raise ValueError(f"지원하지 않는 ERMCT XML 파서입니다: {self.xml_parser}")
 
     # ---------- 공통 변환 헬퍼 ----------
 
@@ -47,40 +90,32 @@ class ErmctClient:
         except Exception:
             return None
 
-    # ---------- 공통 GET 래퍼 ----------
 
-    def _request(self, url: str, query: Dict[str, Any]) -> requests.Response:
-        try:
-            resp = requests.get(url, params=query, timeout=self.timeout)
-            resp.raise_for_status()
-            return resp
-        except requests.Timeout as exc:
-            raise requests.Timeout(
-                sanitize_error_text(exc),
-                request=exc.request,
-            ) from None
-        except requests.HTTPError as exc:
-            raise requests.HTTPError(
-                sanitize_error_text(exc),
-                request=exc.request,
-                response=exc.response,
-            ) from None
-        except requests.RequestException as exc:
-            raise requests.RequestException(
-                sanitize_error_text(exc),
-                request=exc.request,
-                response=exc.response,
-            ) from None
+    def _to_bool(self, x: Any) -> Optional[bool]:
+        if x is None:
+            return None
+        s = str(x).strip().upper()
+        # 공공데이터에서 N1 같은 꼴도 나와서 묶어서 처리
+        if s in {"Y", "YES", "1"}:
+            return True
+        if s in {"N", "N0", "N1", "0"}:
+            return False
+        return None
 
-    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    # ---------- 요청 구성 / 응답 파싱 ----------
+
+    def _build_query(self, path: str, params: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
         query = {
             "serviceKey": self.service_key,
             **params,
         }
-        url = f"{BASE_URL}/{path}"
-        resp = self._request(url, query)
+        return f"{BASE_URL}/{path}", query
 
-        data = xmltodict.parse(resp.text)
+    def _parse_body(self, text: str) -> Dict[str, Any]:
+        if self.xml_parser == "fast":
+            return ermct_xml.parse_body(text)
+
+        data = xmltodict.parse(text)
         response = data.get("response", {})
         header = response.get("header", {})
 
@@ -92,35 +127,13 @@ class ErmctClient:
         body = response.get("body") or {}
         return body
 
-    #  ---------- 1. 실시간 병상 조회  ----------
-
-    def get_realtime_beds(
-        self,
-        sido: str,
-        sigungu: str,
-        num_rows: int = 50,
-        page_no: int = 1,
-    ) -> List[HospitalRealtime]:
-        """
-        응급실 실시간 가용 병상 정보 조회
-        (getEmrrmRltmUsefulSckbdInfoInqire)
-        """
-        body = self._get(
-            "getEmrrmRltmUsefulSckbdInfoInqire",
-            {
-                "STAGE1": sido,
-                "STAGE2": sigungu,
-                "numOfRows": num_rows,
-                "pageNo": page_no,
-            },
-        )
-
+    def _extract_items(self, body: Any) -> List[Dict[str, Any]]:
         if not isinstance(body, dict):
             return []
 
         items_container = body.get("items")
         if not items_container:
-            # 해당 시군구에 응급의료기관이 없거나, 일시적으로 데이터가 없을 때
+            # 해당 조건에 데이터가 없거나, 일시적으로 데이터가 없을 때
             return []
 
         items = items_container.get("item", [])
@@ -131,31 +144,18 @@ class ErmctClient:
         if isinstance(items, dict):
             items = [items]
 
-        def to_int(x: Any) -> Optional[int]:
-            if x is None:
-                return None
-            s = str(x).strip()
-            if not s:
-                return None
-            try:
-                return int(s)
-            except Exception:
-                return None
-
-        def to_bool(x: Any) -> Optional[bool]:
-            if x is None:
-                return None
-            s = str(x).strip().upper()
-            # 공공데이터에서 N1 같은 꼴도 나와서 묶어서 처리
-            if s in {"Y", "YES", "1"}:
-                return True
-            if s in {"N", "N0", "N1", "0"}:
-                return False
-            return None
+        return items
+
+    def _parse_realtime_beds(self, body: Any) -> List[HospitalRealtime]:
+        if self.xml_parser == "fast":
+            return ermct_xml.build_realtime_beds(self._extract_items(body))
+
+        to_int = self._to_int
+        to_bool = self._to_bool
 
         results: List[HospitalRealtime] = []
 
-        for it in items:
+        for it in self._extract_items(body):
             # 1) 원본 태그 전체 백업 (문자열 기반)
             raw_fields: Dict[str, Any] = {}
             for k, v in it.items():
@@ -236,28 +236,7 @@ class ErmctClient:
 
         return results
 
-    # ---------- 2. 기본정보 조회 (getEgytBassInfoInqire) ----------
-
-    def get_basic_info(
-        self,
-        hpid: str,
-        num_rows: int = 1,
-        page_no: int = 1,
-    ) -> Optional[HospitalBasicInfo]:
-        """
-        응급의료기관 기본정보 조회
-        (getEgytBassInfoInqire)
-        HPID 기준으로 병원 기본정보(주소, 전화, 위경도 등)를 가져온다.
-        """
-        body = self._get(
-            "getEgytBassInfoInqire",
-            {
-                "HPID": hpid,
-                "pageNo": page_no,
-                "numOfRows": num_rows,
-            },
-        )
-
+    def _parse_basic_info(self, body: Any, hpid: str) -> Optional[HospitalBasicInfo]:
         if not isinstance(body, dict):
             return None
 
@@ -275,6 +254,27 @@ class ErmctClient:
         else:
             it = items
 
+        return self._basic_info_from_item(it, hpid)
+
+    def _parse_basic_info_list(self, body: Any) -> tuple[Dict[str, HospitalBasicInfo], int]:
+        """
+        응급의료기관 목록(getEgytListInfoInqire) → (HPID별 HospitalBasicInfo, totalCount)
+
+        목록 item의 hpid/dutyName/dutyAddr/dutyTel1/dutyTel3/wgs84Lat/wgs84Lon은
+        기본정보(getEgytBassInfoInqire)와 태그 이름이 같아서 같은 매핑을 쓴다.
+        목록에는 MKioskTy 플래그 같은 기본정보 전용 필드가 없으므로
+        이름/주소/전화/좌표 용도로만 쓰고, 플래그는 get_basic_info 결과에서 읽을 것.
+        """
+        results: Dict[str, HospitalBasicInfo] = {}
+        for it in self._extract_items(body):
+            info = self._basic_info_from_item(it, "")
+            if info.id:
+                results.setdefault(info.id, info)
+
+        total_count = self._to_int(body.get("totalCount")) if isinstance(body, dict) else None
+        return results, total_count or 0
+
+    def _basic_info_from_item(self, it: Dict[str, Any], hpid: str) -> HospitalBasicInfo:
         # 문자열은 일단 strip 해두자
         clean = {k: (v.strip() if isinstance(v, str) else v) for k, v in it.items()}
 
@@ -292,53 +292,13 @@ class ErmctClient:
             raw_fields=clean,
         )
 
-    # ---------- 3. 중증질환 수용가능 정보 (getSrsillDissAceptncPosblInfoInqire) ----------
-
-    def get_serious_acceptance(
-        self,
-        sido: str,
-        sigungu: str,
-        sm_type: int = 1,
-        num_rows: int = 30,
-        page_no: int = 1,
-    ) -> List[SeriousDiseaseStatus]:
-        """
-        중증질환자 수용가능정보 조회
-        (getSrsillDissAceptncPosblInfoInqire)
-
-        - STAGE1: 시도
-        - STAGE2: 시군구
-        - SM_TYPE: 1/2/3 등 (가이드 문서 기준)
-        """
-        body = self._get(
-            "getSrsillDissAceptncPosblInfoInqire",
-            {
-                "STAGE1": sido,
-                "STAGE2": sigungu,
-                "SM_TYPE": sm_type,
-                "pageNo": page_no,
-                "numOfRows": num_rows,
-            },
-        )
-
-        if not isinstance(body, dict):
-            return []
-
-        items_container = body.get("items")
-        if not items_container:
-            # 데이터 없을 때
-            return []
-
-        items = items_container.get("item", [])
-        if not items:
-            return []
-
-        if isinstance(items, dict):
-            items = [items]
+    def _parse_serious_acceptance(self, body: Any) -> List[SeriousDiseaseStatus]:
+        if self.xml_parser == "fast":
+            return ermct_xml.build_serious_acceptance(self._extract_items(body))
 
         results: List[SeriousDiseaseStatus] = []
 
-        for it in items:
+        for it in self._extract_items(body):
             clean = {k: (v.strip() if isinstance(v, str) else v) for k, v in it.items()}
 
             mkiosk: Dict[str, Optional[str]] = {}
@@ -364,48 +324,13 @@ class ErmctClient:
 
         return results
 
-    # ---------- 4. 응급실/중증 메시지 (getEmrrmSrsillDissMsgInqire) ----------
-
-    def get_emergency_messages(
-        self,
-        hpid: str,
-        num_rows: int = 10,
-        page_no: int = 1,
-    ) -> List[HospitalMessage]:
-        """
-        응급실 및 중증질환 메시지 조회
-        (getEmrrmSrsillDissMsgInqire)
-
-        HPID 기준으로 최근 메시지를 가져온다.
-        """
-        body = self._get(
-            "getEmrrmSrsillDissMsgInqire",
-            {
-                "HPID": hpid,
-                "pageNo": page_no,
-                "numOfRows": num_rows,
-            },
-        )
-
-        # body None / 비 dict 방어
-        if not isinstance(body, dict):
-            return []
-
-        items_container = body.get("items")
-        if not items_container:
-            # 해당 병원에 메시지가 없거나, 일시적으로 데이터 없음
-            return []
-
-        items = items_container.get("item", [])
-        if not items:
-            return []
-
-        if isinstance(items, dict):
-            items = [items]
+    def _parse_emergency_messages(self, body: Any, hpid: str) -> List[HospitalMessage]:
+        if self.xml_parser == "fast":
+            return ermct_xml.build_emergency_messages(self._extract_items(body), hpid)
 
         results: List[HospitalMessage] = []
 
-        for it in items:
+        for it in self._extract_items(body):
             clean = {k: (v.strip() if isinstance(v, str) else v) for k, v in it.items()}
 
             results.append(
@@ -429,22 +354,370 @@ class ErmctClient:
 
         return results
 
+    def _parse_trauma_centers(self, body: Any) -> List[TraumaCenter]:
+        results: List[TraumaCenter] = []
+        for it in self._extract_items(body):
+            clean = {k: (v.strip() if isinstance(v, str) else v) for k, v in it.items()}
+
+            tc = TraumaCenter(
+                id=str(clean.get("hpid")),
+                name=clean.get("dutyName"),
+                address=clean.get("dutyAddr"),
+                emc_class_code=clean.get("dutyEmcls"),
+                emc_class_name=clean.get("dutyEmclsName"),
+                tel=clean.get("dutyTel1"),
+                er_tel=clean.get("dutyTel3"),
+                lat=self._to_float(clean.get("wgs84Lat")),
+                lon=self._to_float(clean.get("wgs84Lon")),
+                raw_fields=clean,
+            )
+            results.append(tc)
+
+        return results
+
+    # ---------- 회로 차단 ----------
 
+    def _circuit(self, path: str) -> Optional[CircuitBreaker]:
+        if self.circuit_breakers is None:
+            return None
+        return self.circuit_breakers.get(path)
 
-    def debug_raw_serious_xml(self, sido: str, sigungu: str, sm_type: int = 1,
-                            num_rows: int = 30, page_no: int = 1) -> str:
-        url = f"{BASE_URL}/getSrsillDissAceptncPosblInfoInqire"
-        query = {
-            "serviceKey": self.service_key,
+    def _serve_open_circuit(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        breaker: CircuitBreaker,
+    ) -> Dict[str, Any]:
+        """
+        회로가 열려 있을 때: 캐시에 남은 마지막 정상 응답을 stale 표시와 함께 돌려주고,
+        그것도 없으면 timeout을 기다리지 않고 바로 실패한다.
+        """
+        if self.cache is not None:
+            entry = self.cache.get_stale(path, params)
+            if entry is not None:
+                mark_stale(path)
+                return entry.value
+        raise ErmctCircuitOpenError(path, breaker.retry_after())
+
+    def _record_outcome(
+        self,
+        breaker: Optional[CircuitBreaker],
+        exc: Optional[BaseException] = None,
+    ) -> None:
+        if breaker is None:
+            return
+        if exc is None:
+            breaker.record_success()
+            return
+
+        status_code = getattr(getattr(exc, "response", None), "status_code", None)
+        if isinstance(exc, ErmctRateLimitError) or (
+            status_code is not None and 400 <= status_code < 500 and status_code != 429
+        ):
+            # upstream 상태와 무관한 실패는 실패율에 넣지 않는다.
+            breaker.release()
+            return
+        breaker.record_failure()
+
+    # ---------- 오퍼레이션별 요청 파라미터 ----------
+
+    def _realtime_beds_params(self, sido: str, sigungu: str, num_rows: int, page_no: int) -> Dict[str, Any]:
+        return {
+            "STAGE1": sido,
+            "STAGE2": sigungu,
+            "numOfRows": num_rows,
+            "pageNo": page_no,
+        }
+
+    def _basic_info_params(self, hpid: str, num_rows: int, page_no: int) -> Dict[str, Any]:
+        return {
+            "HPID": hpid,
+            "pageNo": page_no,
+            "numOfRows": num_rows,
+        }
+
+    def _basic_info_list_params(
+        self, sido: Optional[str], sigungu: Optional[str], num_rows: int, page_no: int
+    ) -> Dict[str, Any]:
+        # getEgytListInfoInqire 요청 변수: Q0(주소 시도), Q1(주소 시군구), pageNo, numOfRows.
+        # 지역을 주지 않으면 전국 목록이다.
+        params: Dict[str, Any] = {
+            "pageNo": page_no,
+            "numOfRows": num_rows,
+        }
+        if sido:
+            params["Q0"] = sido
+        if sigungu:
+            params["Q1"] = sigungu
+        return params
+
+    def _serious_acceptance_params(
+        self, sido: str, sigungu: str, sm_type: int, num_rows: int, page_no: int
+    ) -> Dict[str, Any]:
+        return {
             "STAGE1": sido,
             "STAGE2": sigungu,
             "SM_TYPE": sm_type,
             "pageNo": page_no,
             "numOfRows": num_rows,
         }
-        resp = self._request(url, query)
-        return resp.text
-    
+
+    def _emergency_messages_params(self, hpid: str, num_rows: int, page_no: int) -> Dict[str, Any]:
+        return {
+            "HPID": hpid,
+            "pageNo": page_no,
+            "numOfRows": num_rows,
+        }
+
+    def _trauma_centers_params(self, sido: str, sigungu: str, num_rows: int, page_no: int) -> Dict[str, Any]:
+        return {
+            "Q0": sido,
+            "Q1": sigungu,
+            "QZ": "A",          # 기관분류(응급의료기관) – 가이드 기본 예시값
+            "ORD": "ADDR",     # 주소순
+            "pageNo": page_no,
+            "numOfRows": num_rows,
+        }
+
+
+class ErmctClient(_ErmctClientBase):
+    """
+    동기(requests) 기반 ERMCT 클라이언트.
+    배치 스크립트(scripts/sync_hospital_status.py 등)와 동기 엔드포인트에서 사용.
+
+    - requests.Session 하나를 재사용해서 매 호출마다 TCP/TLS 연결을 새로 만들지 않는다.
+    - 커넥션 풀 크기(pool_maxsize)는 동시에 나가는 호출 수에 맞춘다 (서버에서는 ERMCT_FANOUT_WORKERS).
+    """
+
+    def __init__(
+        self,
+        service_key: str | None = None,
+        timeout: int = 5,
+        cache: ErmctResponseCache | None = None,
+        xml_parser: str | None = None,
+        rate_limiter: ErmctRateLimiter | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        pool_maxsize: int | None = None,
+    ) -> None:
+        super().__init__(
+            service_key=service_key,
+            timeout=timeout,
+            cache=cache,
+            xml_parser=xml_parser,
+            rate_limiter=rate_limiter,
+            circuit_breakers=circuit_breakers,
+        )
+        self.single_flight = SingleFlight()
+        self.pool_maxsize = max(1, pool_maxsize or ERMCT_MAX_CONCURRENCY)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self) -> None:
+        self.session.close()
+
+    # ---------- 공통 GET 래퍼 ----------
+
+    def _request(self, url: str, query: Dict[str, Any]) -> requests.Response:
+        try:
+            resp = self.session.get(url, params=query, timeout=self.timeout)
+            resp.raise_for_status()
+            return resp
+        except requests.Timeout as exc:
+            raise requests.Timeout(
+                sanitize_error_text(exc),
+                request=exc.request,
+            ) from None
+        except requests.HTTPError as exc:
+            raise requests.HTTPError(
+                sanitize_error_text(exc),
+                request=exc.request,
+                response=exc.response,
+            ) from None
+        except requests.RequestException as exc:
+            raise requests.RequestException(
+                sanitize_error_text(exc),
+                request=exc.request,
+                response=exc.response,
+            ) from None
+
+    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        if self.cache is not None:
+            cached = self.cache.get(path, params)
+            if cached is not None:
+                return cached
+
+        breaker = self._circuit(path)
+        if breaker is not None and not breaker.allow():
+            return self._serve_open_circuit(path, params, breaker)
+
+        # 같은 오퍼레이션/파라미터로 동시에 들어온 호출은 upstream 요청 1번을 공유한다.
+        return self.single_flight.do(
+            cache_key(path, params),
+            lambda: self._fetch(path, params),
+        )
+
+    def _request_text(self, path: str, params: Dict[str, Any]) -> str:
+        # rate limiter(토큰 버킷 + 일일 한도)를 거친 upstream 호출. 회로 차단 결과 기록은 호출한 쪽에서 한다.
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(path)
+        url, query = self._build_query(path, params)
+        return self._request(url, query).text
+
+    def _fetch(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        breaker = self._circuit(path)
+        try:
+            body = self._parse_body(self._request_text(path, params))
+        except Exception as exc:
+            self._record_outcome(breaker, exc)
+            raise
+        self._record_outcome(breaker)
+
+        if self.cache is not None:
+            self.cache.set(path, params, body)
+        return body
+
+    #  ---------- 1. 실시간 병상 조회  ----------
+
+    def get_realtime_beds(
+        self,
+        sido: str,
+        sigungu: str,
+        num_rows: int = 50,
+        page_no: int = 1,
+    ) -> List[HospitalRealtime]:
+        """
+        응급실 실시간 가용 병상 정보 조회
+        (getEmrrmRltmUsefulSckbdInfoInqire)
+        """
+        body = self._get(
+            "getEmrrmRltmUsefulSckbdInfoInqire",
+            self._realtime_beds_params(sido, sigungu, num_rows, page_no),
+        )
+        return self._parse_realtime_beds(body)
+
+    # ---------- 2. 기본정보 조회 (getEgytBassInfoInqire) ----------
+
+    def get_basic_info(
+        self,
+        hpid: str,
+        num_rows: int = 1,
+        page_no: int = 1,
+    ) -> Optional[HospitalBasicInfo]:
+        """
+        응급의료기관 기본정보 조회
+        (getEgytBassInfoInqire)
+        HPID 기준으로 병원 기본정보(주소, 전화, 위경도 등)를 가져온다.
+        """
+        body = self._get(
+            "getEgytBassInfoInqire",
+            self._basic_info_params(hpid, num_rows, page_no),
+        )
+        return self._parse_basic_info(body, hpid)
+
+    def get_basic_info_bulk(
+        self,
+        sido: Optional[str] = None,
+        sigungu: Optional[str] = None,
+        num_rows: int = 1000,
+        max_pages: int = 5,
+    ) -> Dict[str, HospitalBasicInfo]:
+        """
+        응급의료기관 목록 조회 (getEgytListInfoInqire)
+
+        getEgytBassInfoInqire는 HPID 단건 조회용이라(요청 변수 HPID/pageNo/numOfRows)
+        지역 조건을 받지 않는다. 지역 필터가 있는 목록 오퍼레이션으로
+        지역(또는 전국) 목록을 페이지 단위로 받아 HPID → HospitalBasicInfo 로 돌려준다.
+        """
+        results: Dict[str, HospitalBasicInfo] = {}
+        for page_no in range(1, max_pages + 1):
+            body = self._get(
+                "getEgytListInfoInqire",
+                self._basic_info_list_params(sido, sigungu, num_rows, page_no),
+            )
+            page, total_count = self._parse_basic_info_list(body)
+            for hpid, info in page.items():
+                results.setdefault(hpid, info)
+            if not page or page_no * num_rows >= total_count:
+                break
+        return results
+
+    # ---------- 3. 중증질환 수용가능 정보 (getSrsillDissAceptncPosblInfoInqire) ----------
+
+    def get_serious_acceptance(
+        self,
+        sido: str,
+        sigungu: str,
+        sm_type: int = 1,
+        num_rows: int = 30,
+        page_no: int = 1,
+    ) -> List[SeriousDiseaseStatus]:
+        """
+        중증질환자 수용가능정보 조회
+        (getSrsillDissAceptncPosblInfoInqire)
+
+        - STAGE1: 시도
+        - STAGE2: 시군구
+        - SM_TYPE: 1/2/3 등 (가이드 문서 기준)
+        """
+        body = self._get(
+            "getSrsillDissAceptncPosblInfoInqire",
+            self._serious_acceptance_params(sido, sigungu, sm_type, num_rows, page_no),
+        )
+        return self._parse_serious_acceptance(body)
+
+    # ---------- 4. 응급실/중증 메시지 (getEmrrmSrsillDissMsgInqire) ----------
+
+    def get_emergency_messages(
+        self,
+        hpid: str,
+        num_rows: int = 10,
+        page_no: int = 1,
+    ) -> List[HospitalMessage]:
+        """
+        응급실 및 중증질환 메시지 조회
+        (getEmrrmSrsillDissMsgInqire)
+
+        HPID 기준으로 최근 메시지를 가져온다.
+        """
+        body = self._get(
+            "getEmrrmSrsillDissMsgInqire",
+            self._emergency_messages_params(hpid, num_rows, page_no),
+        )
+        return self._parse_emergency_messages(body, hpid)
+
+
+
+    def _get_raw_xml(self, path: str, params: Dict[str, Any]) -> str:
+        """
+        디버그용 원본 XML 조회. 캐시는 건너뛰지만 rate limiter / 일일 한도 / 회로 차단은 _get과 같이 거친다.
+        회로가 열려 있으면 stale 캐시 대신 바로 ErmctCircuitOpenError를 낸다.
+        """
+        breaker = self._circuit(path)
+        if breaker is not None and not breaker.allow():
+            raise ErmctCircuitOpenError(path, breaker.retry_after())
+        try:
+            text = self._request_text(path, params)
+        except Exception as exc:
+            self._record_outcome(breaker, exc)
+            raise
+        self._record_outcome(breaker)
+        return text
+
+    def debug_raw_realtime_xml(self, sido: str, sigungu: str, num_rows: int = 5, page_no: int = 1) -> str:
+        return self._get_raw_xml(
+            "getEmrrmRltmUsefulSckbdInfoInqire",
+            self._realtime_beds_params(sido, sigungu, num_rows, page_no),
+        )
+
+    def debug_raw_serious_xml(self, sido: str, sigungu: str, sm_type: int = 1,
+                            num_rows: int = 30, page_no: int = 1) -> str:
+        return self._get_raw_xml(
+            "getSrsillDissAceptncPosblInfoInqire",
+            self._serious_acceptance_params(sido, sigungu, sm_type, num_rows, page_no),
+        )
+
 
     def get_trauma_centers(
         self,
@@ -459,46 +732,193 @@ class ErmctClient:
         """
         body = self._get(
             "getStrmListInfoInqire",
-            {
-                "Q0": sido,
-                "Q1": sigungu,
-                "QZ": "A",          # 기관분류(응급의료기관) – 가이드 기본 예시값
-                "ORD": "ADDR",     # 주소순
-                "pageNo": page_no,
-                "numOfRows": num_rows,
-            },
+            self._trauma_centers_params(sido, sigungu, num_rows, page_no),
         )
+        return self._parse_trauma_centers(body)
 
-        if not isinstance(body, dict):
-            return []
 
-        items_container = body.get("items")
-        if not items_container:
-            return []
+class AsyncErmctClient(_ErmctClientBase):
+    """
+    httpx.AsyncClient 기반 비동기 ERMCT 클라이언트.
 
-        items = items_container.get("item", [])
-        if not items:
-            return []
+    - keep-alive 커넥션 풀을 재사용해서 매 호출마다 TCP 연결을 새로 만들지 않는다.
+    - max_concurrency로 동시에 나가는 upstream 요청 수를 제한한다.
+    - 예외는 동기 클라이언트와 동일하게 serviceKey를 가린 requests 예외로 변환한다.
+    """
 
-        if isinstance(items, dict):
-            items = [items]
+    def __init__(
+        self,
+        service_key: str | None = None,
+        timeout: int = 5,
+        max_concurrency: int = ERMCT_MAX_CONCURRENCY,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: ErmctResponseCache | None = None,
+        xml_parser: str | None = None,
+        rate_limiter: ErmctRateLimiter | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+    ) -> None:
+        super().__init__(
+            service_key=service_key,
+            timeout=timeout,
+            cache=cache,
+            xml_parser=xml_parser,
+            rate_limiter=rate_limiter,
+            circuit_breakers=circuit_breakers,
+        )
+        self.max_concurrency = max(1, max_concurrency)
+        self._transport = transport
+        self._http: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.single_flight = AsyncSingleFlight()
+
+    def _get_http(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+                transport=self._transport,
+            )
+        return self._http
 
-        results: List[TraumaCenter] = []
-        for it in items:
-            clean = {k: (v.strip() if isinstance(v, str) else v) for k, v in it.items()}
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
-            tc = TraumaCenter(
-                id=str(clean.get("hpid")),
-                name=clean.get("dutyName"),
-                address=clean.get("dutyAddr"),
-                emc_class_code=clean.get("dutyEmcls"),
-                emc_class_name=clean.get("dutyEmclsName"),
-                tel=clean.get("dutyTel1"),
-                er_tel=clean.get("dutyTel3"),
-                lat=self._to_float(clean.get("wgs84Lat")),
-                lon=self._to_float(clean.get("wgs84Lon")),
-                raw_fields=clean,
-            )
-            results.append(tc)
+    # ---------- 공통 GET 래퍼 ----------
+
+    async def _request(self, url: str, query: Dict[str, Any]) -> httpx.Response:
+        try:
+            async with self._semaphore:
+                resp = await self._get_http().get(url, params=query)
+            resp.raise_for_status()
+            return resp
+        except httpx.TimeoutException as exc:
+            raise requests.Timeout(sanitize_error_text(exc)) from None
+        except httpx.HTTPStatusError as exc:
+            raise requests.HTTPError(
+                sanitize_error_text(exc),
+                response=exc.response,
+            ) from None
+        except httpx.HTTPError as exc:
+            raise requests.RequestException(sanitize_error_text(exc)) from None
+
+    async def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        if self.cache is not None:
+            cached = self.cache.get(path, params)
+            if cached is not None:
+                return cached
+
+        breaker = self._circuit(path)
+        if breaker is not None and not breaker.allow():
+            return self._serve_open_circuit(path, params, breaker)
+
+        return await self.single_flight.do(
+            cache_key(path, params),
+            lambda: self._fetch(path, params),
+        )
+
+    async def _fetch(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        breaker = self._circuit(path)
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(path)
+
+            url, query = self._build_query(path, params)
+            resp = await self._request(url, query)
+            body = self._parse_body(resp.text)
+        except Exception as exc:
+            self._record_outcome(breaker, exc)
+            raise
+        self._record_outcome(breaker)
+
+        if self.cache is not None:
+            self.cache.set(path, params, body)
+        return body
+
+    async def get_realtime_beds(
+        self,
+        sido: str,
+        sigungu: str,
+        num_rows: int = 50,
+        page_no: int = 1,
+    ) -> List[HospitalRealtime]:
+        body = await self._get(
+            "getEmrrmRltmUsefulSckbdInfoInqire",
+            self._realtime_beds_params(sido, sigungu, num_rows, page_no),
+        )
+        return self._parse_realtime_beds(body)
 
+    async def get_basic_info(
+        self,
+        hpid: str,
+        num_rows: int = 1,
+        page_no: int = 1,
+    ) -> Optional[HospitalBasicInfo]:
+        body = await self._get(
+            "getEgytBassInfoInqire",
+            self._basic_info_params(hpid, num_rows, page_no),
+        )
+        return self._parse_basic_info(body, hpid)
+
+    async def get_basic_info_bulk(
+        self,
+        sido: Optional[str] = None,
+        sigungu: Optional[str] = None,
+        num_rows: int = 1000,
+        max_pages: int = 5,
+    ) -> Dict[str, HospitalBasicInfo]:
+        results: Dict[str, HospitalBasicInfo] = {}
+        for page_no in range(1, max_pages + 1):
+            body = await self._get(
+                "getEgytListInfoInqire",
+                self._basic_info_list_params(sido, sigungu, num_rows, page_no),
+            )
+            page, total_count = self._parse_basic_info_list(body)
+            for hpid, info in page.items():
+                results.setdefault(hpid, info)
+            if not page or page_no * num_rows >= total_count:
+                break
         return results
+
+    async def get_serious_acceptance(
+        self,
+        sido: str,
+        sigungu: str,
+        sm_type: int = 1,
+        num_rows: int = 30,
+        page_no: int = 1,
+    ) -> List[SeriousDiseaseStatus]:
+        body = await self._get(
+            "getSrsillDissAceptncPosblInfoInqire",
+            self._serious_acceptance_params(sido, sigungu, sm_type, num_rows, page_no),
+        )
+        return self._parse_serious_acceptance(body)
+
+    async def get_emergency_messages(
+        self,
+        hpid: str,
+        num_rows: int = 10,
+        page_no: int = 1,
+    ) -> List[HospitalMessage]:
+        body = await self._get(
+            "getEmrrmSrsillDissMsgInqire",
+            self._emergency_messages_params(hpid, num_rows, page_no),
+        )
+        return self._parse_emergency_messages(body, hpid)
+
+    async def get_trauma_centers(
+        self,
+        sido: str,
+        sigungu: str,
+        num_rows: int = 50,
+        page_no: int = 1,
+    ) -> List[TraumaCenter]:
+        body = await self._get(
+            "getStrmListInfoInqire",
+            self._trauma_centers_params(sido, sigungu, num_rows, page_no),
+        )
+        return self._parse_trauma_centers(body)
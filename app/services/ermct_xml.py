@@ -0,0 +1,299 @@
+"""
+ERMCT XML 빠른 파싱 경로.
+
+xmltodict.parse(SAX 콜백마다 파이썬 코드 실행)로 중첩 dict를 만드는 대신,
+C로 구현된 ElementTree 파서로 트리를 만든 뒤 <item>마다 평평한 tag → text dict를 만든다.
+결과 body 모양은 xmltodict와 같아서 캐시/기존 파서와 호환되고,
+실시간 병상/중증 수용/메시지는 미리 만들어 둔 tag → 필드 표로 한 번만 훑어서 모델을 만든다.
+"""
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.schemas import HospitalMessage, HospitalRealtime, SeriousDiseaseStatus
+
+
+_BODY_FIELDS = {"numOfRows", "pageNo", "totalCount"}
+_MISSING = object()
+
+
+def _clean_text(text: Optional[str]) -> Optional[str]:
+    # xmltodict 기본 동작(strip_whitespace=True)과 동일: 공백뿐이면 None
+    if text is None:
+        return None
+    text = text.strip()
+    return text or None
+
+
+def _item_dict(elem: ET.Element) -> Dict[str, Any]:
+    item: Dict[str, Any] = {}
+    for child in elem:
+        value = _clean_text(child.text)
+        previous = item.get(child.tag, _MISSING)
+        if previous is _MISSING:
+            item[child.tag] = value
+        elif isinstance(previous, list):
+            previous.append(value)
+        else:
+            item[child.tag] = [previous, value]
+    return item
+
+
+def parse_body(text: str) -> Dict[str, Any]:
+    """
+    ERMCT 응답 XML → xmltodict의 response.body와 같은 모양의 dict.
+    resultCode가 00이 아니면 xmltodict 경로와 같은 RuntimeError를 낸다.
+    """
+    root = ET.fromstring(text)
+
+    header: Dict[str, Optional[str]] = {}
+    if root.tag == "response":
+        header_elem = root.find("header")
+        if header_elem is not None:
+            header = {child.tag: _clean_text(child.text) for child in header_elem}
+
+    result_code = header.get("resultCode")
+    if result_code != "00":
+        msg = header.get("resultMsg") or "Unknown error"
+        raise RuntimeError(f"API error {result_code}: {msg}")
+
+    body_elem = root.find("body")
+    if body_elem is None:
+        return {}
+
+    body: Dict[str, Any] = {}
+    for child in body_elem:
+        if child.tag == "items":
+            items = [item for item in map(_item_dict, child.iterfind("item")) if item]
+            if not items:
+                body["items"] = None
+            else:
+                body["items"] = {"item": items if len(items) > 1 else items[0]}
+        elif child.tag in _BODY_FIELDS:
+            body[child.tag] = _clean_text(child.text)
+    return body
+
+
+def _to_int(x: Any) -> Optional[int]:
+    # 값은 이미 strip된 문자열이라 int()에 바로 넘긴다 (빈 문자열/Y,N 등은 None)
+    if x is None:
+        return None
+    try:
+        return int(x)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_bool(x: Any) -> Optional[bool]:
+    if x is None:
+        return None
+    s = str(x).strip().upper()
+    if s in {"Y", "YES", "1"}:
+        return True
+    if s in {"N", "N0", "N1", "0"}:
+        return False
+    return None
+
+
+# ---------- 실시간 병상 ----------
+
+_REALTIME_INT_FIELDS: Dict[str, str] = {
+    "rnum": "rnum",
+    "hvec": "er_beds",
+    "hvoc": "or_beds",
+    "hvcc": "neuro_icu_beds",
+    "hvncc": "neonatal_icu_beds",
+    "hvccc": "thoracic_icu_beds",
+    "hvicc": "general_icu_beds",
+    "hvgc": "ward_beds",
+}
+
+_REALTIME_BOOL_FIELDS: Dict[str, str] = {
+    "hvctayn": "ct_available",
+    "hvmriayn": "mri_available",
+    "hvangioayn": "angio_available",
+    "hvventiayn": "ventilator_available",
+    "hvventisoayn": "ventilator_premature_available",
+    "hvincuayn": "incubator_available",
+    "hvcrrtayn": "crrt_available",
+    "hvecmoayn": "ecmo_available",
+    "hvoxyayn": "hyperbaric_oxygen_available",
+    "hvhypoayn": "hypothermia_available",
+    "hvamyn": "ambulance_available",
+    "hv10": "pediatric_ventilator_flag",
+    "hv11": "incubator_flag",
+    "hv5": "neuro_ward_flag",
+    "hv7": "toxic_icu_flag",
+    "hv42": "pediatric_icu_flag",
+}
+
+_REALTIME_RAW_FIELDS: Dict[str, str] = {
+    "phpid": "old_id",
+    "hvidate": "input_datetime",
+}
+
+_HV = 1
+_HVS = 2
+
+# tag → (필드명, 변환 함수, hv 분류, 소문자 tag). 처음 보는 tag는 한 번만 분류해서 여기에 쌓는다.
+_RealtimeTagPlan = Tuple[Optional[str], Optional[Callable[[Any], Any]], int, str]
+_realtime_tag_plans: Dict[str, _RealtimeTagPlan] = {}
+
+
+def _realtime_tag_plan(tag: str) -> _RealtimeTagPlan:
+    plan = _realtime_tag_plans.get(tag)
+    if plan is not None:
+        return plan
+
+    field: Optional[str] = None
+    convert: Optional[Callable[[Any], Any]] = None
+    if tag in _REALTIME_INT_FIELDS:
+        field, convert = _REALTIME_INT_FIELDS[tag], _to_int
+    elif tag in _REALTIME_BOOL_FIELDS:
+        field, convert = _REALTIME_BOOL_FIELDS[tag], _to_bool
+    elif tag in _REALTIME_RAW_FIELDS:
+        field = _REALTIME_RAW_FIELDS[tag]
+
+    lower = tag.lower()
+    bucket = 0
+    if lower.startswith("hvs"):
+        if len(lower) > 3 and lower[3].isdigit():
+            bucket = _HVS
+    elif lower.startswith("hv") and len(lower) > 2 and lower[2].isdigit():
+        bucket = _HV
+
+    plan = (field, convert, bucket, lower)
+    _realtime_tag_plans[tag] = plan
+    return plan
+
+
+def build_realtime_beds(items: Iterable[Dict[str, Any]]) -> List[HospitalRealtime]:
+    results: List[HospitalRealtime] = []
+
+    for it in items:
+        raw_fields: Dict[str, Any] = {}
+        raw_hv: Dict[str, Optional[int]] = {}
+        baseline_hvs: Dict[str, Optional[int]] = {}
+        fields: Dict[str, Any] = {}
+
+        for tag, value in it.items():
+            raw_fields[tag] = None if value is None else str(value)
+
+            field, convert, bucket, lower = _realtime_tag_plan(tag)
+            if field is not None:
+                fields[field] = convert(value) if convert is not None else value
+            if bucket:
+                iv = _to_int(value)
+                if iv is not None:
+                    (raw_hv if bucket == _HV else baseline_hvs)[lower] = iv
+
+        name = it.get("dutyName") or it.get("dutyname")
+        results.append(
+            HospitalRealtime(
+                id=str(it.get("hpid")),
+                name=str(name) if name is not None else "",
+                phone=it.get("dutyTel3") or it.get("dutytel3"),
+                raw_hv=raw_hv,
+                baseline_hvs=baseline_hvs,
+                raw_fields=raw_fields,
+                **fields,
+            )
+        )
+
+    return results
+
+
+# ---------- 중증질환 수용 가능 정보 ----------
+
+_MKIOSK = 1
+_MKIOSK_MSG = 2
+_serious_tag_kinds: Dict[str, int] = {}
+
+
+def _serious_tag_kind(tag: str) -> int:
+    kind = _serious_tag_kinds.get(tag)
+    if kind is None:
+        if tag.startswith("MKioskTy"):
+            kind = _MKIOSK_MSG if tag.endswith("Msg") else _MKIOSK
+        else:
+            kind = 0
+        _serious_tag_kinds[tag] = kind
+    return kind
+
+
+def build_serious_acceptance(items: Iterable[Dict[str, Any]]) -> List[SeriousDiseaseStatus]:
+    results: List[SeriousDiseaseStatus] = []
+
+    for it in items:
+        mkiosk: Dict[str, Optional[str]] = {}
+        mkiosk_msg: Dict[str, Optional[str]] = {}
+        others: Dict[str, Any] = {}
+
+        for tag, value in it.items():
+            if isinstance(value, str):
+                value = value.strip()
+            kind = _serious_tag_kind(tag)
+            if kind == _MKIOSK_MSG:
+                mkiosk_msg[tag] = value
+            elif kind == _MKIOSK:
+                mkiosk[tag] = value
+            else:
+                others[tag] = value
+
+        results.append(
+            SeriousDiseaseStatus(
+                name=others.get("dutyName"),
+                mkiosk=mkiosk,
+                mkiosk_msg=mkiosk_msg,
+                raw_fields=others,
+            )
+        )
+
+    return results
+
+
+# ---------- 응급실/중증 메시지 ----------
+
+_MESSAGE_FIELDS: Dict[str, str] = {
+    "dutyName": "name",
+    "dutyAddr": "address",
+    "emcOrgCod": "emc_org_code",
+    "symBlkMsg": "message",
+    "symBlkMsgTyp": "message_type",
+    "symTypCod": "message_type_code",
+    "symTypCodMag": "message_type_name",
+    "symOutDspMth": "out_display_method",
+    "symOutDspYon": "out_display_status",
+    "symBlkSttDtm": "block_start",
+    "symBlkEndDtm": "block_end",
+}
+
+
+def build_emergency_messages(
+    items: Iterable[Dict[str, Any]],
+    hpid: str,
+) -> List[HospitalMessage]:
+    results: List[HospitalMessage] = []
+
+    for it in items:
+        clean: Dict[str, Any] = {}
+        fields: Dict[str, Any] = {}
+        for tag, value in it.items():
+            if isinstance(value, str):
+                value = value.strip()
+            clean[tag] = value
+            field = _MESSAGE_FIELDS.get(tag)
+            if field is not None:
+                fields[field] = value
+
+        results.append(
+            HospitalMessage(
+                id=clean.get("hpid") or hpid,
+                rnum=_to_int(clean.get("rnum")),
+                raw_fields=clean,
+                **fields,
+            )
+        )
+
+    return results
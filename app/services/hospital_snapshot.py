@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from app.error_utils import sanitize_error_text
+from app.schemas import HospitalSummary
+
+
+RegionKey = Tuple[str, str, int]
+RegionTarget = Tuple[str, str]
+
+
+def region_key(sido: str, sigungu: str, sm_type: int = 1) -> RegionKey:
+    return (sido.strip(), sigungu.strip(), int(sm_type))
+
+
+@dataclass(frozen=True)
+class RegionSnapshot:
+    sido: str
+    sigungu: str
+    sm_type: int
+    summaries: Tuple[HospitalSummary, ...]
+    fetched_at: float
+    num_rows: int
+    include_messages: bool
+
+    @property
+    def key(self) -> RegionKey:
+        return region_key(self.sido, self.sigungu, self.sm_type)
+
+
+@dataclass(frozen=True)
+class SnapshotState:
+    version: int = 0
+    published_at: Optional[float] = None
+    regions: Mapping[RegionKey, RegionSnapshot] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    hospitals: Mapping[str, HospitalSummary] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    hospital_regions: Mapping[str, RegionKey] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, UTC).isoformat()
+
+
+class HospitalSnapshotStore:
+    """
+    시군구 단위 HospitalSummary 스냅샷을 메모리에 들고 있는 저장소.
+
+    publish()마다 새 불변 상태(SnapshotState)를 만들어 통째로 교체하므로
+    읽는 쪽은 락 없이 한 버전의 일관된 뷰를 본다.
+    요청 경로에서 읽거나 넣은 시군구는 마지막 사용 시각을 기록해 두고,
+    백그라운드 갱신은 최근에 쓰인 시군구만 대상으로 삼을 수 있다 (region_targets).
+    """
+
+    def __init__(
+        self,
+        max_age_seconds: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = SnapshotState()
+        self._last_used: Dict[RegionKey, float] = {}
+
+    @property
+    def state(self) -> SnapshotState:
+        return self._state
+
+    @property
+    def version(self) -> int:
+        return self._state.version
+
+    def _is_fresh(self, fetched_at: float, max_age: Optional[float]) -> bool:
+        limit = self.max_age_seconds if max_age is None else max_age
+        return self._clock() - fetched_at <= limit
+
+    def _mark_used(self, key: RegionKey) -> None:
+        with self._lock:
+            self._last_used[key] = self._clock()
+
+    def lookup_region(
+        self,
+        sido: str,
+        sigungu: str,
+        sm_type: int = 1,
+        num_rows: int = 200,
+        include_messages: bool = True,
+        max_age: Optional[float] = None,
+    ) -> Tuple[Optional[List[HospitalSummary]], int]:
+        """get_region과 같지만 실제로 읽은 상태의 버전도 같이 돌려준다."""
+        key = region_key(sido, sigungu, sm_type)
+        self._mark_used(key)
+        state = self._state
+        entry = state.regions.get(key)
+        if entry is None:
+            return None, state.version
+        if entry.num_rows < num_rows:
+            return None, state.version
+        if include_messages and not entry.include_messages:
+            return None, state.version
+        if not self._is_fresh(entry.fetched_at, max_age):
+            return None, state.version
+        return list(entry.summaries[:num_rows]), state.version
+
+    def get_region(
+        self,
+        sido: str,
+        sigungu: str,
+        sm_type: int = 1,
+        num_rows: int = 200,
+        include_messages: bool = True,
+        max_age: Optional[float] = None,
+    ) -> Optional[List[HospitalSummary]]:
+        summaries, _ = self.lookup_region(
+            sido,
+            sigungu,
+            sm_type=sm_type,
+            num_rows=num_rows,
+            include_messages=include_messages,
+            max_age=max_age,
+        )
+        return summaries
+
+    def get_hospital(
+        self,
+        hpid: str,
+        max_age: Optional[float] = None,
+    ) -> Optional[HospitalSummary]:
+        state = self._state
+        summary = state.hospitals.get(hpid)
+        if summary is None:
+            return None
+        entry = state.regions.get(state.hospital_regions[hpid])
+        if entry is None or not self._is_fresh(entry.fetched_at, max_age):
+            return None
+        return summary
+
+    def region_targets(self, active_within: Optional[float] = None) -> List[RegionTarget]:
+        """
+        스냅샷에 있는 시군구 목록.
+        active_within이 있으면 그 시간(초) 안에 요청 경로에서 읽거나 넣은 시군구만 돌려준다.
+        """
+        regions = self._state.regions
+        if active_within is None:
+            return [(key[0], key[1]) for key in regions]
+        cutoff = self._clock() - active_within
+        with self._lock:
+            used = [key for key, used_at in self._last_used.items() if used_at >= cutoff]
+            for key in [key for key, used_at in self._last_used.items() if used_at < cutoff]:
+                del self._last_used[key]
+        return [(key[0], key[1]) for key in used if key in regions]
+
+    def publish(self, updates: Iterable[RegionSnapshot]) -> int:
+        updates = list(updates)
+        if not updates:
+            return self._state.version
+
+        with self._lock:
+            current = self._state
+            regions: Dict[RegionKey, RegionSnapshot] = dict(current.regions)
+            for entry in updates:
+                regions[entry.key] = entry
+
+            hospitals: Dict[str, HospitalSummary] = {}
+            hospital_regions: Dict[str, RegionKey] = {}
+            for key, entry in regions.items():
+                for summary in entry.summaries:
+                    if not summary.id or summary.id in hospitals:
+                        continue
+                    hospitals[summary.id] = summary
+                    hospital_regions[summary.id] = key
+
+            self._state = SnapshotState(
+                version=current.version + 1,
+                published_at=self._clock(),
+                regions=MappingProxyType(regions),
+                hospitals=MappingProxyType(hospitals),
+                hospital_regions=MappingProxyType(hospital_regions),
+            )
+            return self._state.version
+
+    def put_region(
+        self,
+        sido: str,
+        sigungu: str,
+        summaries: Sequence[HospitalSummary],
+        sm_type: int = 1,
+        num_rows: int = 200,
+        include_messages: bool = True,
+    ) -> int:
+        self._mark_used(region_key(sido, sigungu, sm_type))
+        return self.publish(
+            [
+                RegionSnapshot(
+                    sido=sido.strip(),
+                    sigungu=sigungu.strip(),
+                    sm_type=int(sm_type),
+                    summaries=tuple(summaries),
+                    fetched_at=self._clock(),
+                    num_rows=num_rows,
+                    include_messages=bool(include_messages),
+                )
+            ]
+        )
+
+    def status(self) -> Dict[str, Any]:
+        state = self._state
+        fetched = [entry.fetched_at for entry in state.regions.values()]
+        return {
+            "version": state.version,
+            "published_at": _iso(state.published_at),
+            "region_count": len(state.regions),
+            "hospital_count": len(state.hospitals),
+            "oldest_region_fetched_at": _iso(min(fetched)) if fetched else None,
+            "newest_region_fetched_at": _iso(max(fetched)) if fetched else None,
+            "max_age_seconds": self.max_age_seconds,
+        }
+
+
+class HospitalSnapshotRefresher:
+    """
+    백그라운드 스레드에서 대상 시군구를 주기적으로 다시 조회해
+    HospitalSnapshotStore에 publish한다. 요청 경로는 네트워크를 타지 않는다.
+
+    한 주기 안에서는 최대 max_workers개 시군구를 동시에 조회한다.
+    (순차 조회로는 대상이 많을 때 한 주기가 스냅샷 max_age보다 길어진다.)
+    """
+
+    def __init__(
+        self,
+        store: HospitalSnapshotStore,
+        fetch_region: Callable[[str, str], Sequence[HospitalSummary]],
+        targets: Callable[[], Iterable[RegionTarget]],
+        interval_seconds: float = 120.0,
+        publish_batch_size: int = 10,
+        num_rows: int = 200,
+        sm_type: int = 1,
+        max_workers: int = 4,
+    ) -> None:
+        self.store = store
+        self.fetch_region = fetch_region
+        self.targets = targets
+        self.interval_seconds = interval_seconds
+        self.publish_batch_size = max(1, publish_batch_size)
+        self.num_rows = num_rows
+        self.sm_type = sm_type
+        self.max_workers = max(1, max_workers)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_cycle: Dict[str, Any] = {}
+
+    def _fetch_target(self, target: RegionTarget) -> Optional[Sequence[HospitalSummary]]:
+        # 종료 중이면 아직 시작 안 한 시군구는 조회하지 않는다
+        if self._stop.is_set():
+            return None
+        return self.fetch_region(*target)
+
+    def run_once(self) -> Dict[str, Any]:
+        started_at = time.monotonic()
+        pending: List[RegionSnapshot] = []
+        refreshed = 0
+        failed = 0
+        failure_samples: List[str] = []
+        targets: List[RegionTarget] = []
+        seen: set[RegionTarget] = set()
+
+        for sido, sigungu in self.targets():
+            target = (sido.strip(), sigungu.strip())
+            if target in seen:
+                continue
+            seen.add(target)
+            targets.append(target)
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(targets))),
+            thread_name_prefix="snapshot-refresh",
+        ) as pool:
+            futures = {pool.submit(self._fetch_target, target): target for target in targets}
+            for future in as_completed(futures):
+                target = futures[future]
+                try:
+                    summaries = future.result()
+                except Exception as exc:
+                    failed += 1
+                    if len(failure_samples) < 5:
+                        failure_samples.append(
+                            f"{target[0]} {target[1]}: {sanitize_error_text(exc)}"
+                        )
+                    continue
+                if summaries is None:
+                    continue
+
+                pending.append(
+                    RegionSnapshot(
+                        sido=target[0],
+                        sigungu=target[1],
+                        sm_type=self.sm_type,
+                        summaries=tuple(summaries),
+                        fetched_at=time.time(),
+                        num_rows=self.num_rows,
+                        include_messages=True,
+                    )
+                )
+                refreshed += 1
+                if len(pending) >= self.publish_batch_size:
+                    self.store.publish(pending)
+                    pending = []
+
+        if pending:
+            self.store.publish(pending)
+
+        self.last_cycle = {
+            "target_regions": len(targets),
+            "refreshed_regions": refreshed,
+            "failed_regions": failed,
+            "failure_samples": failure_samples,
+            "elapsed_seconds": round(time.monotonic() - started_at, 3),
+            "version": self.store.version,
+        }
+        return self.last_cycle
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                cycle = self.run_once()
+                print(
+                    "[SNAPSHOT] refresh cycle "
+                    f"version={cycle['version']} "
+                    f"refreshed={cycle['refreshed_regions']} "
+                    f"failed={cycle['failed_regions']} "
+                    f"elapsed={cycle['elapsed_seconds']}s"
+                )
+            except Exception as exc:
+                print(f"[SNAPSHOT] refresh cycle failed: {sanitize_error_text(exc)}")
+            self._stop.wait(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop,
+            name="hospital-snapshot-refresher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
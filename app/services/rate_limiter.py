@@ -0,0 +1,431 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Protocol, Tuple
+
+import requests
+
+
+ERMCT_RATE_LIMIT_ENABLED = os.getenv("ERMCT_RATE_LIMIT_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+ERMCT_RATE_LIMIT_PER_SECOND = float(os.getenv("ERMCT_RATE_LIMIT_PER_SECOND", "10"))
+ERMCT_RATE_LIMIT_BURST = float(os.getenv("ERMCT_RATE_LIMIT_BURST", "20"))
+# data.go.kr 일일 트래픽은 오퍼레이션별로 따로 잡힌다.
+ERMCT_DAILY_QUOTA = int(os.getenv("ERMCT_DAILY_QUOTA", "10000"))
+# 예: getEmrrmRltmUsefulSckbdInfoInqire:50000,getEgytBassInfoInqire:1000
+ERMCT_DAILY_QUOTA_OVERRIDES = os.getenv("ERMCT_DAILY_QUOTA_OVERRIDES", "")
+ERMCT_RATE_LIMIT_STATE = os.getenv("ERMCT_RATE_LIMIT_STATE", "memory").strip().lower()
+ERMCT_RATE_LIMIT_PATH = os.getenv("ERMCT_RATE_LIMIT_PATH", "data/ermct_rate_limit.sqlite3")
+
+# 공공데이터포털 일일 트래픽은 한국 시간 자정에 초기화된다.
+KST = timezone(timedelta(hours=9))
+
+PRIORITY_CRITICAL = "critical"
+PRIORITY_NORMAL = "normal"
+PRIORITY_BACKGROUND = "background"
+
+
+@dataclass(frozen=True)
+class PriorityPolicy:
+    # 일일 한도 중 이 우선순위가 쓸 수 있는 비율
+    quota_share: float
+    # 버킷에 남겨 둬야 하는 토큰 비율 (상위 우선순위 몫)
+    token_reserve: float
+    # 토큰이 없을 때 기다릴 수 있는 최대 시간
+    max_wait_seconds: float
+
+
+DEFAULT_PRIORITY_POLICIES: Dict[str, PriorityPolicy] = {
+    PRIORITY_CRITICAL: PriorityPolicy(quota_share=1.0, token_reserve=0.0, max_wait_seconds=3.0),
+    PRIORITY_NORMAL: PriorityPolicy(quota_share=0.9, token_reserve=0.0, max_wait_seconds=1.0),
+    PRIORITY_BACKGROUND: PriorityPolicy(quota_share=0.7, token_reserve=0.5, max_wait_seconds=10.0),
+}
+
+_ermct_priority: ContextVar[str] = ContextVar("ermct_priority", default=PRIORITY_NORMAL)
+
+
+def current_priority() -> str:
+    return _ermct_priority.get()
+
+
+@contextmanager
+def ermct_priority(priority: str) -> Iterator[None]:
+    """
+    이 블록 안에서 나가는 ERMCT 호출의 우선순위를 지정한다.
+    스레드풀로 넘길 때는 contextvars.copy_context().run 으로 같이 넘겨야 한다.
+    """
+    token = _ermct_priority.set(priority)
+    try:
+        yield
+    finally:
+        _ermct_priority.reset(token)
+
+
+def priority_for_ktas(ktas_level: Optional[int]) -> str:
+    if ktas_level is not None and 1 <= int(ktas_level) <= 2:
+        return PRIORITY_CRITICAL
+    return PRIORITY_NORMAL
+
+
+class ErmctRateLimitError(requests.RequestException):
+    """
+    로컬 rate limiter가 upstream 호출 전에 막은 경우.
+    upstream 429와 같은 방식으로 처리되도록 status_code=429를 함께 들고 있다.
+    """
+
+    status_code = 429
+
+    def __init__(
+        self,
+        path: str,
+        priority: str,
+        reason: str,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        self.path = path
+        self.priority = priority
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(
+            f"ERMCT local rate limit (429, {reason}): {path} priority={priority}"
+        )
+
+
+def _kst_day(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, KST).strftime("%Y-%m-%d")
+
+
+def _decide(
+    tokens: float,
+    updated_at: float,
+    used_today: int,
+    now: float,
+    rate: float,
+    burst: float,
+    token_floor: float,
+    daily_ceiling: float,
+) -> Tuple[float, bool, Optional[float], Optional[str]]:
+    """
+    (갱신된 토큰 수, 획득 여부, 재시도까지 대기 초, 거절 사유)
+    일일 한도에 걸리면 대기 초는 None (오늘 안에는 풀리지 않음).
+    """
+    tokens = min(burst, tokens + max(0.0, now - updated_at) * rate)
+    if used_today >= daily_ceiling:
+        return tokens, False, None, "daily_quota"
+    if tokens - 1.0 < token_floor:
+        return tokens, False, (token_floor + 1.0 - tokens) / rate, "rate"
+    return tokens - 1.0, True, 0.0, None
+
+
+class RateLimitState(Protocol):
+    def try_acquire(
+        self,
+        path: str,
+        now: float,
+        rate: float,
+        burst: float,
+        token_floor: float,
+        daily_ceiling: float,
+    ) -> Tuple[bool, Optional[float], Optional[str]]:
+        ...
+
+    def usage(self, day: str) -> Dict[str, int]:
+        ...
+
+    def tokens(self, now: float, rate: float, burst: float) -> float:
+        ...
+
+
+class MemoryRateLimitState:
+    """프로세스 안에서만 공유되는 버킷/일일 사용량."""
+
+    def __init__(self, burst: float) -> None:
+        self._lock = threading.Lock()
+        self._tokens = burst
+        self._updated_at: Optional[float] = None
+        self._usage: Dict[Tuple[str, str], int] = {}
+
+    def try_acquire(
+        self,
+        path: str,
+        now: float,
+        rate: float,
+        burst: float,
+        token_floor: float,
+        daily_ceiling: float,
+    ) -> Tuple[bool, Optional[float], Optional[str]]:
+        day = _kst_day(now)
+        with self._lock:
+            updated_at = now if self._updated_at is None else self._updated_at
+            used = self._usage.get((day, path), 0)
+            tokens, ok, retry_after, reason = _decide(
+                self._tokens, updated_at, used, now, rate, burst, token_floor, daily_ceiling
+            )
+            self._tokens = tokens
+            self._updated_at = now
+            if ok:
+                if any(key[0] != day for key in self._usage):
+                    self._usage = {key: count for key, count in self._usage.items() if key[0] == day}
+                self._usage[(day, path)] = used + 1
+            return ok, retry_after, reason
+
+    def usage(self, day: str) -> Dict[str, int]:
+        with self._lock:
+            return {path: count for (used_day, path), count in self._usage.items() if used_day == day}
+
+    def tokens(self, now: float, rate: float, burst: float) -> float:
+        with self._lock:
+            if self._updated_at is None:
+                return self._tokens
+            return min(burst, self._tokens + max(0.0, now - self._updated_at) * rate)
+
+
+class SqliteRateLimitState:
+    """
+    SQLite 파일로 버킷/일일 사용량을 공유한다.
+    같은 호스트의 uvicorn 워커들이 같은 경로를 쓰면 한 한도를 나눠 쓴다.
+    """
+
+    def __init__(self, path: str | Path, burst: float) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=5.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS bucket ("
+            " name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS usage ("
+            " day TEXT NOT NULL, path TEXT NOT NULL, count INTEGER NOT NULL,"
+            " PRIMARY KEY (day, path))"
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO bucket (name, tokens, updated_at) VALUES ('ermct', ?, ?)",
+            (burst, time.time()),
+        )
+
+    def try_acquire(
+        self,
+        path: str,
+        now: float,
+        rate: float,
+        burst: float,
+        token_floor: float,
+        daily_ceiling: float,
+    ) -> Tuple[bool, Optional[float], Optional[str]]:
+        day = _kst_day(now)
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                stored_tokens, updated_at = conn.execute(
+                    "SELECT tokens, updated_at FROM bucket WHERE name = 'ermct'"
+                ).fetchone()
+                row = conn.execute(
+                    "SELECT count FROM usage WHERE day = ? AND path = ?",
+                    (day, path),
+                ).fetchone()
+                used = int(row[0]) if row else 0
+
+                tokens, ok, retry_after, reason = _decide(
+                    stored_tokens, updated_at, used, now, rate, burst, token_floor, daily_ceiling
+                )
+                conn.execute(
+                    "UPDATE bucket SET tokens = ?, updated_at = ? WHERE name = 'ermct'",
+                    (tokens, max(now, updated_at)),
+                )
+                if ok:
+                    conn.execute(
+                        "INSERT INTO usage (day, path, count) VALUES (?, ?, 1)"
+                        " ON CONFLICT(day, path) DO UPDATE SET count = count + 1",
+                        (day, path),
+                    )
+                    conn.execute("DELETE FROM usage WHERE day < ?", (day,))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return ok, retry_after, reason
+
+    def usage(self, day: str) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, count FROM usage WHERE day = ?",
+                (day,),
+            ).fetchall()
+        return {path: int(count) for path, count in rows}
+
+    def tokens(self, now: float, rate: float, burst: float) -> float:
+        with self._lock:
+            stored_tokens, updated_at = self._conn.execute(
+                "SELECT tokens, updated_at FROM bucket WHERE name = 'ermct'"
+            ).fetchone()
+        return min(burst, stored_tokens + max(0.0, now - updated_at) * rate)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ErmctRateLimiter:
+    """
+    모든 ERMCT upstream 호출이 지나가는 토큰 버킷 + 오퍼레이션별 일일 한도 관리자.
+
+    - 토큰 버킷: 초당 rate_per_second, 최대 burst개까지 몰아서 허용
+    - 일일 한도: 오퍼레이션(path)별 daily_quota, KST 자정 기준
+    - 우선순위: background는 버킷 토큰 일부와 일일 한도 일부를 critical/normal 몫으로 남겨 둔다.
+    기다려도 토큰을 못 얻거나 일일 한도에 걸리면 upstream에 보내지 않고 ErmctRateLimitError를 낸다.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = ERMCT_RATE_LIMIT_PER_SECOND,
+        burst: float = ERMCT_RATE_LIMIT_BURST,
+        daily_quota: int = ERMCT_DAILY_QUOTA,
+        daily_quotas: Optional[Mapping[str, int]] = None,
+        state: Optional[RateLimitState] = None,
+        policies: Optional[Mapping[str, PriorityPolicy]] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate_per_second = max(rate_per_second, 1e-6)
+        self.burst = max(burst, 1.0)
+        self.daily_quota = daily_quota
+        self.daily_quotas: Dict[str, int] = dict(daily_quotas or {})
+        self.state: RateLimitState = state if state is not None else MemoryRateLimitState(self.burst)
+        self.policies: Dict[str, PriorityPolicy] = dict(policies or DEFAULT_PRIORITY_POLICIES)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def quota_for(self, path: str) -> int:
+        return int(self.daily_quotas.get(path, self.daily_quota))
+
+    def _policy(self, priority: str) -> PriorityPolicy:
+        return self.policies.get(priority) or self.policies[PRIORITY_NORMAL]
+
+    def _count(self, priority: str, name: str) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(
+                priority,
+                {"acquired": 0, "waited": 0, "rejected_rate": 0, "rejected_quota": 0},
+            )
+            counters[name] += 1
+
+    def _try(self, path: str, priority: str) -> Tuple[bool, Optional[float], Optional[str]]:
+        policy = self._policy(priority)
+        return self.state.try_acquire(
+            path=path,
+            now=self._clock(),
+            rate=self.rate_per_second,
+            burst=self.burst,
+            token_floor=self.burst * policy.token_reserve,
+            daily_ceiling=self.quota_for(path) * policy.quota_share,
+        )
+
+    def _reject(self, path: str, priority: str, reason: Optional[str], retry_after: Optional[float]):
+        self._count(priority, "rejected_quota" if reason == "daily_quota" else "rejected_rate")
+        return ErmctRateLimitError(path, priority, reason or "rate", retry_after)
+
+    def acquire(self, path: str, priority: Optional[str] = None) -> None:
+        priority = priority or current_priority()
+        deadline = self._clock() + self._policy(priority).max_wait_seconds
+        waited = False
+        while True:
+            ok, retry_after, reason = self._try(path, priority)
+            if ok:
+                self._count(priority, "acquired")
+                if waited:
+                    self._count(priority, "waited")
+                return
+            if retry_after is None or self._clock() + retry_after > deadline:
+                raise self._reject(path, priority, reason, retry_after)
+            waited = True
+            self._sleep(retry_after)
+
+    async def acquire_async(self, path: str, priority: Optional[str] = None) -> None:
+        priority = priority or current_priority()
+        deadline = self._clock() + self._policy(priority).max_wait_seconds
+        waited = False
+        while True:
+            ok, retry_after, reason = self._try(path, priority)
+            if ok:
+                self._count(priority, "acquired")
+                if waited:
+                    self._count(priority, "waited")
+                return
+            if retry_after is None or self._clock() + retry_after > deadline:
+                raise self._reject(path, priority, reason, retry_after)
+            waited = True
+            await asyncio.sleep(retry_after)
+
+    def status(self) -> Dict[str, Any]:
+        now = self._clock()
+        day = _kst_day(now)
+        usage = self.state.usage(day)
+        operations: Dict[str, Dict[str, int]] = {}
+        for path in sorted(set(usage) | set(self.daily_quotas)):
+            quota = self.quota_for(path)
+            used = usage.get(path, 0)
+            operations[path] = {
+                "used": used,
+                "quota": quota,
+                "remaining": max(0, quota - used),
+            }
+        with self._lock:
+            counters = {priority: dict(values) for priority, values in self._counters.items()}
+        return {
+            "day": day,
+            "state": type(self.state).__name__,
+            "rate_per_second": self.rate_per_second,
+            "burst": self.burst,
+            "tokens_available": round(self.state.tokens(now, self.rate_per_second, self.burst), 3),
+            "default_daily_quota": self.daily_quota,
+            "operations": operations,
+            "priorities": counters,
+        }
+
+
+def _parse_quota_overrides(raw: str) -> Dict[str, int]:
+    quotas: Dict[str, int] = {}
+    for item in raw.split(","):
+        path, _, value = item.partition(":")
+        if path.strip() and value.strip():
+            quotas[path.strip()] = int(value)
+    return quotas
+
+
+def build_ermct_rate_limiter_from_env() -> Optional[ErmctRateLimiter]:
+    if not ERMCT_RATE_LIMIT_ENABLED:
+        return None
+    if ERMCT_RATE_LIMIT_STATE == "sqlite":
+        state: RateLimitState = SqliteRateLimitState(ERMCT_RATE_LIMIT_PATH, ERMCT_RATE_LIMIT_BURST)
+    elif ERMCT_RATE_LIMIT_STATE == "memory":
+        state = MemoryRateLimitState(ERMCT_RATE_LIMIT_BURST)
+    else:
+        raise RuntimeError(f"지원하지 않는 ERMCT_RATE_LIMIT_STATE 값입니다: {ERMCT_RATE_LIMIT_STATE}")
+    return ErmctRateLimiter(
+        daily_quotas=_parse_quota_overrides(ERMCT_DAILY_QUOTA_OVERRIDES),
+        state=state,
+    )
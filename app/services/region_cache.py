@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from app.services.region_resolver import KakaoRegion, KakaoRegionResolver, region_to_sigungu
+from app.services.sigungu_search import ResolvedSigungu
+
+
+REGION_CACHE_ENABLED = os.getenv("REGION_CACHE_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+REGION_CACHE_GEOHASH_PRECISION = int(os.getenv("REGION_CACHE_GEOHASH_PRECISION", "7"))
+REGION_CACHE_MAX_ENTRIES = int(os.getenv("REGION_CACHE_MAX_ENTRIES", "50000"))
+REGION_CACHE_PATH = os.getenv("REGION_CACHE_PATH", "")
+REGION_CACHE_SAVE_EVERY = int(os.getenv("REGION_CACHE_SAVE_EVERY", "50"))
+REGION_CACHE_BORDER_CHECK = os.getenv("REGION_CACHE_BORDER_CHECK", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+_GEOHASH_INDEX = {char: index for index, char in enumerate(_GEOHASH_ALPHABET)}
+
+# 시군구 경계에 걸친 칸 표시 (캐시하지 않고 항상 실제 조회)
+_STRADDLES = "straddles"
+
+
+@dataclass(frozen=True)
+class _Unverified:
+    """경계 확인 전인 칸. 다시 들어오면 실제 조회로 답하고 경계 확인을 백그라운드로 넘긴다."""
+
+    region: KakaoRegion
+
+
+def geohash_encode(lat: float, lon: float, precision: int) -> str:
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = value = 0
+    even = True
+    while len(chars) < precision:
+        target, bounds = (lon, lon_range) if even else (lat, lat_range)
+        mid = (bounds[0] + bounds[1]) / 2
+        value <<= 1
+        if target >= mid:
+            value |= 1
+            bounds[0] = mid
+        else:
+            bounds[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_GEOHASH_ALPHABET[value])
+            bits = value = 0
+    return "".join(chars)
+
+
+def geohash_bounds(geohash: str) -> Tuple[float, float, float, float]:
+    """geohash 칸의 (min_lat, min_lon, max_lat, max_lon)"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        value = _GEOHASH_INDEX[char]
+        for shift in range(4, -1, -1):
+            bounds = lon_range if even else lat_range
+            mid = (bounds[0] + bounds[1]) / 2
+            if (value >> shift) & 1:
+                bounds[0] = mid
+            else:
+                bounds[1] = mid
+            even = not even
+    return lat_range[0], lon_range[0], lat_range[1], lon_range[1]
+
+
+def _region_key(region: Optional[KakaoRegion]) -> Optional[Tuple[str, str]]:
+    return (region.sido_name, region.sigungu_name) if region is not None else None
+
+
+class CachedRegionResolver:
+    """
+    KakaoRegionResolver.resolve_region 앞의 geohash 칸 단위 LRU 캐시.
+
+    구급대 대기 위치나 병원 앞처럼 같은 칸이 반복해서 들어오므로, 요청 경로에서는
+    Kakao를 한 번 넘게 부르지 않는다.
+
+    - 처음 보는 칸: 실제 조회 1번, 결과를 "확인 전"으로 저장하고 바로 돌려준다.
+    - 확인 전 칸에 다시 들어옴: 실제 조회 1번으로 답한다. 저장된 시군구와 다르면 바로
+      경계 칸으로 표시하고, 같으면 네 모서리 조회를 백그라운드 작업으로 넘긴다.
+      이동 중인 구급차처럼 한 번만 지나가는 칸에는 모서리 조회를 쓰지 않는다.
+    - 확인 끝난 칸은 캐시로 답하고, 모서리 중 한 곳이라도 시군구가 다르면 경계 칸으로
+      표시해서 그 칸은 항상 실제 조회한다.
+
+    모서리만 보므로 한 변의 가운데로 들어왔다 나가는 경계(칸 모서리는 모두 같은 시군구)는
+    놓칠 수 있다. 두 번째 방문의 실제 조회 비교가 그런 칸 일부를 잡아낸다.
+    path를 주면 칸 → 지역 표를 JSON으로 저장해서 재시작 후에도 쓴다.
+    """
+
+    def __init__(
+        self,
+        resolver: KakaoRegionResolver,
+        precision: int = REGION_CACHE_GEOHASH_PRECISION,
+        max_entries: int = REGION_CACHE_MAX_ENTRIES,
+        path: Optional[Path] = None,
+        save_every: int = REGION_CACHE_SAVE_EVERY,
+        border_check: bool = REGION_CACHE_BORDER_CHECK,
+        border_executor: Optional[Executor] = None,
+    ) -> None:
+        self.resolver = resolver
+        self.precision = precision
+        self.max_entries = max(1, max_entries)
+        self.path = path
+        self.save_every = save_every
+        self.border_check = border_check
+        self._border_executor = border_executor
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._checking: set[str] = set()
+        self._unsaved = 0
+        self.hits = 0
+        self.misses = 0
+        self.border_live = 0
+        self.unverified_live = 0
+        self.border_checks = 0
+        self.evictions = 0
+        if path is not None:
+            self._load(path)
+
+    def _load(self, path: Path) -> None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            print(f"[REGION CACHE] load failed path={path} error={exc!r}")
+            return
+        if data.get("precision") != self.precision:
+            return
+        for cell, value in (data.get("cells") or {}).items():
+            if value == _STRADDLES:
+                self._entries[cell] = _STRADDLES
+            elif isinstance(value, dict):
+                value = dict(value)
+                verified = value.pop("verified", True)
+                try:
+                    region = KakaoRegion(**value)
+                except TypeError:
+                    continue
+                self._entries[cell] = region if verified else _Unverified(region)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            cells = {cell: self._serialize(value) for cell, value in self._entries.items()}
+            self._unsaved = 0
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            payload = {"precision": self.precision, "cells": cells}
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            print(f"[REGION CACHE] save failed path={self.path} error={exc!r}")
+
+    @staticmethod
+    def _serialize(value: Any) -> Any:
+        if value == _STRADDLES:
+            return value
+        region = value.region if isinstance(value, _Unverified) else value
+        payload = {
+            "sido_name": region.sido_name,
+            "sigungu_name": region.sigungu_name,
+            "dong_name": region.dong_name,
+        }
+        if isinstance(value, _Unverified):
+            payload["verified"] = False
+        return payload
+
+    def _straddles(self, cell: str, region: KakaoRegion) -> bool:
+        min_lat, min_lon, max_lat, max_lon = geohash_bounds(cell)
+        expected = _region_key(region)
+        for lat, lon in ((min_lat, min_lon), (min_lat, max_lon), (max_lat, min_lon), (max_lat, max_lon)):
+            if _region_key(self.resolver.resolve_region(lat, lon)) != expected:
+                return True
+        return False
+
+    def _store(self, cell: str, value: Any) -> None:
+        with self._lock:
+            self._entries[cell] = value
+            self._entries.move_to_end(cell)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._unsaved += 1
+            should_save = self.save_every > 0 and self._unsaved >= self.save_every
+        if should_save:
+            self.save()
+
+    def _schedule_border_check(self, cell: str, region: KakaoRegion) -> None:
+        with self._lock:
+            if cell in self._checking:
+                return
+            self._checking.add(cell)
+            if self._border_executor is None:
+                self._border_executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="region-border-check",
+                )
+            executor = self._border_executor
+        executor.submit(self._check_border, cell, region)
+
+    def _check_border(self, cell: str, region: KakaoRegion) -> None:
+        try:
+            straddles = self._straddles(cell, region)
+        except Exception as exc:
+            # 실패하면 확인 전 상태로 두고 다음 방문 때 다시 시도한다
+            print(f"[REGION CACHE] border check failed cell={cell} error={exc!r}")
+            with self._lock:
+                self._checking.discard(cell)
+            return
+        with self._lock:
+            self._checking.discard(cell)
+            self.border_checks += 1
+            # 확인하는 동안 밀려났거나 바뀐 칸은 건드리지 않는다
+            if self._entries.get(cell) != _Unverified(region):
+                return
+        self._store(cell, _STRADDLES if straddles else region)
+
+    def resolve_region(self, lat: float, lon: float) -> Optional[KakaoRegion]:
+        cell = geohash_encode(lat, lon, self.precision)
+        with self._lock:
+            cached = self._entries.get(cell)
+            if cached is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(cell)
+                if cached == _STRADDLES:
+                    self.border_live += 1
+                elif isinstance(cached, _Unverified):
+                    self.unverified_live += 1
+                else:
+                    self.hits += 1
+                    return cached
+
+        region = self.resolver.resolve_region(lat, lon)
+        if region is None:
+            return None
+        if cached is None:
+            self._store(cell, _Unverified(region) if self.border_check else region)
+        elif isinstance(cached, _Unverified):
+            if _region_key(region) != _region_key(cached.region):
+                self._store(cell, _STRADDLES)
+            else:
+                self._schedule_border_check(cell, cached.region)
+        return region
+
+    def resolve_sigungu(self, lat: float, lon: float) -> Optional[ResolvedSigungu]:
+        return region_to_sigungu(self.resolve_region(lat, lon))
+
+    def resolve(self, lat: float, lon: float) -> Optional[ResolvedSigungu]:
+        return self.resolve_sigungu(lat, lon)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses + self.border_live + self.unverified_live
+            return {
+                "precision": self.precision,
+                "entries": len(self._entries),
+                "straddling_cells": sum(1 for value in self._entries.values() if value == _STRADDLES),
+                "unverified_cells": sum(1 for value in self._entries.values() if isinstance(value, _Unverified)),
+                "hits": self.hits,
+                "misses": self.misses,
+                "border_live": self.border_live,
+                "unverified_live": self.unverified_live,
+                "border_checks": self.border_checks,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+def build_region_cache_from_env(resolver: KakaoRegionResolver) -> Optional[CachedRegionResolver]:
+    if not REGION_CACHE_ENABLED:
+        return None
+    path = Path(REGION_CACHE_PATH) if REGION_CACHE_PATH else None
+    return CachedRegionResolver(resolver, path=path)
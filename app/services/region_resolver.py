@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -9,7 +10,8 @@ from app.config import KAKAO_REST_API_KEY
 from app.services.sigungu_search import ResolvedSigungu
 
 
-KAKAO_COORD2REGION_URL = "https://dapi.kakao.com/v2/local/geo/coord2regioncode.json"
+KAKAO_BASE_URL = os.getenv("KAKAO_BASE_URL", "https://dapi.kakao.com").rstrip("/")
+KAKAO_COORD2REGION_URL = f"{KAKAO_BASE_URL}/v2/local/geo/coord2regioncode.json"
 
 
 @dataclass(frozen=True)
@@ -53,6 +55,18 @@ def _extract_kakao_region(data: dict[str, Any]) -> Optional[KakaoRegion]:
     )
 
 
+def region_to_sigungu(region: Optional[KakaoRegion]) -> Optional[ResolvedSigungu]:
+    if not region:
+        return None
+
+    return ResolvedSigungu(
+        sigungu_code="",
+        sigungu_name=_strip_region_suffix(region.sigungu_name),
+        sido_code=None,
+        sido_name=region.sido_name,
+    )
+
+
 class KakaoRegionResolver:
     def __init__(self, api_key: str | None = None, timeout: float = 2.5) -> None:
         self.api_key = api_key or KAKAO_REST_API_KEY
@@ -81,13 +95,7 @@ class KakaoRegionResolver:
         return _extract_kakao_region(data)
 
     def resolve_sigungu(self, lat: float, lon: float) -> Optional[ResolvedSigungu]:
-        region = self.resolve_region(lat, lon)
-        if not region:
-            return None
+        return region_to_sigungu(self.resolve_region(lat, lon))
 
-        return ResolvedSigungu(
-            sigungu_code="",
-            sigungu_name=_strip_region_suffix(region.sigungu_name),
-            sido_code=None,
-            sido_name=region.sido_name,
-        )
+    def resolve(self, lat: float, lon: float) -> Optional[ResolvedSigungu]:
+        return self.resolve_sigungu(lat, lon)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.services.sigungu_search import ResolvedSigungu
+
+
+SIGUNGU_BOUNDARY_PATH = os.getenv("SIGUNGU_BOUNDARY_PATH", "data/sigungu_boundaries.json")
+SIGUNGU_BOUNDARY_GRID_DEGREES = float(os.getenv("SIGUNGU_BOUNDARY_GRID_DEGREES", "0.05"))
+
+# 파일 형식 (scripts/build_sigungu_boundaries.py가 만든다)
+# {"version": 1, "features": [{"code": "11010", "name": "종로구", "sido_code": "11",
+#   "polygons": [[[lon0, lat0, lon1, lat1, ...], [구멍 ring ...]], ...]}]}
+# code는 sigungu_adjacency.json 코드. ring은 [lon, lat]를 평평하게 이어 붙인 배열이다.
+BOUNDARY_FILE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SigunguBoundary:
+    code: str
+    name: str
+    sido_code: Optional[str]
+    # 폴리곤마다 ring 목록 (첫 ring이 바깥, 나머지는 구멍), 각 ring은 lon/lat 교대 배열
+    polygons: Tuple[Tuple[array, ...], ...]
+    bbox: Tuple[float, float, float, float]  # (min_lon, min_lat, max_lon, max_lat)
+
+
+def _ring_contains(ring: array, lon: float, lat: float) -> bool:
+    # ray casting (짝홀 규칙)
+    inside = False
+    count = len(ring) // 2
+    x1, y1 = ring[2 * count - 2], ring[2 * count - 1]
+    for i in range(count):
+        x2, y2 = ring[2 * i], ring[2 * i + 1]
+        if (y2 > lat) != (y1 > lat):
+            if lon < (x1 - x2) * (lat - y2) / (y1 - y2) + x2:
+                inside = not inside
+        x1, y1 = x2, y2
+    return inside
+
+
+def _polygon_contains(rings: Sequence[array], lon: float, lat: float) -> bool:
+    if not rings or not _ring_contains(rings[0], lon, lat):
+        return False
+    return not any(_ring_contains(hole, lon, lat) for hole in rings[1:])
+
+
+class SigunguBoundaryIndex:
+    """
+    시군구 경계 폴리곤에 대한 격자 인덱스.
+
+    경계 bbox가 걸치는 격자 칸마다 시군구 번호를 등록해 두고,
+    좌표가 들어오면 그 칸의 후보만 bbox → point-in-polygon 순서로 확인한다.
+    """
+
+    def __init__(
+        self,
+        boundaries: Sequence[SigunguBoundary],
+        grid_degrees: float = SIGUNGU_BOUNDARY_GRID_DEGREES,
+    ) -> None:
+        self.boundaries = list(boundaries)
+        self.grid_degrees = grid_degrees
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+        for index, boundary in enumerate(self.boundaries):
+            min_lon, min_lat, max_lon, max_lat = boundary.bbox
+            for gx in range(self._cell(min_lon), self._cell(max_lon) + 1):
+                for gy in range(self._cell(min_lat), self._cell(max_lat) + 1):
+                    self._grid.setdefault((gx, gy), []).append(index)
+
+    def __len__(self) -> int:
+        return len(self.boundaries)
+
+    def _cell(self, value: float) -> int:
+        return math.floor(value / self.grid_degrees)
+
+    def lookup(self, lat: float, lon: float) -> Optional[SigunguBoundary]:
+        for index in self._grid.get((self._cell(lon), self._cell(lat)), ()):
+            boundary = self.boundaries[index]
+            min_lon, min_lat, max_lon, max_lat = boundary.bbox
+            if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+                continue
+            if any(_polygon_contains(rings, lon, lat) for rings in boundary.polygons):
+                return boundary
+        return None
+
+
+def _parse_boundary(feature: Dict[str, Any]) -> Optional[SigunguBoundary]:
+    polygons = []
+    min_lon = min_lat = math.inf
+    max_lon = max_lat = -math.inf
+    for raw_polygon in feature.get("polygons") or []:
+        rings = []
+        for raw_ring in raw_polygon:
+            ring = array("d", raw_ring)
+            if len(ring) < 6 or len(ring) % 2:
+                continue
+            rings.append(ring)
+        if not rings:
+            continue
+        outer = rings[0]
+        min_lon = min(min_lon, min(outer[0::2]))
+        max_lon = max(max_lon, max(outer[0::2]))
+        min_lat = min(min_lat, min(outer[1::2]))
+        max_lat = max(max_lat, max(outer[1::2]))
+        polygons.append(tuple(rings))
+    if not polygons or not feature.get("code"):
+        return None
+    return SigunguBoundary(
+        code=str(feature["code"]),
+        name=str(feature.get("name") or ""),
+        sido_code=str(feature["sido_code"]) if feature.get("sido_code") else None,
+        polygons=tuple(polygons),
+        bbox=(min_lon, min_lat, max_lon, max_lat),
+    )
+
+
+def load_sigungu_boundary_index(
+    path: str | Path,
+    grid_degrees: float = SIGUNGU_BOUNDARY_GRID_DEGREES,
+) -> SigunguBoundaryIndex:
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    if raw.get("version") != BOUNDARY_FILE_VERSION:
+        raise ValueError(f"unsupported sigungu boundary file version: {raw.get('version')!r}")
+    boundaries = [
+        boundary
+        for boundary in (_parse_boundary(feature) for feature in raw.get("features") or [])
+        if boundary is not None
+    ]
+    return SigunguBoundaryIndex(boundaries, grid_degrees=grid_degrees)
+
+
+def load_sigungu_boundary_index_from_env() -> Optional[SigunguBoundaryIndex]:
+    path = Path(SIGUNGU_BOUNDARY_PATH) if SIGUNGU_BOUNDARY_PATH else None
+    if path is None or not path.exists():
+        print(f"[REGION RESOLVER] boundary file not found path={path}; using Kakao only")
+        return None
+    try:
+        return load_sigungu_boundary_index(path)
+    except (OSError, ValueError) as exc:
+        print(f"[REGION RESOLVER] boundary file load failed path={path} error={exc!r}")
+        return None
+
+
+class LocalSigunguResolver:
+    """
+    SigunguResolver 구현. 로컬 경계 인덱스에서 먼저 찾고(adjacency 코드를 바로 돌려준다),
+    인덱스가 없거나 경계 밖(해상, 단순화 틈)일 때만 fallback(Kakao)에 묻는다.
+    """
+
+    def __init__(
+        self,
+        index: Optional[SigunguBoundaryIndex],
+        fallback: Optional[Any] = None,
+    ) -> None:
+        self.index = index
+        self.fallback = fallback
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.fallback_calls = 0
+
+    def resolve(self, lat: float, lon: float) -> Optional[ResolvedSigungu]:
+        if self.index is not None:
+            boundary = self.index.lookup(lat, lon)
+            if boundary is not None:
+                with self._lock:
+                    self.local_hits += 1
+                return ResolvedSigungu(
+                    sigungu_code=boundary.code,
+                    sigungu_name=boundary.name,
+                    sido_code=boundary.sido_code,
+                )
+        if self.fallback is None:
+            return None
+        with self._lock:
+            self.fallback_calls += 1
+        return self.fallback.resolve_sigungu(lat, lon)
+
+    # KakaoRegionResolver와 같은 이름으로도 부를 수 있게 한다
+    resolve_sigungu = resolve
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "boundaries": len(self.index) if self.index is not None else 0,
+                "local_hits": self.local_hits,
+                "fallback_calls": self.fallback_calls,
+            }
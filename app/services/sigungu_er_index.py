@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+SIGUNGU_ER_INDEX_ENABLED = os.getenv("SIGUNGU_ER_INDEX_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+SIGUNGU_ER_COUNTS_PATH = os.getenv("SIGUNGU_ER_COUNTS_PATH", "data/sigungu_er_counts.json")
+SIGUNGU_EMPTY_CACHE_TTL_SECONDS = float(os.getenv("SIGUNGU_EMPTY_CACHE_TTL_SECONDS", "21600"))
+# 파일에 0으로 적힌 시군구를 건너뛰는 기간. 지나면 한 번 다시 조회해서 새로 생긴 응급실을 찾는다.
+SIGUNGU_FILE_EMPTY_TTL_SECONDS = float(os.getenv("SIGUNGU_FILE_EMPTY_TTL_SECONDS", "86400"))
+
+# 파일 형식 (scripts/build_sigungu_er_counts.py가 만들고, 서버 종료 시 조회 결과로 갱신한다)
+# {"version": 1, "updated_at": "...", "counts": {"11010": 3, "32330": 0, ...}}
+# 코드는 sigungu_adjacency.json 코드, 값은 실시간 병상 API가 돌려준 응급의료기관 수.
+ER_COUNTS_FILE_VERSION = 1
+
+
+class SigunguErIndex:
+    """
+    시군구별 응급의료기관 수 인덱스 + 0건 지역 negative cache.
+
+    - counts: 스크립트로 만든 파일 값에 실제 조회 결과(record)를 덮어쓴다.
+      파일에 0으로 적힌 시군구는 시작할 때 negative cache에 file_empty_ttl_seconds 만료로 넣는다.
+      만료되면 다시 조회하므로 응급실이 새로 생긴 지역도 스크립트 없이 record로 반영된다.
+    - negative cache: 조회했더니 0건이던 시군구는 empty_ttl_seconds 동안 건너뛴다.
+      파일 값이 양수여도 적용되고, TTL이 지나면 다시 조회한다.
+    """
+
+    def __init__(
+        self,
+        counts: Optional[Dict[str, int]] = None,
+        empty_ttl_seconds: float = SIGUNGU_EMPTY_CACHE_TTL_SECONDS,
+        path: Optional[Path] = None,
+        clock: Callable[[], float] = time.monotonic,
+        file_empty_ttl_seconds: float = SIGUNGU_FILE_EMPTY_TTL_SECONDS,
+    ) -> None:
+        self.empty_ttl_seconds = empty_ttl_seconds
+        self.path = path
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = dict(counts or {})
+        file_empty_until = clock() + file_empty_ttl_seconds
+        self._empty_until: Dict[str, float] = {
+            code: file_empty_until for code, count in self._counts.items() if count == 0
+        }
+        self._dirty = False
+        self.skipped = 0
+        self.recorded = 0
+
+    def count(self, sigungu_code: str) -> Optional[int]:
+        with self._lock:
+            return self._counts.get(sigungu_code)
+
+    def _is_empty_locked(self, sigungu_code: str, now: float) -> bool:
+        until = self._empty_until.get(sigungu_code)
+        if until is None:
+            return False
+        if until <= now:
+            del self._empty_until[sigungu_code]
+            return False
+        return True
+
+    def is_empty(self, sigungu_code: str) -> bool:
+        with self._lock:
+            return self._is_empty_locked(sigungu_code, self.clock())
+
+    def filter_codes(self, sigungu_codes: Iterable[str]) -> List[str]:
+        """빈 지역을 뺀 코드 목록 (순서 유지). 뺀 개수는 stats의 skipped에 쌓인다."""
+        now = self.clock()
+        kept: List[str] = []
+        with self._lock:
+            for code in sigungu_codes:
+                if self._is_empty_locked(code, now):
+                    self.skipped += 1
+                else:
+                    kept.append(code)
+        return kept
+
+    def record(self, sigungu_code: str, count: int) -> None:
+        """지역 조회가 성공했을 때 받은 병원 수를 반영한다 (실패한 조회는 넘기지 말 것)."""
+        with self._lock:
+            self.recorded += 1
+            if count > 0:
+                self._empty_until.pop(sigungu_code, None)
+                if self._counts.get(sigungu_code) != count:
+                    self._counts[sigungu_code] = count
+                    self._dirty = True
+            else:
+                self._empty_until[sigungu_code] = self.clock() + self.empty_ttl_seconds
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                "version": ER_COUNTS_FILE_VERSION,
+                "updated_at": datetime.now(UTC).isoformat(timespec="seconds"),
+                "counts": dict(sorted(self._counts.items())),
+            }
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=1), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            print(f"[SIGUNGU ER INDEX] save failed path={self.path} error={exc!r}")
+
+    def stats(self) -> Dict[str, Any]:
+        now = self.clock()
+        with self._lock:
+            return {
+                "indexed": len(self._counts),
+                "empty_indexed": sum(1 for count in self._counts.values() if count == 0),
+                "negative_cached": sum(1 for until in self._empty_until.values() if until > now),
+                "skipped": self.skipped,
+                "recorded": self.recorded,
+            }
+
+
+def load_sigungu_er_counts(path: str | Path) -> Dict[str, int]:
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    if raw.get("version") != ER_COUNTS_FILE_VERSION:
+        raise ValueError(f"unsupported sigungu ER count file version: {raw.get('version')!r}")
+    return {str(code): int(count) for code, count in (raw.get("counts") or {}).items()}
+
+
+def load_sigungu_er_index_from_env() -> Optional[SigunguErIndex]:
+    if not SIGUNGU_ER_INDEX_ENABLED:
+        return None
+    path = Path(SIGUNGU_ER_COUNTS_PATH) if SIGUNGU_ER_COUNTS_PATH else None
+    counts: Dict[str, int] = {}
+    if path is not None and path.exists():
+        try:
+            counts = load_sigungu_er_counts(path)
+        except (OSError, ValueError) as exc:
+            print(f"[SIGUNGU ER INDEX] count file load failed path={path} error={exc!r}")
+    return SigunguErIndex(counts, path=path)
@@ -1,13 +1,42 @@
 from __future__ import annotations
 
+import contextvars
+import heapq
 import json
-from dataclasses import dataclass
+import math
+import struct
+import threading
+import time
+from array import array
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, Generic, Iterable, List, Optional, Protocol, Sequence, TypeVar
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Protocol, Sequence, Tuple, TypeVar
 
 
 T = TypeVar("T")
 
+# sigungu_adjacency.json(통계청) 시도 코드 → ERMCT STAGE1 시도 이름
+SIDO_CODE_TO_NAME = {
+    "11": "서울특별시",
+    "21": "부산광역시",
+    "22": "대구광역시",
+    "23": "인천광역시",
+    "24": "광주광역시",
+    "25": "대전광역시",
+    "26": "울산광역시",
+    "29": "세종특별자치시",
+    "31": "경기도",
+    "32": "강원특별자치도",
+    "33": "충청북도",
+    "34": "충청남도",
+    "35": "전북특별자치도",
+    "36": "전라남도",
+    "37": "경상북도",
+    "38": "경상남도",
+    "39": "제주특별자치도",
+}
+
 
 @dataclass(frozen=True)
 class AdjacentSigungu:
@@ -19,11 +48,126 @@ class AdjacentSigungu:
     centroid_distance_km: float
 
 
+EXPANSION_MODES = ("adjacency", "k_ring", "nearest_n")
+
+
 @dataclass(frozen=True)
 class ExpansionPolicy:
+    """
+    mode
+    - adjacency: 기준 → 맞닿은 상위 N개 → 나머지 맞닿은 곳 → buffer 교차 (1홉)
+    - k_ring: 인접 그래프 BFS로 max_hops 홉까지, 홉마다 한 레벨
+    - nearest_n: centroid 거리 행렬 기준 가까운 nearest_n곳을 level_size개씩 레벨로
+    """
+
     top_touching_limit: int = 3
     include_remaining_touches: bool = True
     include_buffer_intersects: bool = True
+    mode: str = "adjacency"
+    max_hops: int = 2
+    nearest_n: int = 12
+    level_size: int = 4
+
+
+# 레벨 목록 (불변, 요청끼리 공유)
+ExpansionPlan = Tuple[Tuple[str, ...], ...]
+
+BORDER_TOUCH = "border_touch"
+
+
+@dataclass(frozen=True)
+class CompactAdjacency:
+    """
+    CSR 형태 인접 그래프. 코드 i의 이웃은 neighbors[offsets[i]:offsets[i + 1]]이고,
+    각 행은 (centroid_distance_km, 이웃 코드) 순으로 미리 정렬돼 있다.
+    """
+
+    codes: Tuple[str, ...]
+    code_index: Dict[str, int]
+    offsets: array  # "i", 길이 len(codes) + 1
+    neighbors: array  # "i", 이웃 코드 번호
+    distances_km: array  # "d"
+    # 비트 0: touches, 비트 1: adjacency_type == border_touch
+    flags: array  # "B"
+
+    def row(self, code_index: int) -> range:
+        return range(self.offsets[code_index], self.offsets[code_index + 1])
+
+    def is_touching(self, edge: int) -> bool:
+        return self.flags[edge] == 0b11
+
+
+@dataclass(frozen=True)
+class CentroidDistanceMatrix:
+    """
+    전체 시군구 쌍의 centroid 거리(km) n×n 행렬 (행 우선 "d" 배열, 닿지 않으면 inf).
+
+    adjacency 파일에는 시군구 좌표가 없고 인접 쌍의 centroid_distance_km만 있으므로,
+    각 값은 그 간선들을 따라간 최단 경로(Dijkstra) 거리다.
+    """
+
+    size: int
+    distances_km: array  # "d", 길이 size * size
+
+    def distance_km(self, from_index: int, to_index: int) -> float:
+        return self.distances_km[from_index * self.size + to_index]
+
+    def ordered_from(self, base_index: int) -> List[int]:
+        """base에서 닿는 코드 번호를 가까운 순서로 (같은 거리면 코드 순, base 포함)."""
+        row = self.distances_km[base_index * self.size : (base_index + 1) * self.size]
+        reachable = [index for index in range(self.size) if row[index] != math.inf]
+        return sorted(reachable, key=lambda index: (row[index], index))
+
+
+def build_centroid_distance_matrix(compact: CompactAdjacency) -> CentroidDistanceMatrix:
+    size = len(compact.codes)
+    distances_km = array("d", [math.inf]) * (size * size)
+    for base_index in range(size):
+        offset = base_index * size
+        distances_km[offset + base_index] = 0.0
+        heap: List[tuple[float, int]] = [(0.0, base_index)]
+        while heap:
+            distance, index = heapq.heappop(heap)
+            if distance > distances_km[offset + index]:
+                continue
+            for edge in compact.row(index):
+                next_index = compact.neighbors[edge]
+                next_distance = distance + compact.distances_km[edge]
+                if next_distance < distances_km[offset + next_index]:
+                    distances_km[offset + next_index] = next_distance
+                    heapq.heappush(heap, (next_distance, next_index))
+    return CentroidDistanceMatrix(size=size, distances_km=distances_km)
+
+
+def build_compact_adjacency(neighbors_by_code: Dict[str, List[AdjacentSigungu]]) -> CompactAdjacency:
+    code_set = set(neighbors_by_code)
+    for items in neighbors_by_code.values():
+        code_set.update(item.neighbor_sigungu_code for item in items)
+    codes = tuple(sorted(code_set))
+    code_index = {code: index for index, code in enumerate(codes)}
+
+    offsets = array("i", [0])
+    neighbors = array("i")
+    distances_km = array("d")
+    flags = array("B")
+    for code in codes:
+        for item in sorted(
+            neighbors_by_code.get(code, []),
+            key=lambda item: (item.centroid_distance_km, item.neighbor_sigungu_code),
+        ):
+            neighbors.append(code_index[item.neighbor_sigungu_code])
+            distances_km.append(item.centroid_distance_km)
+            flags.append(int(item.touches) | (int(item.adjacency_type == BORDER_TOUCH) << 1))
+        offsets.append(len(neighbors))
+
+    return CompactAdjacency(
+        codes=codes,
+        code_index=code_index,
+        offsets=offsets,
+        neighbors=neighbors,
+        distances_km=distances_km,
+        flags=flags,
+    )
 
 
 @dataclass(frozen=True)
@@ -32,11 +176,53 @@ class SigunguAdjacencyIndex:
     code_to_name: Dict[str, str]
     code_to_sido_code: Dict[str, str]
     name_to_code: Dict[str, str]
+    # CSR 그래프 / 정책별 확장 계획은 처음 쓸 때 한 번 만든다
+    _derived: Dict[Any, Any] = field(default_factory=dict, repr=False, compare=False)
+    _derived_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     @property
     def all_codes(self) -> List[str]:
         return sorted(self.neighbors_by_code.keys())
 
+    @property
+    def compact(self) -> CompactAdjacency:
+        compact = self._derived.get("compact")
+        if compact is None:
+            with self._derived_lock:
+                compact = self._derived.get("compact")
+                if compact is None:
+                    compact = build_compact_adjacency(self.neighbors_by_code)
+                    self._derived["compact"] = compact
+        return compact
+
+    @property
+    def distance_matrix(self) -> CentroidDistanceMatrix:
+        matrix = self._derived.get("distance_matrix")
+        if matrix is None:
+            compact = self.compact
+            with self._derived_lock:
+                matrix = self._derived.get("distance_matrix")
+                if matrix is None:
+                    matrix = build_centroid_distance_matrix(compact)
+                    self._derived["distance_matrix"] = matrix
+        return matrix
+
+    def expansion_plans(self, policy: ExpansionPolicy) -> Dict[str, ExpansionPlan]:
+        """정책 하나에 대한 전체 시군구 확장 계획 {기준 코드: 레벨 목록}."""
+        plans = self._derived.get(policy)
+        if plans is None:
+            compact = self.compact
+            matrix = self.distance_matrix if policy.mode != "adjacency" else None
+            with self._derived_lock:
+                plans = self._derived.get(policy)
+                if plans is None:
+                    plans = {
+                        code: _plan_expansion(compact, index, policy, matrix)
+                        for index, code in enumerate(compact.codes)
+                    }
+                    self._derived[policy] = plans
+        return plans
+
     def get_name(self, sigungu_code: str) -> Optional[str]:
         return self.code_to_name.get(sigungu_code)
 
@@ -57,6 +243,7 @@ class ProgressiveSearchAttempt:
     fetched_count: int
     valid_count: int
     error: Optional[str] = None
+    elapsed_ms: Optional[float] = None
 
 
 @dataclass(frozen=True)
@@ -140,60 +327,202 @@ def load_sigungu_adjacency(path: str | Path) -> SigunguAdjacencyIndex:
     )
 
 
-def build_expansion_levels(
-    base_code: str,
-    adjacency_index: SigunguAdjacencyIndex,
-    policy: ExpansionPolicy | None = None,
-    fallback_codes: Optional[Iterable[str]] = None,
-) -> List[List[str]]:
-    cfg = policy or ExpansionPolicy()
-    seen = {base_code}
-    levels: List[List[str]] = [[base_code]]
-
-    neighbors = sorted(
-        adjacency_index.neighbors_by_code.get(base_code, []),
-        key=lambda item: (item.centroid_distance_km, item.neighbor_sigungu_code),
+# 바이너리 인접 그래프: 매직 8바이트 + 헤더 길이(uint32) + JSON 헤더 + 배열 원본 바이트.
+# JSON 파싱/데이터클래스 생성 없이 파일 한 번 읽고 배열을 그대로 올린다.
+ADJACENCY_ARTIFACT_MAGIC = b"SGADJ\x00\x00\x01"
+_ARTIFACT_ARRAYS = (("offsets", "i"), ("neighbors", "i"), ("distances_km", "d"), ("flags", "B"), ("edge_types", "B"))
+
+
+def write_sigungu_adjacency_artifact(index: SigunguAdjacencyIndex, path: str | Path) -> int:
+    compact = index.compact
+    adjacency_types: List[str] = []
+    neighbor_sido_codes: Dict[str, str] = {}
+    edge_types = array("B")
+    for code in compact.codes:
+        row_items = sorted(
+            index.neighbors_by_code.get(code, []),
+            key=lambda item: (item.centroid_distance_km, item.neighbor_sigungu_code),
+        )
+        for item in row_items:
+            if item.adjacency_type not in adjacency_types:
+                adjacency_types.append(item.adjacency_type)
+            edge_types.append(adjacency_types.index(item.adjacency_type))
+            neighbor_sido_codes.setdefault(item.neighbor_sigungu_code, item.neighbor_sido_code)
+
+    arrays = {
+        "offsets": compact.offsets,
+        "neighbors": compact.neighbors,
+        "distances_km": compact.distances_km,
+        "flags": compact.flags,
+        "edge_types": edge_types,
+    }
+    header = json.dumps(
+        {
+            "codes": list(compact.codes),
+            "base_codes": sorted(index.neighbors_by_code),
+            "code_to_name": index.code_to_name,
+            "code_to_sido_code": index.code_to_sido_code,
+            "neighbor_sido_codes": neighbor_sido_codes,
+            "adjacency_types": adjacency_types,
+            "lengths": {name: len(arrays[name]) for name, _ in _ARTIFACT_ARRAYS},
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    payload = b"".join(
+        [ADJACENCY_ARTIFACT_MAGIC, struct.pack("<I", len(header)), header]
+        + [arrays[name].tobytes() for name, _ in _ARTIFACT_ARRAYS]
+    )
+    Path(path).write_bytes(payload)
+    return len(payload)
+
+
+def load_sigungu_adjacency_artifact(path: str | Path) -> SigunguAdjacencyIndex:
+    data = memoryview(Path(path).read_bytes())
+    magic_length = len(ADJACENCY_ARTIFACT_MAGIC)
+    if bytes(data[:magic_length]) != ADJACENCY_ARTIFACT_MAGIC:
+        raise ValueError(f"not a sigungu adjacency artifact: {path}")
+    (header_length,) = struct.unpack_from("<I", data, magic_length)
+    offset = magic_length + 4
+    header = json.loads(bytes(data[offset : offset + header_length]).decode("utf-8"))
+    offset += header_length
+
+    arrays: Dict[str, array] = {}
+    for name, typecode in _ARTIFACT_ARRAYS:
+        values = array(typecode)
+        size = header["lengths"][name] * values.itemsize
+        values.frombytes(data[offset : offset + size])
+        arrays[name] = values
+        offset += size
+
+    codes = tuple(header["codes"])
+    compact = CompactAdjacency(
+        codes=codes,
+        code_index={code: index for index, code in enumerate(codes)},
+        offsets=arrays["offsets"],
+        neighbors=arrays["neighbors"],
+        distances_km=arrays["distances_km"],
+        flags=arrays["flags"],
     )
+    code_to_name: Dict[str, str] = header["code_to_name"]
+    neighbor_sido_codes: Dict[str, str] = header["neighbor_sido_codes"]
+    adjacency_types: List[str] = header["adjacency_types"]
 
-    touching = [
-        item for item in neighbors if item.touches and item.adjacency_type == "border_touch"
-    ]
+    neighbors_by_code: Dict[str, List[AdjacentSigungu]] = {}
+    for code in header["base_codes"]:
+        parsed = []
+        for edge in compact.row(compact.code_index[code]):
+            neighbor_code = codes[compact.neighbors[edge]]
+            parsed.append(
+                AdjacentSigungu(
+                    neighbor_sigungu_code=neighbor_code,
+                    neighbor_sigungu_name=code_to_name.get(neighbor_code, ""),
+                    neighbor_sido_code=neighbor_sido_codes.get(neighbor_code, ""),
+                    adjacency_type=adjacency_types[arrays["edge_types"][edge]],
+                    touches=bool(compact.flags[edge] & 1),
+                    centroid_distance_km=compact.distances_km[edge],
+                )
+            )
+        neighbors_by_code[code] = parsed
+
+    index = SigunguAdjacencyIndex(
+        neighbors_by_code=neighbors_by_code,
+        code_to_name=code_to_name,
+        code_to_sido_code=header["code_to_sido_code"],
+        name_to_code={_normalize_name(name): code for code, name in code_to_name.items()},
+    )
+    index._derived["compact"] = compact
+    return index
+
+
+def _plan_k_ring(
+    compact: CompactAdjacency,
+    base_index: int,
+    cfg: ExpansionPolicy,
+    matrix: CentroidDistanceMatrix,
+) -> ExpansionPlan:
+    codes = compact.codes
+    seen = {base_index}
+    levels: List[Tuple[str, ...]] = [(codes[base_index],)]
+    frontier = [base_index]
+    for _ in range(max(0, cfg.max_hops)):
+        ring = {
+            compact.neighbors[edge]
+            for index in frontier
+            for edge in compact.row(index)
+        } - seen
+        if not ring:
+            break
+        seen.update(ring)
+        frontier = sorted(ring, key=lambda index: (matrix.distance_km(base_index, index), index))
+        levels.append(tuple(codes[index] for index in frontier))
+    return tuple(levels)
+
+
+def _plan_nearest_n(
+    compact: CompactAdjacency,
+    base_index: int,
+    cfg: ExpansionPolicy,
+    matrix: CentroidDistanceMatrix,
+) -> ExpansionPlan:
+    codes = compact.codes
+    nearest = [index for index in matrix.ordered_from(base_index) if index != base_index]
+    nearest = nearest[: max(0, cfg.nearest_n)]
+    level_size = max(1, cfg.level_size)
+    levels: List[Tuple[str, ...]] = [(codes[base_index],)]
+    for start in range(0, len(nearest), level_size):
+        levels.append(tuple(codes[index] for index in nearest[start : start + level_size]))
+    return tuple(levels)
+
+
+def _plan_expansion(
+    compact: CompactAdjacency,
+    base_index: int,
+    cfg: ExpansionPolicy,
+    matrix: Optional[CentroidDistanceMatrix] = None,
+) -> ExpansionPlan:
+    if cfg.mode == "k_ring" and matrix is not None:
+        return _plan_k_ring(compact, base_index, cfg, matrix)
+    if cfg.mode == "nearest_n" and matrix is not None:
+        return _plan_nearest_n(compact, base_index, cfg, matrix)
+
+    codes = compact.codes
+    row = compact.row(base_index)
+    touching = [compact.neighbors[edge] for edge in row if compact.is_touching(edge)]
+    touching_set = set(touching)
     non_touching = [
-        item
-        for item in neighbors
-        if item.neighbor_sigungu_code not in {n.neighbor_sigungu_code for n in touching}
+        compact.neighbors[edge] for edge in row if compact.neighbors[edge] not in touching_set
     ]
 
-    top_touching = [
-        item.neighbor_sigungu_code
-        for item in touching[: cfg.top_touching_limit]
-        if item.neighbor_sigungu_code not in seen
-    ]
-    if top_touching:
-        seen.update(top_touching)
-        levels.append(top_touching)
+    seen = {base_index}
+    levels: List[Tuple[str, ...]] = [(codes[base_index],)]
 
+    groups = [touching[: cfg.top_touching_limit]]
     if cfg.include_remaining_touches:
-        remaining_touching = [
-            item.neighbor_sigungu_code
-            for item in touching[cfg.top_touching_limit :]
-            if item.neighbor_sigungu_code not in seen
-        ]
-        if remaining_touching:
-            seen.update(remaining_touching)
-            levels.append(remaining_touching)
-
+        groups.append(touching[cfg.top_touching_limit :])
     if cfg.include_buffer_intersects:
-        buffered = [
-            item.neighbor_sigungu_code
-            for item in non_touching
-            if item.neighbor_sigungu_code not in seen
-        ]
-        if buffered:
-            seen.update(buffered)
-            levels.append(buffered)
+        groups.append(non_touching)
+
+    for group in groups:
+        level = [index for index in group if index not in seen]
+        if level:
+            seen.update(level)
+            levels.append(tuple(codes[index] for index in level))
+    return tuple(levels)
+
+
+def build_expansion_levels(
+    base_code: str,
+    adjacency_index: SigunguAdjacencyIndex,
+    policy: ExpansionPolicy | None = None,
+    fallback_codes: Optional[Iterable[str]] = None,
+) -> List[List[str]]:
+    cfg = policy or ExpansionPolicy()
+    plan = adjacency_index.expansion_plans(cfg).get(base_code, ((base_code,),))
+    levels = [list(level) for level in plan]
 
     if fallback_codes:
+        seen = {code for level in plan for code in level}
         fallback = [code for code in fallback_codes if code not in seen]
         if fallback:
             levels.append(fallback)
@@ -201,6 +530,28 @@ def build_expansion_levels(
     return levels
 
 
+def order_codes_by_distance(
+    base_code: str,
+    adjacency_index: SigunguAdjacencyIndex,
+) -> List[str]:
+    """
+    base_code에서 가까운 순서로 전체 시군구 코드를 정렬한다.
+
+    인접 시군구 간 centroid_distance_km를 간선 가중치로 둔 최단 경로 거리(distance_matrix) 기준이고,
+    인접 그래프로 닿지 않는 곳(섬 등)은 코드 순서로 맨 뒤에 붙인다.
+    """
+    compact = adjacency_index.compact
+    base_index = compact.code_index.get(base_code)
+    if base_index is None:
+        return [base_code] + [code for code in adjacency_index.all_codes if code != base_code]
+
+    codes = compact.codes
+    ordered = [codes[index] for index in adjacency_index.distance_matrix.ordered_from(base_index)]
+    seen = set(ordered)
+    ordered.extend(code for code in adjacency_index.all_codes if code not in seen)
+    return ordered
+
+
 def expand_sigungu(
     base_code: str,
     adjacency_index: SigunguAdjacencyIndex,
@@ -218,21 +569,111 @@ def expand_sigungu(
     return ordered
 
 
+@dataclass(frozen=True)
+class _FetchOutcome(Generic[T]):
+    items: List[T]
+    error: Optional[str]
+    elapsed_ms: float
+
+
+def _timed_fetch(fetch_valid_items: Callable[[str], Sequence[T]], code: str) -> _FetchOutcome[T]:
+    started = time.perf_counter()
+    try:
+        items = list(fetch_valid_items(code))
+        error = None
+    except Exception as exc:
+        items, error = [], str(exc)
+    return _FetchOutcome(items, error, round((time.perf_counter() - started) * 1000, 1))
+
+
+def _submit_level(
+    codes: Sequence[str],
+    fetch_valid_items: Callable[[str], Sequence[T]],
+    executor: Executor,
+) -> List[Future]:
+    # contextvars(ERMCT 우선순위, stale 수집 등)를 worker 스레드로 넘긴다
+    return [
+        executor.submit(contextvars.copy_context().run, _timed_fetch, fetch_valid_items, code)
+        for code in codes
+    ]
+
+
+def _discard_prefetch(
+    level_idx: int,
+    codes: Sequence[str],
+    futures: Sequence[Future],
+    code_to_name: Optional[Dict[str, str]],
+    valid_count: int,
+) -> List[ProgressiveSearchAttempt]:
+    """
+    기준을 채워서 필요 없어진 조회(다음 레벨 선행 조회, 같은 레벨의 남은 동시 조회)를 정리하고
+    낭비된 비용을 attempt로 남긴다.
+    - 아직 시작 안 한 조회: 취소 (prefetch_cancelled)
+    - 끝났거나 진행 중인 조회: 결과는 버린다 (prefetch_discarded, 끝난 것만 elapsed_ms 기록)
+    """
+    attempts: List[ProgressiveSearchAttempt] = []
+    for code, future in zip(codes, futures):
+        if future.cancel():
+            status, outcome = "prefetch_cancelled", None
+        else:
+            status = "prefetch_discarded"
+            outcome = future.result() if future.done() else None
+        attempts.append(
+            ProgressiveSearchAttempt(
+                level=level_idx,
+                sigungu_code=code,
+                sigungu_name=(code_to_name or {}).get(code),
+                fetch_status=status,
+                raw_count=len(outcome.items) if outcome else 0,
+                fetched_count=0,
+                valid_count=valid_count,
+                error=outcome.error if outcome else None,
+                elapsed_ms=outcome.elapsed_ms if outcome else None,
+            )
+        )
+    return attempts
+
+
 def search_regions_progressively(
     levels: Sequence[Sequence[str]],
     fetch_valid_items: Callable[[str], Sequence[T]],
     item_key: Callable[[T], str],
     min_valid_items: int,
     code_to_name: Optional[Dict[str, str]] = None,
+    level_executor: Optional[Executor] = None,
+    prefetch_next_level: bool = False,
 ) -> ProgressiveSearchResult[T]:
+    """
+    확장 레벨 순서대로 시군구를 조회해 min_valid_items개가 모일 때까지 결과를 합친다.
+
+    level_executor가 주어지면 한 레벨의 시군구를 모두 동시에 조회한 뒤,
+    레벨 안의 코드 순서대로 합쳐서 순차 모드와 같은 결과/attempt 기록을 만든다.
+    (호출하는 쪽이 같은 executor 안에서 돌고 있으면 교착되므로 전용 풀을 넘길 것)
+
+    prefetch_next_level=True면 레벨 N을 합치는 동안 레벨 N+1 조회를 미리 시작한다.
+    레벨 N에서 기준을 채우면 선행 조회는 취소/폐기하고 그 비용을 attempts에 남긴다.
+    """
     items_by_key: Dict[str, T] = {}
     attempts: List[ProgressiveSearchAttempt] = []
+    prefetched: Dict[int, List[Future]] = {}
+    prefetch = prefetch_next_level and level_executor is not None
 
     for level_idx, codes in enumerate(levels):
-        for code in codes:
-            try:
-                fetched_items = list(fetch_valid_items(code))
-                for item in fetched_items:
+        futures = prefetched.pop(level_idx, None)
+        if futures is None and level_executor is not None and len(codes) > 1:
+            futures = _submit_level(codes, fetch_valid_items, level_executor)
+        next_idx = level_idx + 1
+        if prefetch and next_idx < len(levels):
+            prefetched[next_idx] = _submit_level(levels[next_idx], fetch_valid_items, level_executor)
+
+        for code_idx, code in enumerate(codes):
+            if futures is not None:
+                outcome = futures[code_idx].result()
+            else:
+                outcome = _timed_fetch(fetch_valid_items, code)
+
+            if outcome.error is None:
+                for item in outcome.items:
                     items_by_key.setdefault(item_key(item), item)
                 attempts.append(
                     ProgressiveSearchAttempt(
@@ -240,12 +681,13 @@ def search_regions_progressively(
                         sigungu_code=code,
                         sigungu_name=(code_to_name or {}).get(code),
                         fetch_status="success",
-                        raw_count=len(fetched_items),
-                        fetched_count=len(fetched_items),
+                        raw_count=len(outcome.items),
+                        fetched_count=len(outcome.items),
                         valid_count=len(items_by_key),
+                        elapsed_ms=outcome.elapsed_ms,
                     )
                 )
-            except Exception as exc:
+            else:
                 attempts.append(
                     ProgressiveSearchAttempt(
                         level=level_idx,
@@ -255,11 +697,33 @@ def search_regions_progressively(
                         raw_count=0,
                         fetched_count=0,
                         valid_count=len(items_by_key),
-                        error=str(exc),
+                        error=outcome.error,
+                        elapsed_ms=outcome.elapsed_ms,
                     )
                 )
 
             if len(items_by_key) >= min_valid_items:
+                if futures is not None and code_idx + 1 < len(codes):
+                    # 같은 레벨에서 아직 합치지 않은 동시 조회도 선행 조회와 같이 정리한다
+                    attempts.extend(
+                        _discard_prefetch(
+                            level_idx,
+                            codes[code_idx + 1 :],
+                            futures[code_idx + 1 :],
+                            code_to_name,
+                            len(items_by_key),
+                        )
+                    )
+                for pending_idx, pending in prefetched.items():
+                    attempts.extend(
+                        _discard_prefetch(
+                            pending_idx,
+                            levels[pending_idx],
+                            pending,
+                            code_to_name,
+                            len(items_by_key),
+                        )
+                    )
                 return ProgressiveSearchResult(
                     items=list(items_by_key.values()),
                     attempts=attempts,
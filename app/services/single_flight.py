@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    같은 key로 동시에 들어온 호출을 하나로 합친다 (스레드용).
+
+    먼저 들어온 호출(leader)만 fn을 실행하고, 실행 중에 들어온 같은 key의 호출은
+    그 결과나 예외를 그대로 나눠 받는다. 끝난 호출은 바로 지워지므로
+    결과를 캐시하지는 않는다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "executed": self.executed,
+            "shared": self.shared,
+            "in_flight": self.in_flight(),
+        }
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight의 asyncio 버전. 같은 이벤트 루프 안에서만 합쳐진다.
+
+    leader의 코루틴은 별도 Task로 돌리기 때문에, 기다리던 호출 하나가
+    취소돼도 다른 호출자가 받을 결과에는 영향이 없다.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.executed = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            self.executed += 1
+            task.add_done_callback(lambda _done, key=key: self._forget(key, _done))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # 기다리던 쪽이 모두 취소된 경우에도 "exception was never retrieved" 경고가 남지 않게
+            task.exception()
+
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "executed": self.executed,
+            "shared": self.shared,
+            "in_flight": self.in_flight(),
+        }
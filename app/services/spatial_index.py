@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass
+from typing import Callable, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from app.schemas import HospitalBasicInfo
+
+
+T = TypeVar("T")
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+@dataclass(frozen=True)
+class SpatialPoint(Generic[T]):
+    key: str
+    latitude: float
+    longitude: float
+    payload: T
+
+
+@dataclass(frozen=True)
+class SpatialHit(Generic[T]):
+    point: SpatialPoint[T]
+    distance_km: float
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _to_unit_xyz(lat: float, lon: float) -> Tuple[float, float, float]:
+    phi, lam = math.radians(lat), math.radians(lon)
+    cos_phi = math.cos(phi)
+    return (cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi))
+
+
+def _chord_to_km(chord: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+
+def _km_to_chord(km: float) -> float:
+    return 2 * math.sin(min(math.pi, km / EARTH_RADIUS_KM) / 2)
+
+
+class SpatialIndex(Generic[T]):
+    """
+    위경도 점들에 대한 정적 KD-tree.
+
+    점을 단위 구 위의 3차원 좌표로 바꿔 두고 직선(현) 거리로 탐색한다.
+    현 거리는 대원 거리와 단조 관계라서 가지치기와 정렬이 그대로 정확하고,
+    돌려주는 distance_km는 대원 거리(haversine과 같은 값)다.
+    """
+
+    def __init__(self, points: Iterable[SpatialPoint[T]]) -> None:
+        self.points: List[SpatialPoint[T]] = list(points)
+        self._xyz = [_to_unit_xyz(p.latitude, p.longitude) for p in self.points]
+        # 노드 i: 점 번호 _order[i], 분할 축 _axis[i], 자식은 [lo, i) / (i, hi) 구간
+        self._order: List[int] = list(range(len(self.points)))
+        self._axis: List[int] = [0] * len(self.points)
+        self._build(0, len(self.points))
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _build(self, lo: int, hi: int) -> None:
+        # 재귀 대신 스택: 구간 [lo, hi)를 가장 넓게 퍼진 축의 중앙값으로 나눈다
+        stack = [(lo, hi)]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo <= 0:
+                continue
+            segment = self._order[lo:hi]
+            spreads = [
+                max(self._xyz[i][axis] for i in segment) - min(self._xyz[i][axis] for i in segment)
+                for axis in range(3)
+            ]
+            axis = spreads.index(max(spreads))
+            segment.sort(key=lambda i: self._xyz[i][axis])
+            self._order[lo:hi] = segment
+            mid = (lo + hi) // 2
+            self._axis[mid] = axis
+            stack.append((lo, mid))
+            stack.append((mid + 1, hi))
+
+    def _search(
+        self,
+        target: Tuple[float, float, float],
+        limit_sq: Callable[[], float],
+        visit: Callable[[int, float], None],
+    ) -> None:
+        # (구간, 분할면까지 거리²): 꺼낼 때 현재 한계와 다시 비교해서 가지친다
+        stack: List[Tuple[int, int, float]] = [(0, len(self.points), 0.0)]
+        while stack:
+            lo, hi, plane_sq = stack.pop()
+            if hi - lo <= 0 or plane_sq > limit_sq():
+                continue
+            mid = (lo + hi) // 2
+            index = self._order[mid]
+            xyz = self._xyz[index]
+            dist_sq = (
+                (xyz[0] - target[0]) ** 2
+                + (xyz[1] - target[1]) ** 2
+                + (xyz[2] - target[2]) ** 2
+            )
+            if dist_sq <= limit_sq():
+                visit(index, dist_sq)
+
+            axis = self._axis[mid]
+            delta = target[axis] - xyz[axis]
+            if delta < 0:
+                near, far = (lo, mid), (mid + 1, hi)
+            else:
+                near, far = (mid + 1, hi), (lo, mid)
+            # far를 먼저 넣어서 near 쪽이 먼저 탐색되게 한다
+            stack.append((far[0], far[1], delta * delta))
+            stack.append((near[0], near[1], plane_sq))
+
+    def nearest_k(
+        self,
+        lat: float,
+        lon: float,
+        k: int,
+        filter: Optional[Callable[[SpatialPoint[T]], bool]] = None,
+    ) -> List[SpatialHit[T]]:
+        if k <= 0 or not self.points:
+            return []
+        target = _to_unit_xyz(lat, lon)
+        # 최대 힙 (음수 거리, 점 번호)
+        best: List[Tuple[float, int]] = []
+
+        def limit_sq() -> float:
+            return -best[0][0] if len(best) >= k else math.inf
+
+        def visit(index: int, dist_sq: float) -> None:
+            if filter is not None and not filter(self.points[index]):
+                return
+            if len(best) < k:
+                heapq.heappush(best, (-dist_sq, index))
+            elif dist_sq < -best[0][0]:
+                heapq.heapreplace(best, (-dist_sq, index))
+
+        self._search(target, limit_sq, visit)
+        return self._hits(best)
+
+    def within_radius(
+        self,
+        lat: float,
+        lon: float,
+        km: float,
+        filter: Optional[Callable[[SpatialPoint[T]], bool]] = None,
+    ) -> List[SpatialHit[T]]:
+        if km < 0 or not self.points:
+            return []
+        target = _to_unit_xyz(lat, lon)
+        radius_sq = _km_to_chord(km) ** 2
+        found: List[Tuple[float, int]] = []
+
+        def visit(index: int, dist_sq: float) -> None:
+            if filter is None or filter(self.points[index]):
+                found.append((-dist_sq, index))
+
+        self._search(target, lambda: radius_sq, visit)
+        return self._hits(found)
+
+    def _hits(self, entries: Sequence[Tuple[float, int]]) -> List[SpatialHit[T]]:
+        ordered = sorted(entries, key=lambda entry: (-entry[0], self.points[entry[1]].key))
+        return [
+            SpatialHit(
+                point=self.points[index],
+                distance_km=_chord_to_km(math.sqrt(-neg_dist_sq)),
+            )
+            for neg_dist_sq, index in ordered
+        ]
+
+
+def build_hospital_spatial_index(
+    hospitals: Iterable[HospitalBasicInfo],
+) -> SpatialIndex[HospitalBasicInfo]:
+    """위경도가 있는 HospitalBasicInfo만 HPID 기준으로 색인한다."""
+    points: dict[str, SpatialPoint[HospitalBasicInfo]] = {}
+    for hospital in hospitals:
+        if not hospital.id or hospital.latitude is None or hospital.longitude is None:
+            continue
+        if not (-90.0 <= hospital.latitude <= 90.0 and -180.0 <= hospital.longitude <= 180.0):
+            continue
+        points.setdefault(
+            hospital.id,
+            SpatialPoint(hospital.id, hospital.latitude, hospital.longitude, hospital),
+        )
+    return SpatialIndex(points.values())
+
+
+def region_from_address(address: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    dutyAddr("경기도 수원시 권선구 ...")에서 (시도, 시군구)를 뽑는다.
+    "OO시 OO구" 형태는 sigungu_adjacency.json 이름과 같게 붙여서 돌려준다.
+    """
+    if not address:
+        return None
+    tokens = address.split()
+    if len(tokens) < 2:
+        return None
+    sido = tokens[0]
+    if sido.startswith("세종"):
+        return sido, "세종시"
+    sigungu = tokens[1]
+    if sigungu.endswith("시") and len(tokens) > 2 and tokens[2].endswith("구"):
+        sigungu = f"{sigungu} {tokens[2]}"
+    return sido, sigungu
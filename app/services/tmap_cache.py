@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+TMAP_DISTANCE_CACHE_ENABLED = os.getenv("TMAP_DISTANCE_CACHE_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+TMAP_DISTANCE_CACHE_CELL_METERS = float(os.getenv("TMAP_DISTANCE_CACHE_CELL_METERS", "200"))
+TMAP_DISTANCE_CACHE_BUCKET_MINUTES = int(os.getenv("TMAP_DISTANCE_CACHE_BUCKET_MINUTES", "30"))
+TMAP_DISTANCE_CACHE_TTL_SECONDS = float(os.getenv("TMAP_DISTANCE_CACHE_TTL_SECONDS", "600"))
+TMAP_DISTANCE_CACHE_MAX_ENTRIES = int(os.getenv("TMAP_DISTANCE_CACHE_MAX_ENTRIES", "20000"))
+TMAP_ROUTE_CACHE_ENABLED = os.getenv("TMAP_ROUTE_CACHE_ENABLED", "true").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+TMAP_ROUTE_CACHE_TTL_SECONDS = float(os.getenv("TMAP_ROUTE_CACHE_TTL_SECONDS", "300"))
+TMAP_ROUTE_CACHE_MAX_ENTRIES = int(os.getenv("TMAP_ROUTE_CACHE_MAX_ENTRIES", "2000"))
+
+METERS_PER_DEGREE_LAT = 111_320.0
+KST_OFFSET_SECONDS = 9 * 3600
+
+
+def snap_to_cell(lat: float, lon: float, cell_meters: float) -> Tuple[int, int]:
+    """
+    좌표를 약 cell_meters 크기의 격자 칸 번호로 바꾼다.
+    경도 방향 칸 폭은 위도 행마다 cos(위도)로 보정해서 칸이 대략 정사각형이 되게 한다.
+    """
+    lat_step = cell_meters / METERS_PER_DEGREE_LAT
+    row = math.floor(lat / lat_step)
+    row_lat = (row + 0.5) * lat_step
+    lon_step = cell_meters / (METERS_PER_DEGREE_LAT * max(0.01, math.cos(math.radians(row_lat))))
+    return row, math.floor(lon / lon_step)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    expires_at: float
+
+
+class TtlLruCache:
+    """TTL + LRU 메모리 캐시 (스레드 안전). 적중률 통계를 같이 센다."""
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = self._clock() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = _Entry(value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": hits,
+                "misses": misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+            }
+
+
+class TmapDistanceCache:
+    """
+    Tmap 거리/시간 결과 캐시.
+
+    키는 (출발지 격자 칸, 목적지 HPID, 시간대 버킷).
+    구급차가 조금씩 움직이며 같은 병원들을 다시 물어보는 경우를 한 칸으로 묶고,
+    출퇴근 시간처럼 교통이 달라지는 시간대는 버킷으로 나눈다 (KST 기준).
+    """
+
+    def __init__(
+        self,
+        cell_meters: float = TMAP_DISTANCE_CACHE_CELL_METERS,
+        bucket_minutes: int = TMAP_DISTANCE_CACHE_BUCKET_MINUTES,
+        ttl_seconds: float = TMAP_DISTANCE_CACHE_TTL_SECONDS,
+        max_entries: int = TMAP_DISTANCE_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.cell_meters = cell_meters
+        self.bucket_minutes = max(1, bucket_minutes)
+        self._clock = clock
+        self._cache = TtlLruCache(ttl_seconds, max_entries, clock)
+
+    def _time_bucket(self) -> int:
+        minute_of_day = int((self._clock() + KST_OFFSET_SECONDS) % 86400 // 60)
+        return minute_of_day // self.bucket_minutes
+
+    def key(self, origin_lat: float, origin_lon: float, hpid: str) -> Tuple[Any, ...]:
+        return (snap_to_cell(origin_lat, origin_lon, self.cell_meters), hpid, self._time_bucket())
+
+    def get(self, origin_lat: float, origin_lon: float, hpid: str) -> Optional[Tuple[Any, Any]]:
+        return self._cache.get(self.key(origin_lat, origin_lon, hpid))
+
+    def set(self, origin_lat: float, origin_lon: float, hpid: str, distance: Any, duration: Any) -> None:
+        self._cache.set(self.key(origin_lat, origin_lon, hpid), (distance, duration))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._cache.stats(),
+            "cell_meters": self.cell_meters,
+            "bucket_minutes": self.bucket_minutes,
+        }
+
+
+class TmapRouteCache:
+    """
+    nearest 라우팅에서 받은 TOP3 경로(path/distance/duration_sec)를 잠깐 보관한다.
+
+    키는 (출발지 격자 칸, 목적지 HPID). 프론트는 TOP3 중 하나를 골라 바로
+    /api/ktas/route/path를 부르므로 TTL은 짧게 둔다. 목적지 좌표가 저장된 값과
+    다르면(병원 좌표 갱신 등) 적중으로 치지 않는다.
+    """
+
+    # 목적지 좌표 허용 오차(도), 약 10m
+    END_TOLERANCE_DEGREES = 1e-4
+
+    def __init__(
+        self,
+        cell_meters: float = TMAP_DISTANCE_CACHE_CELL_METERS,
+        ttl_seconds: float = TMAP_ROUTE_CACHE_TTL_SECONDS,
+        max_entries: int = TMAP_ROUTE_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.cell_meters = cell_meters
+        self._cache = TtlLruCache(ttl_seconds, max_entries, clock)
+
+    def _key(self, origin_lat: float, origin_lon: float, hpid: str) -> Tuple[Any, ...]:
+        return (snap_to_cell(origin_lat, origin_lon, self.cell_meters), hpid)
+
+    def get(
+        self,
+        origin_lat: float,
+        origin_lon: float,
+        hpid: str,
+        end_lat: float,
+        end_lon: float,
+    ) -> Optional[Dict[str, Any]]:
+        entry = self._cache.get(self._key(origin_lat, origin_lon, hpid))
+        if entry is None:
+            return None
+        (cached_lat, cached_lon), route = entry
+        if (
+            abs(cached_lat - end_lat) > self.END_TOLERANCE_DEGREES
+            or abs(cached_lon - end_lon) > self.END_TOLERANCE_DEGREES
+        ):
+            return None
+        return route
+
+    def set(
+        self,
+        origin_lat: float,
+        origin_lon: float,
+        hpid: str,
+        end_lat: float,
+        end_lon: float,
+        route: Dict[str, Any],
+    ) -> None:
+        self._cache.set(self._key(origin_lat, origin_lon, hpid), ((end_lat, end_lon), route))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._cache.stats(), "cell_meters": self.cell_meters}
+
+
+def build_tmap_distance_cache_from_env() -> Optional[TmapDistanceCache]:
+    if not TMAP_DISTANCE_CACHE_ENABLED:
+        return None
+    return TmapDistanceCache()
+
+
+def build_tmap_route_cache_from_env() -> Optional[TmapRouteCache]:
+    if not TMAP_ROUTE_CACHE_ENABLED:
+        return None
+    return TmapRouteCache()
@@ -1262,6 +1262,7 @@ export const ParamedicDashboard: React.FC<ParamedicDashboardProps> = ({ userName
   const fetchDrivingRoute = useCallback(async (
     start: { lat: number; lon: number },
     end: { lat: number; lon: number },
+    hospitalId?: string,
   ) => {
     if (!TMAP_API_KEY) {
       throw new Error(TMAP_API_KEY_ERROR_MESSAGE);
@@ -1272,6 +1273,7 @@ export const ParamedicDashboard: React.FC<ParamedicDashboardProps> = ({ userName
       start_lon: start.lon,
       end_lat: end.lat,
       end_lon: end.lon,
+      hospital_id: hospitalId,
     });
 
     if (!Array.isArray(data.path) || !data.path.length) {
@@ -1579,6 +1581,7 @@ export const ParamedicDashboard: React.FC<ParamedicDashboardProps> = ({ userName
         const route = await fetchDrivingRoute(
           { lat: origin.lat, lon: origin.lon },
           { lat: selectedHospitalCoordinate.lat, lon: selectedHospitalCoordinate.lon },
+          selectedHospital.id,
         );
 
         if (!isActiveMapContext() || activeRouteRequestKeyRef.current !== routeKey) return;
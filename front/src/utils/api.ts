@@ -127,6 +127,10 @@ export interface RoutePathRequest {
   start_lon: number;
   end_lat: number;
   end_lon: number;
+  hospital_id?: string;
+  path_format?: 'points' | 'polyline' | 'delta';
+  precision?: number;
+  simplify_tolerance_m?: number;
 }
 
 export interface RoutePathPoint {
@@ -138,6 +142,13 @@ export interface RoutePathResponse {
   path: RoutePathPoint[];
   distance: number;
   duration_sec: number;
+  route_source?: 'tmap' | 'cache' | null;
+  path_format?: 'points' | 'polyline' | 'delta';
+  encoded_path?: string | null;
+  delta_path?: number[] | null;
+  precision?: number | null;
+  point_count?: number | null;
+  original_point_count?: number | null;
 }
 
 export async function routeFromKTAS(
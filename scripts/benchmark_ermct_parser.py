@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, List
+from xml.sax.saxutils import escape
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.services.ermct_client import ErmctClient
+
+
+# 실시간 병상 응답에서 실제로 보이는 hv/hvs 태그 구성을 흉내 낸 값
+_REALTIME_NUMERIC_TAGS = [
+    "hvec", "hvoc", "hvcc", "hvncc", "hvccc", "hvicc", "hvgc",
+    "hv2", "hv3", "hv4", "hv6", "hv8", "hv9", "hv13", "hv14",
+    "hv28", "hv29", "hv30", "hv31", "hv32", "hv33", "hv34", "hv35", "hv36", "hv41",
+    "hvs01", "hvs02", "hvs03", "hvs04", "hvs17", "hvs22", "hvs27", "hvs28",
+    "hvs29", "hvs30", "hvs31", "hvs32", "hvs38", "hvs46", "hvs47", "hvs50",
+]
+_REALTIME_FLAG_TAGS = [
+    "hv5", "hv7", "hv10", "hv11", "hv42",
+    "hvctayn", "hvmriayn", "hvangioayn", "hvventiayn", "hvventisoayn",
+    "hvincuayn", "hvcrrtayn", "hvecmoayn", "hvoxyayn", "hvhypoayn", "hvamyn",
+]
+
+
+def _wrap(items: List[str]) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        "<response><header><resultCode>00</resultCode>"
+        "<resultMsg>NORMAL SERVICE.</resultMsg></header>"
+        f"<body><items>{''.join(items)}</items>"
+        f"<numOfRows>{len(items)}</numOfRows><pageNo>1</pageNo>"
+        f"<totalCount>{len(items)}</totalCount></body></response>"
+    )
+
+
+def _fields(values: Dict[str, object]) -> str:
+    return "".join(
+        f"<{tag}/>" if value is None else f"<{tag}>{escape(str(value))}</{tag}>"
+        for tag, value in values.items()
+    )
+
+
+def build_realtime_xml(rows: int) -> str:
+    items = []
+    for index in range(rows):
+        values: Dict[str, object] = {
+            "rnum": index + 1,
+            "dutyName": f"테스트병원{index}",
+            "dutyTel3": f"02-{index:03d}-0000",
+            "hpid": f"A{1100000 + index}",
+            "phpid": f"A{1100000 + index}",
+            "hvidate": "20260101120000",
+        }
+        for offset, tag in enumerate(_REALTIME_NUMERIC_TAGS):
+            values[tag] = (index + offset) % 17 - 1
+        for offset, tag in enumerate(_REALTIME_FLAG_TAGS):
+            values[tag] = "Y" if (index + offset) % 3 else "N1"
+        values["hvdnm"] = " 당직의 "
+        values["hv1"] = None
+        items.append(f"<item>{_fields(values)}</item>")
+    return _wrap(items)
+
+
+def build_serious_xml(rows: int) -> str:
+    items = []
+    for index in range(rows):
+        values: Dict[str, object] = {
+            "dutyName": f"테스트병원{index}",
+            "rnum": index + 1,
+        }
+        for code in range(1, 28):
+            values[f"MKioskTy{code}"] = "Y" if (index + code) % 4 else "N1"
+            values[f"MKioskTy{code}Msg"] = f"메시지 {code}" if code % 5 == 0 else None
+        items.append(f"<item>{_fields(values)}</item>")
+    return _wrap(items)
+
+
+def build_messages_xml(rows: int) -> str:
+    items = []
+    for index in range(rows):
+        values: Dict[str, object] = {
+            "dutyAddr": "서울특별시 강남구",
+            "dutyName": f"테스트병원{index}",
+            "emcOrgCod": f"A{1100000 + index}",
+            "hpid": f"A{1100000 + index}",
+            "rnum": index + 1,
+            "symBlkEndDtm": "20260101130000",
+            "symBlkMsg": "CT 장비 점검 중",
+            "symBlkMsgTyp": "응급",
+            "symBlkSttDtm": "20260101120000",
+            "symOutDspMth": "자동",
+            "symOutDspYon": "Y",
+            "symTypCod": "Y0010",
+            "symTypCodMag": "응급실",
+        }
+        items.append(f"<item>{_fields(values)}</item>")
+    return _wrap(items)
+
+
+def _parse_fn(client: ErmctClient, operation: str) -> Callable[[str], object]:
+    if operation == "realtime":
+        return lambda text: client._parse_realtime_beds(client._parse_body(text))
+    if operation == "serious":
+        return lambda text: client._parse_serious_acceptance(client._parse_body(text))
+    return lambda text: client._parse_emergency_messages(client._parse_body(text), "")
+
+
+def run_benchmark(operation: str, xml: str, repeat: int, number: int) -> Dict[str, float]:
+    timings: Dict[str, float] = {}
+    for parser_name in ("xmltodict", "fast"):
+        parse = _parse_fn(ErmctClient(service_key="benchmark", xml_parser=parser_name), operation)
+        best = min(timeit.repeat(lambda: parse(xml), repeat=repeat, number=number))
+        timings[parser_name] = best / number * 1000
+    return timings
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare xmltodict and the streaming ERMCT XML parser.",
+    )
+    parser.add_argument(
+        "--operation",
+        choices=["realtime", "serious", "messages", "all"],
+        default="all",
+    )
+    parser.add_argument("--rows", type=int, default=200, help="합성 응답의 item 수")
+    parser.add_argument(
+        "--xml-file",
+        type=Path,
+        default=None,
+        help="기록해 둔 실제 응답 XML (지정하면 --operation 하나에만 사용)",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    builders = {
+        "realtime": build_realtime_xml,
+        "serious": build_serious_xml,
+        "messages": build_messages_xml,
+    }
+
+    if args.xml_file is not None:
+        if args.operation == "all":
+            raise SystemExit("--xml-file 사용 시 --operation 을 하나 지정하세요.")
+        cases = {args.operation: args.xml_file.read_text(encoding="utf-8")}
+    else:
+        operations = list(builders) if args.operation == "all" else [args.operation]
+        cases = {name: builders[name](args.rows) for name in operations}
+
+    for operation, xml in cases.items():
+        timings = run_benchmark(operation, xml, args.repeat, args.number)
+        speedup = timings["xmltodict"] / timings["fast"] if timings["fast"] else float("inf")
+        print(
+            f"[BENCH] {operation:<9} bytes={len(xml.encode('utf-8'))} "
+            f"xmltodict={timings['xmltodict']:.2f}ms "
+            f"fast={timings['fast']:.2f}ms "
+            f"speedup={speedup:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.services.sigungu_search import (
+    load_sigungu_adjacency,
+    load_sigungu_adjacency_artifact,
+    write_sigungu_adjacency_artifact,
+)
+
+# data/sigungu_adjacency.json → data/sigungu_adjacency.bin (CSR 배열 + 이름 헤더)
+# 서버는 .bin이 JSON보다 새것이면 .bin을 읽는다. JSON을 고치면 다시 만들 것.
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Build the binary sigungu adjacency artifact loaded at startup.",
+    )
+    parser.add_argument("--input", type=Path, default=ROOT / "data" / "sigungu_adjacency.json")
+    parser.add_argument("--output", type=Path, default=ROOT / "data" / "sigungu_adjacency.bin")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    index = load_sigungu_adjacency(args.input)
+    size = write_sigungu_adjacency_artifact(index, args.output)
+
+    loaded = load_sigungu_adjacency_artifact(args.output)
+    if loaded.all_codes != index.all_codes or loaded.code_to_name != index.code_to_name:
+        raise SystemExit("artifact round trip mismatch")
+
+    json_ms = timeit.timeit(lambda: load_sigungu_adjacency(args.input), number=10) * 100
+    artifact_ms = timeit.timeit(lambda: load_sigungu_adjacency_artifact(args.output), number=10) * 100
+    print(
+        f"[ADJACENCY] codes={len(index.compact.codes)} edges={len(index.compact.neighbors)} "
+        f"json_bytes={args.input.stat().st_size} artifact_bytes={size} "
+        f"json_load={json_ms:.2f}ms artifact_load={artifact_ms:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.route_geometry import simplify_douglas_peucker
+from app.services.sigungu_boundaries import BOUNDARY_FILE_VERSION
+from app.services.sigungu_search import load_sigungu_adjacency
+
+# 시군구 경계 GeoJSON(WGS84) → data/sigungu_boundaries.json
+#
+# 입력은 통계청/SGIS 또는 국토부 행정구역 경계(SIG) 자료를 WGS84 GeoJSON으로 바꾼 것.
+#   예) ogr2ogr -t_srs EPSG:4326 -f GeoJSON sig.geojson SIG.shp
+# 행정표준코드(SIG_CD, 서울 11110 …)는 sigungu_adjacency.json 코드(서울 11010 …)와 다르므로
+# 시도 코드 앞 2자리 + 시군구 이름으로 adjacency 코드에 맞춘다.
+
+# 행정표준코드 시도 앞자리 → adjacency(통계청) 시도 코드
+ADMIN_TO_ADJACENCY_SIDO = {
+    "11": "11",
+    "26": "21",
+    "27": "22",
+    "28": "23",
+    "29": "24",
+    "30": "25",
+    "31": "26",
+    "36": "29",
+    "41": "31",
+    "42": "32",
+    "51": "32",
+    "43": "33",
+    "44": "34",
+    "45": "35",
+    "52": "35",
+    "46": "36",
+    "47": "37",
+    "48": "38",
+    "50": "39",
+}
+
+
+def _normalize(name: str) -> str:
+    return name.strip().replace(" ", "")
+
+
+def build_code_matcher(adjacency_path: Path):
+    adjacency = load_sigungu_adjacency(adjacency_path)
+    by_sido_name: Dict[Tuple[str, str], str] = {}
+    for code, name in adjacency.code_to_name.items():
+        sido_code = adjacency.get_sido_code(code)
+        if sido_code:
+            by_sido_name[(sido_code, _normalize(name))] = code
+
+    def match(feature_code: str, feature_name: str) -> Optional[str]:
+        if adjacency.get_name(feature_code) and _normalize(adjacency.get_name(feature_code)) == _normalize(feature_name):
+            return feature_code
+        sido_code = ADMIN_TO_ADJACENCY_SIDO.get(feature_code[:2])
+        if sido_code is None:
+            return None
+        return by_sido_name.get((sido_code, _normalize(feature_name)))
+
+    return adjacency, match
+
+
+def _polygons(geometry: Dict[str, Any]) -> Iterable[List[List[List[float]]]]:
+    if geometry.get("type") == "Polygon":
+        yield geometry["coordinates"]
+    elif geometry.get("type") == "MultiPolygon":
+        yield from geometry["coordinates"]
+
+
+def _compact_ring(ring: List[List[float]], tolerance_m: float, precision: int) -> Optional[List[float]]:
+    points = [(float(lat), float(lon)) for lon, lat, *_ in ring]
+    if len(points) >= 2 and points[0] == points[-1]:
+        points = points[:-1]
+    simplified = simplify_douglas_peucker(points + [points[0]], tolerance_m)[:-1] if points else []
+    if len(simplified) < 3:
+        simplified = points
+    if len(simplified) < 3:
+        return None
+    flat: List[float] = []
+    for lat, lon in simplified:
+        flat.append(round(lon, precision))
+        flat.append(round(lat, precision))
+    return flat
+
+
+def build_boundaries(
+    geojson: Dict[str, Any],
+    adjacency_path: Path,
+    code_field: str,
+    name_field: str,
+    tolerance_m: float,
+    precision: int,
+) -> Tuple[Dict[str, Any], List[str]]:
+    adjacency, match = build_code_matcher(adjacency_path)
+    merged: Dict[str, Dict[str, Any]] = {}
+    unmatched: List[str] = []
+
+    for feature in geojson.get("features") or []:
+        properties = feature.get("properties") or {}
+        feature_code = str(properties.get(code_field) or "").strip()
+        feature_name = str(properties.get(name_field) or "").strip()
+        code = match(feature_code, feature_name)
+        if code is None:
+            unmatched.append(f"{feature_code} {feature_name}")
+            continue
+
+        polygons = []
+        for polygon in _polygons(feature.get("geometry") or {}):
+            rings = [_compact_ring(ring, tolerance_m, precision) for ring in polygon]
+            if rings and rings[0] is not None:
+                polygons.append([ring for ring in rings if ring is not None])
+
+        # 행정구(예: 수원시 장안구)가 여러 조각으로 나뉜 자료도 있어서 코드 기준으로 합친다
+        entry = merged.setdefault(
+            code,
+            {
+                "code": code,
+                "name": adjacency.get_name(code) or feature_name,
+                "sido_code": adjacency.get_sido_code(code),
+                "polygons": [],
+            },
+        )
+        entry["polygons"].extend(polygons)
+
+    payload = {
+        "version": BOUNDARY_FILE_VERSION,
+        "source": {"code_field": code_field, "name_field": name_field, "tolerance_m": tolerance_m},
+        "features": [merged[code] for code in sorted(merged)],
+    }
+    return payload, unmatched
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Build the simplified sigungu boundary file used by the offline region resolver.",
+    )
+    parser.add_argument("input", type=Path, help="시군구 경계 GeoJSON (WGS84)")
+    parser.add_argument("--output", type=Path, default=ROOT / "data" / "sigungu_boundaries.json")
+    parser.add_argument("--adjacency", type=Path, default=ROOT / "data" / "sigungu_adjacency.json")
+    parser.add_argument("--code-field", default="SIG_CD")
+    parser.add_argument("--name-field", default="SIG_KOR_NM")
+    parser.add_argument("--tolerance-m", type=float, default=30.0, help="Douglas–Peucker 허용 오차(m)")
+    parser.add_argument("--precision", type=int, default=5, help="좌표 소수점 자릿수")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    geojson = json.loads(args.input.read_text(encoding="utf-8"))
+    payload, unmatched = build_boundaries(
+        geojson,
+        args.adjacency,
+        code_field=args.code_field,
+        name_field=args.name_field,
+        tolerance_m=args.tolerance_m,
+        precision=args.precision,
+    )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+
+    adjacency = load_sigungu_adjacency(args.adjacency)
+    missing = sorted(set(adjacency.code_to_name) - {feature["code"] for feature in payload["features"]})
+    print(
+        f"[BOUNDARIES] features={len(payload['features'])} "
+        f"bytes={args.output.stat().st_size} unmatched={len(unmatched)} missing_codes={len(missing)}"
+    )
+    for item in unmatched:
+        print(f"[BOUNDARIES] unmatched feature: {item}")
+    for code in missing:
+        print(f"[BOUNDARIES] no boundary for adjacency code {code} {adjacency.get_name(code)}")
+
+
+if __name__ == "__main__":
+    main()
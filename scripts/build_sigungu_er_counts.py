@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from dotenv import load_dotenv
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.error_utils import sanitize_error_text
+from app.services.sigungu_er_index import ER_COUNTS_FILE_VERSION
+from app.services.sigungu_search import SIDO_CODE_TO_NAME, SigunguAdjacencyIndex, load_sigungu_adjacency
+
+# sigungu_adjacency.json 전체 시군구 → data/sigungu_er_counts.json
+#
+# 시군구마다 실시간 병상 API(STAGE1/STAGE2)를 한 번씩 불러 응급의료기관 수를 센다.
+# 서버는 0인 시군구를 점진 확장/전국 fallback에서 조회하지 않는다.
+# 응급의료기관 지정이 바뀌었으면 다시 돌릴 것 (ERMCT_SERVICE_KEY 필요, 약 250회 호출).
+
+
+def build_er_counts(
+    adjacency: SigunguAdjacencyIndex,
+    fetch_rows: Callable[[str, str], Sequence[Any]],
+    sleep_seconds: float = 0.0,
+) -> Tuple[Dict[str, int], List[str]]:
+    counts: Dict[str, int] = {}
+    failures: List[str] = []
+    for code in adjacency.all_codes:
+        sigungu_name = adjacency.get_name(code)
+        sido_code = adjacency.get_sido_code(code)
+        sido_name = SIDO_CODE_TO_NAME.get(sido_code) if sido_code else None
+        if not sigungu_name or not sido_name:
+            failures.append(f"{code} no sido/sigungu name")
+            continue
+        try:
+            rows = fetch_rows(sido_name, sigungu_name)
+        except Exception as exc:
+            # 실패한 시군구는 파일에 넣지 않는다 (없는 코드는 서버가 항상 조회한다)
+            failures.append(f"{code} {sido_name} {sigungu_name}: {sanitize_error_text(exc)}")
+            continue
+        counts[code] = len(rows)
+        if sleep_seconds > 0:
+            time.sleep(sleep_seconds)
+    return counts, failures
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Count ERMCT emergency departments per sigungu for the empty-region index.",
+    )
+    parser.add_argument("--adjacency", type=Path, default=ROOT / "data" / "sigungu_adjacency.json")
+    parser.add_argument("--output", type=Path, default=ROOT / "data" / "sigungu_er_counts.json")
+    parser.add_argument("--num-rows", type=int, default=500)
+    parser.add_argument("--sleep", type=float, default=0.1, help="시군구 사이 대기 시간(초)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    load_dotenv()
+    args = parse_args(argv)
+
+    from app.services.ermct_client import ErmctClient
+
+    client = ErmctClient()
+    adjacency = load_sigungu_adjacency(args.adjacency)
+    counts, failures = build_er_counts(
+        adjacency,
+        lambda sido, sigungu: client.get_realtime_beds(sido=sido, sigungu=sigungu, num_rows=args.num_rows),
+        sleep_seconds=args.sleep,
+    )
+
+    payload = {
+        "version": ER_COUNTS_FILE_VERSION,
+        "updated_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "counts": dict(sorted(counts.items())),
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(payload, ensure_ascii=False, indent=1), encoding="utf-8")
+
+    print(
+        f"[ER COUNTS] sigungu={len(counts)} empty={sum(1 for count in counts.values() if count == 0)} "
+        f"hospitals={sum(counts.values())} failures={len(failures)}"
+    )
+    for item in failures:
+        print(f"[ER COUNTS] failed: {item}")
+
+
+if __name__ == "__main__":
+    main()
@@ -406,6 +406,16 @@ def run_sync_once(
         return 1
     fetched = len(realtime_rows)
 
+    basic_by_hpid: dict[str, HospitalBasicInfo] = {}
+    if not args.skip_basic_info:
+        try:
+            basic_by_hpid = client.get_basic_info_bulk(sido=sido, sigungu=sigungu)
+        except Exception as exc:
+            print(
+                "[WARN] basic-info listing failed, falling back to per-hospital "
+                f"lookups: {sanitize_error_text(exc)}"
+            )
+
     seen: set[str] = set()
     for realtime in realtime_rows:
         if not realtime.id or realtime.id in seen:
@@ -415,7 +425,9 @@ def run_sync_once(
         try:
             basic = None
             if not args.skip_basic_info:
-                basic = client.get_basic_info(realtime.id)
+                basic = basic_by_hpid.get(realtime.id) or client.get_basic_info(
+                    realtime.id
+                )
 
             hospital_rows.append(normalize_hospital_row(realtime, basic, sido, sigungu))
             status_rows.append(normalize_hospital_status(realtime))
@@ -0,0 +1,536 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import threading
+import zlib
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+# ERMCT / Tmap / Kakao 대역(stand-in) 서버.
+# 부하/회귀 테스트에서 실제 upstream 대신 띄워 두고 ERMCT_BASE_URL / TMAP_BASE_URL /
+# KAKAO_BASE_URL 로 백엔드를 여기로 돌린다.
+#
+#   python scripts/upstream_stand_in.py --port 8090 --latency-ms 150 --jitter-ms 50 \
+#       --error-rate 0.01 --rate-limit-rate 0.005
+#
+#   ERMCT_BASE_URL=http://127.0.0.1:8090/B552657/ErmctInfoInqireService
+#   TMAP_BASE_URL=http://127.0.0.1:8090
+#   KAKAO_BASE_URL=http://127.0.0.1:8090
+
+ERMCT_PREFIX = "/B552657/ErmctInfoInqireService"
+ERMCT_OPERATIONS = (
+    "getEmrrmRltmUsefulSckbdInfoInqire",
+    "getEgytBassInfoInqire",
+    "getEgytListInfoInqire",
+    "getSrsillDissAceptncPosblInfoInqire",
+    "getEmrrmSrsillDissMsgInqire",
+    "getStrmListInfoInqire",
+)
+
+# 서울 25개 구 대략적인 중심 좌표 (Kakao coord2region 대역 + 가상 병원 위치용)
+SEOUL_GU_CENTERS: Dict[str, Tuple[float, float]] = {
+    "강남구": (37.5172, 127.0473),
+    "강동구": (37.5301, 127.1238),
+    "강북구": (37.6396, 127.0257),
+    "강서구": (37.5509, 126.8495),
+    "관악구": (37.4784, 126.9516),
+    "광진구": (37.5385, 127.0823),
+    "구로구": (37.4954, 126.8874),
+    "금천구": (37.4569, 126.8955),
+    "노원구": (37.6542, 127.0568),
+    "도봉구": (37.6688, 127.0471),
+    "동대문구": (37.5744, 127.0400),
+    "동작구": (37.5124, 126.9393),
+    "마포구": (37.5663, 126.9019),
+    "서대문구": (37.5791, 126.9368),
+    "서초구": (37.4837, 127.0324),
+    "성동구": (37.5633, 127.0371),
+    "성북구": (37.5894, 127.0167),
+    "송파구": (37.5145, 127.1059),
+    "양천구": (37.5170, 126.8665),
+    "영등포구": (37.5264, 126.8962),
+    "용산구": (37.5324, 126.9906),
+    "은평구": (37.6027, 126.9291),
+    "종로구": (37.5735, 126.9790),
+    "중구": (37.5641, 126.9979),
+    "중랑구": (37.6066, 127.0927),
+}
+DEFAULT_REGION_CENTER = (36.5, 127.8)
+
+
+@dataclass
+class LatencyProfile:
+    """응답 지연 분포. fixed | uniform | normal | lognormal (ms 단위)"""
+
+    distribution: str = "fixed"
+    mean_ms: float = 0.0
+    jitter_ms: float = 0.0
+
+    def sample_seconds(self, rng: random.Random) -> float:
+        mean, jitter = self.mean_ms, self.jitter_ms
+        if self.distribution == "uniform":
+            value = rng.uniform(mean - jitter, mean + jitter)
+        elif self.distribution == "normal":
+            value = rng.gauss(mean, jitter)
+        elif self.distribution == "lognormal" and mean > 0:
+            sigma = math.sqrt(math.log(1 + (jitter / mean) ** 2)) if jitter else 0.0
+            value = rng.lognormvariate(math.log(mean) - sigma**2 / 2, sigma)
+        else:
+            value = mean
+        return max(0.0, value) / 1000.0
+
+
+@dataclass
+class EndpointBehavior:
+    latency: LatencyProfile = field(default_factory=LatencyProfile)
+    # 5xx로 실패시킬 비율
+    error_rate: float = 0.0
+    # 429(또는 ERMCT resultCode 22)로 실패시킬 비율
+    rate_limit_rate: float = 0.0
+
+
+@dataclass
+class StandInConfig:
+    ermct: EndpointBehavior = field(default_factory=EndpointBehavior)
+    tmap: EndpointBehavior = field(default_factory=EndpointBehavior)
+    kakao: EndpointBehavior = field(default_factory=EndpointBehavior)
+    # 오퍼레이션별 덮어쓰기 (예: getEmrrmSrsillDissMsgInqire만 느리게)
+    ermct_operations: Dict[str, EndpointBehavior] = field(default_factory=dict)
+    # http: HTTP 429 / result_code: 200 + resultCode 22 (data.go.kr 실제 동작)
+    ermct_rate_limit_mode: str = "http"
+    hospitals_per_region: int = 8
+    # {operation}.xml 또는 {operation}/{sido}_{sigungu}.xml 이 있으면 합성 대신 그대로 응답
+    recorded_dir: Optional[Path] = None
+    seed: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StandInConfig":
+        def behavior(raw: Optional[Dict[str, Any]]) -> EndpointBehavior:
+            raw = dict(raw or {})
+            latency = LatencyProfile(**raw.pop("latency", {}))
+            return EndpointBehavior(latency=latency, **raw)
+
+        recorded_dir = data.get("recorded_dir")
+        return cls(
+            ermct=behavior(data.get("ermct")),
+            tmap=behavior(data.get("tmap")),
+            kakao=behavior(data.get("kakao")),
+            ermct_operations={
+                name: behavior(raw) for name, raw in (data.get("ermct_operations") or {}).items()
+            },
+            ermct_rate_limit_mode=data.get("ermct_rate_limit_mode", "http"),
+            hospitals_per_region=int(data.get("hospitals_per_region", 8)),
+            recorded_dir=Path(recorded_dir) if recorded_dir else None,
+            seed=int(data.get("seed", 0)),
+        )
+
+
+# ---------- 합성 데이터 ----------
+
+
+def _region_seed(sido: str, sigungu: str) -> int:
+    return zlib.crc32(f"{sido}|{sigungu}".encode("utf-8"))
+
+
+@dataclass(frozen=True)
+class FakeHospital:
+    hpid: str
+    name: str
+    sido: str
+    sigungu: str
+    lat: float
+    lon: float
+    trauma: bool
+
+
+# 지역 목록(getEgytListInfoInqire)으로 한 번 내준 병원은 HPID 단건 조회(getEgytBassInfoInqire)에서도 같은 값을 돌려준다
+_KNOWN_HOSPITALS: Dict[str, FakeHospital] = {}
+
+
+def region_hospitals(sido: str, sigungu: str, count: int) -> List[FakeHospital]:
+    seed = _region_seed(sido, sigungu)
+    rng = random.Random(seed)
+    center = SEOUL_GU_CENTERS.get(sigungu) if sido.startswith("서울") else None
+    if center is None:
+        center = (
+            DEFAULT_REGION_CENTER[0] + rng.uniform(-1.2, 1.2),
+            DEFAULT_REGION_CENTER[1] + rng.uniform(-1.0, 1.0),
+        )
+    hospitals = []
+    for index in range(count):
+        hospitals.append(
+            FakeHospital(
+                hpid=f"S{seed % 100_000:05d}{index:02d}",
+                name=f"{sigungu} 대역병원{index + 1}",
+                sido=sido,
+                sigungu=sigungu,
+                lat=round(center[0] + rng.uniform(-0.02, 0.02), 6),
+                lon=round(center[1] + rng.uniform(-0.02, 0.02), 6),
+                trauma=index == 0 and seed % 3 == 0,
+            )
+        )
+    _KNOWN_HOSPITALS.update((hospital.hpid, hospital) for hospital in hospitals)
+    return hospitals
+
+
+def _xml_fields(values: Dict[str, Any]) -> str:
+    return "".join(
+        f"<{tag}/>" if value is None else f"<{tag}>{escape(str(value))}</{tag}>"
+        for tag, value in values.items()
+    )
+
+
+def ermct_xml(items: List[Dict[str, Any]], num_rows: int, page_no: int, total: int) -> str:
+    body_items = "".join(f"<item>{_xml_fields(item)}</item>" for item in items)
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        "<response><header><resultCode>00</resultCode>"
+        "<resultMsg>NORMAL SERVICE.</resultMsg></header>"
+        f"<body><items>{body_items}</items><numOfRows>{num_rows}</numOfRows>"
+        f"<pageNo>{page_no}</pageNo><totalCount>{total}</totalCount></body></response>"
+    )
+
+
+def ermct_error_xml(code: str, message: str) -> str:
+    return (
+        "<response><header>"
+        f"<resultCode>{code}</resultCode><resultMsg>{message}</resultMsg>"
+        "</header></response>"
+    )
+
+
+def _realtime_item(hospital: FakeHospital, rng: random.Random) -> Dict[str, Any]:
+    item: Dict[str, Any] = {
+        "dutyName": hospital.name,
+        "dutyTel3": "02-000-0000",
+        "hpid": hospital.hpid,
+        "hvidate": "20260101120000",
+        "hvec": rng.randint(-2, 15),
+        "hvoc": rng.randint(0, 6),
+        "hvcc": rng.randint(0, 4),
+        "hvncc": rng.randint(0, 3),
+        "hvccc": rng.randint(0, 3),
+        "hvicc": rng.randint(0, 8),
+        "hvgc": rng.randint(0, 40),
+    }
+    for tag in ("hvctayn", "hvmriayn", "hvangioayn", "hvventiayn", "hvcrrtayn", "hvecmoayn", "hvamyn"):
+        item[tag] = "Y" if rng.random() < 0.8 else "N1"
+    for tag in ("hv5", "hv7", "hv10", "hv11", "hv42"):
+        item[tag] = "Y" if rng.random() < 0.5 else "N"
+    for index in (2, 3, 4, 6, 8, 9, 28, 29, 30, 31, 34, 35, 36, 41):
+        item[f"hv{index}"] = rng.randint(0, 5)
+    for index in (1, 2, 3, 4, 17, 22, 27, 28, 29, 30, 38, 46):
+        item[f"hvs{index:02d}"] = rng.randint(1, 20)
+    return item
+
+
+def _basic_item(hospital: FakeHospital) -> Dict[str, Any]:
+    return {
+        "dutyAddr": f"{hospital.sido} {hospital.sigungu} 대역로 {hospital.hpid[-3:]}",
+        "dutyEryn": 1,
+        "dutyName": hospital.name,
+        "dutyTel1": "02-000-0001",
+        "dutyTel3": "02-000-0000",
+        "hpid": hospital.hpid,
+        "wgs84Lat": hospital.lat,
+        "wgs84Lon": hospital.lon,
+    }
+
+
+def _serious_item(hospital: FakeHospital, rng: random.Random) -> Dict[str, Any]:
+    item: Dict[str, Any] = {"dutyName": hospital.name, "hpid": hospital.hpid}
+    for code in range(1, 28):
+        item[f"MKioskTy{code}"] = "Y" if rng.random() < 0.7 else "N1"
+        item[f"MKioskTy{code}Msg"] = None
+    return item
+
+
+def _message_items(hospital: FakeHospital, rng: random.Random) -> List[Dict[str, Any]]:
+    return [
+        {
+            "dutyName": hospital.name,
+            "hpid": hospital.hpid,
+            "symBlkMsg": "대역 서버 메시지",
+            "symBlkMsgTyp": "응급",
+            "symTypCod": "Y0010",
+            "symTypCodMag": "응급실",
+            "symOutDspMth": "자동",
+            "symOutDspYon": "Y",
+            "symBlkSttDtm": "20260101120000",
+            "symBlkEndDtm": "20260101130000",
+        }
+        for _ in range(rng.randint(0, 2))
+    ]
+
+
+def _haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    radius = 6_371_000.0
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * radius * math.asin(math.sqrt(a))
+
+
+def tmap_route_json(start: Tuple[float, float], end: Tuple[float, float]) -> Dict[str, Any]:
+    # 직선거리 × 도로 계수, 시속 30km 가정
+    distance = int(_haversine_m(start[0], start[1], end[0], end[1]) * 1.3)
+    duration = int(distance / (30_000 / 3600))
+    mid = ((start[0] + end[0]) / 2, (start[1] + end[1]) / 2)
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [start[1], start[0]]},
+                "properties": {"totalDistance": distance, "totalTime": duration, "pointType": "S"},
+            },
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": [[start[1], start[0]], [mid[1], start[0]], [mid[1], mid[0]], [end[1], end[0]]],
+                },
+                "properties": {"distance": distance, "time": duration},
+            },
+        ],
+    }
+
+
+def kakao_region_json(lat: float, lon: float) -> Dict[str, Any]:
+    gu, _ = min(
+        SEOUL_GU_CENTERS.items(),
+        key=lambda item: _haversine_m(lat, lon, item[1][0], item[1][1]),
+    )
+    document = {
+        "region_type": "B",
+        "address_name": f"서울특별시 {gu}",
+        "region_1depth_name": "서울특별시",
+        "region_2depth_name": gu,
+        "region_3depth_name": "",
+        "x": lon,
+        "y": lat,
+    }
+    return {"meta": {"total_count": 1}, "documents": [document]}
+
+
+# ---------- 서버 ----------
+
+
+class StandInState:
+    def __init__(self, config: StandInConfig) -> None:
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self.counters: Dict[str, Dict[str, int]] = {}
+
+    def count(self, name: str, outcome: str) -> None:
+        with self._lock:
+            counters = self.counters.setdefault(name, {"ok": 0, "error": 0, "rate_limited": 0})
+            counters[outcome] += 1
+
+    def behavior_for(self, service: str, operation: Optional[str] = None) -> EndpointBehavior:
+        if operation and operation in self.config.ermct_operations:
+            return self.config.ermct_operations[operation]
+        return getattr(self.config, service)
+
+    async def inject(self, name: str, behavior: EndpointBehavior) -> Optional[str]:
+        """지연을 넣고, 실패를 주입할 경우 'error' / 'rate_limited' 를 돌려준다."""
+        with self._lock:
+            delay = behavior.latency.sample_seconds(self.rng)
+            roll = self.rng.random()
+        if delay:
+            await asyncio.sleep(delay)
+        if roll < behavior.rate_limit_rate:
+            self.count(name, "rate_limited")
+            return "rate_limited"
+        if roll < behavior.rate_limit_rate + behavior.error_rate:
+            self.count(name, "error")
+            return "error"
+        self.count(name, "ok")
+        return None
+
+
+def _recorded_xml(config: StandInConfig, operation: str, sido: str, sigungu: str) -> Optional[str]:
+    if config.recorded_dir is None:
+        return None
+    for candidate in (
+        config.recorded_dir / operation / f"{sido}_{sigungu}.xml",
+        config.recorded_dir / f"{operation}.xml",
+    ):
+        if candidate.exists():
+            return candidate.read_text(encoding="utf-8")
+    return None
+
+
+def build_ermct_response(config: StandInConfig, operation: str, params: Dict[str, str], rng: random.Random) -> str:
+    sido = params.get("STAGE1") or params.get("Q0") or "서울특별시"
+    sigungu = params.get("STAGE2") or params.get("Q1") or ""
+    recorded = _recorded_xml(config, operation, sido, sigungu)
+    if recorded is not None:
+        return recorded
+
+    num_rows = max(1, int(params.get("numOfRows") or 10))
+    page_no = max(1, int(params.get("pageNo") or 1))
+    hpid = params.get("HPID")
+
+    if operation == "getEgytBassInfoInqire" and hpid:
+        hospital = _KNOWN_HOSPITALS.get(hpid)
+        if hospital is None:
+            # 목록에서 본 적 없는 HPID → 이름/좌표만 결정적으로 만든다
+            seed = zlib.crc32(hpid.encode("utf-8"))
+            gu, center = list(SEOUL_GU_CENTERS.items())[seed % len(SEOUL_GU_CENTERS)]
+            hospital = FakeHospital(hpid, f"대역병원 {hpid}", "서울특별시", gu, center[0], center[1], False)
+        return ermct_xml([_basic_item(hospital)], num_rows, page_no, 1)
+
+    if operation == "getEmrrmSrsillDissMsgInqire":
+        hospital = FakeHospital(hpid or "A0000000", f"대역병원 {hpid}", sido, sigungu, 0.0, 0.0, False)
+        items = _message_items(hospital, rng)
+        return ermct_xml(items, num_rows, page_no, len(items))
+
+    if sigungu:
+        hospitals = region_hospitals(sido, sigungu, config.hospitals_per_region)
+    else:
+        # 지역 없이 전체 목록을 요청한 경우: 서울 25개 구를 전부 합친다
+        hospitals = [
+            hospital
+            for gu in SEOUL_GU_CENTERS
+            for hospital in region_hospitals("서울특별시", gu, config.hospitals_per_region)
+        ]
+
+    if operation == "getStrmListInfoInqire":
+        hospitals = [hospital for hospital in hospitals if hospital.trauma]
+
+    total = len(hospitals)
+    page = hospitals[(page_no - 1) * num_rows : page_no * num_rows]
+
+    if operation == "getEmrrmRltmUsefulSckbdInfoInqire":
+        items = [_realtime_item(hospital, rng) for hospital in page]
+    elif operation == "getSrsillDissAceptncPosblInfoInqire":
+        items = [_serious_item(hospital, rng) for hospital in page]
+    else:
+        items = [_basic_item(hospital) for hospital in page]
+    return ermct_xml(items, num_rows, page_no, total)
+
+
+def create_app(config: Optional[StandInConfig] = None) -> FastAPI:
+    state = StandInState(config or StandInConfig())
+    app = FastAPI(title="ERMCT/Tmap/Kakao stand-in")
+    app.state.stand_in = state
+
+    @app.get(f"{ERMCT_PREFIX}/{{operation}}")
+    async def ermct_operation(operation: str, request: Request):
+        if operation not in ERMCT_OPERATIONS:
+            return Response(ermct_error_xml("04", "HTTP_ERROR"), status_code=404, media_type="application/xml")
+
+        outcome = await state.inject(f"ermct:{operation}", state.behavior_for("ermct", operation))
+        if outcome == "rate_limited":
+            if state.config.ermct_rate_limit_mode == "result_code":
+                return Response(
+                    ermct_error_xml("22", "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR"),
+                    media_type="application/xml",
+                )
+            return Response("API rate limit exceeded", status_code=429)
+        if outcome == "error":
+            return Response("Service Unavailable", status_code=503)
+
+        with state._lock:
+            rng = random.Random(state.rng.random())
+        xml = build_ermct_response(state.config, operation, dict(request.query_params), rng)
+        return Response(xml, media_type="application/xml;charset=UTF-8")
+
+    @app.post("/tmap/routes")
+    async def tmap_routes(request: Request):
+        outcome = await state.inject("tmap:routes", state.behavior_for("tmap"))
+        if outcome == "rate_limited":
+            return JSONResponse({"error": {"code": "QUOTA_EXCEEDED"}}, status_code=429)
+        if outcome == "error":
+            return JSONResponse({"error": {"code": "INTERNAL"}}, status_code=500)
+
+        body = await request.json()
+        start = (float(body["startY"]), float(body["startX"]))
+        end = (float(body["endY"]), float(body["endX"]))
+        return JSONResponse(tmap_route_json(start, end))
+
+    @app.get("/v2/local/geo/coord2regioncode.json")
+    async def kakao_coord2region(x: float, y: float):
+        outcome = await state.inject("kakao:coord2region", state.behavior_for("kakao"))
+        if outcome == "rate_limited":
+            return JSONResponse({"errorType": "RequestThrottled"}, status_code=429)
+        if outcome == "error":
+            return JSONResponse({"errorType": "InternalServerError"}, status_code=500)
+        return JSONResponse(kakao_region_json(lat=y, lon=x))
+
+    @app.get("/_stand_in/stats")
+    async def stand_in_stats():
+        with state._lock:
+            counters = {name: dict(values) for name, values in state.counters.items()}
+        config = asdict(state.config)
+        config["recorded_dir"] = str(state.config.recorded_dir) if state.config.recorded_dir else None
+        return {"requests": counters, "config": config}
+
+    @app.post("/_stand_in/config")
+    async def update_stand_in_config(request: Request):
+        # 부하 테스트 도중 지연/오류율을 바꿀 때 사용
+        state.config = StandInConfig.from_dict(await request.json())
+        return {"ok": True}
+
+    return app
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve stand-in ERMCT/Tmap/Kakao APIs for load tests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--config", type=Path, default=None, help="StandInConfig JSON 파일")
+    parser.add_argument("--latency-ms", type=float, default=None, help="모든 upstream 공통 평균 지연")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--latency-distribution",
+        choices=["fixed", "uniform", "normal", "lognormal"],
+        default="lognormal",
+    )
+    parser.add_argument("--error-rate", type=float, default=None)
+    parser.add_argument("--rate-limit-rate", type=float, default=None)
+    parser.add_argument("--recorded-dir", type=Path, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def build_config(args: argparse.Namespace) -> StandInConfig:
+    raw: Dict[str, Any] = {}
+    if args.config is not None:
+        raw = json.loads(args.config.read_text(encoding="utf-8"))
+    config = StandInConfig.from_dict(raw)
+
+    for behavior in (config.ermct, config.tmap, config.kakao):
+        if args.latency_ms is not None:
+            behavior.latency = LatencyProfile(args.latency_distribution, args.latency_ms, args.jitter_ms)
+        if args.error_rate is not None:
+            behavior.error_rate = args.error_rate
+        if args.rate_limit_rate is not None:
+            behavior.rate_limit_rate = args.rate_limit_rate
+    if args.recorded_dir is not None:
+        config.recorded_dir = args.recorded_dir
+    if args.seed is not None:
+        config.seed = args.seed
+    return config
+
+
+def main(argv: list[str] | None = None) -> None:
+    import uvicorn
+
+    args = parse_args(argv)
+    uvicorn.run(create_app(build_config(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
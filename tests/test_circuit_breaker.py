@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from app.services.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    ErmctCircuitOpenError,
+    collect_stale_operations,
+)
+from app.services.ermct_cache import ErmctResponseCache
+from app.services.ermct_client import ErmctClient
+
+
+MESSAGES_PATH = "getEmrrmSrsillDissMsgInqire"
+
+MESSAGES_XML = """<response>
+  <header><resultCode>00</resultCode></header>
+  <body><items><item><hpid>A1</hpid><symBlkMsg>CT 점검</symBlkMsg></item></items></body>
+</response>"""
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def ok_response(text: str) -> Mock:
+    response = Mock(status_code=200, text=text)
+    response.raise_for_status.return_value = None
+    return response
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def test_opens_on_failure_rate_and_recovers_through_half_open(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("op", failure_rate_threshold=0.5, min_calls=4, open_seconds=10, clock=clock)
+
+        for outcome in (True, False, True, False):
+            self.assertTrue(breaker.allow())
+            breaker.record_success() if outcome else breaker.record_failure()
+
+        self.assertEqual(breaker.state, STATE_OPEN)
+        self.assertFalse(breaker.allow())
+
+        clock.now += 10
+        self.assertEqual(breaker.state, STATE_HALF_OPEN)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())  # only one probe at a time
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, STATE_CLOSED)
+
+    def test_failed_probe_reopens(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("op", min_calls=1, open_seconds=5, clock=clock)
+        breaker.record_failure()
+        clock.now += 5
+
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, STATE_OPEN)
+        self.assertEqual(breaker.status()["open_count"], 2)
+
+    def test_below_min_calls_does_not_open(self) -> None:
+        breaker = CircuitBreaker("op", min_calls=5)
+
+        for _ in range(4):
+            breaker.record_failure()
+
+        self.assertEqual(breaker.state, STATE_CLOSED)
+
+
+class ErmctClientCircuitTests(unittest.TestCase):
+    def _client(self, cache: ErmctResponseCache | None = None) -> ErmctClient:
+        registry = CircuitBreakerRegistry(
+            lambda name: CircuitBreaker(name, min_calls=2, open_seconds=60)
+        )
+        return ErmctClient(service_key="test", cache=cache, circuit_breakers=registry)
+
+    def test_open_circuit_fails_fast_without_upstream_call(self) -> None:
+        client = self._client()
+
+        with patch(
+            "app.services.ermct_client.requests.Session.get",
+            side_effect=requests.Timeout("read timed out"),
+        ) as get:
+            for _ in range(2):
+                with self.assertRaises(requests.Timeout):
+                    client.get_emergency_messages("A1")
+            with self.assertRaises(ErmctCircuitOpenError):
+                client.get_emergency_messages("A2")
+
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(client.circuit_breakers.status()[MESSAGES_PATH]["state"], STATE_OPEN)
+
+    def test_debug_raw_xml_records_outcomes_and_respects_open_circuit(self) -> None:
+        client = self._client()
+        path = "getSrsillDissAceptncPosblInfoInqire"
+
+        with patch(
+            "app.services.ermct_client.requests.Session.get",
+            side_effect=requests.Timeout("read timed out"),
+        ) as get:
+            for _ in range(2):
+                with self.assertRaises(requests.Timeout):
+                    client.debug_raw_serious_xml("서울특별시", "강남구")
+            with self.assertRaises(ErmctCircuitOpenError):
+                client.debug_raw_serious_xml("서울특별시", "강남구")
+
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(client.circuit_breakers.status()[path]["state"], STATE_OPEN)
+
+    def test_open_circuit_serves_last_good_value_flagged_stale(self) -> None:
+        clock = FakeClock()
+        cache = ErmctResponseCache(ttls={MESSAGES_PATH: 10}, clock=clock)
+        client = self._client(cache)
+
+        with patch("app.services.ermct_client.requests.Session.get", return_value=ok_response(MESSAGES_XML)):
+            client.get_emergency_messages("A1")
+        clock.now += 11
+
+        with patch(
+            "app.services.ermct_client.requests.Session.get",
+            side_effect=requests.ConnectionError("reset"),
+        ):
+            # 1 success + 1 failure = 50% over min_calls=2 → open
+            with self.assertRaises(requests.RequestException):
+                client.get_emergency_messages("A1")
+
+            with collect_stale_operations() as stale:
+                messages = client.get_emergency_messages("A1")
+
+        self.assertEqual(messages[0].message, "CT 점검")
+        self.assertEqual(stale, [MESSAGES_PATH])
+
+    def test_client_errors_do_not_open_circuit(self) -> None:
+        client = self._client()
+        bad_request = requests.HTTPError("400", response=Mock(status_code=400))
+
+        with patch("app.services.ermct_client.requests.Session.get", side_effect=bad_request):
+            for _ in range(3):
+                with self.assertRaises(requests.HTTPError):
+                    client.get_emergency_messages("A1")
+
+        self.assertEqual(client.circuit_breakers.status()[MESSAGES_PATH]["state"], STATE_CLOSED)
+
+
+class HealthCircuitTests(unittest.TestCase):
+    def test_health_reports_open_circuits_as_degraded(self) -> None:
+        from app import main
+
+        registry = CircuitBreakerRegistry(lambda name: CircuitBreaker(name, min_calls=1))
+        registry.get(MESSAGES_PATH).record_failure()
+
+        with patch.object(main, "ermct_circuit_breakers", registry):
+            health = main.health_check()
+
+        self.assertEqual(health["status"], "degraded")
+        self.assertEqual(health["ermct_circuits"][MESSAGES_PATH]["state"], STATE_OPEN)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from app.services.ermct_cache import (
+    CacheEntry,
+    ErmctResponseCache,
+    MemoryCacheBackend,
+    SqliteCacheBackend,
+    cache_key,
+)
+from app.services.ermct_client import ErmctClient
+
+
+TRAUMA_XML = """<response>
+  <header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header>
+  <body><items><item><hpid>A1100001</hpid><dutyName>외상센터</dutyName></item></items></body>
+</response>"""
+
+REALTIME_PATH = "getEmrrmRltmUsefulSckbdInfoInqire"
+TRAUMA_PATH = "getStrmListInfoInqire"
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def ok_response(text: str) -> Mock:
+    response = Mock(status_code=200, text=text)
+    response.raise_for_status.return_value = None
+    return response
+
+
+class ErmctResponseCacheTests(unittest.TestCase):
+    def test_each_operation_expires_on_its_own_ttl(self) -> None:
+        clock = FakeClock()
+        cache = ErmctResponseCache(
+            ttls={REALTIME_PATH: 10, TRAUMA_PATH: 3600},
+            clock=clock,
+        )
+        cache.set(REALTIME_PATH, {"STAGE1": "서울특별시"}, {"rows": 1})
+        cache.set(TRAUMA_PATH, {"STAGE1": "서울특별시"}, {"rows": 2})
+
+        clock.now += 11
+
+        self.assertIsNone(cache.get(REALTIME_PATH, {"STAGE1": "서울특별시"}))
+        self.assertEqual(cache.get(TRAUMA_PATH, {"STAGE1": "서울특별시"}), {"rows": 2})
+        self.assertEqual(cache.get_stale(REALTIME_PATH, {"STAGE1": "서울특별시"}).value, {"rows": 1})
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["operations"][REALTIME_PATH]["misses"], 1)
+
+    def test_zero_ttl_operation_is_not_cached(self) -> None:
+        cache = ErmctResponseCache(ttls={REALTIME_PATH: 0})
+
+        cache.set(REALTIME_PATH, {}, {"rows": 1})
+
+        self.assertIsNone(cache.get(REALTIME_PATH, {}))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_cache_key_ignores_service_key_and_param_order(self) -> None:
+        first = cache_key(TRAUMA_PATH, {"serviceKey": "secret", "Q0": "서울", "pageNo": 1})
+        second = cache_key(TRAUMA_PATH, {"pageNo": 1, "Q0": "서울"})
+
+        self.assertEqual(first, second)
+        self.assertNotIn("secret", first)
+
+    def test_memory_backend_evicts_least_recently_used(self) -> None:
+        backend = MemoryCacheBackend(max_entries=2)
+        entry = CacheEntry(value=1, stored_at=0.0, expires_at=10.0)
+        backend.set("a", entry)
+        backend.set("b", entry)
+        backend.get("a")
+
+        backend.set("c", entry)
+
+        self.assertIsNone(backend.get("b"))
+        self.assertIsNotNone(backend.get("a"))
+        self.assertEqual(backend.evictions, 1)
+
+    def test_sqlite_backend_persists_across_instances(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.sqlite3"
+            first = SqliteCacheBackend(path, max_entries=2)
+            first.set("a", CacheEntry(value={"rows": [1, 2]}, stored_at=1.0, expires_at=2.0))
+            first.set("b", CacheEntry(value=2, stored_at=1.0, expires_at=2.0))
+            first.set("c", CacheEntry(value=3, stored_at=1.0, expires_at=2.0))
+            first.close()
+
+            second = SqliteCacheBackend(path, max_entries=2)
+            try:
+                self.assertEqual(len(second), 2)
+                self.assertEqual(second.get("c").value, 3)
+                self.assertEqual(first.evictions, 1)
+            finally:
+                second.close()
+
+
+class ErmctClientCacheTests(unittest.TestCase):
+    def test_cached_operation_skips_second_upstream_call(self) -> None:
+        cache = ErmctResponseCache()
+        client = ErmctClient(service_key="test", cache=cache)
+
+        with patch(
+            "app.services.ermct_client.requests.Session.get",
+            return_value=ok_response(TRAUMA_XML),
+        ) as get:
+            first = client.get_trauma_centers("서울특별시", "강남구")
+            second = client.get_trauma_centers("서울특별시", "강남구")
+            client.get_trauma_centers("서울특별시", "서초구")
+
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(
+            [item.model_dump() for item in first],
+            [item.model_dump() for item in second],
+        )
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_upstream_error_is_not_cached(self) -> None:
+        cache = ErmctResponseCache()
+        client = ErmctClient(service_key="test", cache=cache)
+        error = ok_response(
+            "<response><header><resultCode>22</resultCode>"
+            "<resultMsg>LIMITED</resultMsg></header></response>"
+        )
+
+        with patch(
+            "app.services.ermct_client.requests.Session.get",
+            side_effect=[error, ok_response(TRAUMA_XML)],
+        ):
+            with self.assertRaises(RuntimeError):
+                client.get_trauma_centers("서울특별시", "강남구")
+            result = client.get_trauma_centers("서울특별시", "강남구")
+
+        self.assertEqual(result[0].id, "A1100001")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+
+import httpx
+import requests
+
+from app.services.ermct_client import BASE_URL, AsyncErmctClient, ErmctClient
+
+
+REALTIME_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header>
+  <body>
+    <items>
+      <item>
+        <dutyName>테스트병원</dutyName>
+        <dutyTel3>02-000-0000</dutyTel3>
+        <hpid>A1100001</hpid>
+        <hvec>5</hvec>
+        <hvoc>2</hvoc>
+        <hv10>Y</hv10>
+        <hv29>3</hv29>
+        <hvs01>12</hvs01>
+        <hvctayn>Y</hvctayn>
+        <hvidate>20260101120000</hvidate>
+      </item>
+      <item>
+        <dutyName>두번째병원</dutyName>
+        <hpid>A1100002</hpid>
+        <hvec>-1</hvec>
+      </item>
+    </items>
+    <numOfRows>50</numOfRows><pageNo>1</pageNo><totalCount>2</totalCount>
+  </body>
+</response>
+"""
+
+BASIC_LIST_PAGE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header>
+  <body>
+    <items>
+      <item><hpid>{hpid}</hpid><dutyName>{name}</dutyName><dutyAddr>서울특별시 강남구</dutyAddr>
+        <wgs84Lat>37.5</wgs84Lat><wgs84Lon>127.0</wgs84Lon></item>
+    </items>
+    <numOfRows>1</numOfRows><pageNo>{page}</pageNo><totalCount>2</totalCount>
+  </body>
+</response>
+"""
+
+ERROR_XML = """<response><header><resultCode>30</resultCode>
+<resultMsg>SERVICE_KEY_IS_NOT_REGISTERED_ERROR</resultMsg></header></response>"""
+
+
+def sync_response(text: str) -> Mock:
+    response = Mock(status_code=200, text=text)
+    response.raise_for_status.return_value = None
+    return response
+
+
+def basic_list_page(request_params: dict) -> str:
+    page = int(request_params["pageNo"])
+    hpid = f"A110000{page}"
+    return BASIC_LIST_PAGE_XML.format(hpid=hpid, name=f"병원{page}", page=page)
+
+
+class ErmctClientBulkBasicInfoTests(unittest.TestCase):
+    def test_bulk_basic_info_pages_until_total_count(self) -> None:
+        calls: list[dict] = []
+
+        def fake_get(url, params, timeout):
+            calls.append(dict(params, url=url))
+            return sync_response(basic_list_page(params))
+
+        with patch("app.services.ermct_client.requests.Session.get", side_effect=fake_get):
+            result = ErmctClient(service_key="test").get_basic_info_bulk(
+                "서울특별시", "강남구", num_rows=1
+            )
+
+        self.assertEqual(sorted(result), ["A1100001", "A1100002"])
+        self.assertEqual(result["A1100002"].name, "병원2")
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0]["Q0"], "서울특별시")
+        self.assertEqual(calls[0]["Q1"], "강남구")
+        self.assertNotIn("HPID", calls[0])
+        self.assertTrue(calls[0]["url"].endswith("/getEgytListInfoInqire"))
+
+
+class ErmctClientSessionTests(unittest.TestCase):
+    def test_calls_reuse_one_pooled_session(self) -> None:
+        client = ErmctClient(service_key="test", pool_maxsize=3)
+        adapter = client.session.get_adapter(BASE_URL)
+
+        self.assertEqual(adapter._pool_maxsize, 3)
+        with patch.object(client.session, "get", return_value=sync_response(REALTIME_XML)) as get:
+            client.get_realtime_beds("서울특별시", "강남구")
+            client.get_realtime_beds("서울특별시", "서초구")
+
+        self.assertEqual(get.call_count, 2)
+        client.close()
+
+
+class AsyncErmctClientTests(unittest.IsolatedAsyncioTestCase):
+    async def test_async_client_parses_same_models_as_sync_client(self) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, text=REALTIME_XML))
+        client = AsyncErmctClient(service_key="test", transport=transport)
+
+        try:
+            async_rows = await client.get_realtime_beds("서울특별시", "강남구")
+        finally:
+            await client.aclose()
+
+        with patch(
+            "app.services.ermct_client.requests.Session.get",
+            return_value=sync_response(REALTIME_XML),
+        ):
+            sync_rows = ErmctClient(service_key="test").get_realtime_beds("서울특별시", "강남구")
+
+        self.assertEqual(
+            [row.model_dump() for row in async_rows],
+            [row.model_dump() for row in sync_rows],
+        )
+        self.assertEqual(async_rows[0].er_beds, 5)
+        self.assertEqual(async_rows[0].raw_hv, {"hv29": 3})
+        self.assertTrue(async_rows[0].pediatric_ventilator_flag)
+
+    async def test_async_bulk_basic_info_matches_sync_client(self) -> None:
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, text=basic_list_page(request.url.params))
+            if request.url.path.endswith("/getEgytListInfoInqire")
+            else httpx.Response(404)
+        )
+        client = AsyncErmctClient(service_key="test", transport=transport)
+        try:
+            result = await client.get_basic_info_bulk("서울특별시", "강남구", num_rows=1)
+        finally:
+            await client.aclose()
+
+        self.assertEqual(sorted(result), ["A1100001", "A1100002"])
+        self.assertEqual(result["A1100001"].latitude, 37.5)
+
+    async def test_concurrency_limit_caps_in_flight_requests(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, text=REALTIME_XML)
+
+        client = AsyncErmctClient(
+            service_key="test",
+            max_concurrency=2,
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            await asyncio.gather(
+                *(client.get_realtime_beds("서울특별시", f"{index}구") for index in range(6))
+            )
+        finally:
+            await client.aclose()
+
+        self.assertEqual(peak, 2)
+
+    async def test_http_error_is_sanitized_requests_error(self) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(429, text="busy"))
+        client = AsyncErmctClient(service_key="raw-secret", transport=transport)
+
+        try:
+            with self.assertRaises(requests.HTTPError) as raised:
+                await client.get_emergency_messages("A1100001")
+        finally:
+            await client.aclose()
+
+        self.assertNotIn("raw-secret", str(raised.exception))
+        self.assertEqual(raised.exception.response.status_code, 429)
+
+    async def test_result_code_error_raises_runtime_error(self) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, text=ERROR_XML))
+        client = AsyncErmctClient(service_key="test", transport=transport)
+
+        try:
+            with self.assertRaises(RuntimeError):
+                await client.get_trauma_centers("서울특별시", "강남구")
+        finally:
+            await client.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
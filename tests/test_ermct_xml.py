@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import unittest
+
+import xmltodict
+
+from app.services import ermct_xml
+from app.services.ermct_client import ErmctClient
+from scripts.benchmark_ermct_parser import (
+    build_messages_xml,
+    build_realtime_xml,
+    build_serious_xml,
+)
+
+
+def dump(rows) -> list[dict]:
+    return [row.model_dump() for row in rows]
+
+
+class ErmctXmlParityTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.fast = ErmctClient(service_key="test", xml_parser="fast")
+        self.legacy = ErmctClient(service_key="test", xml_parser="xmltodict")
+
+    def test_body_matches_xmltodict_shape(self) -> None:
+        xml = build_realtime_xml(3)
+
+        expected = xmltodict.parse(xml)["response"]["body"]
+
+        self.assertEqual(ermct_xml.parse_body(xml), expected)
+
+    def test_single_item_and_empty_items_match_xmltodict(self) -> None:
+        single = build_messages_xml(1)
+        empty = (
+            "<response><header><resultCode>00</resultCode></header>"
+            "<body><items/><totalCount>0</totalCount></body></response>"
+        )
+
+        for xml in (single, empty):
+            with self.subTest(xml=xml[:40]):
+                self.assertEqual(
+                    ermct_xml.parse_body(xml),
+                    xmltodict.parse(xml)["response"]["body"],
+                )
+
+    def test_realtime_models_match_legacy_parser(self) -> None:
+        xml = build_realtime_xml(50)
+
+        fast_rows = self.fast._parse_realtime_beds(self.fast._parse_body(xml))
+        legacy_rows = self.legacy._parse_realtime_beds(self.legacy._parse_body(xml))
+
+        self.assertEqual(dump(fast_rows), dump(legacy_rows))
+        self.assertIn("hvs01", fast_rows[0].baseline_hvs)
+        self.assertIsNone(fast_rows[0].raw_fields["hv1"])
+
+    def test_serious_and_message_models_match_legacy_parser(self) -> None:
+        serious = build_serious_xml(20)
+        messages = build_messages_xml(20)
+
+        self.assertEqual(
+            dump(self.fast._parse_serious_acceptance(self.fast._parse_body(serious))),
+            dump(self.legacy._parse_serious_acceptance(self.legacy._parse_body(serious))),
+        )
+        self.assertEqual(
+            dump(self.fast._parse_emergency_messages(self.fast._parse_body(messages), "X")),
+            dump(self.legacy._parse_emergency_messages(self.legacy._parse_body(messages), "X")),
+        )
+
+    def test_error_result_code_matches_legacy_message(self) -> None:
+        xml = (
+            "<response><header><resultCode>22</resultCode>"
+            "<resultMsg>LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR</resultMsg>"
+            "</header></response>"
+        )
+
+        with self.assertRaises(RuntimeError) as fast_error:
+            self.fast._parse_body(xml)
+        with self.assertRaises(RuntimeError) as legacy_error:
+            self.legacy._parse_body(xml)
+
+        self.assertEqual(str(fast_error.exception), str(legacy_error.exception))
+
+    def test_non_response_root_is_an_api_error(self) -> None:
+        xml = (
+            "<OpenAPI_ServiceResponse><cmmMsgHeader>"
+            "<returnReasonCode>30</returnReasonCode></cmmMsgHeader></OpenAPI_ServiceResponse>"
+        )
+
+        with self.assertRaises(RuntimeError) as raised:
+            ermct_xml.parse_body(xml)
+
+        self.assertEqual(str(raised.exception), "API error None: Unknown error")
+
+
+if __name__ == "__main__":
+    unittest.main()
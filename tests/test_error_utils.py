@@ -29,7 +29,7 @@ class ErrorUtilsTests(unittest.TestCase):
             "429 for url?serviceKey=raw-secret&x=1",
             response=response,
         )
-        with patch("app.services.ermct_client.requests.get", return_value=response):
+        with patch("app.services.ermct_client.requests.Session.get", return_value=response):
             with self.assertRaises(requests.HTTPError) as raised:
                 ErmctClient(service_key="raw-secret")._get("endpoint", {})
 
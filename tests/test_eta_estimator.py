@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.distance_logic import prefilter_by_great_circle
+from app.eta_estimator import EtaEstimator, region_key
+
+
+class EtaEstimatorTests(unittest.TestCase):
+    def test_uses_defaults_until_region_is_calibrated(self) -> None:
+        estimator = EtaEstimator(default_detour_factor=1.5, default_speed_kmh=36, min_samples=2)
+        self.assertEqual(estimator.estimate("서울특별시 강남구", 1000).basis, "default")
+        self.assertEqual(estimator.estimate("서울특별시 강남구", 1000).duration_sec, 150)
+
+        estimator.observe("서울특별시 강남구", 2000, 3000, 600)
+        estimator.observe("서울특별시 강남구", 4000, 5000, 1000)
+        estimate = estimator.estimate("서울특별시 강남구", 1000)
+
+        self.assertEqual(estimate.basis, "서울특별시 강남구")
+        self.assertAlmostEqual(estimate.distance_m, 1333.3, places=1)
+        self.assertEqual(estimate.duration_sec, 267)  # 8000m / 1600s = 5 m/s
+        # 표본이 없는 시군구는 전국 값을 쓴다
+        self.assertEqual(estimator.estimate("부산광역시 중구", 1000).basis, "*")
+
+    def test_short_trips_are_not_used_for_calibration(self) -> None:
+        estimator = EtaEstimator(min_samples=1)
+        estimator.observe(None, 200, 900, 120)
+
+        self.assertEqual(estimator.stats()["samples"], 0)
+
+    def test_calibration_persists_across_instances(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "eta.json"
+            first = EtaEstimator(path=path, min_samples=1, save_every=0)
+            first.observe("경기도 성남시 분당구", 3000, 4500, 540)
+            first.save()
+
+            second = EtaEstimator(path=path, min_samples=1)
+
+        self.assertEqual(second.estimate("경기도 성남시 분당구", 1000).basis, "경기도 성남시 분당구")
+        self.assertEqual(second.stats()["calibrated_regions"], 1)
+
+    def test_periodic_save_runs_on_the_save_executor(self) -> None:
+        submitted = []
+
+        class RecordingExecutor:
+            def submit(self, fn, *args):
+                submitted.append((fn, args))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "eta.json"
+            estimator = EtaEstimator(path=path, save_every=2, save_executor=RecordingExecutor())
+            for _ in range(4):
+                estimator.observe("경기도 성남시 분당구", 3000, 4500, 540)
+
+            # observe()는 파일을 쓰지 않고, 저장이 끝나기 전에는 한 번만 예약한다
+            self.assertFalse(path.exists())
+            self.assertEqual(len(submitted), 1)
+            fn, args = submitted[0]
+            fn(*args)
+            self.assertTrue(path.exists())
+
+    def test_region_key_from_address(self) -> None:
+        self.assertEqual(region_key("경기도 수원시 권선구 세권로 1"), "경기도 수원시 권선구")
+        self.assertIsNone(region_key(""))
+
+    def test_prefilter_can_rank_by_estimated_road_distance(self) -> None:
+        estimator = EtaEstimator(min_samples=1)
+        # 강 건너 병원: 직선으로는 가깝지만 도로로는 멀고 느리다
+        estimator.observe("서울특별시 용산구", 1000, 4000, 900)
+        estimator.observe("서울특별시 동작구", 1000, 1100, 120)
+        hospitals = [
+            {"id": "across", "latitude": 37.509, "longitude": 127.0, "address": "서울특별시 용산구 1"},
+            {"id": "same-side", "latitude": 37.488, "longitude": 127.0, "address": "서울특별시 동작구 1"},
+        ]
+
+        kept, _ = prefilter_by_great_circle(37.5, 127.0, hospitals, keep=1, estimator=estimator)
+        plain, _ = prefilter_by_great_circle(37.5, 127.0, hospitals, keep=1)
+
+        self.assertEqual([item["id"] for item in kept], ["same-side"])
+        self.assertEqual([item["id"] for item in plain], ["across"])
+
+    def test_prefilter_ranks_by_distance_even_when_duration_disagrees(self) -> None:
+        estimator = EtaEstimator(min_samples=1)
+        # 가까운 병원은 느린 지역, 조금 먼 병원은 빠른 지역
+        estimator.observe("서울특별시 종로구", 1000, 1100, 900)
+        estimator.observe("서울특별시 중구", 1000, 1500, 100)
+        hospitals = [
+            {"id": "near-slow", "latitude": 37.509, "longitude": 127.0, "address": "서울특별시 종로구 1"},
+            {"id": "far-fast", "latitude": 37.49, "longitude": 127.0, "address": "서울특별시 중구 1"},
+        ]
+        near, far = (estimator.estimate(region_key(h["address"]), m) for h, m in zip(hospitals, (1000, 1112)))
+        self.assertLess(near.distance_m, far.distance_m)
+        self.assertGreater(near.duration_sec, far.duration_sec)
+
+        kept, _ = prefilter_by_great_circle(37.5, 127.0, hospitals, keep=1, estimator=estimator)
+
+        # get_top3의 1차 기준(거리)과 같은 기준으로 고른다
+        self.assertEqual([item["id"] for item in kept], ["near-slow"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from app.schemas import HospitalSummary
+from app.services.hospital_snapshot import (
+    HospitalSnapshotRefresher,
+    HospitalSnapshotStore,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def summary(hpid: str) -> HospitalSummary:
+    return HospitalSummary(id=hpid, name=f"name-{hpid}")
+
+
+class HospitalSnapshotStoreTests(unittest.TestCase):
+    def test_put_region_bumps_version_and_indexes_by_hpid(self) -> None:
+        store = HospitalSnapshotStore(max_age_seconds=60, clock=FakeClock())
+
+        version = store.put_region("서울특별시", "강남구", [summary("A1"), summary("A2")])
+
+        self.assertEqual(version, 1)
+        self.assertEqual(
+            [item.id for item in store.get_region("서울특별시", "강남구")],
+            ["A1", "A2"],
+        )
+        self.assertEqual(store.get_hospital("A2").name, "name-A2")
+        self.assertEqual(store.status()["hospital_count"], 2)
+
+    def test_stale_region_is_a_miss(self) -> None:
+        clock = FakeClock()
+        store = HospitalSnapshotStore(max_age_seconds=60, clock=clock)
+        store.put_region("서울특별시", "강남구", [summary("A1")])
+
+        clock.now += 61
+
+        self.assertIsNone(store.get_region("서울특별시", "강남구"))
+        self.assertIsNone(store.get_hospital("A1"))
+
+    def test_region_without_messages_does_not_serve_message_requests(self) -> None:
+        store = HospitalSnapshotStore(clock=FakeClock())
+        store.put_region("서울특별시", "강남구", [summary("A1")], include_messages=False)
+
+        self.assertIsNone(store.get_region("서울특별시", "강남구", include_messages=True))
+        self.assertIsNotNone(store.get_region("서울특별시", "강남구", include_messages=False))
+
+    def test_smaller_stored_page_does_not_serve_larger_request(self) -> None:
+        store = HospitalSnapshotStore(clock=FakeClock())
+        store.put_region("서울특별시", "강남구", [summary("A1")], num_rows=20)
+
+        self.assertIsNone(store.get_region("서울특별시", "강남구", num_rows=200))
+        self.assertIsNotNone(store.get_region("서울특별시", "강남구", num_rows=10))
+
+    def test_published_state_is_not_mutated_by_later_publish(self) -> None:
+        store = HospitalSnapshotStore(clock=FakeClock())
+        store.put_region("서울특별시", "강남구", [summary("A1")])
+        old_state = store.state
+
+        store.put_region("서울특별시", "서초구", [summary("B1")])
+
+        self.assertEqual(len(old_state.regions), 1)
+        self.assertEqual(len(store.state.regions), 2)
+        self.assertEqual(store.version, 2)
+
+    def test_region_targets_keep_only_recently_used_regions(self) -> None:
+        clock = FakeClock()
+        store = HospitalSnapshotStore(max_age_seconds=60, clock=clock)
+        store.put_region("서울특별시", "강남구", [summary("A1")])
+        store.put_region("서울특별시", "서초구", [summary("B1")])
+
+        clock.now += 100
+        store.get_region("서울특별시", "서초구")
+
+        self.assertEqual(store.region_targets(active_within=50), [("서울특별시", "서초구")])
+        self.assertEqual(len(store.region_targets()), 2)
+
+
+class HospitalSnapshotRefresherTests(unittest.TestCase):
+    def test_run_once_publishes_batches_and_reports_failures(self) -> None:
+        store = HospitalSnapshotStore()
+
+        def fetch(sido: str, sigungu: str) -> list[HospitalSummary]:
+            if sigungu == "실패구":
+                raise RuntimeError("upstream 502 serviceKey=secret")
+            return [summary(f"{sigungu}-1")]
+
+        refresher = HospitalSnapshotRefresher(
+            store=store,
+            fetch_region=fetch,
+            targets=lambda: [
+                ("서울특별시", "강남구"),
+                ("서울특별시", "실패구"),
+                ("서울특별시", "서초구"),
+                ("서울특별시", "강남구"),
+            ],
+            publish_batch_size=1,
+        )
+
+        cycle = refresher.run_once()
+
+        self.assertEqual(cycle["refreshed_regions"], 2)
+        self.assertEqual(cycle["failed_regions"], 1)
+        self.assertNotIn("secret", " ".join(cycle["failure_samples"]))
+        self.assertEqual(store.version, 2)
+        self.assertIsNotNone(store.get_hospital("서초구-1"))
+
+    def test_run_once_fetches_targets_concurrently(self) -> None:
+        store = HospitalSnapshotStore()
+        # 두 시군구가 동시에 조회 중이어야만 통과한다
+        barrier = threading.Barrier(2, timeout=2)
+
+        def fetch(sido: str, sigungu: str) -> list[HospitalSummary]:
+            barrier.wait()
+            return [summary(f"{sigungu}-1")]
+
+        refresher = HospitalSnapshotRefresher(
+            store=store,
+            fetch_region=fetch,
+            targets=lambda: [("서울특별시", "강남구"), ("서울특별시", "서초구")],
+            max_workers=2,
+        )
+
+        cycle = refresher.run_once()
+
+        self.assertEqual(cycle["refreshed_regions"], 2)
+        self.assertEqual(cycle["failed_regions"], 0)
+        self.assertEqual(store.version, 1)
+
+
+class RegionSummarySnapshotTests(unittest.TestCase):
+    def test_by_region_endpoint_serves_snapshot_without_live_fetch(self) -> None:
+        from app import main
+
+        store = HospitalSnapshotStore()
+        store.put_region("서울특별시", "강남구", [summary("A1")])
+
+        with (
+            patch.object(main, "HOSPITAL_SNAPSHOT_ENABLED", True),
+            patch.object(main, "hospital_snapshot", store),
+            patch.object(main, "_fetch_hospital_summaries_live") as live,
+        ):
+            result = main.get_hospital_summaries_by_region(
+                sido="서울특별시",
+                sigungu="강남구",
+                sm_type=1,
+                num_rows=200,
+                include_messages=True,
+            )
+
+        live.assert_not_called()
+        self.assertEqual([item.id for item in result], ["A1"])
+
+    def test_snapshot_miss_fetches_live_and_stores_region(self) -> None:
+        from app import main
+
+        store = HospitalSnapshotStore()
+        with (
+            patch.object(main, "HOSPITAL_SNAPSHOT_ENABLED", True),
+            patch.object(main, "hospital_snapshot", store),
+            patch.object(
+                main,
+                "_fetch_hospital_summaries_live",
+                return_value=[summary("A1")],
+            ) as live,
+        ):
+            main.get_hospital_summaries_by_region(
+                sido="서울특별시",
+                sigungu="강남구",
+                sm_type=1,
+                num_rows=200,
+                include_messages=False,
+            )
+
+        live.assert_called_once()
+        self.assertEqual(store.version, 1)
+        self.assertIsNotNone(
+            store.get_region("서울특별시", "강남구", include_messages=False)
+        )
+
+
+    def test_collected_snapshot_version_is_the_one_read(self) -> None:
+        from app import main
+
+        store = HospitalSnapshotStore()
+        store.put_region("서울특별시", "강남구", [summary("A1")])
+        with (
+            patch.object(main, "HOSPITAL_SNAPSHOT_ENABLED", True),
+            patch.object(main, "hospital_snapshot", store),
+            main.collect_snapshot_versions() as versions,
+        ):
+            main.get_hospital_summaries_by_region(
+                sido="서울특별시",
+                sigungu="강남구",
+                sm_type=1,
+                num_rows=200,
+                include_messages=True,
+            )
+            # 검색이 끝난 뒤의 갱신은 응답 버전에 들어가지 않는다
+            store.put_region("서울특별시", "서초구", [summary("B1")])
+
+        self.assertEqual(versions, {1})
+        self.assertEqual(store.version, 2)
+
+if __name__ == "__main__":
+    unittest.main()
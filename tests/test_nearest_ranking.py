@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import unittest
 from unittest.mock import AsyncMock, patch
 
-from app.distance_logic import calculate_all_distances_async, get_top3
-from app.main import route_seoul_nearest
+import httpx
+
+from app import distance_logic
+
+from app.distance_logic import calculate_all_distances_async, get_top3, prefilter_by_great_circle
+from app.main import get_route_path, route_seoul_nearest
 from app.schemas import (
     NearestRoutingRequest,
+    RoutePathRequest,
     RoutingCandidateHospital,
     RoutingCase,
 )
+from app.eta_estimator import EtaEstimator
+from app.services.tmap_cache import TmapDistanceCache, TmapRouteCache
 
 
 def hospital(
@@ -60,6 +69,12 @@ def nearest_request(hospitals: list[RoutingCandidateHospital]) -> NearestRouting
 
 
 class DistanceRankingTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        for name, value in (("tmap_distance_cache", TmapDistanceCache()), ("eta_estimator", None)):
+            patcher = patch.object(distance_logic, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
     def test_distance_is_primary_sort_key(self) -> None:
         results = [
             {"id": "far", "distance": 2000, "duration_sec": 100, "coverage_score": 1.0, "priority_score": 99},
@@ -127,6 +142,149 @@ class DistanceRankingTests(unittest.IsolatedAsyncioTestCase):
             "reason_summary": "정보 없음",
         }])
 
+    def test_prefilter_keeps_nearest_in_input_order_and_drops_missing_coordinates(self) -> None:
+        hospitals = [
+            {"id": "far", "latitude": 37.9, "longitude": 127.0},
+            {"id": "near", "latitude": 37.501, "longitude": 127.0},
+            {"id": "no-coords", "latitude": None, "longitude": None},
+            {"id": "mid", "latitude": 37.52, "longitude": 127.0},
+        ]
+
+        kept, pruned = prefilter_by_great_circle(37.5, 127.0, hospitals, keep=2)
+
+        self.assertEqual([item["id"] for item in kept], ["near", "mid"])
+        self.assertEqual(pruned, 2)
+
+
+class PooledTmapClientTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.cache = TmapDistanceCache()
+        for name, value in (("tmap_distance_cache", self.cache), ("eta_estimator", None)):
+            patcher = patch.object(distance_logic, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self) -> None:
+        await distance_logic.close_tmap_client()
+        distance_logic._tmap_transport = None
+
+    def _install(self, delays: dict[str, float]) -> dict[str, int]:
+        stats = {"calls": 0, "in_flight": 0, "max_in_flight": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            stats["calls"] += 1
+            stats["in_flight"] += 1
+            stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            try:
+                await asyncio.sleep(delays.get(body["endY"], 0.01))
+            finally:
+                stats["in_flight"] -= 1
+            properties = {"totalDistance": int(float(body["endY"]) * 1000), "totalTime": 60}
+            return httpx.Response(200, json={"features": [{"properties": properties}]})
+
+        distance_logic.init_tmap_client(transport=httpx.MockTransport(handler))
+        return stats
+
+    def _hospitals(self, count: int) -> list[dict]:
+        return [
+            {"id": f"A{i}", "name": f"H{i}", "latitude": float(i + 1), "longitude": 127.0}
+            for i in range(count)
+        ]
+
+    async def test_calls_share_one_client_under_concurrency_cap(self) -> None:
+        with patch.object(distance_logic, "TMAP_MAX_CONCURRENCY", 2):
+            stats = self._install({})
+            client = distance_logic._tmap_client
+            results = await distance_logic.calculate_all_distances_async(37.5, 127.0, self._hospitals(6))
+
+        self.assertEqual(len(results), 6)
+        self.assertIs(distance_logic._tmap_client, client)
+        self.assertEqual(stats["calls"], 6)
+        self.assertLessEqual(stats["max_in_flight"], 2)
+
+    async def test_batch_deadline_returns_results_gathered_so_far(self) -> None:
+        self._install({"2.0": 5.0})
+
+        results = await distance_logic.calculate_all_distances_async(
+            37.5, 127.0, self._hospitals(3), batch_timeout=0.2
+        )
+
+        self.assertEqual([item["id"] for item in results], ["A0", "A2"])
+
+    async def test_repeat_request_from_same_cell_is_served_from_cache(self) -> None:
+        stats = self._install({})
+
+        first = await distance_logic.calculate_all_distances_async(37.5, 127.0, self._hospitals(3))
+        # 몇십 미터 움직인 같은 격자 칸에서 다시 요청
+        second = await distance_logic.calculate_all_distances_async(37.5001, 127.0001, self._hospitals(3))
+
+        self.assertEqual(stats["calls"], 3)
+        self.assertTrue(all(item.get("cached") for item in second))
+        self.assertEqual(
+            [(item["id"], item["distance"]) for item in second],
+            [(item["id"], item["distance"]) for item in first],
+        )
+        self.assertEqual(self.cache.stats()["hits"], 3)
+
+    async def test_route_paths_are_collected_from_distance_calls(self) -> None:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            end = [float(body["endX"]), float(body["endY"])]
+            return httpx.Response(200, json={"features": [
+                {"properties": {"totalDistance": 1200, "totalTime": 90}},
+                {"geometry": {"type": "LineString", "coordinates": [[127.0, 37.5], end]}},
+            ]})
+
+        distance_logic.init_tmap_client(transport=httpx.MockTransport(handler))
+        route_paths: dict[str, dict] = {}
+
+        await distance_logic.calculate_all_distances_async(
+            37.5, 127.0, self._hospitals(2), route_paths=route_paths
+        )
+
+        self.assertEqual(set(route_paths), {"A0", "A1"})
+        self.assertEqual(route_paths["A1"]["path"][-1], {"lon": 127.0, "lat": 2.0})
+        self.assertEqual(route_paths["A1"]["duration_sec"], 90)
+
+    async def test_failed_and_skipped_calls_are_not_cached(self) -> None:
+        self._install({"2.0": 5.0})
+
+        await distance_logic.calculate_all_distances_async(37.5, 127.0, self._hospitals(3), batch_timeout=0.2)
+
+        self.assertEqual(self.cache.stats()["entries"], 2)
+        self.assertIsNone(self.cache.get(37.5, 127.0, "A1"))
+
+    async def test_failed_and_skipped_calls_fall_back_to_estimates(self) -> None:
+        self._install({"2.0": 5.0})
+        estimator = EtaEstimator(min_samples=1)
+
+        with patch.object(distance_logic, "eta_estimator", estimator):
+            results = await distance_logic.calculate_all_distances_async(
+                37.5, 127.0, self._hospitals(3), batch_timeout=0.2
+            )
+
+        self.assertEqual([item["id"] for item in results], ["A0", "A1", "A2"])
+        self.assertEqual([bool(item.get("estimated")) for item in results], [False, True, False])
+        # 성공한 두 응답으로 보정된 전국 값을 쓴다
+        self.assertEqual(estimator.stats()["samples"], 2)
+        self.assertGreater(results[1]["distance"], 0)
+
+    async def test_hospital_without_coordinates_does_not_drop_other_results(self) -> None:
+        self._install({})
+        hospitals = self._hospitals(2) + [{"id": "NOLOC", "name": "no coords", "latitude": None, "longitude": None}]
+
+        with patch.object(distance_logic, "eta_estimator", EtaEstimator(min_samples=1)):
+            results = await distance_logic.calculate_all_distances_async(37.5, 127.0, hospitals)
+
+        self.assertEqual([item["id"] for item in results], ["A0", "A1"])
+
+    async def test_per_call_deadline_returns_none(self) -> None:
+        self._install({"1.0": 5.0})
+
+        with patch.object(distance_logic, "TMAP_CALL_TIMEOUT_SECONDS", 0.05):
+            self.assertEqual(await distance_logic.get_tmap_distance_async(37.5, 127.0, 1.0, 127.0), (None, None))
+
 
 class NearestEndpointOrderingTests(unittest.IsolatedAsyncioTestCase):
     async def test_severance_regression_returns_nearest_hospital_first(self) -> None:
@@ -161,6 +319,79 @@ class NearestEndpointOrderingTests(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual([item.id for item in response.hospitals], ["A2", "A1"])
 
+    async def test_route_path_reuses_geometry_from_nearest_call(self) -> None:
+        hospitals = [hospital("A1", "경로병원", coverage=0.5, priority=5.0, beds=3)]
+        route = {"path": [{"lat": 37.5, "lon": 127.0}, {"lat": 37.51, "lon": 127.0}], "distance": 1200.0, "duration_sec": 90}
+
+        async def distances(**kwargs):
+            kwargs["route_paths"]["A1"] = route
+            return [{"id": "A1", "name": "경로병원", "distance": 1200, "duration_sec": 90, "coverage_score": 0.5, "priority_score": 5.0}]
+
+        route_mock = AsyncMock(return_value=None)
+        with (
+            patch("app.main.calculate_all_distances_async", new=distances),
+            patch("app.main.tmap_route_cache", TmapRouteCache()),
+            patch("app.main.get_tmap_route_async", new=route_mock),
+        ):
+            await route_seoul_nearest(nearest_request(hospitals))
+            target = hospitals[0]
+            response = await get_route_path(RoutePathRequest(
+                start_lat=37.5, start_lon=127.0,
+                end_lat=target.latitude, end_lon=target.longitude,
+                hospital_id="A1",
+            ))
+
+        route_mock.assert_not_called()
+        self.assertEqual(response.route_source, "cache")
+        self.assertEqual(response.duration_sec, 90)
+        self.assertEqual(len(response.path), 2)
+
+    async def test_estimated_distances_are_flagged_in_response(self) -> None:
+        hospitals = [hospital("A1", "추정병원", coverage=0.5, priority=5.0, beds=3)]
+        distance_results = [
+            {"id": "A1", "name": "추정병원", "distance": 1350.0, "duration_sec": 162, "coverage_score": 0.5, "priority_score": 5.0, "estimated": True},
+        ]
+        with (
+            patch("app.main.calculate_all_distances_async", new=AsyncMock(return_value=distance_results)),
+            patch("app.main.eta_estimator", EtaEstimator()),
+        ):
+            response = await route_seoul_nearest(nearest_request(hospitals))
+
+        self.assertEqual(response.hospitals[0].distance_source, "estimate")
+        self.assertEqual(response.distance_estimated, 1)
+
+    async def test_cache_hits_are_marked_in_response(self) -> None:
+        hospitals = [
+            hospital("A1", "캐시병원", coverage=0.2, priority=6.0, beds=8),
+            hospital("A2", "호출병원", coverage=0.8, priority=5.8, beds=6),
+        ]
+        distance_results = [
+            {"id": "A1", "name": "캐시병원", "distance": 900, "duration_sec": 200, "coverage_score": 0.2, "priority_score": 6.0, "cached": True},
+            {"id": "A2", "name": "호출병원", "distance": 1000, "duration_sec": 360, "coverage_score": 0.8, "priority_score": 5.8},
+        ]
+        with (
+            patch("app.main.calculate_all_distances_async", new=AsyncMock(return_value=distance_results)),
+            patch("app.main.tmap_distance_cache", TmapDistanceCache()),
+        ):
+            response = await route_seoul_nearest(nearest_request(hospitals))
+
+        self.assertEqual([item.distance_source for item in response.hospitals], ["cache", "tmap"])
+        self.assertEqual(response.distance_cache_hits, 1)
+
+    async def test_only_prefiltered_candidates_reach_tmap(self) -> None:
+        hospitals = []
+        for index in range(12):
+            item = hospital(f"A{index}", f"병원{index}", coverage=0.5, priority=5.0, beds=1)
+            hospitals.append(item.model_copy(update={"latitude": 37.5 + index * 0.01}))
+        distance_mock = AsyncMock(return_value=[])
+
+        with patch("app.main.calculate_all_distances_async", new=distance_mock):
+            response = await route_seoul_nearest(nearest_request(hospitals))
+
+        sent = distance_mock.call_args.kwargs["hospitals"]
+        self.assertEqual([item["id"] for item in sent], [f"A{index}" for index in range(8)])
+        self.assertEqual(response.prefilter_pruned, 4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from app.services.ermct_client import ErmctClient
+from app.services.rate_limiter import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_CRITICAL,
+    ErmctRateLimitError,
+    ErmctRateLimiter,
+    SqliteRateLimitState,
+    current_priority,
+    ermct_priority,
+    priority_for_ktas,
+)
+
+
+PATH = "getEmrrmRltmUsefulSckbdInfoInqire"
+
+TRAUMA_XML = """<response>
+  <header><resultCode>00</resultCode></header>
+  <body><items><item><hpid>A1</hpid></item></items></body>
+</response>"""
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_767_225_600.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def limiter(clock: FakeClock, **kwargs) -> ErmctRateLimiter:
+    kwargs.setdefault("rate_per_second", 1.0)
+    kwargs.setdefault("burst", 2.0)
+    kwargs.setdefault("daily_quota", 100)
+    return ErmctRateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class ErmctRateLimiterTests(unittest.TestCase):
+    def test_bucket_waits_for_refill_within_max_wait(self) -> None:
+        clock = FakeClock()
+        rate_limiter = limiter(clock)
+
+        for _ in range(3):
+            rate_limiter.acquire(PATH, priority=PRIORITY_CRITICAL)
+
+        self.assertAlmostEqual(clock.now - 1_767_225_600.0, 1.0)
+        status = rate_limiter.status()
+        self.assertEqual(status["operations"][PATH]["used"], 3)
+        self.assertEqual(status["priorities"][PRIORITY_CRITICAL]["waited"], 1)
+
+    def test_background_keeps_token_reserve_for_critical(self) -> None:
+        clock = FakeClock()
+        rate_limiter = limiter(clock, rate_per_second=0.01, burst=4.0)
+
+        # burst 4, reserve 50% → background can take the bucket down to 2 tokens.
+        rate_limiter.acquire(PATH, priority=PRIORITY_BACKGROUND)
+        rate_limiter.acquire(PATH, priority=PRIORITY_BACKGROUND)
+        with self.assertRaises(ErmctRateLimitError):
+            rate_limiter.acquire(PATH, priority=PRIORITY_BACKGROUND)
+
+        rate_limiter.acquire(PATH, priority=PRIORITY_CRITICAL)
+        rate_limiter.acquire(PATH, priority=PRIORITY_CRITICAL)
+
+    def test_daily_quota_reserves_share_for_critical(self) -> None:
+        clock = FakeClock()
+        rate_limiter = limiter(clock, burst=100.0, daily_quota=10)
+
+        for _ in range(7):
+            rate_limiter.acquire(PATH, priority=PRIORITY_BACKGROUND)
+        with self.assertRaises(ErmctRateLimitError) as raised:
+            rate_limiter.acquire(PATH, priority=PRIORITY_BACKGROUND)
+        self.assertEqual(raised.exception.reason, "daily_quota")
+
+        for _ in range(3):
+            rate_limiter.acquire(PATH, priority=PRIORITY_CRITICAL)
+        with self.assertRaises(ErmctRateLimitError):
+            rate_limiter.acquire(PATH, priority=PRIORITY_CRITICAL)
+        self.assertEqual(rate_limiter.status()["operations"][PATH]["remaining"], 0)
+
+    def test_daily_usage_resets_at_kst_midnight(self) -> None:
+        clock = FakeClock(now=1_767_279_599.0)  # 2026-01-01 23:59:59 KST
+        rate_limiter = limiter(clock, burst=100.0, daily_quota=1)
+
+        rate_limiter.acquire(PATH, priority=PRIORITY_CRITICAL)
+        with self.assertRaises(ErmctRateLimitError):
+            rate_limiter.acquire(PATH, priority=PRIORITY_CRITICAL)
+
+        clock.now += 2
+        rate_limiter.acquire(PATH, priority=PRIORITY_CRITICAL)
+        self.assertEqual(rate_limiter.status()["day"], "2026-01-02")
+
+    def test_sqlite_state_is_shared_between_limiters(self) -> None:
+        clock = FakeClock()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "limit.sqlite3"
+            first_state = SqliteRateLimitState(path, burst=100.0)
+            second_state = SqliteRateLimitState(path, burst=100.0)
+            try:
+                first = limiter(clock, burst=100.0, daily_quota=3, state=first_state)
+                second = limiter(clock, burst=100.0, daily_quota=3, state=second_state)
+
+                first.acquire(PATH, priority=PRIORITY_CRITICAL)
+                second.acquire(PATH, priority=PRIORITY_CRITICAL)
+                first.acquire(PATH, priority=PRIORITY_CRITICAL)
+
+                with self.assertRaises(ErmctRateLimitError):
+                    second.acquire(PATH, priority=PRIORITY_CRITICAL)
+                self.assertEqual(second.status()["operations"][PATH]["used"], 3)
+            finally:
+                first_state.close()
+                second_state.close()
+
+    def test_priority_context_and_ktas_mapping(self) -> None:
+        self.assertEqual(priority_for_ktas(1), PRIORITY_CRITICAL)
+        self.assertEqual(priority_for_ktas(3), "normal")
+
+        with ermct_priority(PRIORITY_BACKGROUND):
+            self.assertEqual(current_priority(), PRIORITY_BACKGROUND)
+        self.assertEqual(current_priority(), "normal")
+
+
+class ErmctClientRateLimitTests(unittest.TestCase):
+    def test_rejected_call_never_reaches_upstream_and_counts_as_rate_limited(self) -> None:
+        from app import main
+
+        clock = FakeClock()
+        client = ErmctClient(
+            service_key="test",
+            rate_limiter=limiter(clock, burst=100.0, daily_quota=1),
+        )
+        response = Mock(status_code=200, text=TRAUMA_XML)
+        response.raise_for_status.return_value = None
+
+        with patch("app.services.ermct_client.requests.Session.get", return_value=response) as get:
+            client.get_trauma_centers("서울특별시", "강남구")
+            with self.assertRaises(ErmctRateLimitError) as raised:
+                client.get_trauma_centers("서울특별시", "서초구")
+
+        self.assertEqual(get.call_count, 1)
+        self.assertTrue(main._is_rate_limited(raised.exception))
+
+    def test_debug_raw_xml_counts_against_the_daily_quota(self) -> None:
+        client = ErmctClient(
+            service_key="test",
+            rate_limiter=limiter(FakeClock(), burst=100.0, daily_quota=1),
+        )
+        response = Mock(status_code=200, text="<response/>")
+        response.raise_for_status.return_value = None
+
+        with patch("app.services.ermct_client.requests.Session.get", return_value=response) as get:
+            self.assertEqual(client.debug_raw_serious_xml("서울특별시", "강남구"), "<response/>")
+            with self.assertRaises(ErmctRateLimitError):
+                client.debug_raw_serious_xml("서울특별시", "강남구")
+
+        self.assertEqual(get.call_count, 1)
+
+    def test_gathered_calls_inherit_request_priority(self) -> None:
+        from app import main
+
+        with ermct_priority(PRIORITY_CRITICAL):
+            results, errors = main._gather_ermct_calls({"priority": current_priority})
+
+        self.assertEqual(errors, {})
+        self.assertEqual(results["priority"], PRIORITY_CRITICAL)
+
+
+if __name__ == "__main__":
+    unittest.main()
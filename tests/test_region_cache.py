@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Optional
+
+from app.services.region_cache import CachedRegionResolver, geohash_bounds, geohash_encode
+from app.services.region_resolver import KakaoRegion
+
+
+class FakeKakao:
+    """경도 border_lon 서쪽은 서초구, 동쪽은 강남구"""
+
+    def __init__(self, border_lon: float = 127.03) -> None:
+        self.border_lon = border_lon
+        self.calls = 0
+
+    def resolve_region(self, lat: float, lon: float) -> Optional[KakaoRegion]:
+        self.calls += 1
+        name = "서초구" if lon < self.border_lon else "강남구"
+        return KakaoRegion(sido_name="서울특별시", sigungu_name=name)
+
+
+class InlineExecutor:
+    """백그라운드 경계 확인을 바로 실행하는 테스트용 executor"""
+
+    def __init__(self) -> None:
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        fn(*args)
+
+
+class GeohashTests(unittest.TestCase):
+    def test_encode_matches_reference_and_bounds_contain_point(self) -> None:
+        self.assertEqual(geohash_encode(57.64911, 10.40744, 11), "u4pruydqqvj")
+
+        min_lat, min_lon, max_lat, max_lon = geohash_bounds(geohash_encode(37.4979, 127.0276, 7))
+        self.assertTrue(min_lat <= 37.4979 <= max_lat and min_lon <= 127.0276 <= max_lon)
+        self.assertLess(max_lat - min_lat, 0.002)
+
+
+class CachedRegionResolverTests(unittest.TestCase):
+    def test_request_path_makes_at_most_one_kakao_call(self) -> None:
+        kakao = FakeKakao()
+        executor = InlineExecutor()
+        cache = CachedRegionResolver(kakao, precision=7, border_executor=executor)
+        min_lat, min_lon, max_lat, max_lon = geohash_bounds(geohash_encode(37.5, 127.05, 7))
+        lat, lon = (min_lat + max_lat) / 2, (min_lon + max_lon) / 2
+
+        first = cache.resolve_region(lat, lon)
+        self.assertEqual((kakao.calls, executor.submitted), (1, 0))
+
+        # 두 번째 방문: 실제 조회 1번 + 모서리 4곳은 백그라운드
+        second = cache.resolve_region(lat + 1e-5, lon + 1e-5)
+        self.assertEqual((kakao.calls, executor.submitted), (1 + 1 + 4, 1))
+
+        third = cache.resolve_region(lat - 1e-5, lon - 1e-5)
+        self.assertEqual(kakao.calls, 6)
+        self.assertEqual(first, second)
+        self.assertEqual(second, third)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["unverified_live"]), (1, 1, 1))
+        self.assertEqual((stats["unverified_cells"], stats["border_checks"]), (0, 1))
+
+    def test_single_visit_cells_skip_the_corner_check(self) -> None:
+        kakao = FakeKakao()
+        executor = InlineExecutor()
+        cache = CachedRegionResolver(kakao, precision=7, border_executor=executor)
+
+        for step in range(5):
+            cache.resolve_region(37.50 + step * 0.01, 127.05)
+
+        self.assertEqual((kakao.calls, executor.submitted), (5, 0))
+
+    def test_cell_straddling_a_border_is_always_resolved_live(self) -> None:
+        min_lat, min_lon, max_lat, max_lon = geohash_bounds(geohash_encode(37.5, 127.03, 7))
+        kakao = FakeKakao(border_lon=min_lon + (max_lon - min_lon) * 0.9)
+        executor = InlineExecutor()
+        cache = CachedRegionResolver(kakao, precision=7, border_executor=executor)
+        lat = (min_lat + max_lat) / 2
+
+        west = cache.resolve_region(lat, min_lon + 1e-6)
+        cache.resolve_region(lat, min_lon + 2e-6)  # 같은 시군구 → 모서리 확인에서 경계 발견
+        calls = kakao.calls
+        east = cache.resolve_region(lat, max_lon - 1e-6)
+
+        self.assertEqual((west.sigungu_name, east.sigungu_name), ("서초구", "강남구"))
+        self.assertEqual(kakao.calls, calls + 1)
+        self.assertEqual(cache.stats()["straddling_cells"], 1)
+        self.assertEqual(cache.stats()["border_live"], 1)
+
+    def test_second_visit_in_another_sigungu_marks_the_cell_without_corner_check(self) -> None:
+        min_lat, min_lon, max_lat, max_lon = geohash_bounds(geohash_encode(37.5, 127.03, 7))
+        kakao = FakeKakao(border_lon=(min_lon + max_lon) / 2)
+        executor = InlineExecutor()
+        cache = CachedRegionResolver(kakao, precision=7, border_executor=executor)
+        lat = (min_lat + max_lat) / 2
+
+        cache.resolve_region(lat, min_lon + 1e-6)
+        east = cache.resolve_region(lat, max_lon - 1e-6)
+
+        self.assertEqual(east.sigungu_name, "강남구")
+        self.assertEqual((kakao.calls, executor.submitted), (2, 0))
+        self.assertEqual(cache.stats()["straddling_cells"], 1)
+
+    def test_lru_eviction(self) -> None:
+        cache = CachedRegionResolver(FakeKakao(), precision=7, max_entries=1, border_check=False)
+
+        cache.resolve_region(37.50, 127.05)
+        cache.resolve_region(37.60, 127.05)
+
+        self.assertEqual(cache.stats()["entries"], 1)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_cells_persist_across_restarts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "regions.json"
+            first = CachedRegionResolver(FakeKakao(), path=path, save_every=0, border_check=False)
+            first.resolve_region(37.50, 127.05)
+            first.save()
+            unverified = CachedRegionResolver(FakeKakao(), path=path.with_name("unverified.json"), save_every=0)
+            unverified.resolve_region(37.50, 127.05)
+            unverified.save()
+            reloaded = CachedRegionResolver(FakeKakao(), path=path.with_name("unverified.json"))
+
+            kakao = FakeKakao()
+            second = CachedRegionResolver(kakao, path=path, border_check=False)
+            resolved = second.resolve_sigungu(37.50, 127.05)
+
+        self.assertEqual(kakao.calls, 0)
+        self.assertEqual((resolved.sigungu_name, resolved.sido_name), ("강남구", "서울특별시"))
+        self.assertEqual(reloaded.stats()["unverified_cells"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
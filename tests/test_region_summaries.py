@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from app import main
+from app.schemas import HospitalBasicInfo, HospitalMessage, HospitalRealtime, KTASRoutingRequest, TraumaCenter
+
+
+def realtime(hpid: str) -> HospitalRealtime:
+    return HospitalRealtime(id=hpid, name=f"rt-{hpid}")
+
+
+class FakeErmctClient:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.basic_errors: dict[str, Exception] = {}
+        self.serious_error: Exception | None = None
+        self.realtime_error: Exception | None = None
+        self.bulk_hpids: list[str] = []
+        self.bulk_error: Exception | None = None
+        self.basic_calls: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _enter(self) -> None:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+
+    def get_realtime_beds(self, **kwargs):
+        self._enter()
+        if self.realtime_error:
+            raise self.realtime_error
+        return [realtime("A3"), realtime("A1"), realtime("A3"), realtime("A2")]
+
+    def get_serious_acceptance(self, **kwargs):
+        self._enter()
+        if self.serious_error:
+            raise self.serious_error
+        return []
+
+    def get_trauma_centers(self, **kwargs):
+        self._enter()
+        return [TraumaCenter(id="A1")]
+
+    def get_basic_info_bulk(self, **kwargs):
+        self._enter()
+        if self.bulk_error:
+            raise self.bulk_error
+        return {
+            hpid: HospitalBasicInfo(id=hpid, name=f"bulk-{hpid}")
+            for hpid in self.bulk_hpids
+        }
+
+    def get_basic_info(self, hpid: str, **kwargs):
+        self._enter()
+        with self._lock:
+            self.basic_calls.append(hpid)
+        if hpid in self.basic_errors:
+            raise self.basic_errors[hpid]
+        return HospitalBasicInfo(id=hpid, name=f"basic-{hpid}")
+
+    def get_emergency_messages(self, hpid: str, **kwargs):
+        self._enter()
+        return [HospitalMessage(id=hpid, message="msg")]
+
+
+class FlaggedErmctClient(FakeErmctClient):
+    """기본정보에만 MKioskTy 플래그가 있고 목록에는 없는 실제 응답 모양."""
+
+    def get_realtime_beds(self, **kwargs):
+        return [
+            HospitalRealtime(id=hpid, name=f"rt-{hpid}", er_beds=3, general_icu_beds=2, neuro_icu_beds=1)
+            for hpid in ("A1", "A2")
+        ]
+
+    def get_basic_info_bulk(self, **kwargs):
+        if self.bulk_error:
+            raise self.bulk_error
+        return {
+            hpid: HospitalBasicInfo(
+                id=hpid,
+                name=f"list-{hpid}",
+                latitude=37.5,
+                longitude=127.0,
+                raw_fields={"hpid": hpid, "dutyEryn": "1"},
+            )
+            for hpid in ("A1", "A2")
+        }
+
+    def get_basic_info(self, hpid: str, **kwargs):
+        return HospitalBasicInfo(
+            id=hpid,
+            name=f"basic-{hpid}",
+            latitude=37.5,
+            longitude=127.0,
+            raw_fields={
+                "hpid": hpid,
+                "dutyEryn": "1",
+                "MKioskTy1": "Y",
+                "MKioskTy2": "N1" if hpid == "A1" else "Y",
+            },
+        )
+
+
+class RegionSummaryFanOutTests(unittest.TestCase):
+    def _fetch(self, client: FakeErmctClient, include_messages: bool = True):
+        with patch.object(main, "ermct_client", client):
+            return main._fetch_hospital_summaries_live(
+                sido="서울특별시",
+                sigungu="강남구",
+                include_messages=include_messages,
+            )
+
+    def test_results_keep_realtime_order_and_skip_duplicates(self) -> None:
+        summaries = self._fetch(FakeErmctClient())
+
+        self.assertEqual([s.id for s in summaries], ["A3", "A1", "A2"])
+        self.assertEqual(summaries[0].name, "basic-A3")
+        self.assertTrue(summaries[1].is_trauma_center)
+        self.assertEqual(len(summaries[2].messages), 1)
+
+    def test_calls_run_concurrently(self) -> None:
+        client = FakeErmctClient(delay=0.05)
+
+        started = time.monotonic()
+        self._fetch(client)
+        elapsed = time.monotonic() - started
+
+        # 4 regional + 3 basic + 3 messages calls would take ~0.5s serially.
+        self.assertLess(elapsed, 0.3)
+        self.assertGreater(client.peak, 1)
+
+    def test_secondary_failures_degrade_instead_of_failing_region(self) -> None:
+        client = FakeErmctClient()
+        client.serious_error = RuntimeError("API error 99")
+        client.basic_errors["A1"] = requests.ConnectionError("reset")
+
+        summaries = self._fetch(client, include_messages=False)
+
+        self.assertEqual([s.id for s in summaries], ["A3", "A1", "A2"])
+        self.assertIsNone(summaries[1].basic)
+        self.assertEqual(summaries[1].name, "rt-A1")
+        self.assertEqual(summaries[0].messages, [])
+
+    def test_realtime_failure_is_raised(self) -> None:
+        client = FakeErmctClient()
+        client.realtime_error = requests.Timeout("Read timed out")
+
+        with self.assertRaises(requests.Timeout):
+            self._fetch(client)
+
+    def test_rate_limited_secondary_call_is_raised(self) -> None:
+        client = FakeErmctClient()
+        client.basic_errors["A2"] = requests.HTTPError("429", response=Mock(status_code=429))
+
+        with self.assertRaises(requests.HTTPError):
+            self._fetch(client)
+
+    def test_bulk_listing_only_fills_fields_missing_from_basic_info(self) -> None:
+        client = FakeErmctClient()
+        client.bulk_hpids = ["A1", "A3"]
+        client.get_basic_info_bulk = lambda **kwargs: {
+            hpid: HospitalBasicInfo(id=hpid, name=f"bulk-{hpid}", address=f"addr-{hpid}")
+            for hpid in client.bulk_hpids
+        }
+
+        summaries = self._fetch(client, include_messages=False)
+
+        # MKioskTy 플래그는 기본정보에만 있으므로 목록에 있는 병원도 개별 조회한다
+        self.assertEqual(sorted(client.basic_calls), ["A1", "A2", "A3"])
+        self.assertEqual([s.name for s in summaries], ["basic-A3", "basic-A1", "basic-A2"])
+        self.assertEqual([s.basic.address for s in summaries], ["addr-A3", "addr-A1", None])
+
+    def test_bulk_listing_failure_falls_back_to_per_hospital_calls(self) -> None:
+        client = FakeErmctClient()
+        client.bulk_error = requests.ConnectionError("reset")
+
+        summaries = self._fetch(client, include_messages=False)
+
+        self.assertEqual(sorted(client.basic_calls), ["A1", "A2", "A3"])
+        self.assertEqual(summaries[0].name, "basic-A3")
+
+    def test_rate_limited_bulk_listing_is_raised(self) -> None:
+        client = FakeErmctClient()
+        client.bulk_error = requests.HTTPError("429", response=Mock(status_code=429))
+
+        with self.assertRaises(requests.HTTPError):
+            self._fetch(client)
+
+    def test_slow_call_is_reported_as_timeout(self) -> None:
+        calls = {"fast": lambda: 1, "slow": lambda: time.sleep(0.2)}
+
+        results, errors = main._gather_ermct_calls(calls, timeout=0.05)
+
+        self.assertEqual(results, {"fast": 1})
+        self.assertIsInstance(errors["slow"], requests.Timeout)
+
+    def test_queue_wait_does_not_count_against_call_timeout(self) -> None:
+        calls = {index: (lambda: time.sleep(0.03) or "ok") for index in range(4)}
+
+        # 한 번에 하나씩 도는 풀이라 마지막 호출은 ~0.09s 기다린 뒤 시작한다
+        with patch.object(main, "ERMCT_FANOUT_WORKERS", 1):
+            results, errors = main._gather_ermct_calls(calls, timeout=0.06)
+
+        self.assertEqual(errors, {})
+        self.assertEqual(len(results), 4)
+
+    def test_partial_failures_are_collected_for_the_response(self) -> None:
+        client = FakeErmctClient()
+        client.serious_error = RuntimeError("API error 99")
+
+        with main.collect_region_failures() as failures:
+            self._fetch(client, include_messages=False)
+
+        self.assertEqual(len(failures), 1)
+        self.assertIn("서울특별시 강남구", failures[0])
+        self.assertIn("serious", failures[0])
+
+
+
+class BasicInfoListingEquivalenceTests(unittest.TestCase):
+    def _candidates(self, use_listing: bool):
+        client = FlaggedErmctClient()
+        if not use_listing:
+            client.bulk_error = requests.ConnectionError("listing unavailable")
+        with patch.object(main, "ermct_client", client):
+            summaries = main._fetch_hospital_summaries_live(
+                sido="서울특별시",
+                sigungu="강남구",
+                include_messages=False,
+            )
+        groups = ["ACS_MI", "ACS_STROKE"]
+        statuses = [main.procedure_status_for_hospital(summary, groups) for summary in summaries]
+        candidates = main._build_routing_candidates_from_summaries(
+            req=KTASRoutingRequest(ktas_level=2, chief_complaint="chest_pain"),
+            complaint_id=1,
+            required_groups=groups,
+            complaint_label="chest pain",
+            summaries=summaries,
+        )
+        return statuses, {candidate.id: candidate.mkiosk_flags for candidate in candidates}
+
+    def test_listing_does_not_change_mkiosk_flags_or_procedure_status(self) -> None:
+        statuses, flags = self._candidates(use_listing=True)
+
+        self.assertEqual((statuses, flags), self._candidates(use_listing=False))
+        self.assertIn("MKioskTy1", flags["A1"])
+        self.assertGreater(statuses[1]["ACS_STROKE"]["api_beds"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from app.route_geometry import (
+    decode_delta,
+    decode_polyline,
+    encode_delta,
+    encode_polyline,
+    simplify_douglas_peucker,
+)
+from app.schemas import RoutePathRequest
+
+
+class EncodingTests(unittest.TestCase):
+    def test_polyline_matches_reference_example(self) -> None:
+        points = [(38.5, -120.2), (40.7, -120.95), (43.252, -126.453)]
+
+        encoded = encode_polyline(points)
+
+        self.assertEqual(encoded, "_p~iF~ps|U_ulLnnqC_mqNvxq`@")
+        self.assertEqual(decode_polyline(encoded), points)
+
+    def test_delta_round_trip_keeps_small_offsets(self) -> None:
+        points = [(37.56654, 126.97797), (37.56660, 126.97810), (37.56601, 126.97702)]
+
+        flat = encode_delta(points)
+
+        self.assertEqual(flat[:2], [3756654, 12697797])
+        self.assertEqual(flat[2:4], [6, 13])
+        self.assertEqual(decode_delta(flat), points)
+
+
+class SimplifyTests(unittest.TestCase):
+    def test_collinear_points_are_dropped_and_corners_kept(self) -> None:
+        straight = [(37.5 + i * 0.001, 127.0) for i in range(11)]
+        corner = straight + [(37.51, 127.0 + i * 0.001) for i in range(1, 11)]
+
+        simplified = simplify_douglas_peucker(corner, tolerance_m=5)
+
+        self.assertEqual(simplified, [corner[0], (37.51, 127.0), corner[-1]])
+
+    def test_zero_tolerance_keeps_everything(self) -> None:
+        points = [(37.5, 127.0), (37.5001, 127.0), (37.5002, 127.0)]
+
+        self.assertEqual(simplify_douglas_peucker(points, 0), points)
+
+
+class RoutePathFormatTests(unittest.IsolatedAsyncioTestCase):
+    async def _request(self, **options):
+        from app.main import get_route_path
+
+        path = [{"lat": 37.5 + i * 0.001, "lon": 127.0} for i in range(20)]
+        route = {"path": path, "distance": 2200.0, "duration_sec": 240}
+        with patch("app.main.get_tmap_route_async", new=AsyncMock(return_value=route)):
+            return await get_route_path(
+                RoutePathRequest(start_lat=37.5, start_lon=127.0, end_lat=37.519, end_lon=127.0, **options)
+            )
+
+    async def test_default_format_is_unchanged(self) -> None:
+        response = await self._request()
+
+        self.assertEqual(len(response.path), 20)
+        self.assertIsNone(response.encoded_path)
+
+    async def test_polyline_with_simplification(self) -> None:
+        response = await self._request(path_format="polyline", simplify_tolerance_m=2)
+
+        self.assertEqual(response.path, [])
+        self.assertEqual(decode_polyline(response.encoded_path), [(37.5, 127.0), (37.519, 127.0)])
+        self.assertEqual((response.point_count, response.original_point_count), (2, 20))
+
+    async def test_delta_format(self) -> None:
+        response = await self._request(path_format="delta", precision=6)
+
+        self.assertEqual(len(decode_delta(response.delta_path, 6)), 20)
+        self.assertEqual(response.precision, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
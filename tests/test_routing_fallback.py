@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+import time
 import unittest
 from unittest.mock import Mock, patch
 
@@ -8,11 +10,13 @@ import requests
 from app.main import (
     GlobalFallbackResult,
     MAX_GLOBAL_FALLBACK_SIGUNGU,
+    REGION_SUMMARY_API_CALLS,
     _merge_candidates_by_hpid,
     _run_global_fallback,
     route_from_ktas_seoul,
 )
 from app.schemas import KTASRoutingRequest, RoutingCandidateHospital
+from app.services.sigungu_er_index import SigunguErIndex
 from app.services.sigungu_search import ProgressiveSearchResult
 
 
@@ -98,6 +102,9 @@ class BoundedGlobalFallbackTests(unittest.TestCase):
         self.adjacency.all_codes = ["11110", "11120", "11130"]
         self.adjacency.get_name.side_effect = lambda code: f"name-{code}"
         self.adjacency.get_sido_code.return_value = "11"
+        patcher = patch("app.main.sigungu_er_index", SigunguErIndex())
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_429_stops_after_first_region_and_redacts_service_key(self) -> None:
         response = Mock(status_code=429)
@@ -107,6 +114,7 @@ class BoundedGlobalFallbackTests(unittest.TestCase):
         )
         with (
             patch("app.main._get_sigungu_adjacency_index", return_value=self.adjacency),
+            patch("app.main.MAX_GLOBAL_FALLBACK_CONCURRENCY", 1),
             patch("app.main.get_hospital_summaries_by_region", side_effect=error) as fetch,
         ):
             result = _run_global_fallback(request(), 1, ["cardiac"], "chest pain")
@@ -118,6 +126,7 @@ class BoundedGlobalFallbackTests(unittest.TestCase):
     def test_repeated_timeouts_stop_fallback(self) -> None:
         with (
             patch("app.main._get_sigungu_adjacency_index", return_value=self.adjacency),
+            patch("app.main.MAX_GLOBAL_FALLBACK_CONCURRENCY", 1),
             patch(
                 "app.main.get_hospital_summaries_by_region",
                 side_effect=requests.Timeout("Read timed out"),
@@ -148,6 +157,104 @@ class BoundedGlobalFallbackTests(unittest.TestCase):
         self.assertEqual(fetch.call_count, MAX_GLOBAL_FALLBACK_SIGUNGU)
         self.assertEqual(result.reason, "sigungu_budget_exhausted")
 
+    def test_deadline_returns_collected_candidates_without_waiting(self) -> None:
+        release = threading.Event()
+
+        def fetch(sido, sigungu, **kwargs):
+            if sigungu == "name-11110":
+                return [sigungu]
+            release.wait(timeout=2)
+            return []
+
+        def build(summaries, **kwargs):
+            return [candidate(f"A-{summary}") for summary in summaries]
+
+        started = time.monotonic()
+        with (
+            patch("app.main._get_sigungu_adjacency_index", return_value=self.adjacency),
+            patch("app.main.MAX_GLOBAL_FALLBACK_SECONDS", 0.2),
+            patch("app.main.get_hospital_summaries_by_region", side_effect=fetch),
+            patch("app.main._build_routing_candidates_from_summaries", side_effect=build),
+        ):
+            result = _run_global_fallback(request(), 1, ["cardiac"], "chest pain")
+        release.set()
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(result.reason, "time_budget_exhausted")
+        self.assertEqual([item.id for item in result.candidates], ["A-name-11110"])
+        # 11120, 11130은 진행 중에 버렸지만 호출은 나갔다
+        self.assertEqual(result.estimated_api_calls, 3 * REGION_SUMMARY_API_CALLS)
+        self.assertIn("abandoned 2 in-flight", " ".join(result.warnings))
+
+    def test_no_new_region_when_slowest_region_cannot_finish_before_deadline(self) -> None:
+        def fetch(sido, sigungu, **kwargs):
+            time.sleep(0.15)
+            return []
+
+        with (
+            patch("app.main._get_sigungu_adjacency_index", return_value=self.adjacency),
+            patch("app.main.MAX_GLOBAL_FALLBACK_CONCURRENCY", 1),
+            patch("app.main.MAX_GLOBAL_FALLBACK_SECONDS", 0.25),
+            patch("app.main.get_hospital_summaries_by_region", side_effect=fetch) as fetch_mock,
+        ):
+            result = _run_global_fallback(request(), 1, ["cardiac"], "chest pain")
+
+        # 첫 지역이 0.15초 걸렸으니 남은 0.1초 안에는 다음 지역을 시작하지 않는다
+        self.assertEqual(fetch_mock.call_count, 1)
+        self.assertEqual(result.reason, "time_budget_exhausted")
+        self.assertEqual(result.warnings, [])
+
+    def test_candidates_merge_in_region_order_not_completion_order(self) -> None:
+        def fetch(sido, sigungu, **kwargs):
+            # 먼저 시작한 지역이 가장 늦게 끝난다
+            time.sleep({"name-11110": 0.1, "name-11120": 0.05}.get(sigungu, 0.0))
+            return [sigungu]
+
+        def build(summaries, **kwargs):
+            return [candidate(f"A-{summary}") for summary in summaries]
+
+        with (
+            patch("app.main._get_sigungu_adjacency_index", return_value=self.adjacency),
+            patch("app.main.get_hospital_summaries_by_region", side_effect=fetch),
+            patch("app.main._build_routing_candidates_from_summaries", side_effect=build),
+        ):
+            result = _run_global_fallback(request(), 1, ["cardiac"], "chest pain")
+
+        self.assertEqual(result.reason, "all_regions_exhausted")
+        self.assertEqual(
+            [item.id for item in result.candidates],
+            ["A-name-11110", "A-name-11120", "A-name-11130"],
+        )
+
+    def test_fallback_starts_near_base_and_skips_searched_regions(self) -> None:
+        from app.main import _global_fallback_order
+        from app.services.sigungu_search import AdjacentSigungu, SigunguAdjacencyIndex
+
+        def edge(code: str, km: float) -> AdjacentSigungu:
+            return AdjacentSigungu(code, f"name-{code}", "11", "border_touch", True, km)
+
+        adjacency = SigunguAdjacencyIndex(
+            neighbors_by_code={
+                "11010": [edge("11020", 2.0), edge("11030", 9.0)],
+                "11020": [edge("11010", 2.0), edge("11030", 3.0)],
+                "11030": [edge("11010", 9.0), edge("11020", 3.0)],
+                "11000": [],
+            },
+            code_to_name={code: f"name-{code}" for code in ("11000", "11010", "11020", "11030")},
+            code_to_sido_code={},
+            name_to_code={},
+        )
+
+        self.assertEqual(
+            _global_fallback_order(adjacency, "11010", searched_codes=["11010"]),
+            ["11020", "11030", "11000"],
+        )
+        # 기준 시군구를 모르면 먼저 조회한 시군구 기준 거리 순
+        self.assertEqual(
+            _global_fallback_order(adjacency, None, searched_codes=["11030"]),
+            ["11020", "11010", "11000"],
+        )
+
     def test_merge_preserves_existing_candidate_and_deduplicates_hpid(self) -> None:
         existing = candidate("A1")
         duplicate = candidate("A1")
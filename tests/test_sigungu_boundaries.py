@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from app.schemas import KTASRoutingRequest
+from app.services.sigungu_boundaries import LocalSigunguResolver, load_sigungu_boundary_index
+from app.services.sigungu_er_index import SigunguErIndex
+from app.services.sigungu_search import ResolvedSigungu
+from scripts.build_sigungu_boundaries import build_boundaries
+
+ADJACENCY_PATH = Path(__file__).resolve().parents[1] / "data" / "sigungu_adjacency.json"
+
+
+def square(lon: float, lat: float, size: float) -> list[list[float]]:
+    return [[lon, lat], [lon + size, lat], [lon + size, lat + size], [lon, lat + size], [lon, lat]]
+
+
+def feature(code: str, name: str, *polygons: list[list[list[float]]]) -> dict:
+    return {
+        "type": "Feature",
+        "properties": {"SIG_CD": code, "SIG_KOR_NM": name},
+        "geometry": {"type": "MultiPolygon", "coordinates": list(polygons)},
+    }
+
+
+class BoundaryBuildAndLookupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        geojson = {
+            "type": "FeatureCollection",
+            "features": [
+                # 종로구: 구멍 안쪽은 중구(서울)
+                feature("11110", "종로구", [square(126.9, 37.5, 0.1), square(126.94, 37.54, 0.02)]),
+                feature("11140", "중구", [square(126.94, 37.54, 0.02)]),
+                # 같은 이름 다른 시도(부산 중구)
+                feature("26110", "중구", [square(129.0, 35.1, 0.05)]),
+                feature("99999", "없는구", [square(120.0, 30.0, 0.1)]),
+            ],
+        }
+        self.payload, self.unmatched = build_boundaries(
+            geojson, ADJACENCY_PATH, "SIG_CD", "SIG_KOR_NM", tolerance_m=10, precision=5
+        )
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        path = Path(self.tmp.name) / "boundaries.json"
+        path.write_text(json.dumps(self.payload, ensure_ascii=False), encoding="utf-8")
+        self.index = load_sigungu_boundary_index(path)
+        patcher = patch("app.main.sigungu_er_index", SigunguErIndex())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_admin_codes_are_mapped_to_adjacency_codes(self) -> None:
+        self.assertEqual([item["code"] for item in self.payload["features"]], ["11010", "11020", "21010"])
+        self.assertEqual(self.unmatched, ["99999 없는구"])
+
+    def test_point_in_polygon_respects_holes(self) -> None:
+        self.assertEqual(self.index.lookup(37.52, 126.92).code, "11010")
+        self.assertEqual(self.index.lookup(37.55, 126.95).code, "11020")
+        self.assertEqual(self.index.lookup(35.12, 129.02).code, "21010")
+        self.assertIsNone(self.index.lookup(37.0, 126.0))
+
+    def test_resolver_falls_back_only_on_miss(self) -> None:
+        kakao = MagicMock()
+        kakao.resolve_sigungu.return_value = ResolvedSigungu(sigungu_code="", sigungu_name="강화군")
+        resolver = LocalSigunguResolver(self.index, fallback=kakao)
+
+        local = resolver.resolve(37.52, 126.92)
+        remote = resolver.resolve(37.7, 126.4)
+
+        self.assertEqual((local.sigungu_code, local.sido_code), ("11010", "11"))
+        self.assertEqual(remote.sigungu_name, "강화군")
+        kakao.resolve_sigungu.assert_called_once_with(37.7, 126.4)
+        self.assertEqual(resolver.stats(), {"boundaries": 3, "local_hits": 1, "fallback_calls": 1})
+
+    def test_routing_uses_local_code_without_kakao(self) -> None:
+        from app import main
+
+        kakao = MagicMock()
+        resolver = LocalSigunguResolver(self.index, fallback=kakao)
+        request = KTASRoutingRequest(ktas_level=2, chief_complaint="chest_pain", user_lat=35.12, user_lon=129.02)
+
+        with patch.object(main, "sigungu_region_resolver", resolver):
+            code, sido_name = main._resolve_current_region(request)
+
+        self.assertEqual((code, sido_name), ("21010", "부산광역시"))
+        kakao.resolve_sigungu.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
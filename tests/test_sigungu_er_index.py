@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.services.sigungu_er_index import SigunguErIndex, load_sigungu_er_counts
+from app.services.sigungu_search import AdjacentSigungu, SigunguAdjacencyIndex
+from scripts.build_sigungu_er_counts import build_er_counts
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def adjacency() -> SigunguAdjacencyIndex:
+    def edge(code: str, km: float) -> AdjacentSigungu:
+        return AdjacentSigungu(code, f"name-{code}", "11", "border_touch", True, km)
+
+    return SigunguAdjacencyIndex(
+        neighbors_by_code={
+            "11010": [edge("11020", 2.0)],
+            "11020": [edge("11010", 2.0), edge("11030", 3.0)],
+            "11030": [edge("11020", 3.0)],
+            "99010": [],
+        },
+        code_to_name={code: f"name-{code}" for code in ("11010", "11020", "11030", "99010")},
+        code_to_sido_code={"11010": "11", "11020": "11", "11030": "11", "99010": "99"},
+        name_to_code={},
+    )
+
+
+class SigunguErIndexTests(unittest.TestCase):
+    def test_zero_count_and_negative_cache_skip_regions(self) -> None:
+        clock = FakeClock()
+        index = SigunguErIndex({"11010": 0, "11020": 2}, empty_ttl_seconds=60, clock=clock)
+
+        self.assertEqual(index.filter_codes(["11010", "11020", "11030"]), ["11020", "11030"])
+
+        index.record("11030", 0)
+        index.record("11020", 0)
+        self.assertEqual(index.filter_codes(["11010", "11020", "11030"]), [])
+
+        clock.now += 61
+        self.assertEqual(index.filter_codes(["11010", "11020", "11030"]), ["11020", "11030"])
+        self.assertEqual(index.count("11020"), 2)
+        self.assertEqual(index.stats()["skipped"], 5)
+
+    def test_file_zero_is_queried_again_after_its_ttl(self) -> None:
+        clock = FakeClock()
+        index = SigunguErIndex(
+            {"11010": 0},
+            empty_ttl_seconds=60,
+            file_empty_ttl_seconds=600,
+            clock=clock,
+        )
+
+        self.assertEqual(index.filter_codes(["11010"]), [])
+        clock.now += 601
+        self.assertEqual(index.filter_codes(["11010"]), ["11010"])
+
+        # 응급실이 새로 생긴 지역은 조회 결과로 반영된다
+        index.record("11010", 1)
+        self.assertEqual(index.count("11010"), 1)
+        self.assertFalse(index.is_empty("11010"))
+
+    def test_positive_record_clears_negative_entry(self) -> None:
+        index = SigunguErIndex(clock=FakeClock())
+
+        index.record("11010", 0)
+        self.assertTrue(index.is_empty("11010"))
+        index.record("11010", 3)
+
+        self.assertFalse(index.is_empty("11010"))
+        self.assertEqual(index.count("11010"), 3)
+
+    def test_save_keeps_counts_but_not_negative_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "counts.json"
+            index = SigunguErIndex({"11010": 0}, path=path, clock=FakeClock())
+            index.record("11020", 4)
+            index.record("11030", 0)
+            index.save()
+
+            self.assertEqual(load_sigungu_er_counts(path), {"11010": 0, "11020": 4})
+            path.write_text(json.dumps({"version": 99, "counts": {}}), encoding="utf-8")
+            with self.assertRaises(ValueError):
+                load_sigungu_er_counts(path)
+
+    def test_build_er_counts_counts_rows_and_leaves_out_failures(self) -> None:
+        def fetch_rows(sido: str, sigungu: str) -> list:
+            self.assertEqual(sido, "서울특별시")
+            if sigungu == "name-11030":
+                raise RuntimeError("upstream down")
+            return ["row"] * (2 if sigungu == "name-11020" else 0)
+
+        counts, failures = build_er_counts(adjacency(), fetch_rows)
+
+        self.assertEqual(counts, {"11010": 0, "11020": 2})
+        self.assertEqual(len(failures), 2)
+
+    def test_global_fallback_order_skips_empty_regions(self) -> None:
+        from app.main import _global_fallback_order
+
+        index = SigunguErIndex({"11020": 0}, clock=FakeClock())
+        with patch("app.main.sigungu_er_index", index):
+            order = _global_fallback_order(adjacency(), "11010", searched_codes=["11010"])
+
+        self.assertEqual(order, ["11030", "99010"])
+
+    def test_progressive_search_does_not_fetch_empty_regions(self) -> None:
+        from app.main import _run_progressive_search
+        from app.schemas import KTASRoutingRequest
+
+        fetched: list[str] = []
+
+        def fetch_candidates(code: str) -> list:
+            fetched.append(code)
+            return []
+
+        index = SigunguErIndex({"11010": 0, "11030": 0}, clock=FakeClock())
+        req = KTASRoutingRequest(ktas_level=2, chief_complaint="chest_pain", current_sigungu_code="11010")
+        with patch("app.main.sigungu_er_index", index), patch("app.main.SIGUNGU_PARALLEL_FETCH", False):
+            _, result = _run_progressive_search(req, [["11010"], ["11020", "11030"]], fetch_candidates, adjacency())
+
+        self.assertEqual(fetched, ["11020"])
+        self.assertEqual([attempt.sigungu_code for attempt in result.attempts], ["11020"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 import json
+import math
 import tempfile
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from app.services.sigungu_search import (
     ExpansionPolicy,
     build_expansion_levels,
     load_sigungu_adjacency,
+    load_sigungu_adjacency_artifact,
+    order_codes_by_distance,
     search_regions_progressively,
+    write_sigungu_adjacency_artifact,
 )
 
 
@@ -75,6 +81,68 @@ class SigunguSearchTests(unittest.TestCase):
         self.assertEqual(levels[3], ["11140"])
         self.assertEqual(levels[4], ["11150"])
 
+    def test_expansion_plans_are_precomputed_once_per_policy(self) -> None:
+        index = load_sigungu_adjacency(self._write_fixture())
+        policy = ExpansionPolicy(top_touching_limit=1)
+
+        plans = index.expansion_plans(policy)
+
+        self.assertIs(index.expansion_plans(policy), plans)
+        self.assertEqual(plans["11110"], (("11110",), ("11120",), ("11130",), ("11140",)))
+        # 이웃으로만 나오는 코드도 계획이 있다
+        self.assertEqual(plans["11130"], (("11130",),))
+        self.assertEqual(build_expansion_levels("99999", index), [["99999"]])
+
+    def test_distance_matrix_holds_shortest_path_centroid_distances(self) -> None:
+        index = load_sigungu_adjacency(self._write_fixture())
+        matrix = index.distance_matrix
+        code_index = index.compact.code_index
+
+        self.assertIs(index.distance_matrix, matrix)
+        self.assertAlmostEqual(matrix.distance_km(code_index["11120"], code_index["11140"]), 4.2)
+        self.assertEqual(matrix.distance_km(code_index["11130"], code_index["11110"]), math.inf)
+        self.assertEqual(order_codes_by_distance("11120", index), ["11120", "11110", "11130", "11140"])
+
+    def test_k_ring_policy_expands_one_level_per_hop(self) -> None:
+        index = load_sigungu_adjacency(self._write_fixture())
+
+        self.assertEqual(
+            build_expansion_levels("11120", index, ExpansionPolicy(mode="k_ring", max_hops=2)),
+            [["11120"], ["11110"], ["11130", "11140"]],
+        )
+        self.assertEqual(
+            build_expansion_levels("11120", index, ExpansionPolicy(mode="k_ring", max_hops=1)),
+            [["11120"], ["11110"]],
+        )
+
+    def test_nearest_n_policy_chunks_by_centroid_distance(self) -> None:
+        index = load_sigungu_adjacency(self._write_fixture())
+
+        self.assertEqual(
+            build_expansion_levels("11120", index, ExpansionPolicy(mode="nearest_n", nearest_n=2, level_size=1)),
+            [["11120"], ["11110"], ["11130"]],
+        )
+        self.assertEqual(
+            build_expansion_levels("11120", index, ExpansionPolicy(mode="nearest_n", nearest_n=5, level_size=2)),
+            [["11120"], ["11110", "11130"], ["11140"]],
+        )
+
+    def test_binary_artifact_round_trips(self) -> None:
+        src = self._write_fixture()
+        index = load_sigungu_adjacency(src)
+        artifact = src.with_suffix(".bin")
+
+        write_sigungu_adjacency_artifact(index, artifact)
+        loaded = load_sigungu_adjacency_artifact(artifact)
+
+        self.assertEqual(loaded.all_codes, index.all_codes)
+        self.assertEqual(loaded.code_to_name, index.code_to_name)
+        self.assertEqual(loaded.get_code("B-gu"), "11120")
+        self.assertEqual(loaded.neighbors_by_code["11110"], index.neighbors_by_code["11110"])
+        for policy in (ExpansionPolicy(), ExpansionPolicy(top_touching_limit=1, include_buffer_intersects=False)):
+            self.assertEqual(loaded.expansion_plans(policy), index.expansion_plans(policy))
+        self.assertEqual(order_codes_by_distance("11120", loaded), order_codes_by_distance("11120", index))
+
     def test_search_regions_progressively_distinguishes_error_and_valid_items(self) -> None:
         levels = [["11110"], ["11120"], ["11130"]]
 
@@ -99,6 +167,134 @@ class SigunguSearchTests(unittest.TestCase):
         self.assertEqual(result.attempts[1].fetch_status, "error")
         self.assertEqual(result.attempts[2].valid_count, 2)
 
+    def test_concurrent_level_fetch_matches_sequential_order(self) -> None:
+        levels = [["11110"], ["11120", "11130", "11140"], ["11150"]]
+        # 레벨 1의 세 시군구가 동시에 들어와야만 barrier를 통과한다
+        barrier = threading.Barrier(3, timeout=2)
+        items_by_code = {
+            "11110": ["H0"],
+            "11120": [],
+            "11130": ["H1", "H2"],
+            "11140": ["H2", "H3"],
+            "11150": ["H4"],
+        }
+
+        def fetch(code: str) -> list[str]:
+            if code in levels[1]:
+                barrier.wait()
+            if code == "11120":
+                raise RuntimeError("upstream 502")
+            return items_by_code[code]
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            result = search_regions_progressively(
+                levels=levels,
+                fetch_valid_items=fetch,
+                item_key=lambda item: item,
+                min_valid_items=3,
+                level_executor=executor,
+            )
+
+        self.assertEqual(result.items, ["H0", "H1", "H2"])
+        self.assertEqual(
+            [(attempt.sigungu_code, attempt.fetch_status, attempt.valid_count) for attempt in result.attempts],
+            [
+                ("11110", "success", 1),
+                ("11120", "error", 1),
+                ("11130", "success", 3),
+                ("11140", "prefetch_discarded", 3),
+            ],
+        )
+
+    def test_prefetch_starts_next_level_while_current_level_is_fetched(self) -> None:
+        levels = [["11110"], ["11120", "11130"]]
+        next_level_started = threading.Event()
+
+        def fetch(code: str) -> list[str]:
+            if code == "11110":
+                # 레벨 1 선행 조회가 이미 돌고 있어야 통과
+                self.assertTrue(next_level_started.wait(timeout=2))
+                return ["H0"]
+            next_level_started.set()
+            return [f"H-{code}"]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = search_regions_progressively(
+                levels=levels,
+                fetch_valid_items=fetch,
+                item_key=lambda item: item,
+                min_valid_items=3,
+                level_executor=executor,
+                prefetch_next_level=True,
+            )
+
+        self.assertEqual(result.items, ["H0", "H-11120", "H-11130"])
+        self.assertEqual([attempt.fetch_status for attempt in result.attempts], ["success"] * 3)
+        self.assertTrue(all(attempt.elapsed_ms is not None for attempt in result.attempts))
+
+    def test_prefetch_is_discarded_and_logged_when_threshold_met(self) -> None:
+        levels = [["11110"], ["11120", "11130"]]
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch(code: str) -> list[str]:
+            if code == "11110":
+                started.wait(timeout=2)
+            if code == "11120":
+                started.set()
+                release.wait(timeout=2)
+            return [f"H-{code}"]
+
+        # worker 1개: 11120은 실행 중(폐기), 11130은 대기 중(취소)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = search_regions_progressively(
+                levels=levels,
+                fetch_valid_items=fetch,
+                item_key=lambda item: item,
+                min_valid_items=1,
+                level_executor=executor,
+                prefetch_next_level=True,
+            )
+            release.set()
+
+        self.assertEqual(result.items, ["H-11110"])
+        self.assertEqual(
+            [(attempt.sigungu_code, attempt.fetch_status) for attempt in result.attempts],
+            [("11110", "success"), ("11120", "prefetch_discarded"), ("11130", "prefetch_cancelled")],
+        )
+
+    def test_same_level_leftovers_are_discarded_when_threshold_met(self) -> None:
+        levels = [["11110", "11120", "11130"]]
+        started = threading.Event()
+        release = threading.Event()
+
+        def fetch(code: str) -> list[str]:
+            if code == "11110":
+                started.wait(timeout=2)
+            if code == "11120":
+                started.set()
+                release.wait(timeout=2)
+            return [f"H-{code}"]
+
+        # worker 2개: 11110을 합칠 때 11120은 실행 중(폐기), 11130은 대기 중이거나 막 시작했다
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = search_regions_progressively(
+                levels=levels,
+                fetch_valid_items=fetch,
+                item_key=lambda item: item,
+                min_valid_items=1,
+                level_executor=executor,
+            )
+            release.set()
+
+        self.assertEqual(result.items, ["H-11110"])
+        self.assertEqual(
+            [(attempt.sigungu_code, attempt.fetch_status) for attempt in result.attempts[:2]],
+            [("11110", "success"), ("11120", "prefetch_discarded")],
+        )
+        self.assertEqual(result.attempts[2].sigungu_code, "11130")
+        self.assertIn(result.attempts[2].fetch_status, {"prefetch_cancelled", "prefetch_discarded"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import httpx
+
+from app.schemas import HospitalSummary
+from app.services.ermct_client import AsyncErmctClient, ErmctClient
+from app.services.single_flight import AsyncSingleFlight, SingleFlight
+
+
+REALTIME_XML = """<response>
+  <header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header>
+  <body><items><item><hpid>A1100001</hpid><dutyName>병원</dutyName><hvec>3</hvec></item></items></body>
+</response>"""
+
+
+class SingleFlightTests(unittest.TestCase):
+    def _run_concurrently(self, count: int, fn):
+        barrier = threading.Barrier(count)
+
+        def call():
+            barrier.wait()
+            return fn()
+
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            futures = [pool.submit(call) for _ in range(count)]
+        return futures
+
+    def test_concurrent_calls_share_one_execution(self) -> None:
+        flight = SingleFlight()
+        calls = 0
+
+        def slow():
+            nonlocal calls
+            calls += 1
+            time.sleep(0.1)
+            return "result"
+
+        futures = self._run_concurrently(5, lambda: flight.do("key", slow))
+
+        self.assertEqual([future.result() for future in futures], ["result"] * 5)
+        self.assertEqual(calls, 1)
+        self.assertEqual(flight.stats(), {"executed": 1, "shared": 4, "in_flight": 0})
+
+    def test_exception_is_shared_and_key_is_released(self) -> None:
+        flight = SingleFlight()
+
+        def failing():
+            time.sleep(0.05)
+            raise RuntimeError("upstream 502")
+
+        futures = self._run_concurrently(3, lambda: flight.do("key", failing))
+
+        for future in futures:
+            with self.assertRaises(RuntimeError):
+                future.result()
+        self.assertEqual(flight.do("key", lambda: "retry"), "retry")
+
+    def test_sync_client_coalesces_identical_upstream_calls(self) -> None:
+        client = ErmctClient(service_key="test")
+        response = Mock(status_code=200, text=REALTIME_XML)
+        response.raise_for_status.return_value = None
+
+        def slow_get(*args, **kwargs):
+            time.sleep(0.1)
+            return response
+
+        with patch("app.services.ermct_client.requests.Session.get", side_effect=slow_get) as get:
+            futures = self._run_concurrently(
+                4,
+                lambda: client.get_realtime_beds("서울특별시", "강남구"),
+            )
+            rows = [future.result() for future in futures]
+
+        self.assertEqual(get.call_count, 1)
+        self.assertTrue(all(result[0].er_beds == 3 for result in rows))
+
+    def test_region_summaries_coalesce_identical_requests(self) -> None:
+        from app import main
+
+        calls = 0
+
+        def slow_live(**kwargs):
+            nonlocal calls
+            calls += 1
+            time.sleep(0.1)
+            return [HospitalSummary(id="A1")]
+
+        with (
+            patch.object(main, "HOSPITAL_SNAPSHOT_ENABLED", False),
+            patch.object(main, "region_summary_flight", SingleFlight()),
+            patch.object(main, "_fetch_hospital_summaries_live", side_effect=slow_live),
+        ):
+            futures = self._run_concurrently(
+                3,
+                lambda: main.get_hospital_summaries_by_region(
+                    sido="서울특별시",
+                    sigungu="강남구",
+                    sm_type=1,
+                    num_rows=200,
+                    include_messages=False,
+                ),
+            )
+            results = [future.result() for future in futures]
+
+        self.assertEqual(calls, 1)
+        self.assertEqual([[item.id for item in result] for result in results], [["A1"]] * 3)
+        self.assertIsNot(results[0], results[1])
+
+
+class AsyncSingleFlightTests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_awaits_share_one_task(self) -> None:
+        flight = AsyncSingleFlight()
+        calls = 0
+
+        async def slow():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return "result"
+
+        results = await asyncio.gather(*(flight.do("key", slow) for _ in range(4)))
+
+        self.assertEqual(results, ["result"] * 4)
+        self.assertEqual(calls, 1)
+        self.assertEqual(flight.in_flight(), 0)
+
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self) -> None:
+        flight = AsyncSingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "result"
+
+        first = asyncio.ensure_future(flight.do("key", slow))
+        second = asyncio.ensure_future(flight.do("key", slow))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await second, "result")
+
+    async def test_async_client_coalesces_identical_upstream_calls(self) -> None:
+        requests_seen = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal requests_seen
+            requests_seen += 1
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, text=REALTIME_XML)
+
+        client = AsyncErmctClient(service_key="test", transport=httpx.MockTransport(handler))
+        try:
+            await asyncio.gather(
+                *(client.get_realtime_beds("서울특별시", "강남구") for _ in range(5))
+            )
+        finally:
+            await client.aclose()
+
+        self.assertEqual(requests_seen, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from app.schemas import HospitalBasicInfo, KTASRoutingRequest, RoutingCandidateHospital
+from app.services.sigungu_er_index import SigunguErIndex
+from app.services.spatial_index import (
+    SpatialIndex,
+    SpatialPoint,
+    build_hospital_spatial_index,
+    haversine_km,
+    region_from_address,
+)
+
+
+def basic(hpid: str, lat: float, lon: float, address: str) -> HospitalBasicInfo:
+    return HospitalBasicInfo(id=hpid, name=hpid, address=address, latitude=lat, longitude=lon)
+
+
+class SpatialIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(7)
+        self.points = [
+            SpatialPoint(f"H{i:04d}", rng.uniform(33.0, 38.6), rng.uniform(125.0, 130.0), i)
+            for i in range(500)
+        ]
+        self.index = SpatialIndex(self.points)
+
+    def _brute(self, lat: float, lon: float) -> list[tuple[float, str]]:
+        return sorted(
+            (haversine_km(lat, lon, p.latitude, p.longitude), p.key) for p in self.points
+        )
+
+    def test_nearest_k_matches_brute_force(self) -> None:
+        rng = random.Random(11)
+        for _ in range(50):
+            lat, lon = rng.uniform(33.0, 38.6), rng.uniform(125.0, 130.0)
+            hits = self.index.nearest_k(lat, lon, 5)
+            expected = self._brute(lat, lon)[:5]
+
+            self.assertEqual([hit.point.key for hit in hits], [key for _, key in expected])
+            self.assertAlmostEqual(hits[0].distance_km, expected[0][0], places=6)
+
+    def test_within_radius_matches_brute_force_sorted_by_distance(self) -> None:
+        hits = self.index.within_radius(36.0, 127.5, 40.0)
+        expected = [key for distance, key in self._brute(36.0, 127.5) if distance <= 40.0]
+
+        self.assertEqual([hit.point.key for hit in hits], expected)
+
+    def test_filter_is_applied_during_search(self) -> None:
+        hits = self.index.nearest_k(36.0, 127.5, 3, filter=lambda point: point.payload % 2 == 0)
+
+        self.assertEqual(len(hits), 3)
+        self.assertTrue(all(hit.point.payload % 2 == 0 for hit in hits))
+
+    def test_hospital_index_skips_missing_coordinates(self) -> None:
+        index = build_hospital_spatial_index(
+            [
+                basic("A1", 37.5, 127.0, "서울특별시 중구"),
+                HospitalBasicInfo(id="A2", name="no coords"),
+            ]
+        )
+
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.nearest_k(37.6, 127.1, 5)[0].point.key, "A1")
+
+    def test_region_from_address(self) -> None:
+        self.assertEqual(region_from_address("경기도 수원시 권선구 세권로 1"), ("경기도", "수원시 권선구"))
+        self.assertEqual(region_from_address("서울특별시 강남구 일원로 81"), ("서울특별시", "강남구"))
+        self.assertEqual(region_from_address("세종특별자치시 보듬7로 20"), ("세종특별자치시", "세종시"))
+        self.assertIsNone(region_from_address(None))
+
+
+class SpatialRoutingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = patch("app.main.sigungu_er_index", SigunguErIndex())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _location_index(self):
+        from app import main
+
+        hospitals = [
+            # 강남구 경계 바로 너머(성남 분당구)에 있는 병원이 더 가깝다
+            basic("A-BUNDANG", 37.4000, 127.1100, "경기도 성남시 분당구 구미로 173"),
+            basic("A-GANGNAM", 37.4880, 127.0850, "서울특별시 강남구 일원로 81"),
+            basic("A-JUNGGU", 35.1000, 129.0300, "부산광역시 중구 대청로 1"),
+        ]
+        adjacency = main._get_sigungu_adjacency_index()
+        return main.HospitalLocationIndex(
+            index=build_hospital_spatial_index(hospitals),
+            sigungu_codes=main._match_sigungu_codes(adjacency, hospitals),
+            built_at=0.0,
+        )
+
+    def test_sigungu_codes_resolve_duplicate_names_by_sido(self) -> None:
+        from app import main
+
+        location_index = self._location_index()
+        adjacency = main._get_sigungu_adjacency_index()
+
+        self.assertEqual(adjacency.get_name(location_index.sigungu_codes["A-JUNGGU"]), "중구")
+        self.assertEqual(adjacency.get_sido_code(location_index.sigungu_codes["A-JUNGGU"]), "21")
+        self.assertEqual(
+            adjacency.get_name(location_index.sigungu_codes["A-BUNDANG"]),
+            "성남시 분당구",
+        )
+
+    def test_spatial_levels_follow_distance_rings(self) -> None:
+        from app import main
+
+        levels = main._spatial_expansion_levels(self._location_index(), 37.4100, 127.1000)
+        adjacency = main._get_sigungu_adjacency_index()
+
+        self.assertEqual(
+            [[adjacency.get_name(code) for code in level] for level in levels],
+            [["성남시 분당구"], ["강남구"]],
+        )
+
+    def test_route_uses_spatial_mode_with_coordinates(self) -> None:
+        from app import main
+
+        fetched: list[str] = []
+
+        def fetch(sido, sigungu, **kwargs):
+            fetched.append(sigungu)
+            return []
+
+        request = KTASRoutingRequest(
+            ktas_level=2,
+            chief_complaint="chest_pain",
+            user_lat=37.4100,
+            user_lon=127.1000,
+            min_valid_hospitals=1,
+        )
+        with (
+            patch.object(main, "_get_hospital_location_index", return_value=self._location_index()),
+            patch.object(main, "_resolve_current_region", return_value=(None, None)),
+            patch.object(main, "get_hospital_summaries_by_region", side_effect=fetch),
+            patch.object(main, "_run_global_fallback", return_value=main.GlobalFallbackResult()),
+        ):
+            response = main.route_from_ktas_seoul(request)
+
+        self.assertEqual(response.search_mode, "spatial")
+        self.assertEqual(set(fetched), {"성남시 분당구", "강남구"})
+
+    def test_route_falls_back_to_adjacency_without_index(self) -> None:
+        from app import main
+        from app.services.sigungu_search import ProgressiveSearchResult
+
+        request = KTASRoutingRequest(
+            ktas_level=2,
+            chief_complaint="chest_pain",
+            current_sigungu_code="11230",
+            user_lat=37.4900,
+            user_lon=127.0800,
+        )
+        empty: tuple[list[RoutingCandidateHospital], ProgressiveSearchResult] = (
+            [],
+            ProgressiveSearchResult(items=[], attempts=[]),
+        )
+        with (
+            patch.object(main, "_get_hospital_location_index", return_value=None),
+            patch.object(main, "_resolve_current_region", return_value=("11230", "서울특별시")),
+            patch.object(main, "_search_routing_candidates_progressively", return_value=empty) as progressive,
+            patch.object(main, "_run_global_fallback", return_value=main.GlobalFallbackResult()),
+        ):
+            response = main.route_from_ktas_seoul(request)
+
+        progressive.assert_called_once()
+        self.assertEqual(response.search_mode, "adjacency")
+
+
+class HospitalLocationIndexBuildTests(unittest.TestCase):
+    def setUp(self) -> None:
+        from app import main
+
+        for name, value in (
+            ("hospital_location_index", None),
+            ("_hospital_location_index_building", False),
+            ("_hospital_location_index_failures", 0),
+            ("_hospital_location_index_next_attempt", 0.0),
+        ):
+            patcher = patch.object(main, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _wait_until_idle(self) -> None:
+        from app import main
+
+        deadline = time.monotonic() + 2
+        while main._hospital_location_index_building and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_requests_do_not_wait_for_the_build(self) -> None:
+        from app import main
+
+        release = threading.Event()
+        calls: list[int] = []
+
+        def slow_bulk():
+            calls.append(1)
+            release.wait(2)
+            return {"A1": basic("A1", 37.5, 127.0, "서울특별시 종로구 대학로 101")}
+
+        with patch.object(main.ermct_client, "get_basic_info_bulk", side_effect=slow_bulk):
+            started = time.monotonic()
+            self.assertIsNone(main._get_hospital_location_index())
+            self.assertIsNone(main._get_hospital_location_index())
+            self.assertLess(time.monotonic() - started, 0.5)
+            release.set()
+            self._wait_until_idle()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(main._get_hospital_location_index().index), 1)
+
+    def test_failed_build_backs_off(self) -> None:
+        from app import main
+
+        bulk = Mock(side_effect=requests.ConnectionError("reset"))
+        with patch.object(main.ermct_client, "get_basic_info_bulk", bulk):
+            self.assertIsNone(main._get_hospital_location_index())
+            self._wait_until_idle()
+            self.assertIsNone(main._get_hospital_location_index())
+
+        bulk.assert_called_once()
+        self.assertEqual(main._hospital_location_index_failures, 1)
+        self.assertGreater(main._hospital_location_index_next_attempt, time.time())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import unittest
+
+from app.services.tmap_cache import TmapDistanceCache, TmapRouteCache, TtlLruCache, snap_to_cell
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SnapToCellTests(unittest.TestCase):
+    def test_nearby_points_share_a_cell_and_distant_points_do_not(self) -> None:
+        base = snap_to_cell(37.50010, 127.00010, 200)
+
+        self.assertEqual(snap_to_cell(37.50030, 127.00040, 200), base)
+        self.assertNotEqual(snap_to_cell(37.50500, 127.00010, 200), base)
+        self.assertNotEqual(snap_to_cell(37.50010, 127.00600, 200), base)
+
+
+class TtlLruCacheTests(unittest.TestCase):
+    def test_ttl_expiry_and_lru_eviction_are_counted(self) -> None:
+        clock = FakeClock()
+        cache = TtlLruCache(ttl_seconds=10, max_entries=2, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # a가 최근 사용
+        cache.set("c", 3)  # b가 밀려난다
+
+        self.assertIsNone(cache.get("b"))
+        clock.now = 11
+        self.assertIsNone(cache.get("a"))
+
+        stats = cache.stats()
+        self.assertEqual(
+            (stats["hits"], stats["misses"], stats["evictions"], stats["expirations"]),
+            (1, 2, 1, 1),
+        )
+        self.assertEqual(stats["hit_ratio"], round(1 / 3, 4))
+
+
+class TmapDistanceCacheTests(unittest.TestCase):
+    def test_key_includes_destination_and_time_bucket(self) -> None:
+        # 2026-01-01 08:10 KST
+        clock = FakeClock(1767222600.0)
+        cache = TmapDistanceCache(cell_meters=200, bucket_minutes=30, ttl_seconds=3600, clock=clock)
+        cache.set(37.5, 127.0, "A1", 1000, 300)
+
+        self.assertEqual(cache.get(37.5001, 127.0001, "A1"), (1000, 300))
+        self.assertIsNone(cache.get(37.5, 127.0, "A2"))
+
+        clock.now += 25 * 60  # 08:35, 다음 버킷
+        self.assertIsNone(cache.get(37.5, 127.0, "A1"))
+
+    def test_empty_stats_have_no_hit_ratio(self) -> None:
+        stats = TmapDistanceCache().stats()
+
+        self.assertIsNone(stats["hit_ratio"])
+        self.assertEqual(stats["entries"], 0)
+
+
+class TmapRouteCacheTests(unittest.TestCase):
+    def test_destination_must_match_cached_route(self) -> None:
+        cache = TmapRouteCache()
+        route = {"path": [], "distance": 1000.0, "duration_sec": 60}
+        cache.set(37.5, 127.0, "A1", 37.55, 127.05, route)
+
+        self.assertIs(cache.get(37.5001, 127.0001, "A1", 37.55, 127.05), route)
+        self.assertIsNone(cache.get(37.5, 127.0, "A1", 37.60, 127.05))
+        self.assertIsNone(cache.get(37.5, 127.0, "A2", 37.55, 127.05))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+from fastapi.testclient import TestClient
+
+from app.services.ermct_client import ErmctClient
+from app.services.region_resolver import KakaoRegionResolver
+from scripts.upstream_stand_in import (
+    ERMCT_PREFIX,
+    EndpointBehavior,
+    LatencyProfile,
+    StandInConfig,
+    create_app,
+)
+
+
+def routed_get(test_client: TestClient):
+    # requests.get(url, params=..., timeout=...) → 같은 경로로 stand-in 앱에 보낸다
+    def get(url, params=None, headers=None, timeout=None):
+        return test_client.get(urlsplit(url).path, params=params, headers=headers)
+
+    return get
+
+
+class StandInErmctTests(unittest.TestCase):
+    def test_client_parses_synthetic_operations(self) -> None:
+        test_client = TestClient(create_app(StandInConfig(hospitals_per_region=3)))
+        client = ErmctClient(service_key="test")
+
+        with patch("app.services.ermct_client.requests.Session.get", side_effect=routed_get(test_client)):
+            beds = client.get_realtime_beds("서울특별시", "강남구")
+            serious = client.get_serious_acceptance("서울특별시", "강남구")
+            bulk = client.get_basic_info_bulk("서울특별시", "강남구")
+            basic = client.get_basic_info(beds[0].id)
+
+        self.assertEqual(len(beds), 3)
+        self.assertEqual({row.name for row in serious}, {row.name for row in beds})
+        self.assertEqual(set(bulk), {row.id for row in beds})
+        self.assertEqual(basic.latitude, bulk[beds[0].id].latitude)
+
+    def test_recorded_xml_overrides_synthetic_data(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            recorded = (
+                "<response><header><resultCode>00</resultCode></header>"
+                "<body><items><item><hpid>REC1</hpid><dutyName>녹화병원</dutyName></item></items></body>"
+                "</response>"
+            )
+            (Path(tmp) / "getStrmListInfoInqire.xml").write_text(recorded, encoding="utf-8")
+            test_client = TestClient(create_app(StandInConfig(recorded_dir=Path(tmp))))
+
+            response = test_client.get(f"{ERMCT_PREFIX}/getStrmListInfoInqire", params={"Q0": "서울특별시"})
+
+        self.assertIn("<hpid>REC1</hpid>", response.text)
+
+    def test_injects_http_429_and_result_code_22(self) -> None:
+        limited = EndpointBehavior(rate_limit_rate=1.0)
+        test_client = TestClient(create_app(StandInConfig(ermct=limited)))
+        url = f"{ERMCT_PREFIX}/getEmrrmRltmUsefulSckbdInfoInqire"
+
+        self.assertEqual(test_client.get(url).status_code, 429)
+
+        test_client = TestClient(create_app(StandInConfig(ermct=limited, ermct_rate_limit_mode="result_code")))
+        client = ErmctClient(service_key="test")
+        with patch("app.services.ermct_client.requests.Session.get", side_effect=routed_get(test_client)):
+            with self.assertRaises(RuntimeError):
+                client.get_realtime_beds("서울특별시", "강남구")
+
+    def test_per_operation_override_and_stats(self) -> None:
+        config = StandInConfig(ermct_operations={"getEmrrmSrsillDissMsgInqire": EndpointBehavior(error_rate=1.0)})
+        test_client = TestClient(create_app(config))
+
+        self.assertEqual(test_client.get(f"{ERMCT_PREFIX}/getEmrrmSrsillDissMsgInqire").status_code, 503)
+        self.assertEqual(test_client.get(f"{ERMCT_PREFIX}/getStrmListInfoInqire").status_code, 200)
+
+        stats = test_client.get("/_stand_in/stats").json()["requests"]
+        self.assertEqual(stats["ermct:getEmrrmSrsillDissMsgInqire"]["error"], 1)
+        self.assertEqual(stats["ermct:getStrmListInfoInqire"]["ok"], 1)
+
+
+class StandInTmapKakaoTests(unittest.TestCase):
+    def test_tmap_route_has_total_distance_and_line(self) -> None:
+        test_client = TestClient(create_app())
+
+        data = test_client.post(
+            "/tmap/routes",
+            params={"version": 1, "format": "json"},
+            json={"startX": "127.0473", "startY": "37.5172", "endX": "127.0324", "endY": "37.4837"},
+        ).json()
+
+        properties = data["features"][0]["properties"]
+        self.assertGreater(properties["totalDistance"], 3000)
+        self.assertGreater(properties["totalTime"], 0)
+        self.assertEqual(data["features"][1]["geometry"]["type"], "LineString")
+
+    def test_kakao_resolver_maps_to_nearest_gu(self) -> None:
+        test_client = TestClient(create_app())
+        resolver = KakaoRegionResolver(api_key="test")
+
+        with patch("app.services.region_resolver.requests.get", side_effect=routed_get(test_client)):
+            region = resolver.resolve_region(37.4837, 127.0324)
+
+        self.assertEqual(region.sigungu_name, "서초구")
+
+    def test_latency_distributions_are_non_negative(self) -> None:
+        rng = random.Random(1)
+        for distribution in ("fixed", "uniform", "normal", "lognormal"):
+            profile = LatencyProfile(distribution, mean_ms=50, jitter_ms=80)
+            samples = [profile.sample_seconds(rng) for _ in range(200)]
+            self.assertTrue(all(sample >= 0 for sample in samples))
+        self.assertEqual(LatencyProfile("fixed", 120).sample_seconds(rng), 0.12)
+
+
+if __name__ == "__main__":
+    unittest.main()